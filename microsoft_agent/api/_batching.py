@@ -0,0 +1,299 @@
+"""Microsoft Graph JSON ``$batch`` coalescing for fan-out requests."""
+
+from __future__ import annotations
+
+import asyncio
+import string
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import quote, urlencode, urlparse
+
+GRAPH_BATCH_LIMIT = 20
+DEFAULT_BATCH_WINDOW_SECONDS = 0.01
+MAX_BATCH_ACTION_REQUESTS = 100
+_BATCH_METHODS = frozenset({"GET", "POST", "PATCH", "PUT", "DELETE"})
+
+BatchSender = Callable[[list[dict[str, Any]]], Awaitable[list[dict[str, Any]]]]
+
+
+def validated_batch_url(value: Any) -> str:
+    """Accept only version-relative Graph paths inside a batch envelope."""
+
+    if not isinstance(value, str) or not value or len(value) > 4096:
+        raise ValueError("Batch request url must be a non-empty relative path")
+    parsed = urlparse(value)
+    if (
+        parsed.scheme
+        or parsed.netloc
+        or parsed.fragment
+        or not value.startswith("/")
+        or value.startswith("//")
+        or ".." in parsed.path.split("/")
+        or any(ord(char) < 33 for char in value)
+    ):
+        raise ValueError("Batch request url must be a Graph path relative to the API")
+    return value
+
+
+@dataclass(frozen=True)
+class BatchRead:
+    """A single-resource Graph read that may share a ``$batch`` round trip.
+
+    ``group`` is the tool group the matching action belongs to; ``path`` names
+    the action's identifier arguments as ``{placeholders}``.
+    """
+
+    group: str
+    path: str
+    query: tuple[str, ...] = ("$select", "$expand")
+
+    @property
+    def identifiers(self) -> tuple[str, ...]:
+        return tuple(
+            field for _, field, _, _ in string.Formatter().parse(self.path) if field
+        )
+
+
+# Reads commonly fanned out per message, event, contact, or attendee. Only
+# these actions may be batched, so a batch cannot reach other Graph paths.
+BATCH_READ_ACTIONS: dict[str, BatchRead] = {
+    "get_mail_message": BatchRead("mail", "/me/messages/{message_id}"),
+    "get_calendar_event": BatchRead("calendar", "/me/events/{event_id}"),
+    "get_outlook_contact": BatchRead("contacts", "/me/contacts/{contact_id}"),
+    "get_group": BatchRead("groups", "/groups/{group_id}"),
+    "get_presence": BatchRead("communications", "/communications/presences/{user_id}"),
+    "get_team": BatchRead("teams", "/teams/{team_id}"),
+    "get_site": BatchRead("sites", "/sites/{site_id}"),
+}
+
+
+def batch_read_url(action: str, arguments: Mapping[str, Any]) -> str:
+    """Build the relative Graph URL of an allow-listed read action.
+
+    ``arguments`` are the action's own arguments: its identifiers and an
+    optional ``params`` object of OData query options.
+    """
+
+    read = BATCH_READ_ACTIONS.get(action)
+    if read is None:
+        raise ValueError(f"Action cannot be batched: {action}")
+    unknown = sorted(set(arguments) - {*read.identifiers, "params"})
+    if unknown:
+        raise ValueError(f"Unknown parameters for '{action}': {', '.join(unknown)}")
+    values = {}
+    for name in read.identifiers:
+        value = arguments.get(name)
+        if not isinstance(value, str) or not value:
+            raise ValueError(f"'{name}' must be a non-empty string for '{action}'")
+        values[name] = quote(value, safe="")
+    params = arguments.get("params") or {}
+    if not isinstance(params, Mapping):
+        raise ValueError(f"'params' must be an object for '{action}'")
+    query = {name: str(params[name]) for name in read.query if params.get(name)}
+    url = read.path.format(**values)
+    if query:
+        url += "?" + urlencode(query, safe="$,", quote_via=quote)
+    return validated_batch_url(url)
+
+
+@dataclass(frozen=True)
+class BatchSubResponse:
+    """One ``$batch`` sub-response, shaped for :class:`RetryPolicy` decisions."""
+
+    payload: dict[str, Any]
+
+    @property
+    def status_code(self) -> int:
+        status = self.payload.get("status")
+        return status if isinstance(status, int) else 0
+
+    @property
+    def headers(self) -> dict[str, str]:
+        headers = self.payload.get("headers")
+        return headers if isinstance(headers, dict) else {}
+
+
+def batch_request_item(
+    method: str,
+    url: str,
+    *,
+    headers: dict[str, str] | None = None,
+    body: Any = None,
+) -> dict[str, Any]:
+    """Build one validated ``$batch`` request entry without an ``id``."""
+
+    normalized = method.upper()
+    if normalized not in _BATCH_METHODS:
+        raise ValueError(f"Unsupported batch request method: {method}")
+    item: dict[str, Any] = {"method": normalized, "url": validated_batch_url(url)}
+    if body is not None:
+        item["body"] = body
+        headers = {"Content-Type": "application/json", **(headers or {})}
+    if headers:
+        item["headers"] = dict(headers)
+    return item
+
+
+class GraphBatchCoalescer:
+    """Group concurrent Graph requests into ``$batch`` calls of up to 20.
+
+    Requests submitted within ``window_seconds`` of the first pending request
+    share one batch; a full batch is sent immediately. With ``window_seconds``
+    set to ``None`` requests wait for an explicit :meth:`flush`.
+    """
+
+    def __init__(
+        self,
+        send: BatchSender,
+        *,
+        window_seconds: float | None = DEFAULT_BATCH_WINDOW_SECONDS,
+        max_batch_size: int = GRAPH_BATCH_LIMIT,
+    ) -> None:
+        if not 1 <= max_batch_size <= GRAPH_BATCH_LIMIT:
+            raise ValueError(
+                f"Graph batches contain between 1 and {GRAPH_BATCH_LIMIT} requests"
+            )
+        if window_seconds is not None and window_seconds < 0:
+            raise ValueError("Batch window must not be negative")
+        self._send = send
+        self._window = window_seconds
+        self._max_batch_size = max_batch_size
+        self._pending: list[tuple[dict[str, Any], asyncio.Future[dict[str, Any]]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._inflight: set[asyncio.Task[None]] = set()
+        self.batches_sent = 0
+
+    def submit(self, request: dict[str, Any]) -> asyncio.Future[dict[str, Any]]:
+        """Queue one request entry and return a future for its response."""
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[dict[str, Any]] = loop.create_future()
+        self._pending.append((request, future))
+        if len(self._pending) >= self._max_batch_size:
+            self._cancel_timer()
+            self._start(self._take())
+        elif self._window is not None and self._timer is None:
+            self._timer = loop.call_later(self._window, self._on_timer)
+        return future
+
+    async def request(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Submit one request entry and wait for its batched response."""
+
+        return await self.submit(request)
+
+    @property
+    def idle(self) -> bool:
+        """Whether nothing is queued or in flight."""
+
+        return not self._pending and not self._inflight
+
+    async def flush(self) -> None:
+        """Send every pending request and wait for all in-flight batches."""
+
+        self._cancel_timer()
+        while self._pending:
+            self._start(self._take())
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+    def cancel_pending(self) -> None:
+        """Drop queued requests that have not been sent yet."""
+
+        self._cancel_timer()
+        for _, future in self._pending:
+            future.cancel()
+        self._pending.clear()
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        while self._pending:
+            self._start(self._take())
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _take(self) -> list[tuple[dict[str, Any], asyncio.Future[dict[str, Any]]]]:
+        chunk = self._pending[: self._max_batch_size]
+        del self._pending[: self._max_batch_size]
+        return chunk
+
+    def _start(
+        self, chunk: list[tuple[dict[str, Any], asyncio.Future[dict[str, Any]]]]
+    ) -> None:
+        task = asyncio.get_running_loop().create_task(self._dispatch(chunk))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(
+        self, chunk: list[tuple[dict[str, Any], asyncio.Future[dict[str, Any]]]]
+    ) -> None:
+        requests = [
+            {**request, "id": str(index)}
+            for index, (request, _) in enumerate(chunk, start=1)
+        ]
+        try:
+            responses = await self._send(requests)
+            self.batches_sent += 1
+        except Exception as exc:
+            for _, future in chunk:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        by_id = {
+            str(response.get("id")): response
+            for response in responses
+            if isinstance(response, dict)
+        }
+        for index, (_, future) in enumerate(chunk, start=1):
+            if future.done():
+                continue
+            response = by_id.get(str(index))
+            if response is None:
+                future.set_exception(
+                    RuntimeError("Microsoft Graph batch omitted a response")
+                )
+            else:
+                future.set_result(response)
+
+
+class GraphBatch:
+    """Explicit request group sent as ``$batch`` calls when the scope exits."""
+
+    def __init__(self, send: BatchSender) -> None:
+        self._coalescer = GraphBatchCoalescer(send, window_seconds=None)
+
+    def add(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        body: Any = None,
+    ) -> asyncio.Future[dict[str, Any]]:
+        """Queue a request; its future resolves once the batch is sent."""
+
+        return self._coalescer.submit(
+            batch_request_item(method, url, headers=headers, body=body)
+        )
+
+    def get(
+        self, url: str, *, headers: dict[str, str] | None = None
+    ) -> asyncio.Future[dict[str, Any]]:
+        """Queue a GET request."""
+
+        return self.add("GET", url, headers=headers)
+
+    async def flush(self) -> None:
+        """Send everything queued so far."""
+
+        await self._coalescer.flush()
+
+    async def aclose(self, *, cancelled: bool = False) -> None:
+        """Send queued requests, or drop them when the scope failed."""
+
+        if cancelled:
+            self._coalescer.cancel_pending()
+        await self._coalescer.flush()
@@ -0,0 +1,102 @@
+"""Single-flight coalescing of concurrent identical Graph reads.
+
+Agents working in parallel often ask for the same resource at the same moment,
+such as the signed-in profile, joined teams, or today's calendar view. A
+``get_*``/``list_*`` wrapper decorated with :func:`coalesced` joins an
+identical read that is already in flight for the same caller instead of
+sending another Graph request. Reads are identical when the tenant, account,
+method, and normalized arguments match. Followers receive a private copy of
+the shared result.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import functools
+import inspect
+import json
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+_READ_PREFIXES = ("get_", "list_")
+
+
+def normalized_arguments(args: tuple[Any, ...], kwargs: dict[str, Any]) -> str | None:
+    """Canonical JSON for call arguments, or ``None`` when not comparable."""
+
+    try:
+        return json.dumps(
+            [args, kwargs], sort_keys=True, separators=(",", ":"), allow_nan=False
+        )
+    except (TypeError, ValueError):
+        return None
+
+
+class ReadCoalescer:
+    """In-flight reads of one client, shared by identical concurrent callers."""
+
+    def __init__(self) -> None:
+        self._flights: dict[Hashable, asyncio.Task[Any]] = {}
+        self.started = 0
+        self.joined = 0
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    async def run(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Await the flight for ``key``, starting it if none is running."""
+
+        task = self._flights.get(key)
+        if task is not None:
+            self.joined += 1
+            return copy.deepcopy(await asyncio.shield(task))
+        task = asyncio.ensure_future(call())
+        self._flights[key] = task
+        self.started += 1
+        task.add_done_callback(functools.partial(self._finish, key))
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict[str, int]:
+        """Return started and joined flight counters."""
+
+        return {"started": self.started, "joined": self.joined, "in_flight": len(self)}
+
+    def _finish(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        if self._flights.get(key) is task:
+            del self._flights[key]
+        # Every borrower may have been cancelled; never leave the error unread.
+        if not task.cancelled():
+            task.exception()
+
+
+def coalesced(method: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """Share one in-flight call among identical concurrent Graph reads."""
+
+    name = method.__name__
+
+    @functools.wraps(method)
+    async def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        identity = self._caller_identity()
+        arguments = normalized_arguments(args, kwargs)
+        if identity is None or arguments is None:
+            return await method(self, *args, **kwargs)
+        key = (*identity, name, arguments)
+        coalescer = getattr(self, "_read_coalescer", None)
+        if coalescer is None:
+            coalescer = ReadCoalescer()
+            self._read_coalescer = coalescer
+        return await coalescer.run(key, lambda: method(self, *args, **kwargs))
+
+    wrapper.__coalesced__ = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+def supports_coalescing(name: str, method: Any) -> bool:
+    """Whether a class attribute is a Graph read wrapper safe to share."""
+
+    return (
+        name.startswith(_READ_PREFIXES)
+        and inspect.iscoroutinefunction(method)
+        and not getattr(method, "__coalesced__", False)
+    )
@@ -15,6 +15,8 @@
 
 GraphModel = TypeVar("GraphModel", bound=Parsable)
 
+MAX_GRAPH_JSON_BODY_BYTES = 4 * 1024 * 1024
+
 
 def graph_model_from_dict(
     data: dict[str, Any], factory: Callable[[], GraphModel]
@@ -27,6 +29,37 @@ def graph_model_from_dict(
     return parse_node.get_object_value(factory)
 
 
+def graph_json_body(
+    data: Any,
+    *,
+    required: tuple[str, ...] = (),
+    max_bytes: int = MAX_GRAPH_JSON_BODY_BYTES,
+) -> bytes:
+    """Serialize a Graph write payload as compact JSON without SDK models.
+
+    Only the shape Graph cannot recover from is checked: the payload must be
+    an object with string keys, carry ``required`` members, contain finite
+    numbers only, and stay within ``max_bytes``. Graph validates the rest.
+    """
+
+    if not isinstance(data, dict):
+        raise ValueError("Request body must be a JSON object")
+    if any(not isinstance(key, str) for key in data):
+        raise ValueError("Request body keys must be strings")
+    missing = [name for name in required if data.get(name) in (None, "", [], {})]
+    if missing:
+        raise ValueError(f"Request body is missing {', '.join(missing)}")
+    try:
+        body = json.dumps(
+            data, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+        ).encode("utf-8")
+    except (TypeError, ValueError) as exc:
+        raise ValueError("Request body must be JSON serializable") from exc
+    if len(body) > max_bytes:
+        raise ValueError(f"Request body exceeds {max_bytes} bytes")
+    return body
+
+
 def decode_graph_base64(value: Any, field_name: str) -> bytes:
     if not isinstance(value, str) or not value:
         raise ValueError(f"{field_name} must be a non-empty base64 string")
@@ -0,0 +1,234 @@
+"""Bounded ``@odata.nextLink`` pagination for Microsoft Graph collections."""
+
+from __future__ import annotations
+
+import functools
+import inspect
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+from urllib.parse import urlparse
+
+DEFAULT_MAX_PAGES = 100
+MAX_PAGES_LIMIT = 1000
+MAX_ITEMS_LIMIT = 100_000
+
+NextPageFetcher = Callable[[str], Awaitable[dict[str, Any]]]
+
+_PAGINATION_PARAMETERS = (
+    inspect.Parameter(
+        "fetch_all", inspect.Parameter.KEYWORD_ONLY, default=False, annotation=bool
+    ),
+    inspect.Parameter(
+        "max_pages",
+        inspect.Parameter.KEYWORD_ONLY,
+        default=DEFAULT_MAX_PAGES,
+        annotation=int,
+    ),
+    inspect.Parameter(
+        "max_items",
+        inspect.Parameter.KEYWORD_ONLY,
+        default=None,
+        annotation=int | None,
+    ),
+)
+
+
+def validate_page_bounds(max_pages: int, max_items: int | None) -> None:
+    """Reject pagination bounds outside the supported range."""
+
+    if not isinstance(max_pages, int) or not 1 <= max_pages <= MAX_PAGES_LIMIT:
+        raise ValueError(f"max_pages must be between 1 and {MAX_PAGES_LIMIT}")
+    if max_items is not None and (
+        not isinstance(max_items, int) or not 1 <= max_items <= MAX_ITEMS_LIMIT
+    ):
+        raise ValueError(f"max_items must be between 1 and {MAX_ITEMS_LIMIT}")
+
+
+def validated_graph_next_link(value: Any, graph_base_url: str) -> str:
+    """Accept only continuation links on the configured Graph endpoint."""
+
+    if not isinstance(value, str) or not value or len(value) > 32768:
+        raise ValueError("Microsoft Graph continuation URL is invalid")
+    parsed = urlparse(value)
+    base = urlparse(graph_base_url)
+    try:
+        port = parsed.port
+    except ValueError as exc:
+        raise ValueError("Microsoft Graph continuation URL is invalid") from exc
+    base_path = base.path.rstrip("/")
+    if (
+        parsed.scheme != "https"
+        or (parsed.hostname or "").casefold() != (base.hostname or "").casefold()
+        or port not in {None, 443, base.port}
+        or parsed.username
+        or parsed.password
+        or parsed.fragment
+        or not parsed.path.startswith(f"{base_path}/")
+    ):
+        raise ValueError(
+            "Microsoft Graph continuation URL must target the configured endpoint"
+        )
+    return value
+
+
+def _page_values(page: Any) -> list[Any]:
+    values = page.get("value") if isinstance(page, dict) else None
+    if not isinstance(values, list):
+        raise ValueError("Microsoft Graph returned an invalid collection page")
+    return values
+
+
+async def iterate_graph_pages(
+    first_page: dict[str, Any],
+    fetch_next: NextPageFetcher,
+    *,
+    max_pages: int = DEFAULT_MAX_PAGES,
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield the first page and each followed page up to ``max_pages``."""
+
+    validate_page_bounds(max_pages, None)
+    page = first_page
+    pages = 1
+    while True:
+        _page_values(page)
+        yield page
+        next_link = page.get("@odata.nextLink")
+        if not next_link or pages >= max_pages:
+            return
+        page = await fetch_next(next_link)
+        pages += 1
+
+
+async def iterate_graph_items(
+    first_page: dict[str, Any],
+    fetch_next: NextPageFetcher,
+    *,
+    max_pages: int = DEFAULT_MAX_PAGES,
+    max_items: int | None = None,
+) -> AsyncIterator[Any]:
+    """Yield collection members across pages until either bound is reached."""
+
+    validate_page_bounds(max_pages, max_items)
+    emitted = 0
+    async for page in iterate_graph_pages(first_page, fetch_next, max_pages=max_pages):
+        for item in page["value"]:
+            if max_items is not None and emitted >= max_items:
+                return
+            yield item
+            emitted += 1
+
+
+async def collect_graph_pages(
+    first_page: dict[str, Any],
+    fetch_next: NextPageFetcher,
+    *,
+    max_pages: int = DEFAULT_MAX_PAGES,
+    max_items: int | None = None,
+) -> dict[str, Any]:
+    """Follow ``@odata.nextLink`` into one bounded combined collection.
+
+    The result sets ``partial`` when a bound stopped enumeration. When it
+    stopped at a page boundary the last unfollowed ``@odata.nextLink`` is kept
+    so callers can resume. When ``max_items`` cut a page short, resuming from
+    that link would skip the rest of the page, so the page's continuation
+    links are dropped and ``resumable`` is ``False``.
+    """
+
+    validate_page_bounds(max_pages, max_items)
+    combined: list[Any] = []
+    pages_fetched = 0
+    next_link: str | None = None
+    delta_link: str | None = None
+    truncated = False
+    async for page in iterate_graph_pages(first_page, fetch_next, max_pages=max_pages):
+        pages_fetched += 1
+        values = page["value"]
+        next_link = page.get("@odata.nextLink")
+        delta_link = page.get("@odata.deltaLink") or delta_link
+        if max_items is not None and len(combined) + len(values) >= max_items:
+            truncated = len(combined) + len(values) > max_items
+            combined.extend(values[: max_items - len(combined)])
+            if truncated:
+                next_link = None
+                delta_link = None
+            break
+        combined.extend(values)
+
+    result: dict[str, Any] = {"value": combined, "pagesFetched": pages_fetched}
+    for key in ("@odata.context", "@odata.count"):
+        if key in first_page:
+            result[key] = first_page[key]
+    if delta_link:
+        result["@odata.deltaLink"] = delta_link
+    if next_link:
+        result["@odata.nextLink"] = next_link
+    if next_link or truncated:
+        result["partial"] = True
+        result["resumable"] = not truncated
+    return result
+
+
+def paginated(method: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """Give a Graph ``list_*`` wrapper opt-in ``fetch_all`` pagination.
+
+    The wrapped method keeps its signature and single-page behaviour. Passing
+    ``fetch_all=True`` follows continuation links through the owning client's
+    :meth:`_fetch_next_page` within the ``max_pages``/``max_items`` bounds.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(
+        self: Any,
+        *args: Any,
+        fetch_all: bool = False,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        max_items: int | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        if not fetch_all:
+            return await method(self, *args, **kwargs)
+        try:
+            validate_page_bounds(max_pages, max_items)
+        except ValueError as exc:
+            return {"error": str(exc)}
+        first_page = await method(self, *args, **kwargs)
+        if not isinstance(first_page, dict) or "error" in first_page:
+            return first_page
+        try:
+            return await collect_graph_pages(
+                first_page,
+                self._fetch_next_page,
+                max_pages=max_pages,
+                max_items=max_items,
+            )
+        except ValueError as exc:
+            return {"error": str(exc)}
+        except Exception as e:
+            print(f"Operation failed: {type(e).__name__}")
+            return {"error": "Operation failed"}
+
+    signature = inspect.signature(method)
+    parameters = list(signature.parameters.values())
+    insert_at = next(
+        (
+            index
+            for index, parameter in enumerate(parameters)
+            if parameter.kind is inspect.Parameter.VAR_KEYWORD
+        ),
+        len(parameters),
+    )
+    parameters[insert_at:insert_at] = _PAGINATION_PARAMETERS
+    wrapper.__signature__ = signature.replace(parameters=parameters)  # type: ignore[attr-defined]
+    wrapper.__paginated__ = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+def supports_pagination(name: str, method: Any) -> bool:
+    """Whether a class attribute is a single-page Graph collection wrapper."""
+
+    if not name.startswith("list_") or not inspect.iscoroutinefunction(method):
+        return False
+    if getattr(method, "__paginated__", False):
+        return False
+    parameters = inspect.signature(method).parameters
+    return not {"fetch_all", "max_pages", "max_items"} & set(parameters)
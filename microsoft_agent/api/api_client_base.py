@@ -1,4 +1,8 @@
+import json
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import Any
 from urllib.parse import urlparse
 
 import httpx
@@ -13,18 +17,63 @@
 )
 from msgraph import GraphServiceClient
 from msgraph.graph_request_adapter import GraphRequestAdapter
+from msgraph_core import GraphClientFactory
 
-from microsoft_agent.auth import AuthManager
+from microsoft_agent.api._batching import (
+    BatchSubResponse,
+    GraphBatch,
+    GraphBatchCoalescer,
+    batch_read_url,
+    batch_request_item,
+)
+from microsoft_agent.api._coalescing import coalesced, supports_coalescing
+from microsoft_agent.api._graph_models import graph_json_body
+from microsoft_agent.api._pagination import (
+    DEFAULT_MAX_PAGES,
+    iterate_graph_items,
+    paginated,
+    supports_pagination,
+    validated_graph_next_link,
+)
+from microsoft_agent.auth import (
+    AuthManager,
+    caller_identity,
+    durable_caller_identity,
+    get_auth_fingerprint,
+)
 from microsoft_agent.credential_adapter import AuthManagerCredential
+from microsoft_agent.power_platform import (
+    HttpxNativeAsyncHttpTransport,
+    StreamingHttpTransport,
+)
+from microsoft_agent.response_cache import ETagRevalidationHandler, get_etag_store
+from microsoft_agent.retry_policy import ThrottlingRetryHandler, get_retry_policy
+from microsoft_agent.settings import get_settings
 
 
 class MicrosoftGraphApiBase(ABC):
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        for name, method in list(vars(cls).items()):
+            if supports_pagination(name, method):
+                method = paginated(method)
+                setattr(cls, name, method)
+            if supports_coalescing(name, method):
+                setattr(cls, name, coalesced(method))
+
     @abstractmethod
     def verify_login(self) -> str:
         """Return the authenticated status for the composed client."""
 
-    def __init__(self, auth_manager: AuthManager):
+    def __init__(
+        self,
+        auth_manager: AuthManager,
+        *,
+        download_transport: StreamingHttpTransport | None = None,
+    ):
         self.auth_manager = auth_manager
+        self._downloads = download_transport
+        self._owned_downloads: HttpxNativeAsyncHttpTransport | None = None
         self.credential = AuthManagerCredential(auth_manager)
         status = self.verify_login()
         if "Not authenticated" in status:
@@ -55,6 +104,21 @@ def __init__(self, auth_manager: AuthManager):
                 allowed_private_hosts=(),
                 **self.tls_profile.httpx_kwargs(),
             )
+            # Throttled Graph calls share pacing with every client of the same
+            # tenant and application and back off instead of failing.
+            middleware: list[Any] = [
+                ThrottlingRetryHandler(get_retry_policy(), key=self._graph_retry_key())
+            ]
+            settings = get_settings()
+            if settings.response_cache_enabled:
+                middleware.append(
+                    ETagRevalidationHandler(
+                        get_etag_store(settings.response_cache_max_bytes)
+                    )
+                )
+            GraphClientFactory.create_with_custom_middleware(
+                middleware, client=self._http_client
+            )
         except Exception:
             self.tls_profile.cleanup()
             self.tls_profile = None
@@ -72,7 +136,325 @@ async def close(self) -> None:
         profile, self.tls_profile = self.tls_profile, None
         if profile is None:
             return
+        coalescers = list(getattr(self, "_batch_coalescers", {}).values())
+        owned_downloads, self._owned_downloads = self._owned_downloads, None
         try:
+            for coalescer in coalescers:
+                await coalescer.flush()
             await self._http_client.aclose()
         finally:
-            profile.cleanup()
+            try:
+                if owned_downloads is not None:
+                    await owned_downloads.aclose()
+            finally:
+                profile.cleanup()
+
+    def _download_transport(self) -> StreamingHttpTransport:
+        """Transport for preauthenticated download URLs, without Graph auth.
+
+        One is created on first use and closed with the client, unless the
+        caller injected its own.
+        """
+
+        downloads = getattr(self, "_downloads", None)
+        if downloads is None:
+            downloads = self._downloads = self._owned_downloads = (
+                HttpxNativeAsyncHttpTransport(
+                    service="microsoft_graph",
+                    tls_profile=self.auth_manager.graph_tls_profile,
+                    tls_profile_ref=self.auth_manager.graph_tls_profile_ref,
+                )
+            )
+        return downloads
+
+    def _graph_retry_key(self) -> tuple[Any, ...]:
+        """Pacing and retry key shared by this client's Graph requests.
+
+        Graph throttles per tenant and application, so the key carries the
+        authentication fingerprint the client was built for next to the host.
+        It is fixed on first use, which ``__init__`` makes construction time.
+        """
+
+        key = getattr(self, "_retry_key", None)
+        if key is None:
+            key = self._retry_key = (
+                "microsoft_graph",
+                urlparse(self.auth_manager.graph_base_url).hostname,
+                get_auth_fingerprint() or (),
+            )
+        return key
+
+    def _caller_identity(self) -> tuple[str, str] | None:
+        """Tenant and account a Graph read is performed for, if known."""
+
+        manager = getattr(self, "auth_manager", None)
+        return None if manager is None else caller_identity(manager)
+
+    def _durable_caller_identity(self) -> tuple[str, str] | None:
+        """Tenant and account that persistent per-caller state is kept for."""
+
+        manager = getattr(self, "auth_manager", None)
+        return None if manager is None else durable_caller_identity(manager)
+
+    async def _graph_request(
+        self,
+        method: str,
+        url: str,
+        *,
+        body: bytes | None = None,
+        content_type: str = "application/json",
+        headers: dict[str, str] | None = None,
+    ) -> Any:
+        """Send one raw request through the authenticated Graph adapter.
+
+        Kiota middleware and authentication still apply; the native HTTP
+        response is returned without SDK model materialization.
+        """
+        from kiota_abstractions.method import Method
+        from kiota_abstractions.native_response_handler import NativeResponseHandler
+        from kiota_abstractions.request_information import RequestInformation
+        from kiota_http.middleware.options import ResponseHandlerOption
+
+        request_info = RequestInformation(Method(method.upper()))
+        request_info.url = url
+        request_info.headers.try_add("Accept", "application/json")
+        for name, value in (headers or {}).items():
+            request_info.headers.add(name, value)
+        if body is not None:
+            request_info.set_stream_content(body, content_type)
+        request_info.add_request_options(
+            [ResponseHandlerOption(NativeResponseHandler())]
+        )
+        return await self.client.request_adapter.send_primitive_async(
+            request_info, "bytes", {}
+        )
+
+    async def _graph_json_request(
+        self,
+        method: str,
+        path: str,
+        data: Any,
+        *,
+        required: tuple[str, ...] = (),
+    ) -> Any:
+        """Send a Graph write payload as raw JSON and check its status.
+
+        ``path`` is relative to the configured Graph endpoint. The payload is
+        validated by :func:`graph_json_body` instead of being materialized as
+        an SDK model and serialized again by Kiota.
+        """
+
+        body = graph_json_body(data, required=required)
+        base_url = self.auth_manager.graph_base_url.rstrip("/")
+        native_response = await self._graph_request(
+            method, f"{base_url}{path}", body=body
+        )
+        native_response.raise_for_status()
+        return native_response
+
+    async def _usage_report(
+        self, function: str, period: str, params: dict | None
+    ) -> dict[str, Any]:
+        """Stream a Graph usage report, projected by ``params`` when given.
+
+        Graph redirects report requests to a pre-authenticated CSV download,
+        which is streamed without the Graph token. ``params`` may carry
+        :class:`~microsoft_agent.usage_reports.UsageReportQuery` options;
+        without any, the whole report is returned as ``content`` if it fits
+        in :data:`~microsoft_agent.usage_reports.MAX_USAGE_REPORT_CONTENT_BYTES`.
+        """
+        from microsoft_agent.graph_file_service import (
+            GraphFileServiceError,
+            validate_upload_url,
+        )
+        from microsoft_agent.usage_reports import (
+            MAX_USAGE_REPORT_BYTES,
+            MAX_USAGE_REPORT_CONTENT_BYTES,
+            USAGE_REPORT_PERIODS,
+            UsageReportQuery,
+            UsageReportReader,
+            summarize_usage_report,
+        )
+
+        options = {
+            name: value
+            for name, value in (params or {}).items()
+            if name in UsageReportQuery.model_fields
+        }
+        try:
+            if period not in USAGE_REPORT_PERIODS:
+                raise ValueError(
+                    f"period must be one of {', '.join(sorted(USAGE_REPORT_PERIODS))}"
+                )
+            query = UsageReportQuery.model_validate(options) if options else None
+            base_url = self.auth_manager.graph_base_url.rstrip("/")
+            native_response = await self._graph_request(
+                "GET", f"{base_url}/reports/{function}(period='{period}')"
+            )
+            if native_response.status_code not in {302, 303, 307}:
+                native_response.raise_for_status()
+                if query is None:
+                    if len(native_response.content) > MAX_USAGE_REPORT_CONTENT_BYTES:
+                        raise ValueError(
+                            "The usage report is too large to return whole; "
+                            "pass columns, where, or totals to summarize it"
+                        )
+                    return {"content": native_response.text}
+                reader = UsageReportReader(query)
+                reader.feed(native_response.content)
+                return reader.finish()
+            report_url = validate_upload_url(
+                native_response.headers.get("location"), "report"
+            )
+            async with self._download_transport().stream(
+                "GET",
+                report_url,
+                headers={"Accept": "text/csv"},
+                timeout=120.0,
+                max_bytes=(
+                    MAX_USAGE_REPORT_BYTES
+                    if query is not None
+                    else MAX_USAGE_REPORT_CONTENT_BYTES
+                ),
+            ) as response:
+                if response.status_code != 200:
+                    return {
+                        "error": "The usage report download failed",
+                        "status": response.status_code,
+                    }
+                if query is None:
+                    return {"content": (await response.read()).decode("utf-8-sig")}
+                return await summarize_usage_report(response, query)
+        except (ValueError, GraphFileServiceError) as exc:
+            return {"error": str(exc)}
+        except Exception as e:
+            print(f"Operation failed: {type(e).__name__}")
+            return {"error": "Operation failed"}
+
+    async def _fetch_next_page(self, next_link: str) -> dict[str, Any]:
+        """Fetch one ``@odata.nextLink`` page from the configured endpoint."""
+
+        url = validated_graph_next_link(next_link, self.auth_manager.graph_base_url)
+        native_response = await self._graph_request("GET", url)
+        native_response.raise_for_status()
+        return native_response.json()
+
+    async def iterate_list(
+        self,
+        list_method: Callable[..., Awaitable[dict[str, Any]]],
+        *args: Any,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        max_items: int | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[Any]:
+        """Stream members of a ``list_*`` collection across bounded pages."""
+
+        first_page = await list_method(*args, **kwargs)
+        if not isinstance(first_page, dict) or "error" in first_page:
+            raise RuntimeError("Microsoft Graph collection request failed")
+        async for item in iterate_graph_items(
+            first_page,
+            self._fetch_next_page,
+            max_pages=max_pages,
+            max_items=max_items,
+        ):
+            yield item
+
+    async def _send_batch(self, requests: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """POST up to 20 request entries to the Graph ``$batch`` endpoint."""
+
+        base_url = self.auth_manager.graph_base_url.rstrip("/")
+        native_response = await self._graph_request(
+            "POST",
+            f"{base_url}/$batch",
+            body=json.dumps({"requests": requests}).encode("utf-8"),
+        )
+        native_response.raise_for_status()
+        responses = native_response.json().get("responses")
+        if not isinstance(responses, list):
+            raise ValueError("Microsoft Graph returned an invalid batch response")
+        return responses
+
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[GraphBatch]:
+        """Group requests into ``$batch`` calls sent when the block exits.
+
+        Each queued request returns a future holding the Graph sub-response
+        (``status``, ``headers``, ``body``); requests beyond 20 are split into
+        further batches.
+        """
+
+        group = GraphBatch(self._send_batch)
+        try:
+            yield group
+        except BaseException:
+            await group.aclose(cancelled=True)
+            raise
+        await group.aclose()
+
+    async def batch_request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        body: Any = None,
+    ) -> dict[str, Any]:
+        """Send one relative Graph request, coalesced with concurrent callers.
+
+        Requests issued by concurrent tool calls of the same caller within a
+        short window share one ``$batch`` round trip. Throttled sub-requests
+        are retried through the shared retry policy, honouring their own
+        ``Retry-After``.
+        """
+
+        item = batch_request_item(method, url, headers=headers, body=body)
+        response = await get_retry_policy().send(
+            self._graph_retry_key(), item["method"], lambda: self._coalesced(item)
+        )
+        return response.payload
+
+    async def _coalesced(self, item: dict[str, Any]) -> BatchSubResponse:
+        # A batch is sent with the credentials of the request that opened its
+        # window, so requests only share one with the same caller.
+        identity = self._caller_identity()
+        coalescers: dict[Any, GraphBatchCoalescer] | None = getattr(
+            self, "_batch_coalescers", None
+        )
+        if coalescers is None:
+            coalescers = self._batch_coalescers = {}
+        coalescer = coalescers.get(identity)
+        if coalescer is None:
+            for stale in [key for key, value in coalescers.items() if value.idle]:
+                del coalescers[stale]
+            coalescer = coalescers[identity] = GraphBatchCoalescer(self._send_batch)
+        return BatchSubResponse(await coalescer.request(item))
+
+    async def _batched_read(
+        self,
+        action: str,
+        arguments: dict[str, Any],
+        *,
+        headers: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        """Read one allow-listed resource through the ``$batch`` coalescer.
+
+        Concurrent reads, such as one message or presence per id, share Graph
+        round trips instead of each sending its own request.
+        """
+
+        try:
+            response = await self.batch_request(
+                "GET", batch_read_url(action, arguments), headers=headers
+            )
+        except ValueError as exc:
+            return {"error": str(exc)}
+        except Exception as e:
+            print(f"Operation failed: {type(e).__name__}")
+            return {"error": "Operation failed"}
+        status = response.get("status")
+        if not isinstance(status, int) or status >= 400:
+            print(f"Operation failed: HTTP {status}")
+            return {"error": "Operation failed"}
+        body = response.get("body")
+        return body if isinstance(body, dict) else {}
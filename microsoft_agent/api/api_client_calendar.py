@@ -1,4 +1,5 @@
 from typing import Any
+from urllib.parse import quote
 
 from microsoft_agent.api._graph_models import (
     graph_model_from_dict,
@@ -52,58 +53,19 @@ async def get_calendar_event(
         timezone: str | None = None,
     ) -> dict[str, Any]:
         """Get calendar event."""
-        from kiota_abstractions.native_response_handler import NativeResponseHandler
-        from kiota_http.middleware.options import ResponseHandlerOption
-        from msgraph.generated.users.item.events.item.event_item_request_builder import (
-            EventItemRequestBuilder,
+        headers = {"Prefer": f'outlook.timezone="{timezone}"'} if timezone else None
+        return await self._batched_read(
+            "get_calendar_event",
+            {"event_id": event_id, "params": params},
+            headers=headers,
         )
 
-        try:
-            query_params = (
-                EventItemRequestBuilder.EventItemRequestBuilderGetQueryParameters()
-            )
-            if params:
-                if "$select" in params:
-                    query_params.select = params["$select"].split(",")
-
-            request_config = (
-                EventItemRequestBuilder.EventItemRequestBuilderGetRequestConfiguration(
-                    query_parameters=query_params,
-                    options=[ResponseHandlerOption(NativeResponseHandler())],
-                )
-            )
-            if timezone:
-                request_config.headers.add("Prefer", f'outlook.timezone="{timezone}"')
-
-            native_response = await self.client.me.events.by_event_id(event_id).get(
-                request_configuration=request_config
-            )
-            native_response.raise_for_status()
-            return native_response.json()
-        except Exception as e:
-            print(f"Operation failed: {type(e).__name__}")
-            return {"error": "Operation failed"}
-
     async def create_calendar_event(
         self, data: dict[str, Any], params: dict | None = None
     ) -> dict[str, Any]:
         """Create calendar event."""
-        from kiota_abstractions.native_response_handler import NativeResponseHandler
-        from kiota_http.middleware.options import ResponseHandlerOption
-        from msgraph.generated.models.event import Event
-
         try:
-            event = graph_model_from_dict(data, Event)
-
-            request_config = self.client.me.events.to_post_request_configuration()
-            request_config.options.append(
-                ResponseHandlerOption(NativeResponseHandler())
-            )
-
-            native_response = await self.client.me.events.post(
-                event, request_configuration=request_config
-            )
-            native_response.raise_for_status()
+            native_response = await self._graph_json_request("POST", "/me/events", data)
             return native_response.json()
         except Exception as e:
             print(f"Operation failed: {type(e).__name__}")
@@ -113,24 +75,10 @@ async def update_calendar_event(
         self, event_id: str, data: dict[str, Any], params: dict | None = None
     ) -> dict[str, Any]:
         """Update calendar event."""
-        from kiota_abstractions.native_response_handler import NativeResponseHandler
-        from kiota_http.middleware.options import ResponseHandlerOption
-        from msgraph.generated.models.event import Event
-
         try:
-            event = graph_model_from_dict(data, Event)
-
-            request_config = self.client.me.events.by_event_id(
-                event_id
-            ).to_patch_request_configuration()
-            request_config.options.append(
-                ResponseHandlerOption(NativeResponseHandler())
+            native_response = await self._graph_json_request(
+                "PATCH", f"/me/events/{quote(str(event_id), safe='')}", data
             )
-
-            native_response = await self.client.me.events.by_event_id(event_id).patch(
-                event, request_configuration=request_config
-            )
-            native_response.raise_for_status()
             return native_response.json()
         except Exception as e:
             print(f"Operation failed: {type(e).__name__}")
@@ -301,24 +249,12 @@ async def create_specific_calendar_event(
         self, calendar_id: str, data: dict[str, Any], params: dict | None = None
     ) -> dict[str, Any]:
         """Create specific calendar event."""
-        from kiota_abstractions.native_response_handler import NativeResponseHandler
-        from kiota_http.middleware.options import ResponseHandlerOption
-        from msgraph.generated.models.event import Event
-
         try:
-            event = graph_model_from_dict(data, Event)
-
-            request_config = self.client.me.calendars.by_calendar_id(
-                calendar_id
-            ).events.to_post_request_configuration()
-            request_config.options.append(
-                ResponseHandlerOption(NativeResponseHandler())
+            native_response = await self._graph_json_request(
+                "POST",
+                f"/me/calendars/{quote(str(calendar_id), safe='')}/events",
+                data,
             )
-
-            native_response = await self.client.me.calendars.by_calendar_id(
-                calendar_id
-            ).events.post(event, request_configuration=request_config)
-            native_response.raise_for_status()
             return native_response.json()
         except Exception as e:
             print(f"Operation failed: {type(e).__name__}")
@@ -332,28 +268,13 @@ async def update_specific_calendar_event(
         params: dict | None = None,
     ) -> dict[str, Any]:
         """Update specific calendar event."""
-        from kiota_abstractions.native_response_handler import NativeResponseHandler
-        from kiota_http.middleware.options import ResponseHandlerOption
-        from msgraph.generated.models.event import Event
-
         try:
-            event = graph_model_from_dict(data, Event)
-
-            request_config = (
-                self.client.me.calendars.by_calendar_id(calendar_id)
-                .events.by_event_id(event_id)
-                .to_patch_request_configuration()
+            native_response = await self._graph_json_request(
+                "PATCH",
+                f"/me/calendars/{quote(str(calendar_id), safe='')}"
+                f"/events/{quote(str(event_id), safe='')}",
+                data,
             )
-            request_config.options.append(
-                ResponseHandlerOption(NativeResponseHandler())
-            )
-
-            native_response = (
-                await self.client.me.calendars.by_calendar_id(calendar_id)
-                .events.by_event_id(event_id)
-                .patch(event, request_configuration=request_config)
-            )
-            native_response.raise_for_status()
             return native_response.json()
         except Exception as e:
             print(f"Operation failed: {type(e).__name__}")
@@ -426,25 +347,9 @@ async def get_outlook_contact(
         self, contact_id: str, params: dict | None = None
     ) -> dict[str, Any]:
         """Get Outlook contact."""
-        from kiota_abstractions.native_response_handler import NativeResponseHandler
-        from kiota_http.middleware.options import ResponseHandlerOption
-
-        try:
-            request_config = self.client.me.contacts.by_contact_id(
-                contact_id
-            ).to_get_request_configuration()
-            request_config.options.append(
-                ResponseHandlerOption(NativeResponseHandler())
-            )
-
-            native_response = await self.client.me.contacts.by_contact_id(
-                contact_id
-            ).get(request_configuration=request_config)
-            native_response.raise_for_status()
-            return native_response.json()
-        except Exception as e:
-            print(f"Operation failed: {type(e).__name__}")
-            return {"error": "Operation failed"}
+        return await self._batched_read(
+            "get_outlook_contact", {"contact_id": contact_id, "params": params}
+        )
 
     async def create_outlook_contact(
         self, data: dict[str, Any], params: dict | None = None
@@ -116,25 +116,9 @@ async def get_team(
         self, team_id: str, params: dict | None = None
     ) -> dict[str, Any]:
         """Get team."""
-        from kiota_abstractions.native_response_handler import NativeResponseHandler
-        from kiota_http.middleware.options import ResponseHandlerOption
-
-        try:
-            request_config = self.client.teams.by_team_id(
-                team_id
-            ).to_get_request_configuration()
-            request_config.options.append(
-                ResponseHandlerOption(NativeResponseHandler())
-            )
-
-            native_response = await self.client.teams.by_team_id(team_id).get(
-                request_configuration=request_config
-            )
-            native_response.raise_for_status()
-            return native_response.json()
-        except Exception as e:
-            print(f"Operation failed: {type(e).__name__}")
-            return {"error": "Operation failed"}
+        return await self._batched_read(
+            "get_team", {"team_id": team_id, "params": params}
+        )
 
     async def list_team_channels(
         self, team_id: str, params: dict | None = None
@@ -258,24 +242,9 @@ async def get_group(
         self, group_id: str, params: dict | None = None
     ) -> dict[str, Any]:
         """Get a specific group."""
-        from kiota_abstractions.native_response_handler import NativeResponseHandler
-        from kiota_http.middleware.options import ResponseHandlerOption
-
-        try:
-            request_config = self.client.groups.by_group_id(
-                group_id
-            ).to_get_request_configuration()
-            request_config.options.append(
-                ResponseHandlerOption(NativeResponseHandler())
-            )
-            native_response = await self.client.groups.by_group_id(group_id).get(
-                request_configuration=request_config
-            )
-            native_response.raise_for_status()
-            return native_response.json()
-        except Exception as e:
-            print(f"Operation failed: {type(e).__name__}")
-            return {"error": "Operation failed"}
+        return await self._batched_read(
+            "get_group", {"group_id": group_id, "params": params}
+        )
 
     async def create_group(
         self, data: dict[str, Any], params: dict | None = None
@@ -503,24 +472,9 @@ async def get_presence(
         self, user_id: str, params: dict | None = None
     ) -> dict[str, Any]:
         """Get presence for a specific user."""
-        from kiota_abstractions.native_response_handler import NativeResponseHandler
-        from kiota_http.middleware.options import ResponseHandlerOption
-
-        try:
-            request_config = self.client.communications.presences.by_presence_id(
-                user_id
-            ).to_get_request_configuration()
-            request_config.options.append(
-                ResponseHandlerOption(NativeResponseHandler())
-            )
-            native_response = await self.client.communications.presences.by_presence_id(
-                user_id
-            ).get(request_configuration=request_config)
-            native_response.raise_for_status()
-            return native_response.json()
-        except Exception as e:
-            print(f"Operation failed: {type(e).__name__}")
-            return {"error": "Operation failed"}
+        return await self._batched_read(
+            "get_presence", {"user_id": user_id, "params": params}
+        )
 
     async def get_my_presence(self, params: dict | None = None) -> dict[str, Any]:
         """Get current user's presence."""
@@ -545,53 +499,15 @@ async def get_office365_active_users(
         self, period: str = "D7", params: dict | None = None
     ) -> dict[str, Any]:
         """Get Office 365 active user detail report."""
-        from kiota_abstractions.native_response_handler import NativeResponseHandler
-        from kiota_http.middleware.options import ResponseHandlerOption
-
-        try:
-            request_config = (
-                self.client.reports.get_office365_active_user_detail_with_period(
-                    period
-                ).to_get_request_configuration()
-            )
-            request_config.options.append(
-                ResponseHandlerOption(NativeResponseHandler())
-            )
-            native_response = (
-                await self.client.reports.get_office365_active_user_detail_with_period(
-                    period
-                ).get(request_configuration=request_config)
-            )
-            native_response.raise_for_status()
-            return {"content": native_response.text()}
-        except Exception as e:
-            print(f"Operation failed: {type(e).__name__}")
-            return {"error": "Operation failed"}
+        return await self._usage_report("getOffice365ActiveUserDetail", period, params)
 
     async def get_teams_user_activity(
         self, period: str = "D7", params: dict | None = None
     ) -> dict[str, Any]:
         """Get Teams user activity detail report."""
-        from kiota_abstractions.native_response_handler import NativeResponseHandler
-        from kiota_http.middleware.options import ResponseHandlerOption
-
-        try:
-            request_config = (
-                self.client.reports.get_teams_user_activity_user_detail_with_period(
-                    period
-                ).to_get_request_configuration()
-            )
-            request_config.options.append(
-                ResponseHandlerOption(NativeResponseHandler())
-            )
-            native_response = await self.client.reports.get_teams_user_activity_user_detail_with_period(
-                period
-            ).get(request_configuration=request_config)
-            native_response.raise_for_status()
-            return {"content": native_response.text()}
-        except Exception as e:
-            print(f"Operation failed: {type(e).__name__}")
-            return {"error": "Operation failed"}
+        return await self._usage_report(
+            "getTeamsUserActivityUserDetail", period, params
+        )
 
     async def list_risky_users(self, params: dict | None = None) -> dict[str, Any]:
         """List risky users."""
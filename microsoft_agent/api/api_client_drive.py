@@ -117,6 +117,75 @@ async def download_onedrive_file_content(
             print(f"Operation failed: {type(e).__name__}")
             return {"error": "Operation failed"}
 
+    async def download_onedrive_file_to_artifact(
+        self,
+        drive_id: str,
+        driveItem_id: str,
+        destination_path: str,
+        overwrite: bool = False,
+        max_concurrent_ranges: int = 4,
+    ) -> dict[str, Any]:
+        """Stream file content into the artifact root and return its local path."""
+        from pathlib import Path
+        from urllib.parse import quote
+
+        from microsoft_agent.document_service import DocumentService
+        from microsoft_agent.graph_file_service import DriveRangeDownloader
+        from microsoft_agent.integration_config import get_integration_settings
+
+        documents = get_integration_settings().documents
+        if documents.artifact_root is None:
+            return {"error": "Downloads require MICROSOFT_DOCUMENT_ARTIFACT_ROOT"}
+        try:
+            destination = DocumentService(
+                documents.artifact_root
+            ).prepare_artifact_path(Path(destination_path), overwrite=overwrite)
+            base_url = self.auth_manager.graph_base_url.rstrip("/")
+            native_response = await self._graph_request(
+                "GET",
+                f"{base_url}/drives/{quote(str(drive_id), safe='')}"
+                f"/items/{quote(str(driveItem_id), safe='')}"
+                "?$select=id,name,size,file,@microsoft.graph.downloadUrl",
+            )
+            if native_response.status_code >= 400:
+                return {
+                    "error": "Microsoft Graph rejected the drive item request",
+                    "status": native_response.status_code,
+                }
+            item = native_response.json()
+            size = item.get("size")
+            if "file" not in item or not isinstance(size, int) or size < 0:
+                return {"error": "The drive item is not a downloadable file"}
+            if size > documents.max_download_bytes:
+                return {"error": "The drive item exceeds the download size limit"}
+            downloader = DriveRangeDownloader(
+                self._download_transport(),
+                max_concurrent_ranges=max_concurrent_ranges,
+            )
+            downloaded = await downloader.download(
+                item.get("@microsoft.graph.downloadUrl"),
+                size,
+                destination,
+                overwrite=overwrite,
+            )
+        except (TypeError, ValueError, RuntimeError) as exc:
+            return {"error": str(exc)}
+        except FileExistsError:
+            return {"error": "The destination artifact already exists"}
+        except OSError as e:
+            # File-system errors name local paths, so only the type is logged.
+            print(f"Operation failed: {type(e).__name__}")
+            return {"error": "The artifact could not be written"}
+        except Exception as e:
+            print(f"Operation failed: {type(e).__name__}")
+            return {"error": "Operation failed"}
+        return {
+            "id": item.get("id"),
+            "name": item.get("name"),
+            "path": str(downloaded.path),
+            "size": downloaded.size,
+        }
+
     async def delete_onedrive_file(
         self, drive_id: str, driveItem_id: str, params: dict | None = None
     ) -> dict[str, Any]:
@@ -203,25 +272,9 @@ async def get_site(
         self, site_id: str, params: dict | None = None
     ) -> dict[str, Any]:
         """Get SharePoint site."""
-        from kiota_abstractions.native_response_handler import NativeResponseHandler
-        from kiota_http.middleware.options import ResponseHandlerOption
-
-        try:
-            request_config = self.client.sites.by_site_id(
-                site_id
-            ).to_get_request_configuration()
-            request_config.options.append(
-                ResponseHandlerOption(NativeResponseHandler())
-            )
-
-            native_response = await self.client.sites.by_site_id(site_id).get(
-                request_configuration=request_config
-            )
-            native_response.raise_for_status()
-            return native_response.json()
-        except Exception as e:
-            print(f"Operation failed: {type(e).__name__}")
-            return {"error": "Operation failed"}
+        return await self._batched_read(
+            "get_site", {"site_id": site_id, "params": params}
+        )
 
     async def list_site_drives(
         self, site_id: str, params: dict | None = None
@@ -610,51 +663,15 @@ async def get_sharepoint_activity_report(
         self, period: str = "D7", params: dict | None = None
     ) -> dict[str, Any]:
         """Get SharePoint activity user detail report."""
-        from kiota_abstractions.native_response_handler import NativeResponseHandler
-        from kiota_http.middleware.options import ResponseHandlerOption
-
-        try:
-            request_config = (
-                self.client.reports.get_share_point_activity_user_detail_with_period(
-                    period
-                ).to_get_request_configuration()
-            )
-            request_config.options.append(
-                ResponseHandlerOption(NativeResponseHandler())
-            )
-            native_response = await self.client.reports.get_share_point_activity_user_detail_with_period(
-                period
-            ).get(request_configuration=request_config)
-            native_response.raise_for_status()
-            return {"content": native_response.text()}
-        except Exception as e:
-            print(f"Operation failed: {type(e).__name__}")
-            return {"error": "Operation failed"}
+        return await self._usage_report(
+            "getSharePointActivityUserDetail", period, params
+        )
 
     async def get_onedrive_usage_report(
         self, period: str = "D7", params: dict | None = None
     ) -> dict[str, Any]:
         """Get OneDrive usage account detail report."""
-        from kiota_abstractions.native_response_handler import NativeResponseHandler
-        from kiota_http.middleware.options import ResponseHandlerOption
-
-        try:
-            request_config = (
-                self.client.reports.get_one_drive_usage_account_detail_with_period(
-                    period
-                ).to_get_request_configuration()
-            )
-            request_config.options.append(
-                ResponseHandlerOption(NativeResponseHandler())
-            )
-            native_response = await self.client.reports.get_one_drive_usage_account_detail_with_period(
-                period
-            ).get(request_configuration=request_config)
-            native_response.raise_for_status()
-            return {"content": native_response.text()}
-        except Exception as e:
-            print(f"Operation failed: {type(e).__name__}")
-            return {"error": "Operation failed"}
+        return await self._usage_report("getOneDriveUsageAccountDetail", period, params)
 
     async def list_permission_grant_policies(
         self, params: dict | None = None
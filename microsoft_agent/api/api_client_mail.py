@@ -1,4 +1,5 @@
 from typing import Any
+from urllib.parse import quote
 
 from microsoft_agent.api._graph_models import (
     chat_message_from_dict,
@@ -7,6 +8,17 @@
 from microsoft_agent.api.api_client_base import MicrosoftGraphApiBase
 
 
+def _send_mail_body(data: dict[str, Any]) -> dict[str, Any]:
+    """Return the ``sendMail`` action body with its documented defaults."""
+
+    if not isinstance(data, dict) or not isinstance(data.get("message"), dict):
+        raise ValueError("sendMail requires a message object")
+    return {
+        "message": data["message"],
+        "saveToSentItems": bool(data.get("saveToSentItems", True)),
+    }
+
+
 class MicrosoftGraphApiMail(MicrosoftGraphApiBase):
     async def list_mail_messages(self, params: dict | None = None) -> dict[str, Any]:
         """List mail messages."""
@@ -124,52 +136,18 @@ async def get_mail_message(
         self, message_id: str, params: dict | None = None
     ) -> dict[str, Any]:
         """Get a specific message."""
-        from kiota_abstractions.native_response_handler import NativeResponseHandler
-        from kiota_http.middleware.options import ResponseHandlerOption
-        from msgraph.generated.users.item.messages.item.message_item_request_builder import (
-            MessageItemRequestBuilder,
+        return await self._batched_read(
+            "get_mail_message", {"message_id": message_id, "params": params}
         )
 
-        query_params = (
-            MessageItemRequestBuilder.MessageItemRequestBuilderGetQueryParameters()
-        )
-        if params:
-            if "$select" in params:
-                query_params.select = params["$select"].split(",")
-
-        request_config = (
-            MessageItemRequestBuilder.MessageItemRequestBuilderGetRequestConfiguration(
-                query_parameters=query_params,
-                options=[ResponseHandlerOption(NativeResponseHandler())],
-            )
-        )
-        try:
-            native_response = await self.client.me.messages.by_message_id(
-                message_id
-            ).get(request_configuration=request_config)
-            native_response.raise_for_status()
-            return native_response.json()
-        except Exception as e:
-            print(f"Operation failed: {type(e).__name__}")
-            return {"error": "Operation failed"}
-
     async def send_mail(
         self, data: dict[str, Any], params: dict | None = None
     ) -> dict[str, Any]:
         """Send mail."""
-        from msgraph.generated.models.message import Message
-        from msgraph.generated.users.item.send_mail.send_mail_post_request_body import (
-            SendMailPostRequestBody,
-        )
-
         try:
-            request_body = SendMailPostRequestBody()
-            request_body.message = graph_model_from_dict(
-                data.get("message", {}), Message
+            await self._graph_json_request(
+                "POST", "/me/sendMail", _send_mail_body(data), required=("message",)
             )
-            request_body.save_to_sent_items = data.get("saveToSentItems", True)
-
-            await self.client.me.send_mail.post(request_body)
             return {"status": "success"}
         except Exception as e:
             print(f"Operation failed: {type(e).__name__}")
@@ -494,20 +472,13 @@ async def send_shared_mailbox_mail(
         self, user_id: str, data: dict[str, Any], params: dict | None = None
     ) -> dict[str, Any]:
         """Send mail from a shared mailbox."""
-        from msgraph.generated.models.message import Message
-        from msgraph.generated.users.item.send_mail.send_mail_post_request_body import (
-            SendMailPostRequestBody,
-        )
-
         try:
-            request_body = SendMailPostRequestBody()
-            request_body.message = graph_model_from_dict(
-                data.get("message", {}), Message
+            await self._graph_json_request(
+                "POST",
+                f"/users/{quote(str(user_id), safe='')}/sendMail",
+                _send_mail_body(data),
+                required=("message",),
             )
-            request_body.save_to_sent_items = data.get("saveToSentItems", True)
-
-            await self.client.users.by_user_id(user_id).send_mail.post(request_body)
-
             return {"status": "success"}
         except Exception as e:
             print(f"Operation failed: {type(e).__name__}")
@@ -806,53 +777,13 @@ async def get_email_activity_report(
         self, period: str = "D7", params: dict | None = None
     ) -> dict[str, Any]:
         """Get email activity user detail report."""
-        from kiota_abstractions.native_response_handler import NativeResponseHandler
-        from kiota_http.middleware.options import ResponseHandlerOption
-
-        try:
-            request_config = (
-                self.client.reports.get_email_activity_user_detail_with_period(
-                    period
-                ).to_get_request_configuration()
-            )
-            request_config.options.append(
-                ResponseHandlerOption(NativeResponseHandler())
-            )
-            native_response = (
-                await self.client.reports.get_email_activity_user_detail_with_period(
-                    period
-                ).get(request_configuration=request_config)
-            )
-            native_response.raise_for_status()
-            return {"content": native_response.text()}
-        except Exception as e:
-            print(f"Operation failed: {type(e).__name__}")
-            return {"error": "Operation failed"}
+        return await self._usage_report("getEmailActivityUserDetail", period, params)
 
     async def get_mailbox_usage_report(
         self, period: str = "D7", params: dict | None = None
     ) -> dict[str, Any]:
         """Get mailbox usage detail report."""
-        from kiota_abstractions.native_response_handler import NativeResponseHandler
-        from kiota_http.middleware.options import ResponseHandlerOption
-
-        try:
-            request_config = self.client.reports.get_mailbox_usage_detail_with_period(
-                period
-            ).to_get_request_configuration()
-            request_config.options.append(
-                ResponseHandlerOption(NativeResponseHandler())
-            )
-            native_response = (
-                await self.client.reports.get_mailbox_usage_detail_with_period(
-                    period
-                ).get(request_configuration=request_config)
-            )
-            native_response.raise_for_status()
-            return {"content": native_response.text()}
-        except Exception as e:
-            print(f"Operation failed: {type(e).__name__}")
-            return {"error": "Operation failed"}
+        return await self._usage_report("getMailboxUsageDetail", period, params)
 
     async def list_channel_message_replies(
         self,
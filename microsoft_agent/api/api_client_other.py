@@ -1,10 +1,18 @@
+import asyncio
 from typing import Any
+from urllib.parse import quote
 
+from microsoft_agent.api._batching import (
+    BATCH_READ_ACTIONS,
+    MAX_BATCH_ACTION_REQUESTS,
+    batch_read_url,
+)
 from microsoft_agent.api._graph_models import (
     decode_graph_base64,
     graph_model_from_dict,
 )
 from microsoft_agent.api.api_client_base import MicrosoftGraphApiBase
+from microsoft_agent.settings import get_settings
 
 
 class MicrosoftGraphApiOther(MicrosoftGraphApiBase):
@@ -39,28 +47,77 @@ async def get_me(self, params: dict | None = None) -> dict[str, Any]:
             print(f"Operation failed: {type(e).__name__}")
             return {"error": "Operation failed"}
 
+    async def get_batch(self, requests: list[dict[str, Any]]) -> dict[str, Any]:
+        """Run several allow-listed read actions through ``$batch`` round trips.
+
+        Each request names an ``action`` that may be batched and its
+        ``params``, exactly as the action's own tool would take them. Every
+        action must belong to an enabled tool group and pass the tool policy;
+        throttled sub-requests are retried, and responses are returned in
+        request order.
+        """
+        from microsoft_agent.tool_policy import MicrosoftToolPolicy
+
+        if not isinstance(requests, list) or not requests:
+            return {"error": "requests must be a non-empty list"}
+        if len(requests) > MAX_BATCH_ACTION_REQUESTS:
+            return {
+                "error": f"requests must contain at most {MAX_BATCH_ACTION_REQUESTS} entries"
+            }
+        settings = get_settings()
+        policy = getattr(self, "_batch_policy", None)
+        if policy is None or policy.settings is not settings:
+            policy = self._batch_policy = MicrosoftToolPolicy(settings)
+        try:
+            urls = []
+            for request in requests:
+                if not isinstance(request, dict):
+                    raise ValueError("Each batch request must be an object")
+                action = request.get("action")
+                read = (
+                    BATCH_READ_ACTIONS.get(action) if isinstance(action, str) else None
+                )
+                if read is None:
+                    raise ValueError(f"Action cannot be batched: {action}")
+                if not settings.tool_group_enabled(read.group):
+                    raise ValueError(f"Tool group '{read.group}' is not enabled")
+                decision = policy.evaluate(action)
+                if not decision.allowed:
+                    raise ValueError(
+                        f"Action '{action}' is disabled by policy: {decision.reason}"
+                    )
+                arguments = request.get("params") or {}
+                if not isinstance(arguments, dict):
+                    raise ValueError("Batch request params must be an object")
+                urls.append(batch_read_url(action, arguments))
+            results = await asyncio.gather(
+                *(self.batch_request("GET", url) for url in urls)
+            )
+            responses = []
+            for request, response in zip(requests, results, strict=True):
+                responses.append(
+                    {
+                        "id": request.get("id"),
+                        "status": response.get("status"),
+                        "headers": response.get("headers", {}),
+                        "body": response.get("body"),
+                    }
+                )
+            return {"responses": responses}
+        except ValueError as exc:
+            return {"error": str(exc)}
+        except Exception as e:
+            print(f"Operation failed: {type(e).__name__}")
+            return {"error": "Operation failed"}
+
     async def search_query(
         self, data: dict[str, Any], params: dict | None = None
     ) -> dict[str, Any]:
         """Search query."""
-        from kiota_abstractions.native_response_handler import NativeResponseHandler
-        from kiota_http.middleware.options import ResponseHandlerOption
-        from msgraph.generated.search.query.query_post_request_body import (
-            QueryPostRequestBody,
-        )
-
         try:
-            body = graph_model_from_dict(data, QueryPostRequestBody)
-
-            request_config = self.client.search.query.to_post_request_configuration()
-            request_config.options.append(
-                ResponseHandlerOption(NativeResponseHandler())
-            )
-
-            native_response = await self.client.search.query.post(
-                body, request_configuration=request_config
+            native_response = await self._graph_json_request(
+                "POST", "/search/query", data, required=("requests",)
             )
-            native_response.raise_for_status()
             return native_response.json()
         except Exception as e:
             print(f"Operation failed: {type(e).__name__}")
@@ -162,20 +219,18 @@ async def create_subscription(
         self, data: dict[str, Any], params: dict | None = None
     ) -> dict[str, Any]:
         """Create a subscription for change notifications."""
-        from kiota_abstractions.native_response_handler import NativeResponseHandler
-        from kiota_http.middleware.options import ResponseHandlerOption
-        from msgraph.generated.models.subscription import Subscription
-
         try:
-            subscription = graph_model_from_dict(data, Subscription)
-            request_config = self.client.subscriptions.to_post_request_configuration()
-            request_config.options.append(
-                ResponseHandlerOption(NativeResponseHandler())
-            )
-            native_response = await self.client.subscriptions.post(
-                subscription, request_configuration=request_config
+            native_response = await self._graph_json_request(
+                "POST",
+                "/subscriptions",
+                data,
+                required=(
+                    "changeType",
+                    "notificationUrl",
+                    "resource",
+                    "expirationDateTime",
+                ),
             )
-            native_response.raise_for_status()
             return native_response.json()
         except Exception as e:
             print(f"Operation failed: {type(e).__name__}")
@@ -185,22 +240,10 @@ async def update_subscription(
         self, subscription_id: str, data: dict[str, Any], params: dict | None = None
     ) -> dict[str, Any]:
         """Update/renew a subscription."""
-        from kiota_abstractions.native_response_handler import NativeResponseHandler
-        from kiota_http.middleware.options import ResponseHandlerOption
-        from msgraph.generated.models.subscription import Subscription
-
         try:
-            subscription = graph_model_from_dict(data, Subscription)
-            request_config = self.client.subscriptions.by_subscription_id(
-                subscription_id
-            ).to_patch_request_configuration()
-            request_config.options.append(
-                ResponseHandlerOption(NativeResponseHandler())
+            native_response = await self._graph_json_request(
+                "PATCH", f"/subscriptions/{quote(str(subscription_id), safe='')}", data
             )
-            native_response = await self.client.subscriptions.by_subscription_id(
-                subscription_id
-            ).patch(subscription, request_configuration=request_config)
-            native_response.raise_for_status()
             return native_response.json()
         except Exception as e:
             print(f"Operation failed: {type(e).__name__}")
@@ -0,0 +1,129 @@
+from typing import Any
+from urllib.parse import quote
+
+from microsoft_agent.api.api_client_base import MicrosoftGraphApiBase
+from microsoft_agent.delta_sync import (
+    DEFAULT_SYNC_MAX_PAGES,
+    DeltaResource,
+    DeltaSyncError,
+    get_delta_sync_engine,
+)
+from microsoft_agent.settings import get_settings
+
+_SYNC_QUERY_PARAMS = ("$select",)
+
+
+class MicrosoftGraphApiSync(MicrosoftGraphApiBase):
+    async def sync_mail_messages(
+        self,
+        folder_id: str = "inbox",
+        params: dict | None = None,
+        reset: bool = False,
+        max_pages: int = DEFAULT_SYNC_MAX_PAGES,
+    ) -> dict[str, Any]:
+        """Return mail folder messages changed since the last sync."""
+        return await self._sync_delta(
+            DeltaResource(
+                "mail_messages",
+                f"/me/mailFolders/{quote(str(folder_id), safe='')}/messages/delta",
+                self._sync_query(params),
+            ),
+            reset=reset,
+            max_pages=max_pages,
+        )
+
+    async def sync_calendar_events(
+        self,
+        start_datetime: str,
+        end_datetime: str,
+        params: dict | None = None,
+        reset: bool = False,
+        max_pages: int = DEFAULT_SYNC_MAX_PAGES,
+    ) -> dict[str, Any]:
+        """Return calendar view events changed since the last sync."""
+        query = (
+            ("startDateTime", str(start_datetime)),
+            ("endDateTime", str(end_datetime)),
+            *self._sync_query(params),
+        )
+        return await self._sync_delta(
+            DeltaResource("calendar_events", "/me/calendarView/delta", query),
+            reset=reset,
+            max_pages=max_pages,
+        )
+
+    async def sync_outlook_contacts(
+        self,
+        params: dict | None = None,
+        reset: bool = False,
+        max_pages: int = DEFAULT_SYNC_MAX_PAGES,
+    ) -> dict[str, Any]:
+        """Return personal contacts changed since the last sync."""
+        return await self._sync_delta(
+            DeltaResource("contacts", "/me/contacts/delta", self._sync_query(params)),
+            reset=reset,
+            max_pages=max_pages,
+        )
+
+    async def sync_users(
+        self,
+        params: dict | None = None,
+        reset: bool = False,
+        max_pages: int = DEFAULT_SYNC_MAX_PAGES,
+    ) -> dict[str, Any]:
+        """Return directory users changed since the last sync."""
+        return await self._sync_delta(
+            DeltaResource("users", "/users/delta", self._sync_query(params)),
+            reset=reset,
+            max_pages=max_pages,
+        )
+
+    async def sync_groups(
+        self,
+        params: dict | None = None,
+        reset: bool = False,
+        max_pages: int = DEFAULT_SYNC_MAX_PAGES,
+    ) -> dict[str, Any]:
+        """Return directory groups changed since the last sync."""
+        return await self._sync_delta(
+            DeltaResource("groups", "/groups/delta", self._sync_query(params)),
+            reset=reset,
+            max_pages=max_pages,
+        )
+
+    @staticmethod
+    def _sync_query(params: dict | None) -> tuple[tuple[str, str], ...]:
+        return tuple(
+            (name, str(params[name]))
+            for name in _SYNC_QUERY_PARAMS
+            if params and params.get(name)
+        )
+
+    async def _sync_delta(
+        self, resource: DeltaResource, *, reset: bool, max_pages: int
+    ) -> dict[str, Any]:
+        state_path = get_settings().delta_state_path
+        if state_path is None:
+            return {"error": "Delta sync requires MICROSOFT_DELTA_STATE_PATH"}
+        identity = self._durable_caller_identity()
+        if identity is None:
+            return {"error": "Delta sync requires an authenticated caller"}
+
+        async def fetch(url: str) -> tuple[int, dict[str, Any]]:
+            native_response = await self._graph_request("GET", url)
+            if native_response.status_code >= 400:
+                return native_response.status_code, {}
+            return native_response.status_code, native_response.json()
+
+        try:
+            engine = get_delta_sync_engine(state_path, self.auth_manager.graph_base_url)
+            return await engine.sync(
+                identity, resource, fetch, max_pages=max_pages, reset=reset
+            )
+        except ValueError as exc:
+            return {"error": str(exc)}
+        except DeltaSyncError as exc:
+            return {"error": str(exc), "status": exc.status_code}
+        except Exception as e:
+            print(f"Operation failed: {type(e).__name__}")
+            return {"error": "Operation failed"}
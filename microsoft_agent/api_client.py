@@ -10,6 +10,7 @@
 from microsoft_agent.api.api_client_drive import MicrosoftGraphApiDrive
 from microsoft_agent.api.api_client_mail import MicrosoftGraphApiMail
 from microsoft_agent.api.api_client_other import MicrosoftGraphApiOther
+from microsoft_agent.api.api_client_sync import MicrosoftGraphApiSync
 from microsoft_agent.api.api_client_system import MicrosoftGraphApiSystem
 
 
@@ -22,5 +23,6 @@ class MicrosoftGraphApi(
     MicrosoftGraphApiApps,
     MicrosoftGraphApiAdmin,
     MicrosoftGraphApiOther,
+    MicrosoftGraphApiSync,
 ):
     pass
@@ -4,6 +4,7 @@
 
 import atexit
 import base64
+import hashlib
 import json
 import logging
 import sys
@@ -24,6 +25,7 @@
     MicrosoftSettings,
     get_settings,
 )
+from microsoft_agent.token_cache import AccessTokenCache
 
 logger = logging.getLogger(__name__)
 
@@ -88,6 +90,15 @@ def _get_incoming_user_token() -> str | None:
         return None
 
 
+_CACHED_TOKEN_MODES = frozenset(
+    {
+        AuthenticationMode.APPLICATION,
+        AuthenticationMode.MANAGED_IDENTITY,
+        AuthenticationMode.WORKLOAD_IDENTITY,
+    }
+)
+
+
 class AuthManager:
     """Acquire and cache Microsoft tokens for one client and authority.
 
@@ -130,6 +141,7 @@ def __init__(
         self.graph_tls_profile = graph_tls_profile
         self.graph_tls_profile_ref = graph_tls_profile_ref
         self.token_cache = msal.SerializableTokenCache()
+        self.access_token_cache = AccessTokenCache()
         self.access_token: str | None = None
         self.selected_account_id: str | None = None
         self.secure_cache_available = True
@@ -308,12 +320,43 @@ def acquire_token_for_scopes(
         self._accept_interactive_result(result)
         return str(result["access_token"]) if result else None
 
+    def _access_token_cache_key(self, requested: Sequence[str]) -> tuple | None:
+        """Key for process-identity tokens; per-user tokens are never shared."""
+
+        if self.mode not in _CACHED_TOKEN_MODES:
+            return None
+        return (self.mode.value, tuple(sorted(requested)))
+
+    def cached_token(self, scopes: Sequence[str] | None = None) -> str | None:
+        """Return a cached process-identity token without acquiring one."""
+
+        requested = self._requested_scopes(scopes)
+        key = self._access_token_cache_key(requested)
+        if key is None:
+            return None
+        details = self.access_token_cache.lookup(
+            key, lambda: self._acquire_token_details(requested)
+        )
+        return str(details["access_token"]) if details else None
+
     def get_token_details(
         self, scopes: Sequence[str] | None = None
     ) -> dict[str, Any] | None:
-        """Return the full MSAL token result without prompting the user."""
+        """Return the full MSAL token result without prompting the user.
+
+        Application and workload-identity results are served from
+        :attr:`access_token_cache` and renewed ahead of expiry.
+        """
 
         requested = self._requested_scopes(scopes)
+        key = self._access_token_cache_key(requested)
+        if key is None:
+            return self._acquire_token_details(requested)
+        return self.access_token_cache.get(
+            key, lambda: self._acquire_token_details(requested)
+        )
+
+    def _acquire_token_details(self, requested: list[str]) -> dict[str, Any] | None:
         if self.mode is AuthenticationMode.EXTERNAL_TOKEN:
             token = (
                 self.external_token_provider() if self.external_token_provider else None
@@ -481,6 +524,7 @@ def logout(self) -> None:
                 self.msal_app.remove_account(account)
         self.selected_account_id = None
         self.access_token = None
+        self.access_token_cache.invalidate()
         try:
             keyring.delete_password(SERVICE_NAME, TOKEN_CACHE_ACCOUNT)
             keyring.delete_password(SERVICE_NAME, SELECTED_ACCOUNT_KEY)
@@ -517,6 +561,53 @@ def remove_account(self, account_id: str) -> bool:
         return False
 
 
+def caller_identity(manager: AuthManager) -> tuple[str, str]:
+    """Return the tenant and account that requests through ``manager`` act for.
+
+    One manager serves every caller of a configuration, so per-user modes are
+    told apart by the selected account or a digest of the incoming assertion.
+    Shared read paths key on this value and never on the token itself.
+    """
+
+    tenant = str(
+        getattr(manager, "expected_tenant_id", None)
+        or getattr(manager, "authority", "")
+    )
+    mode = getattr(manager, "mode", None)
+    if mode is AuthenticationMode.DELEGATED:
+        return tenant, f"account:{manager.selected_account_id or ''}"
+    if mode in {AuthenticationMode.ON_BEHALF_OF, AuthenticationMode.EXTERNAL_TOKEN}:
+        provider = manager.external_token_provider
+        assertion = (provider() if provider else None) or ""
+        digest = hashlib.sha256(assertion.encode("utf-8")).hexdigest()
+        return tenant, f"assertion:{digest}"
+    return tenant, f"mode:{getattr(mode, 'value', mode)}"
+
+
+def durable_caller_identity(manager: AuthManager) -> tuple[str, str] | None:
+    """Return a caller key that survives token rotation, or ``None``.
+
+    :func:`caller_identity` digests the incoming assertion for per-user token
+    modes, which changes with every token. State kept across calls, such as
+    delta links, is keyed by the assertion's ``tid`` and ``oid`` claims
+    instead. The claims are not verified here; Graph still authorizes every
+    request made with the stored state.
+    """
+
+    mode = getattr(manager, "mode", None)
+    if mode not in {AuthenticationMode.ON_BEHALF_OF, AuthenticationMode.EXTERNAL_TOKEN}:
+        return caller_identity(manager)
+    provider = manager.external_token_provider
+    claims = _jwt_claims((provider() if provider else None) or "")
+    tenant = claims.get("tid") if claims else None
+    account = claims.get("oid") if claims else None
+    if not isinstance(tenant, str) or not isinstance(account, str):
+        return None
+    if not tenant or not account:
+        return None
+    return tenant, f"object:{account}"
+
+
 def _certificate_credential(settings: MicrosoftSettings) -> dict[str, Any]:
     path = Path(settings.client_certificate_path or "")
     private_key = path.read_text(encoding="utf-8")
@@ -607,14 +698,10 @@ def build_auth_manager(settings: MicrosoftSettings | None = None) -> AuthManager
 _auth_fingerprint: tuple[Any, ...] | None = None
 
 
-def get_auth_manager(
-    settings: MicrosoftSettings | None = None, *, refresh: bool = False
-) -> AuthManager:
-    """Return a cached authentication manager for the active configuration."""
+def _settings_fingerprint(config: MicrosoftSettings) -> tuple[Any, ...]:
+    """Return the identity and transport values that require a new manager."""
 
-    global _auth_fingerprint, _auth_manager
-    config = settings or get_settings()
-    fingerprint = (
+    return (
         config.tenant_id,
         config.client_id,
         config.authentication_mode,
@@ -629,12 +716,35 @@ def get_auth_manager(
         config.graph_tls_profile,
         config.graph_tls_profile_ref,
     )
+
+
+def get_auth_manager(
+    settings: MicrosoftSettings | None = None, *, refresh: bool = False
+) -> AuthManager:
+    """Return a cached authentication manager for the active configuration."""
+
+    global _auth_fingerprint, _auth_manager
+    config = settings or get_settings()
+    fingerprint = _settings_fingerprint(config)
     if refresh or _auth_manager is None or fingerprint != _auth_fingerprint:
         _auth_manager = build_auth_manager(config)
         _auth_fingerprint = fingerprint
     return _auth_manager
 
 
+def get_auth_fingerprint() -> tuple[Any, ...] | None:
+    """Return the configuration fingerprint of the cached manager, if any."""
+
+    return _auth_fingerprint
+
+
+def access_token_cache_stats() -> dict[str, Any] | None:
+    """Return the cached manager's access-token counters, if one was built."""
+
+    manager = _auth_manager
+    return None if manager is None else manager.access_token_cache.stats()
+
+
 def clear_auth_manager_cache() -> None:
     """Discard the process-wide manager; intended for tests and config reloads."""
 
@@ -678,10 +788,13 @@ async def get_client() -> Any:
 
 
 async def get_client_dependency() -> AsyncIterator[Any]:
-    """Yield one request-scoped Graph client and always release its transport."""
+    """Yield a pooled Graph client and return it to the pool after the call."""
+
+    from microsoft_agent.graph_client_pool import get_graph_client_pool
 
-    client = await get_client()
+    pool = get_graph_client_pool()
+    client = await pool.acquire()
     try:
         yield client
     finally:
-        await client.close()
+        await pool.release(client)
@@ -0,0 +1,283 @@
+"""Incremental Microsoft Graph delta-query synchronization.
+
+Recurring mailbox, calendar, contact, and directory scans re-read every item
+although only a handful changed. Graph delta queries return only the
+changes since an opaque ``@odata.deltaLink``. :class:`DeltaSyncEngine` follows
+a delta round to its next ``deltaLink`` and stores that link per caller and
+resource in a local SQLite state file (:class:`DeltaStateStore`). The next
+sync then returns only what changed.
+
+A bounded round that stops before the ``deltaLink`` stores the pending
+``nextLink`` instead and resumes from it. A ``410 Gone`` reply means Graph
+discarded the sync state; the engine then restarts with a full round.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import weakref
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlencode
+
+from microsoft_agent.api._pagination import validated_graph_next_link
+
+DEFAULT_SYNC_MAX_PAGES = 20
+MAX_SYNC_PAGES_LIMIT = 200
+# Graph expires unused delta tokens well within this window; older state
+# would only earn a 410 and a full round, so it is pruned.
+DELTA_STATE_RETENTION = timedelta(days=30)
+
+DeltaFetcher = Callable[[str], Awaitable[tuple[int, dict[str, Any]]]]
+
+
+class DeltaStateStore:
+    """Durable per-caller delta links in a local SQLite file.
+
+    Caller identities are stored as SHA-256 digests; resource keys combine a
+    resource name with its canonical query.
+    """
+
+    def __init__(self, database_path: str | os.PathLike[str]) -> None:
+        self.path = Path(database_path)
+        if str(self.path) == ":memory:":
+            raise ValueError("Delta sync state must use a durable SQLite file")
+        if self.path.is_symlink():
+            raise ValueError("The delta sync SQLite file cannot be a symlink")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._initialize()
+
+    async def load(self, identity: Hashable, resource: str) -> tuple[str, str] | None:
+        """Return the stored ``(kind, link)`` for a caller and resource."""
+
+        return await asyncio.to_thread(self._load_sync, identity, resource)
+
+    async def save(
+        self, identity: Hashable, resource: str, kind: str, link: str
+    ) -> None:
+        """Store a ``delta`` or pending ``next`` link."""
+
+        await asyncio.to_thread(self._save_sync, identity, resource, kind, link)
+
+    async def reset(self, identity: Hashable, resource: str) -> None:
+        """Forget the stored link so the next sync starts a full round."""
+
+        await asyncio.to_thread(self._reset_sync, identity, resource)
+
+    @staticmethod
+    def _identity_key(identity: Hashable) -> str:
+        return hashlib.sha256(repr(identity).encode("utf-8")).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+        connection.execute("PRAGMA busy_timeout=10000")
+        return connection
+
+    def _initialize(self) -> None:
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS delta_state (
+                    identity TEXT NOT NULL,
+                    resource TEXT NOT NULL,
+                    kind TEXT NOT NULL CHECK (kind IN ('delta', 'next')),
+                    link TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    PRIMARY KEY (identity, resource)
+                )
+                """
+            )
+        try:
+            if os.name != "nt":
+                self.path.chmod(0o600)
+        except OSError:
+            pass
+
+    def _load_sync(self, identity: Hashable, resource: str) -> tuple[str, str] | None:
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT kind, link FROM delta_state WHERE identity=? AND resource=?",
+                (self._identity_key(identity), resource),
+            ).fetchone()
+        return (str(row[0]), str(row[1])) if row else None
+
+    def _save_sync(
+        self, identity: Hashable, resource: str, kind: str, link: str
+    ) -> None:
+        now = datetime.now(UTC)
+        with self._connect() as connection:
+            connection.execute(
+                "DELETE FROM delta_state WHERE updated_at < ?",
+                ((now - DELTA_STATE_RETENTION).isoformat(),),
+            )
+            connection.execute(
+                """
+                INSERT INTO delta_state (identity, resource, kind, link, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (identity, resource) DO UPDATE SET
+                    kind=excluded.kind,
+                    link=excluded.link,
+                    updated_at=excluded.updated_at
+                """,
+                (
+                    self._identity_key(identity),
+                    resource,
+                    kind,
+                    link,
+                    now.isoformat(),
+                ),
+            )
+
+    def _reset_sync(self, identity: Hashable, resource: str) -> None:
+        with self._connect() as connection:
+            connection.execute(
+                "DELETE FROM delta_state WHERE identity=? AND resource=?",
+                (self._identity_key(identity), resource),
+            )
+
+
+@dataclass(frozen=True)
+class DeltaResource:
+    """One delta-capable Graph collection and its initial request."""
+
+    name: str
+    path: str
+    query: tuple[tuple[str, str], ...] = ()
+
+    @property
+    def key(self) -> str:
+        """Stable state key for the collection and its initial query."""
+
+        return f"{self.name}:{self.path}?" + json.dumps(sorted(self.query))
+
+
+class DeltaSyncEngine:
+    """Follow delta rounds and persist their continuation state."""
+
+    def __init__(self, store: DeltaStateStore, graph_base_url: str) -> None:
+        self.store = store
+        self.graph_base_url = graph_base_url.rstrip("/")
+        # A lock lives only while a sync holds or awaits it, so idle callers
+        # and resources leave no entry behind.
+        self._locks: weakref.WeakValueDictionary[tuple[Hashable, str], asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
+
+    async def sync(
+        self,
+        identity: Hashable,
+        resource: DeltaResource,
+        fetch: DeltaFetcher,
+        *,
+        max_pages: int = DEFAULT_SYNC_MAX_PAGES,
+        reset: bool = False,
+    ) -> dict[str, Any]:
+        """Return the changes since the last sync of ``resource``.
+
+        The first sync, or one with ``reset=True``, returns the full
+        collection. ``partial`` is set when ``max_pages`` stopped the round;
+        the next call resumes where it stopped.
+        """
+
+        if not isinstance(max_pages, int) or not 1 <= max_pages <= MAX_SYNC_PAGES_LIMIT:
+            raise ValueError(f"max_pages must be between 1 and {MAX_SYNC_PAGES_LIMIT}")
+        lock = self._locks.get((identity, resource.key))
+        if lock is None:
+            lock = self._locks[(identity, resource.key)] = asyncio.Lock()
+        async with lock:
+            if reset:
+                await self.store.reset(identity, resource.key)
+            state = await self.store.load(identity, resource.key)
+            initial = state is None
+            url = self._initial_url(resource) if state is None else state[1]
+            status, page = await fetch(
+                validated_graph_next_link(url, self.graph_base_url)
+            )
+            if status == 410 and state is not None:
+                # Graph discarded the sync state; restart with a full round.
+                await self.store.reset(identity, resource.key)
+                initial = True
+                status, page = await fetch(self._initial_url(resource))
+            changes: list[Any] = []
+            pages = 0
+            while True:
+                if status >= 400:
+                    raise DeltaSyncError(status)
+                values = page.get("value")
+                if not isinstance(values, list):
+                    raise ValueError("Microsoft Graph returned an invalid delta page")
+                changes.extend(values)
+                pages += 1
+                delta_link = page.get("@odata.deltaLink")
+                next_link = page.get("@odata.nextLink")
+                if delta_link:
+                    await self.store.save(
+                        identity,
+                        resource.key,
+                        "delta",
+                        validated_graph_next_link(delta_link, self.graph_base_url),
+                    )
+                    break
+                if not next_link:
+                    raise ValueError("Microsoft Graph delta round ended without a link")
+                next_link = validated_graph_next_link(next_link, self.graph_base_url)
+                if pages >= max_pages:
+                    await self.store.save(identity, resource.key, "next", next_link)
+                    break
+                status, page = await fetch(next_link)
+        return {
+            "value": changes,
+            "removed": [
+                item.get("id")
+                for item in changes
+                if isinstance(item, dict) and "@removed" in item
+            ],
+            "pagesFetched": pages,
+            "initial": initial,
+            "partial": not delta_link,
+        }
+
+    def _initial_url(self, resource: DeltaResource) -> str:
+        query = f"?{urlencode(resource.query)}" if resource.query else ""
+        return f"{self.graph_base_url}{resource.path}{query}"
+
+
+class DeltaSyncError(RuntimeError):
+    """Graph rejected a delta request with an HTTP error status."""
+
+    def __init__(self, status_code: int) -> None:
+        super().__init__(f"Microsoft Graph delta request failed with {status_code}")
+        self.status_code = status_code
+
+
+_engines: dict[tuple[Path, str], DeltaSyncEngine] = {}
+
+
+def get_delta_sync_engine(database_path: Path, graph_base_url: str) -> DeltaSyncEngine:
+    """Return the process-wide engine for one state file and Graph endpoint."""
+
+    key = (Path(database_path), graph_base_url)
+    engine = _engines.get(key)
+    if engine is None:
+        engine = _engines.setdefault(
+            key, DeltaSyncEngine(DeltaStateStore(database_path), graph_base_url)
+        )
+    return engine
+
+
+__all__ = [
+    "DEFAULT_SYNC_MAX_PAGES",
+    "DeltaResource",
+    "DeltaStateStore",
+    "DeltaSyncEngine",
+    "DeltaSyncError",
+    "get_delta_sync_engine",
+]
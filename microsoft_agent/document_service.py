@@ -10,12 +10,16 @@
 
 import asyncio
 import base64
+import copy
 import hashlib
 import os
 import re
 import tempfile
+import threading
 import zipfile
 from bisect import bisect_right
+from collections import OrderedDict
+from collections.abc import Callable
 from enum import StrEnum
 from io import BytesIO
 from pathlib import Path, PurePosixPath
@@ -343,8 +347,14 @@ def __init__(
         max_template_entries: int = 10_000,
         allow_external_relationships: bool = False,
         allow_embedded_objects: bool = False,
+        max_cached_templates: int = 8,
     ) -> None:
-        """Configure path roots, package limits, and active-content policy."""
+        """Configure path roots, package limits, and active-content policy.
+
+        Up to ``max_cached_templates`` validated templates are kept parsed,
+        keyed by path, size, mtime, and SHA-256; each document starts from a
+        deep copy.  ``0`` disables the cache.
+        """
         if (
             min(
                 max_template_bytes,
@@ -355,6 +365,8 @@ def __init__(
             <= 0
         ):
             raise ValueError("document service size and entry limits must be positive")
+        if max_cached_templates < 0:
+            raise ValueError("max_cached_templates must not be negative")
         self.artifact_root = Path(artifact_root).expanduser().resolve(strict=False)
         template_base = template_root if template_root is not None else artifact_root
         self.template_root = Path(template_base).expanduser().resolve(strict=False)
@@ -364,6 +376,9 @@ def __init__(
         self.max_template_entries = max_template_entries
         self.allow_external_relationships = allow_external_relationships
         self.allow_embedded_objects = allow_embedded_objects
+        self.max_cached_templates = max_cached_templates
+        self._templates: OrderedDict[tuple[Any, ...], Any] = OrderedDict()
+        self._templates_lock = threading.Lock()
 
     async def generate_word_document(
         self, request: WordDocumentRequest
@@ -387,9 +402,11 @@ async def generate_powerpoint_presentation(
 
     def _generate_word_sync(self, request: WordDocumentRequest) -> GeneratedArtifact:
         try:
-            template = self._prepare_template(request.template_path, ".docx")
+            template = self._load_template(
+                request.template_path, ".docx", _DocxDocument
+            )
             output_path = self._prepare_output(request.artifact, ".docx")
-            document = _DocxDocument(str(template)) if template else _DocxDocument()
+            document = template if template is not None else _DocxDocument()
             replacement_plan = _replacement_plan(request.replacements)
             if replacement_plan is not None:
                 _replace_word_document(document, replacement_plan)
@@ -414,12 +431,12 @@ def _generate_powerpoint_sync(
         self, request: PowerPointPresentationRequest
     ) -> GeneratedArtifact:
         try:
-            template = self._prepare_template(request.template_path, ".pptx")
+            template = self._load_template(
+                request.template_path, ".pptx", _PowerPointPresentation
+            )
             output_path = self._prepare_output(request.artifact, ".pptx")
             presentation = (
-                _PowerPointPresentation(str(template))
-                if template
-                else _PowerPointPresentation()
+                template if template is not None else _PowerPointPresentation()
             )
             replacement_plan = _replacement_plan(request.replacements)
             if replacement_plan is not None:
@@ -443,7 +460,10 @@ def _generate_powerpoint_sync(
                 "PowerPoint presentation generation failed"
             ) from exc
 
-    def _prepare_template(self, requested: Path | None, extension: str) -> Path | None:
+    def _load_template(
+        self, requested: Path | None, extension: str, loader: Callable[[Any], Any]
+    ) -> Any | None:
+        """Return a private copy of a validated, parsed template."""
         if requested is None:
             return None
         template = self._contained_path(
@@ -453,20 +473,58 @@ def _prepare_template(self, requested: Path | None, extension: str) -> Path | No
             raise DocumentTemplateError("the requested template is not a regular file")
         if template.suffix.lower() != extension:
             raise DocumentTemplateError(f"templates must use the {extension} extension")
-        self._validate_office_package(template)
-        return template
+        # Validation and parsing use the same bytes, so the file cannot be
+        # swapped between the two.
+        content, modified_ns = self._read_template(template)
+        key = (
+            template,
+            len(content),
+            modified_ns,
+            hashlib.sha256(content).hexdigest(),
+        )
+        with self._templates_lock:
+            pristine = self._templates.get(key)
+            if pristine is not None:
+                self._templates.move_to_end(key)
+        if pristine is None:
+            self._validate_office_archive(content)
+            pristine = loader(BytesIO(content))
+            if self.max_cached_templates:
+                with self._templates_lock:
+                    self._templates[key] = pristine
+                    while len(self._templates) > self.max_cached_templates:
+                        self._templates.popitem(last=False)
+        return copy.deepcopy(pristine)
+
+    def _read_template(self, template: Path) -> tuple[bytes, int]:
+        try:
+            info = template.stat()
+            if info.st_size > self.max_template_bytes:
+                raise DocumentTemplateError(
+                    "template exceeds the compressed size limit"
+                )
+            content = template.read_bytes()
+        except OSError as exc:
+            raise DocumentTemplateError("template could not be read") from exc
+        if len(content) > self.max_template_bytes:
+            raise DocumentTemplateError("template exceeds the compressed size limit")
+        return content, info.st_mtime_ns
 
-    def _prepare_output(self, options: ArtifactOptions, extension: str) -> Path | None:
-        if options.delivery is not ArtifactDelivery.FILE:
-            return None
-        assert options.output_path is not None
+    def prepare_artifact_path(
+        self, requested: Path, *, overwrite: bool, extension: str | None = None
+    ) -> Path:
+        """Return a writable file path confined to the artifact root.
+
+        Missing parent directories are created inside the root once the path,
+        and ``extension`` when given, have been checked.
+        """
         output = self._contained_path(
             self.artifact_root,
-            options.output_path,
+            requested,
             kind="artifact",
             must_exist=False,
         )
-        if output.suffix.lower() != extension:
+        if extension is not None and output.suffix.lower() != extension:
             raise DocumentPathError(
                 f"artifact paths must use the {extension} extension"
             )
@@ -474,12 +532,38 @@ def _prepare_output(self, options: ArtifactOptions, extension: str) -> Path | No
         safe_parent = output.parent.resolve(strict=True)
         self._assert_contained(self.artifact_root, safe_parent, "artifact")
         output = safe_parent / output.name
-        if output.exists() and not options.overwrite:
+        if output.exists() and not overwrite:
             raise ArtifactExistsError(f"artifact already exists: {output.name}")
         if output.exists() and not output.is_file():
             raise DocumentPathError("artifact path does not identify a regular file")
         return output
 
+    def artifact_source(self, artifact: GeneratedArtifact) -> Path:
+        """Return the file of a file-delivered artifact, confined to the root.
+
+        The recorded path must still resolve to a regular file inside the
+        artifact root; a path that was edited or relinked since is refused.
+        """
+        if artifact.path is None:
+            raise DocumentServiceError("the artifact was not delivered as a file")
+        source = self._contained_path(
+            self.artifact_root,
+            artifact.path,
+            kind="artifact",
+            must_exist=True,
+        )
+        if not source.is_file():
+            raise DocumentPathError("artifact path does not identify a regular file")
+        return source
+
+    def _prepare_output(self, options: ArtifactOptions, extension: str) -> Path | None:
+        if options.delivery is not ArtifactDelivery.FILE:
+            return None
+        assert options.output_path is not None
+        return self.prepare_artifact_path(
+            options.output_path, overwrite=options.overwrite, extension=extension
+        )
+
     def _contained_path(
         self,
         root: Path,
@@ -514,12 +598,11 @@ def _assert_contained(root: Path, candidate: Path, kind: str) -> None:
             ) from exc
 
     def _validate_office_package(self, template: Path) -> None:
+        self._validate_office_archive(self._read_template(template)[0])
+
+    def _validate_office_archive(self, content: bytes) -> None:
         try:
-            if template.stat().st_size > self.max_template_bytes:
-                raise DocumentTemplateError(
-                    "template exceeds the compressed size limit"
-                )
-            with zipfile.ZipFile(template) as package:
+            with zipfile.ZipFile(BytesIO(content)) as package:
                 entries = package.infolist()
                 if len(entries) > self.max_template_entries:
                     raise DocumentTemplateError(
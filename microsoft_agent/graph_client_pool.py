@@ -0,0 +1,233 @@
+"""Process-wide pool of authenticated Microsoft Graph clients.
+
+Building a :class:`~microsoft_agent.api_client.MicrosoftGraphApi` resolves a TLS
+profile, creates a pinned HTTP connection pool, and verifies the login. Doing
+that per MCP call discards warm Graph connections after every request, so tool
+handlers borrow a long-lived client from this pool instead.
+
+Entries are keyed by the authentication configuration fingerprint and bound to
+one event loop. Clients are reference counted: a client whose configuration was
+superseded, or that stayed idle past the eviction window, is closed once the
+last borrower returns it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from microsoft_agent.auth import (
+    AuthenticationRequiredError,
+    get_auth_fingerprint,
+    get_auth_manager,
+    get_client,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IDLE_TIMEOUT_SECONDS = 300.0
+
+
+@dataclass
+class _PoolEntry:
+    key: tuple[Any, ...]
+    client: Any
+    loop: asyncio.AbstractEventLoop
+    borrowers: int = 0
+    released_at: float = field(default_factory=time.monotonic)
+    retired: bool = False
+
+
+class GraphClientPool:
+    """Share Graph clients across tool calls for one authentication identity.
+
+    Token acquisition stays per call: the pooled client's credential asks the
+    authentication manager for a token on every request, so delegated,
+    on-behalf-of, and external-token modes keep their per-request identity.
+    """
+
+    def __init__(
+        self,
+        *,
+        idle_timeout_seconds: float = DEFAULT_IDLE_TIMEOUT_SECONDS,
+    ) -> None:
+        if idle_timeout_seconds <= 0:
+            raise ValueError("Graph client idle timeout must be positive")
+        self._idle_timeout = idle_timeout_seconds
+        self._entries: dict[tuple[Any, ...], _PoolEntry] = {}
+        self._by_client: dict[int, _PoolEntry] = {}
+        self._lock: asyncio.Lock | None = None
+        self._lock_loop: asyncio.AbstractEventLoop | None = None
+
+    def __len__(self) -> int:
+        return len(self._by_client)
+
+    def stats(self) -> dict[str, int]:
+        """Return the pooled client count and their summed coalescing counters."""
+
+        totals = {"clients": len(self), "started": 0, "joined": 0, "in_flight": 0}
+        for entry in list(self._by_client.values()):
+            coalescer = getattr(entry.client, "_read_coalescer", None)
+            if coalescer is not None:
+                for name, value in coalescer.stats().items():
+                    totals[name] += value
+        return totals
+
+    async def acquire(self) -> Any:
+        """Borrow an authenticated client for the active configuration."""
+
+        manager = get_auth_manager()
+        if not manager.get_token():
+            raise AuthenticationRequiredError(
+                "Microsoft token is not available. Use the login tool for "
+                "delegated mode or configure workload authentication."
+            )
+        key = get_auth_fingerprint() or ()
+        loop = asyncio.get_running_loop()
+        async with self._loop_lock(loop):
+            stale = self._collect_stale(key, manager, loop)
+            entry = self._entries.get(key)
+            if entry is None:
+                client = await get_client()
+                entry = _PoolEntry(key=key, client=client, loop=loop)
+                self._entries[key] = entry
+                self._by_client[id(client)] = entry
+            entry.borrowers += 1
+        await self._close_all(stale)
+        return entry.client
+
+    async def release(self, client: Any) -> None:
+        """Return a borrowed client and close it if it is no longer current."""
+
+        entry = self._by_client.get(id(client))
+        if entry is None or entry.client is not client:
+            await client.close()
+            return
+        entry.borrowers = max(entry.borrowers - 1, 0)
+        entry.released_at = time.monotonic()
+        if entry.retired and entry.borrowers == 0:
+            self._by_client.pop(id(client), None)
+            await self._close_all([entry])
+
+    async def aclose(self) -> None:
+        """Close every pooled client regardless of outstanding borrowers."""
+
+        entries = list(self._by_client.values())
+        self._entries.clear()
+        self._by_client.clear()
+        await self._close_all(entries)
+
+    def abandon(self) -> None:
+        """Drop every client after its event loop has stopped.
+
+        Connection pools cannot be closed without their loop, but materialized
+        TLS trust files are still removed.
+        """
+
+        entries = list(self._by_client.values())
+        self._entries.clear()
+        self._by_client.clear()
+        for entry in entries:
+            _cleanup_tls(entry.client)
+
+    def _loop_lock(self, loop: asyncio.AbstractEventLoop) -> asyncio.Lock:
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    def _collect_stale(
+        self,
+        key: tuple[Any, ...],
+        manager: Any,
+        loop: asyncio.AbstractEventLoop,
+    ) -> list[_PoolEntry]:
+        """Retire superseded or idle entries and return those ready to close."""
+
+        now = time.monotonic()
+        closable: list[_PoolEntry] = []
+        for entry_key, entry in list(self._entries.items()):
+            if entry.loop is not loop:
+                # A client bound to a finished loop can never be reused or closed.
+                del self._entries[entry_key]
+                self._by_client.pop(id(entry.client), None)
+                _cleanup_tls(entry.client)
+                continue
+            superseded = entry_key != key or (
+                getattr(entry.client, "auth_manager", manager) is not manager
+            )
+            idle = entry.borrowers == 0 and now - entry.released_at > self._idle_timeout
+            if not (superseded or idle):
+                continue
+            del self._entries[entry_key]
+            entry.retired = True
+            if entry.borrowers == 0:
+                self._by_client.pop(id(entry.client), None)
+                closable.append(entry)
+        return closable
+
+    @staticmethod
+    async def _close_all(entries: list[_PoolEntry]) -> None:
+        for entry in entries:
+            try:
+                await entry.client.close()
+            except Exception as exc:  # pragma: no cover - defensive shutdown path
+                logger.warning(
+                    "Pooled Graph client close failed: error_type=%s",
+                    type(exc).__name__,
+                )
+
+
+def _cleanup_tls(client: Any) -> None:
+    profile = getattr(client, "tls_profile", None)
+    if profile is None:
+        return
+    client.tls_profile = None
+    try:
+        profile.cleanup()
+    except Exception as exc:  # pragma: no cover - defensive shutdown path
+        logger.warning(
+            "Pooled Graph TLS cleanup failed: error_type=%s", type(exc).__name__
+        )
+
+
+_graph_client_pool: GraphClientPool | None = None
+
+
+def get_graph_client_pool() -> GraphClientPool:
+    """Return the process-wide Graph client pool."""
+
+    global _graph_client_pool
+    if _graph_client_pool is None:
+        _graph_client_pool = GraphClientPool()
+    return _graph_client_pool
+
+
+async def close_graph_client_pool() -> None:
+    """Close and discard the process-wide pool from inside its event loop."""
+
+    global _graph_client_pool
+    pool, _graph_client_pool = _graph_client_pool, None
+    if pool is not None:
+        await pool.aclose()
+
+
+def shutdown_graph_client_pool() -> None:
+    """Release pooled Graph resources after the server loop has exited."""
+
+    global _graph_client_pool
+    pool, _graph_client_pool = _graph_client_pool, None
+    if pool is not None:
+        pool.abandon()
+
+
+__all__ = [
+    "DEFAULT_IDLE_TIMEOUT_SECONDS",
+    "GraphClientPool",
+    "close_graph_client_pool",
+    "get_graph_client_pool",
+    "shutdown_graph_client_pool",
+]
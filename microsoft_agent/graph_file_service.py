@@ -1,36 +1,62 @@
 """Safe OneDrive and SharePoint document upload support.
 
 Small files use the Microsoft Graph content endpoint.  Files over the
-configured threshold use a resumable upload session with sequential chunks
-that are multiples of 320 KiB, as required by Graph.
+configured threshold use a resumable upload session with chunks that are
+multiples of 320 KiB, as required by Graph.  Chunks are sent in order, one at
+a time, while the next chunk is read; a failed chunk resumes from the ranges
+the session still expects.  Local files and streams are read one chunk at a
+time and hashed as they are read, so they are never buffered whole.
+:class:`DriveRangeDownloader` is the inverse: it writes a preauthenticated
+download URL to disk in bounded ``Range`` requests.
 """
 
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
+import os
 import re
-from collections.abc import Mapping
+import stat
+import tempfile
+import threading
+from collections.abc import Awaitable, Callable, Mapping
 from enum import StrEnum
-from pathlib import PurePosixPath
-from typing import Any
+from pathlib import Path, PurePosixPath
+from typing import Any, BinaryIO
 from urllib.parse import quote, urlparse
 
 from agent_utilities.security.egress import validate_base_url
 from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_validator
 
-from microsoft_agent.document_service import GeneratedArtifact
+from microsoft_agent.document_service import (
+    DocumentService,
+    DocumentServiceError,
+    GeneratedArtifact,
+)
 from microsoft_agent.power_platform import (
     AsyncHttpTransport,
     AudienceTokenProvider,
     HttpResponse,
+    StreamingHttpTransport,
+)
+from microsoft_agent.retry_policy import RetryPolicy, get_retry_policy
+from microsoft_agent.upload_pipeline import (
+    MAX_CONCURRENT_FRAGMENTS,
+    UploadProgress,
+    UploadProgressCallback,
+    fragment_ranges,
+    transfer_ranges_concurrently,
 )
 
 GRAPH_AUDIENCE = "https://graph.microsoft.com"
 _CHUNK_GRANULARITY = 320 * 1024
 _MAX_FRAGMENT_BYTES = 60 * 1024 * 1024
+DOWNLOAD_CHUNK_BYTES = 8 * 1024 * 1024
 _SAFE_DRIVE_ID = re.compile(r"^[A-Za-z0-9!._~-]{1,512}$")
 
+_RangeReader = Callable[[int, int], Awaitable[bytes | memoryview]]
+
 
 class UploadConflictBehavior(StrEnum):
     """How Graph should handle an existing destination name."""
@@ -93,6 +119,7 @@ class UploadedDriveItem(BaseModel):
     web_url: str | None = Field(default=None, alias="webUrl")
     e_tag: str | None = Field(default=None, alias="eTag")
     c_tag: str | None = Field(default=None, alias="cTag")
+    sha256: str | None = None
 
 
 class GraphFileServiceError(RuntimeError):
@@ -111,10 +138,13 @@ def __init__(
         settings: GraphFileSettings,
         token_provider: AudienceTokenProvider,
         transport: AsyncHttpTransport,
+        *,
+        retry_policy: RetryPolicy | None = None,
     ) -> None:
         self.settings = settings
         self._token_provider = token_provider
         self._transport = transport
+        self._retry_policy = retry_policy or get_retry_policy()
 
     async def upload_artifact(
         self,
@@ -123,15 +153,38 @@ async def upload_artifact(
         artifact: GeneratedArtifact,
         *,
         conflict_behavior: UploadConflictBehavior = UploadConflictBehavior.FAIL,
+        progress: UploadProgressCallback | None = None,
+        documents: DocumentService | None = None,
     ) -> UploadedDriveItem:
-        """Upload an in-memory generated Office artifact."""
-
+        """Upload a generated Office artifact.
+
+        A file-delivered artifact is streamed from disk only through the
+        ``documents`` service that owns its artifact root, which confirms the
+        file still lies under that root. It must also still match the SHA-256
+        recorded when it was generated.
+        """
+
+        if artifact.path is not None:
+            if documents is None:
+                raise DocumentServiceError(
+                    "file-delivered artifacts must be read explicitly by their owner"
+                )
+            return await self.upload_path(
+                drive_id,
+                destination_path,
+                documents.artifact_source(artifact),
+                artifact.content_type,
+                conflict_behavior=conflict_behavior,
+                progress=progress,
+                expected_sha256=artifact.sha256,
+            )
         return await self.upload_bytes(
             drive_id,
             destination_path,
             artifact.upload_bytes(),
             artifact.content_type,
             conflict_behavior=conflict_behavior,
+            progress=progress,
         )
 
     async def upload_bytes(
@@ -142,34 +195,124 @@ async def upload_bytes(
         content_type: str = "application/octet-stream",
         *,
         conflict_behavior: UploadConflictBehavior = UploadConflictBehavior.FAIL,
+        progress: UploadProgressCallback | None = None,
+    ) -> UploadedDriveItem:
+        """Upload bytes by drive-relative path, using a session when needed.
+
+        ``progress`` is called with the acknowledged byte count as ranges
+        complete.
+        """
+
+        view = memoryview(content)
+
+        async def read(start: int, end: int) -> memoryview:
+            return view[start : end + 1]
+
+        return await self._upload(
+            drive_id,
+            destination_path,
+            len(content),
+            read,
+            content_type,
+            conflict_behavior,
+            progress,
+        )
+
+    async def upload_stream(
+        self,
+        drive_id: str,
+        destination_path: str,
+        stream: BinaryIO,
+        size: int,
+        content_type: str = "application/octet-stream",
+        *,
+        conflict_behavior: UploadConflictBehavior = UploadConflictBehavior.FAIL,
+        progress: UploadProgressCallback | None = None,
+        expected_sha256: str | None = None,
     ) -> UploadedDriveItem:
-        """Upload bytes by drive-relative path, using a session when needed."""
+        """Upload ``size`` bytes read from ``stream`` one fragment at a time.
+
+        The returned item carries the SHA-256 of the bytes read. When
+        ``expected_sha256`` is given, a mismatch aborts before the final
+        fragment, so Graph never completes the file.
+        """
+
+        reader = _FragmentReader(stream, size, expected_sha256)
+        item = await self._upload(
+            drive_id,
+            destination_path,
+            size,
+            reader.read,
+            content_type,
+            conflict_behavior,
+            progress,
+        )
+        return item.model_copy(update={"sha256": reader.hexdigest()})
 
+    async def upload_path(
+        self,
+        drive_id: str,
+        destination_path: str,
+        source: str | os.PathLike[str],
+        content_type: str = "application/octet-stream",
+        *,
+        conflict_behavior: UploadConflictBehavior = UploadConflictBehavior.FAIL,
+        progress: UploadProgressCallback | None = None,
+        expected_sha256: str | None = None,
+    ) -> UploadedDriveItem:
+        """Stream a regular local file to a drive path without buffering it."""
+
+        stream, size = await asyncio.to_thread(_open_regular_file, source)
+        with stream:
+            return await self.upload_stream(
+                drive_id,
+                destination_path,
+                stream,
+                size,
+                content_type,
+                conflict_behavior=conflict_behavior,
+                progress=progress,
+                expected_sha256=expected_sha256,
+            )
+
+    async def _upload(
+        self,
+        drive_id: str,
+        destination_path: str,
+        total: int,
+        read: _RangeReader,
+        content_type: str,
+        conflict_behavior: UploadConflictBehavior,
+        progress: UploadProgressCallback | None,
+    ) -> UploadedDriveItem:
         encoded_drive = _encode_drive_id(drive_id)
         encoded_path = _encode_drive_path(destination_path)
-        if not content:
+        if total <= 0:
             raise ValueError("content cannot be empty")
-        if len(content) > self.settings.max_file_bytes:
+        if total > self.settings.max_file_bytes:
             raise ValueError("content exceeds the configured upload size limit")
         if not content_type or "\r" in content_type or "\n" in content_type:
             raise ValueError("content_type must be a safe MIME type")
-        if len(content) < self.settings.resumable_threshold_bytes:
-            return await self._simple_upload(
+        if total < self.settings.resumable_threshold_bytes:
+            item = await self._simple_upload(
                 encoded_drive,
                 encoded_path,
-                content,
+                await read(0, total - 1),
                 content_type,
                 conflict_behavior,
             )
+            if progress is not None:
+                progress(UploadProgress(bytes_uploaded=total, total_bytes=total))
+            return item
         return await self._resumable_upload(
-            encoded_drive, encoded_path, content, conflict_behavior
+            encoded_drive, encoded_path, total, read, conflict_behavior, progress
         )
 
     async def _simple_upload(
         self,
         drive_id: str,
         path: str,
-        content: bytes,
+        content: bytes | memoryview,
         content_type: str,
         conflict_behavior: UploadConflictBehavior,
     ) -> UploadedDriveItem:
@@ -189,8 +332,10 @@ async def _resumable_upload(
         self,
         drive_id: str,
         path: str,
-        content: bytes,
+        total: int,
+        read: _RangeReader,
         conflict_behavior: UploadConflictBehavior,
+        progress: UploadProgressCallback | None = None,
     ) -> UploadedDriveItem:
         base = str(self.settings.graph_base_url).rstrip("/")
         filename = PurePosixPath(path).name
@@ -212,81 +357,158 @@ async def _resumable_upload(
             expected={200, 201},
         )
         payload = _json_object(response)
-        upload_url = _validate_upload_url(payload.get("uploadUrl"))
+        upload_url = validate_upload_url(payload.get("uploadUrl"))
 
-        total = len(content)
-        offset = 0
-        while offset < total:
-            end = min(offset + self.settings.fragment_size_bytes, total) - 1
-            fragment = content[offset : end + 1]
-            chunk_response = await self._upload_fragment(
-                upload_url,
-                fragment,
-                offset,
-                end,
-                total,
+        fragment_bytes = self.settings.fragment_size_bytes
+        uploaded = 0
+
+        def advance(count: int) -> None:
+            nonlocal uploaded
+            uploaded += count
+            if progress is not None:
+                progress(UploadProgress(bytes_uploaded=uploaded, total_bytes=total))
+
+        def read_from(start: int) -> asyncio.Future[bytes | memoryview]:
+            return asyncio.ensure_future(
+                read(start, min(start + fragment_bytes, total) - 1)
             )
-            if chunk_response.status_code in {200, 201}:
-                if end + 1 != total:
+
+        # Graph accepts session fragments only in order, so one PUT is in
+        # flight at a time; the next fragment is read and hashed meanwhile.
+        offset = 0
+        following = read_from(0)
+        try:
+            while offset < total:
+                end = min(offset + fragment_bytes, total) - 1
+                body = await following
+                if end + 1 < total:
+                    following = read_from(end + 1)
+                result = await self._send_fragment(upload_url, body, offset, end, total)
+                if isinstance(result, HttpResponse):
+                    if end + 1 != total:
+                        raise GraphFileServiceError(
+                            "Graph completed the upload before all bytes were sent."
+                        )
+                    advance(total - offset)
+                    return self._drive_item(result)
+                if result < end + 1 or result > total:
                     raise GraphFileServiceError(
-                        "Graph completed the upload before all bytes were sent."
+                        "Graph returned an invalid next range for the upload."
                     )
-                return self._drive_item(chunk_response)
-            payload = _json_object(chunk_response)
-            ranges = payload.get("nextExpectedRanges")
+                advance(result - offset)
+                if result != end + 1:
+                    await following
+                    following = read_from(result)
+                offset = result
+        finally:
+            following.cancel()
+            await asyncio.gather(following, return_exceptions=True)
+        raise GraphFileServiceError(
+            "Graph did not return completed drive item metadata."
+        )
+
+    async def _send_fragment(
+        self,
+        upload_url: str,
+        body: bytes | memoryview,
+        start: int,
+        end: int,
+        total: int,
+    ) -> HttpResponse | int:
+        """PUT one fragment and return the completed item or the next offset.
+
+        After a failed PUT, the session's ``nextExpectedRanges`` say how much
+        of the fragment Graph already holds, and only the rest is sent again.
+        """
+
+        view = memoryview(body)
+        offset = start
+        resumes = 0
+        while True:
+            try:
+                response = await self._upload_fragment(
+                    upload_url, view[offset - start :], offset, end, total
+                )
+            except GraphFileServiceError:
+                if resumes >= self.settings.max_retries:
+                    raise
+                resumes += 1
+                expected = await self._next_expected_offset(upload_url)
+                # Only the final fragment's reply carries the completed item,
+                # so at least its last byte is always sent again.
+                last = end + 1 if end + 1 < total else end
+                if expected is None or not start <= expected <= last:
+                    raise
+                if expected == end + 1:
+                    return expected
+                offset = expected
+                continue
+            if response.status_code in {200, 201}:
+                return response
+            ranges = _json_object(response).get("nextExpectedRanges")
             if not isinstance(ranges, list) or not ranges:
                 raise GraphFileServiceError(
                     "Graph returned no next range for the resumable upload."
                 )
-            next_offset = _range_start(ranges[0])
-            if next_offset < end + 1 or next_offset > total:
-                raise GraphFileServiceError(
-                    "Graph returned an invalid next range for the upload."
-                )
-            offset = next_offset
-        raise GraphFileServiceError(
-            "Graph did not return completed drive item metadata."
-        )
+            return _range_start(ranges[0])
+
+    async def _next_expected_offset(self, upload_url: str) -> int | None:
+        # A session that cannot report its next range cannot be resumed.
+        try:
+            response = await self._retry_policy.send(
+                ("microsoft_graph_upload", urlparse(upload_url).hostname),
+                "GET",
+                lambda: self._transport.request(
+                    "GET",
+                    upload_url,
+                    headers={"Accept": "application/json"},
+                    timeout=self.settings.timeout_seconds,
+                ),
+                max_retries=self.settings.max_retries,
+            )
+            if response.status_code != 200:
+                return None
+            ranges = _json_object(response).get("nextExpectedRanges")
+            if not isinstance(ranges, list) or not ranges:
+                return None
+            return _range_start(ranges[0])
+        except (OSError, TimeoutError, GraphFileServiceError):
+            return None
 
     async def _upload_fragment(
         self,
         upload_url: str,
-        fragment: bytes,
+        body: bytes | memoryview,
         start: int,
         end: int,
         total: int,
     ) -> HttpResponse:
         headers = {
-            "Content-Length": str(len(fragment)),
+            "Content-Length": str(len(body)),
             "Content-Range": f"bytes {start}-{end}/{total}",
         }
         # The preauthenticated upload URL must not receive the Graph bearer token.
-        for attempt in range(self.settings.max_retries + 1):
-            try:
-                response = await self._transport.request(
+        try:
+            response = await self._retry_policy.send(
+                ("microsoft_graph_upload", urlparse(upload_url).hostname),
+                "PUT",
+                lambda: self._transport.request(
                     "PUT",
                     upload_url,
                     headers=headers,
-                    body=fragment,
+                    body=body,
                     timeout=self.settings.timeout_seconds,
-                )
-            except (OSError, TimeoutError) as exc:
-                if attempt >= self.settings.max_retries:
-                    raise GraphFileServiceError("Upload transport failed.") from exc
-                await asyncio.sleep(min(2**attempt, 8))
-                continue
-            if response.status_code in {200, 201, 202}:
-                return response
-            if (
-                response.status_code not in {429, 500, 502, 503, 504}
-                or attempt >= self.settings.max_retries
-            ):
-                raise GraphFileServiceError(
-                    "Microsoft Graph rejected an upload fragment.",
-                    status_code=response.status_code,
-                )
-            await asyncio.sleep(_retry_delay(response, attempt))
-        raise GraphFileServiceError("Upload fragment retry limit was exceeded.")
+                ),
+                max_retries=self.settings.max_retries,
+            )
+        except (OSError, TimeoutError) as exc:
+            raise GraphFileServiceError("Upload transport failed.") from exc
+        if response.status_code in {200, 201, 202}:
+            return response
+        raise GraphFileServiceError(
+            "Microsoft Graph rejected an upload fragment.",
+            status_code=response.status_code,
+        )
 
     async def _graph_request(
         self,
@@ -294,7 +516,7 @@ async def _graph_request(
         url: str,
         *,
         headers: Mapping[str, str],
-        body: bytes | None = None,
+        body: bytes | memoryview | None = None,
         params: Mapping[str, Any] | None = None,
         expected: set[int],
     ) -> HttpResponse:
@@ -328,6 +550,229 @@ def _drive_item(response: HttpResponse) -> UploadedDriveItem:
             ) from exc
 
 
+def _flush_to_disk(target: BinaryIO) -> None:
+    target.flush()
+    os.fsync(target.fileno())
+
+
+def _move_into_place(source: Path, destination: Path, overwrite: bool) -> None:
+    if overwrite:
+        os.replace(source, destination)
+        return
+    # A hard link fails atomically if the destination appeared meanwhile,
+    # where an existence check followed by a rename would replace it.
+    try:
+        os.link(source, destination)
+    except FileExistsError:
+        raise FileExistsError(f"artifact already exists: {destination.name}") from None
+    source.unlink()
+
+
+class DownloadedDriveFile(BaseModel):
+    """A drive item written to a local file by :class:`DriveRangeDownloader`."""
+
+    model_config = ConfigDict(frozen=True)
+
+    path: Path
+    size: int = Field(ge=0)
+
+
+class DriveRangeDownloader:
+    """Download a preauthenticated drive item URL into a file by byte ranges.
+
+    At most ``max_concurrent_ranges`` chunks of ``chunk_bytes`` are in memory
+    at once. The file is written beside its destination and renamed into
+    place only when every range has arrived.
+    """
+
+    def __init__(
+        self,
+        transport: StreamingHttpTransport,
+        *,
+        timeout_seconds: float = 60,
+        chunk_bytes: int = DOWNLOAD_CHUNK_BYTES,
+        max_concurrent_ranges: int = 4,
+        max_retries: int = 3,
+        retry_policy: RetryPolicy | None = None,
+    ) -> None:
+        if not 0 < chunk_bytes <= _MAX_FRAGMENT_BYTES:
+            raise ValueError("download chunks must be between 1 byte and 60 MiB")
+        if not 0 < timeout_seconds <= 600:
+            raise ValueError("timeout_seconds must be between 0 and 600")
+        if not 0 <= max_retries <= 8:
+            raise ValueError("max_retries must be between 0 and 8")
+        if not 1 <= max_concurrent_ranges <= MAX_CONCURRENT_FRAGMENTS:
+            raise ValueError(
+                "max_concurrent_ranges must be between 1 and "
+                f"{MAX_CONCURRENT_FRAGMENTS}"
+            )
+        self._transport = transport
+        self.timeout_seconds = timeout_seconds
+        self.chunk_bytes = chunk_bytes
+        self.max_concurrent_ranges = max_concurrent_ranges
+        self.max_retries = max_retries
+        self._retry_policy = retry_policy or get_retry_policy()
+
+    async def download(
+        self,
+        download_url: str,
+        size: int,
+        destination: Path,
+        *,
+        overwrite: bool = False,
+        progress: UploadProgressCallback | None = None,
+    ) -> DownloadedDriveFile:
+        """Fetch ``size`` bytes with ``Range`` requests into ``destination``."""
+
+        safe_url = validate_upload_url(download_url, "download")
+        if size < 0:
+            raise ValueError("size must not be negative")
+        # File-system calls run in worker threads so a slow disk never
+        # stalls the event loop that is driving the other ranges.
+        descriptor, temporary_name = await asyncio.to_thread(
+            tempfile.mkstemp,
+            prefix=f".{destination.name}.",
+            suffix=".part",
+            dir=destination.parent,
+        )
+        temporary_path = Path(temporary_name)
+        written = 0
+        try:
+            with os.fdopen(descriptor, "wb") as target:
+                await asyncio.to_thread(target.truncate, size)
+                lock = threading.Lock()
+
+                def write_at(offset: int, data: bytes) -> None:
+                    with lock:
+                        target.seek(offset)
+                        target.write(data)
+
+                async def fetch(start: int, end: int) -> None:
+                    nonlocal written
+                    data = await self._get_range(safe_url, start, end)
+                    await asyncio.to_thread(write_at, start, data)
+                    written += len(data)
+                    if progress is not None:
+                        progress(
+                            UploadProgress(bytes_uploaded=written, total_bytes=size)
+                        )
+
+                await transfer_ranges_concurrently(
+                    fragment_ranges(size, self.chunk_bytes),
+                    fetch,
+                    self.max_concurrent_ranges,
+                )
+                await asyncio.to_thread(_flush_to_disk, target)
+            await asyncio.to_thread(
+                _move_into_place, temporary_path, destination, overwrite
+            )
+        finally:
+            await asyncio.to_thread(temporary_path.unlink, missing_ok=True)
+        return DownloadedDriveFile(path=destination, size=size)
+
+    async def _get_range(self, url: str, start: int, end: int) -> bytes:
+        # The preauthenticated download URL must not receive the Graph token.
+        headers = {"Range": f"bytes={start}-{end}"}
+        length = end + 1 - start
+        data = b""
+
+        async def send_once() -> HttpResponse:
+            nonlocal data
+            async with self._transport.stream(
+                "GET",
+                url,
+                headers=headers,
+                timeout=self.timeout_seconds,
+                max_bytes=length,
+            ) as response:
+                # Anything but the requested range is refused unread.
+                if response.status_code == 206:
+                    data = await response.read()
+                return HttpResponse(
+                    status_code=response.status_code, headers=response.headers
+                )
+
+        try:
+            response = await self._retry_policy.send(
+                ("microsoft_graph_download", urlparse(url).hostname),
+                "GET",
+                send_once,
+                max_retries=self.max_retries,
+            )
+        except ValueError as exc:
+            raise GraphFileServiceError(
+                "Microsoft Graph returned a longer download range than requested."
+            ) from exc
+        except (OSError, TimeoutError) as exc:
+            raise GraphFileServiceError("Download transport failed.") from exc
+        if response.status_code != 206:
+            raise GraphFileServiceError(
+                "Microsoft Graph rejected a download range.",
+                status_code=response.status_code,
+            )
+        if len(data) != length:
+            raise GraphFileServiceError(
+                "Microsoft Graph returned a short download range."
+            )
+        return data
+
+
+class _FragmentReader:
+    """Read a stream in range order while hashing what was read."""
+
+    def __init__(
+        self, stream: BinaryIO, total: int, expected_sha256: str | None
+    ) -> None:
+        self._stream = stream
+        self._total = total
+        self._expected = expected_sha256.lower() if expected_sha256 else None
+        self._position = 0
+        self._digest = hashlib.sha256()
+        self._lock = asyncio.Lock()
+
+    async def read(self, start: int, end: int) -> bytes:
+        # The upload reads one fragment ahead; the lock keeps reads in order.
+        async with self._lock:
+            if start != self._position:
+                raise GraphFileServiceError("Upload ranges must be read in order.")
+            data = await asyncio.to_thread(self._read_exactly, end + 1 - start)
+            self._digest.update(data)
+            self._position = end + 1
+            if self._position == self._total and self._expected is not None:
+                if self._digest.hexdigest() != self._expected:
+                    raise GraphFileServiceError(
+                        "The upload source does not match its expected SHA-256."
+                    )
+            return data
+
+    def hexdigest(self) -> str:
+        return self._digest.hexdigest()
+
+    def _read_exactly(self, count: int) -> bytes:
+        data = bytearray()
+        while len(data) < count:
+            chunk = self._stream.read(count - len(data))
+            if not chunk:
+                raise GraphFileServiceError(
+                    "The upload source ended before its declared size."
+                )
+            data += chunk
+        return bytes(data)
+
+
+def _open_regular_file(source: str | os.PathLike[str]) -> tuple[BinaryIO, int]:
+    flags = os.O_RDONLY | getattr(os, "O_BINARY", 0) | getattr(os, "O_NOFOLLOW", 0)
+    try:
+        descriptor = os.open(source, flags)
+    except OSError as exc:
+        raise ValueError("source must be a readable regular file") from exc
+    status = os.fstat(descriptor)
+    if not stat.S_ISREG(status.st_mode):
+        os.close(descriptor)
+        raise ValueError("source must be a readable regular file")
+    return os.fdopen(descriptor, "rb"), status.st_size
+
+
 def _encode_drive_id(drive_id: str) -> str:
     value = drive_id.strip()
     if not _SAFE_DRIVE_ID.fullmatch(value):
@@ -350,22 +795,28 @@ def _encode_drive_path(path: str) -> str:
     return "/".join(quote(part, safe="!$&'()+,;=@[]^_`{}~-") for part in parsed.parts)
 
 
-def _validate_upload_url(value: Any) -> str:
+def validate_upload_url(value: Any, kind: str = "upload") -> str:
+    """Accept a Graph-issued opaque HTTPS URL that is safe to fetch without auth.
+
+    Upload sessions, drive downloads, and usage reports hand out such URLs on
+    hosts this module cannot know in advance. ``kind`` names the URL in errors.
+    """
+
     if not isinstance(value, str) or not value or len(value) > 8_192:
-        raise GraphFileServiceError("Graph did not return a valid upload URL.")
+        raise GraphFileServiceError(f"Graph did not return a valid {kind} URL.")
     if (
         value != value.strip()
         or "\\" in value
         or any(ord(character) < 32 for character in value)
     ):
-        raise GraphFileServiceError("Graph returned an unsafe upload URL.")
+        raise GraphFileServiceError(f"Graph returned an unsafe {kind} URL.")
     parsed = urlparse(value)
     try:
         port = parsed.port
         host = (parsed.hostname or "").casefold().rstrip(".")
         host.encode("ascii")
     except (UnicodeEncodeError, ValueError) as exc:
-        raise GraphFileServiceError("Graph returned an unsafe upload URL.") from exc
+        raise GraphFileServiceError(f"Graph returned an unsafe {kind} URL.") from exc
     decision = validate_base_url(value, allow_loopback=False)
     if (
         not decision.allowed
@@ -379,7 +830,7 @@ def _validate_upload_url(value: Any) -> str:
         or host == "localhost"
         or host.endswith((".localhost", ".local", ".internal", ".home.arpa"))
     ):
-        raise GraphFileServiceError("Graph returned an unsafe upload URL.")
+        raise GraphFileServiceError(f"Graph returned an unsafe {kind} URL.")
     return value
 
 
@@ -397,20 +848,3 @@ def _range_start(value: Any) -> int:
     if not isinstance(value, str) or not re.fullmatch(r"\d+-\d*", value):
         raise GraphFileServiceError("Graph returned an invalid expected range.")
     return int(value.partition("-")[0])
-
-
-def _retry_delay(response: HttpResponse, attempt: int) -> float:
-    raw = next(
-        (
-            value
-            for key, value in response.headers.items()
-            if key.lower() == "retry-after"
-        ),
-        None,
-    )
-    try:
-        return (
-            min(max(float(raw), 0.0), 30.0) if raw is not None else min(2**attempt, 8)
-        )
-    except ValueError:
-        return min(2**attempt, 8)
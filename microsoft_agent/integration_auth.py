@@ -35,7 +35,8 @@ def normalize_audience(audience: str) -> str:
 class MicrosoftAudienceTokenProvider:
     """Acquire tokens for an explicit set of Microsoft resource audiences.
 
-    MSAL is synchronous, so acquisition runs in a worker thread.  The provider
+    MSAL is synchronous, so acquisition runs in a worker thread unless the
+    manager already holds a cached process-identity token.  The provider
     accepts only configured audiences; an invocation cannot choose a new token
     target dynamically.
     """
@@ -70,7 +71,7 @@ async def get_token(self, audience: str) -> str:
             )
         manager = self._auth_manager or get_auth_manager()
         scope = f"{normalized}/.default"
-        token = await asyncio.to_thread(
+        token = manager.cached_token([scope]) or await asyncio.to_thread(
             manager.acquire_token_for_scopes,
             [scope],
             allow_interactive=self._allow_interactive,
@@ -27,6 +27,7 @@ class DocumentRuntimeSettings(BaseModel):
     template_root: Path | None = None
     max_artifact_bytes: int = Field(default=100 * 1024 * 1024, ge=1)
     max_template_bytes: int = Field(default=50 * 1024 * 1024, ge=1)
+    max_download_bytes: int = Field(default=4 * 1024 * 1024 * 1024, ge=1)
 
 
 class IntegrationRuntimeSettings(BaseModel):
@@ -40,8 +40,10 @@
     DesktopFlowSchemaKind,
     FlowState,
     HttpxAsyncHttpTransport,
+    HttpxNativeAsyncHttpTransport,
     PowerPlatformClient,
 )
+from microsoft_agent.retry_policy import RetryPolicy, get_retry_policy
 from microsoft_agent.settings import get_settings
 from microsoft_agent.windows_companion import (
     CompanionAction,
@@ -49,6 +51,7 @@
     CompanionActionRequest,
     ConfirmationEvidence,
     HttpxCompanionTransport,
+    HttpxNativeCompanionTransport,
     WindowsCompanionClient,
 )
 
@@ -95,13 +98,15 @@ def _http_transport(
     tls_profile: str | None = None,
     tls_profile_ref: str | None = None,
     allowed_private_hosts: tuple[str, ...] = (),
-) -> HttpxAsyncHttpTransport:
+    retry_policy: RetryPolicy | None = None,
+) -> HttpxNativeAsyncHttpTransport:
     return _manage_transport(
-        HttpxAsyncHttpTransport(
+        HttpxNativeAsyncHttpTransport(
             service=service,
             tls_profile=tls_profile,
             tls_profile_ref=tls_profile_ref,
             allowed_private_hosts=allowed_private_hosts,
+            retry_policy=retry_policy,
         )
     )
 
@@ -111,9 +116,9 @@ def _companion_transport(
     tls_profile: str | None,
     tls_profile_ref: str | None,
     allowed_private_hosts: tuple[str, ...],
-) -> HttpxCompanionTransport:
+) -> HttpxNativeCompanionTransport:
     return _manage_transport(
-        HttpxCompanionTransport(
+        HttpxNativeCompanionTransport(
             tls_profile=tls_profile,
             tls_profile_ref=tls_profile_ref,
             allowed_private_hosts=allowed_private_hosts,
@@ -158,6 +163,7 @@ def _power_platform_client() -> PowerPlatformClient:
                 settings.dataverse_environment_url,
                 *(flow.trigger_url for flow in settings.named_flows.values()),
             ),
+            retry_policy=get_retry_policy(),
         ),
     )
 
@@ -207,6 +213,7 @@ def _intune_service() -> IntuneService:
                 service="microsoft_graph",
                 tls_profile=graph_settings.graph_tls_profile,
                 tls_profile_ref=graph_settings.graph_tls_profile_ref,
+                retry_policy=get_retry_policy(),
             )
         ),
         IntuneGraphTokenAdapter(provider),
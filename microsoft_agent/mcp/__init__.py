@@ -1,47 +1,57 @@
 """MCP tool registration modules for microsoft-agent.
 
 Auto-generated during ecosystem standardization.
-Each domain has its own module with a register_*_tools function.
+Each domain has its own module with a register_*_tools function. A module is
+imported when its registrar is first accessed, so importing this package does
+not import every tool family.
 """
 
-from microsoft_agent.mcp.mcp_admin import register_admin_tools
-from microsoft_agent.mcp.mcp_agreements import register_agreements_tools
-from microsoft_agent.mcp.mcp_applications import register_applications_tools
-from microsoft_agent.mcp.mcp_audit import register_audit_tools
-from microsoft_agent.mcp.mcp_auth import register_auth_tools
-from microsoft_agent.mcp.mcp_calendar import register_calendar_tools
-from microsoft_agent.mcp.mcp_chat import register_chat_tools
-from microsoft_agent.mcp.mcp_communications import register_communications_tools
-from microsoft_agent.mcp.mcp_connections import register_connections_tools
-from microsoft_agent.mcp.mcp_contacts import register_contacts_tools
-from microsoft_agent.mcp.mcp_devices import register_devices_tools
-from microsoft_agent.mcp.mcp_directory import register_directory_tools
-from microsoft_agent.mcp.mcp_domains import register_domains_tools
-from microsoft_agent.mcp.mcp_education import register_education_tools
-from microsoft_agent.mcp.mcp_employee_experience import (
-    register_employee_experience_tools,
-)
-from microsoft_agent.mcp.mcp_files import register_files_tools
-from microsoft_agent.mcp.mcp_groups import register_groups_tools
-from microsoft_agent.mcp.mcp_identity import register_identity_tools
-from microsoft_agent.mcp.mcp_mail import register_mail_tools
-from microsoft_agent.mcp.mcp_meta import register_meta_tools
-from microsoft_agent.mcp.mcp_notes import register_notes_tools
-from microsoft_agent.mcp.mcp_organization import register_organization_tools
-from microsoft_agent.mcp.mcp_places import register_places_tools
-from microsoft_agent.mcp.mcp_policies import register_policies_tools
-from microsoft_agent.mcp.mcp_print import register_print_tools
-from microsoft_agent.mcp.mcp_privacy import register_privacy_tools
-from microsoft_agent.mcp.mcp_reports import register_reports_tools
-from microsoft_agent.mcp.mcp_search import register_search_tools
-from microsoft_agent.mcp.mcp_security import register_security_tools
-from microsoft_agent.mcp.mcp_sites import register_sites_tools
-from microsoft_agent.mcp.mcp_solutions import register_solutions_tools
-from microsoft_agent.mcp.mcp_storage import register_storage_tools
-from microsoft_agent.mcp.mcp_subscriptions import register_subscriptions_tools
-from microsoft_agent.mcp.mcp_tasks import register_tasks_tools
-from microsoft_agent.mcp.mcp_teams import register_teams_tools
-from microsoft_agent.mcp.mcp_user import register_user_tools
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from microsoft_agent.mcp.mcp_admin import register_admin_tools
+    from microsoft_agent.mcp.mcp_agreements import register_agreements_tools
+    from microsoft_agent.mcp.mcp_applications import register_applications_tools
+    from microsoft_agent.mcp.mcp_audit import register_audit_tools
+    from microsoft_agent.mcp.mcp_auth import register_auth_tools
+    from microsoft_agent.mcp.mcp_batch import register_batch_tools
+    from microsoft_agent.mcp.mcp_calendar import register_calendar_tools
+    from microsoft_agent.mcp.mcp_chat import register_chat_tools
+    from microsoft_agent.mcp.mcp_communications import register_communications_tools
+    from microsoft_agent.mcp.mcp_connections import register_connections_tools
+    from microsoft_agent.mcp.mcp_contacts import register_contacts_tools
+    from microsoft_agent.mcp.mcp_devices import register_devices_tools
+    from microsoft_agent.mcp.mcp_directory import register_directory_tools
+    from microsoft_agent.mcp.mcp_domains import register_domains_tools
+    from microsoft_agent.mcp.mcp_education import register_education_tools
+    from microsoft_agent.mcp.mcp_employee_experience import (
+        register_employee_experience_tools,
+    )
+    from microsoft_agent.mcp.mcp_files import register_files_tools
+    from microsoft_agent.mcp.mcp_groups import register_groups_tools
+    from microsoft_agent.mcp.mcp_identity import register_identity_tools
+    from microsoft_agent.mcp.mcp_mail import register_mail_tools
+    from microsoft_agent.mcp.mcp_meta import register_meta_tools
+    from microsoft_agent.mcp.mcp_notes import register_notes_tools
+    from microsoft_agent.mcp.mcp_organization import register_organization_tools
+    from microsoft_agent.mcp.mcp_places import register_places_tools
+    from microsoft_agent.mcp.mcp_policies import register_policies_tools
+    from microsoft_agent.mcp.mcp_print import register_print_tools
+    from microsoft_agent.mcp.mcp_privacy import register_privacy_tools
+    from microsoft_agent.mcp.mcp_reports import register_reports_tools
+    from microsoft_agent.mcp.mcp_search import register_search_tools
+    from microsoft_agent.mcp.mcp_security import register_security_tools
+    from microsoft_agent.mcp.mcp_sites import register_sites_tools
+    from microsoft_agent.mcp.mcp_solutions import register_solutions_tools
+    from microsoft_agent.mcp.mcp_storage import register_storage_tools
+    from microsoft_agent.mcp.mcp_subscriptions import register_subscriptions_tools
+    from microsoft_agent.mcp.mcp_sync import register_sync_tools
+    from microsoft_agent.mcp.mcp_tasks import register_tasks_tools
+    from microsoft_agent.mcp.mcp_teams import register_teams_tools
+    from microsoft_agent.mcp.mcp_user import register_user_tools
 
 __all__ = [
     "register_admin_tools",
@@ -49,6 +59,7 @@
     "register_applications_tools",
     "register_audit_tools",
     "register_auth_tools",
+    "register_batch_tools",
     "register_calendar_tools",
     "register_chat_tools",
     "register_communications_tools",
@@ -77,7 +88,21 @@
     "register_solutions_tools",
     "register_storage_tools",
     "register_subscriptions_tools",
+    "register_sync_tools",
     "register_tasks_tools",
     "register_teams_tools",
     "register_user_tools",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    family = name.removeprefix("register_").removesuffix("_tools")
+    register = getattr(import_module(f"{__name__}.mcp_{family}"), name)
+    globals()[name] = register
+    return register
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,133 @@
+"""Precompiled action dispatch for the condensed ``microsoft_*`` MCP tools.
+
+Each action-routed tool builds one :class:`ActionTable` when it is registered.
+The table maps every action to the client method it calls and the keyword
+arguments that method accepts, read once from the
+:class:`~microsoft_agent.api_client.MicrosoftGraphApi` signatures. A call then
+costs one dict lookup, and unknown or missing arguments are rejected before
+the client builds a Graph request.
+"""
+
+from __future__ import annotations
+
+import inspect
+import json
+from dataclasses import dataclass
+from typing import Any
+
+from agent_utilities.mcp.action_dispatch import resolve_action
+from agent_utilities.mcp.concurrency import invoke_client_method
+
+ACTION_SERVICE = "microsoft-agent"
+# A client method that takes its Graph request body as one dict parameter
+# receives the fields it does not name in that parameter, matching the
+# agent-utilities convention for REST-body parameters.
+_BODY_PARAMETERS = ("data", "payload", "body")
+_NAMED = (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+
+
+@dataclass(frozen=True)
+class ActionSpec:
+    """The client method behind one action and the arguments it accepts.
+
+    ``accepted`` is ``None`` when the method's arguments cannot be checked,
+    either because it takes ``**kwargs`` or because the client class does not
+    define it.
+    """
+
+    method: str
+    accepted: frozenset[str] | None = None
+    required: frozenset[str] = frozenset()
+    body: str | None = None
+
+    @classmethod
+    def from_method(cls, name: str, function: Any) -> ActionSpec:
+        """Read the accepted arguments from an unbound client method."""
+
+        if function is None:
+            return cls(name)
+        try:
+            parameters = list(inspect.signature(function).parameters.values())
+        except (TypeError, ValueError):
+            return cls(name)
+        if any(p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters):
+            return cls(name)
+        named = {p.name: p for p in parameters[1:] if p.kind in _NAMED}
+        bodies = [body for body in _BODY_PARAMETERS if body in named]
+        return cls(
+            name,
+            accepted=frozenset(named),
+            required=frozenset(
+                p.name for p in named.values() if p.default is inspect.Parameter.empty
+            ),
+            body=bodies[0] if len(bodies) == 1 else None,
+        )
+
+    def arguments(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Check ``kwargs`` against the method, folding body fields if needed."""
+
+        if self.accepted is None:
+            return kwargs
+        unknown = [name for name in kwargs if name not in self.accepted]
+        if unknown and self.body is not None and self.body not in kwargs:
+            folded = {name: kwargs[name] for name in unknown}
+            kwargs = {
+                name: value for name, value in kwargs.items() if name in self.accepted
+            }
+            kwargs[self.body] = folded
+            unknown = []
+        if unknown:
+            raise ValueError(
+                f"Unknown parameters for '{self.method}': {', '.join(unknown)}. "
+                f"Accepted: {', '.join(sorted(self.accepted)) or 'none'}"
+            )
+        missing = self.required.difference(kwargs)
+        if missing:
+            raise ValueError(
+                f"Missing required parameters for '{self.method}': "
+                f"{', '.join(sorted(missing))}"
+            )
+        return kwargs
+
+
+class ActionTable:
+    """Dispatch the actions of one ``microsoft_*`` tool to the Graph client."""
+
+    def __init__(self, actions: tuple[str, ...]) -> None:
+        from microsoft_agent.api_client import MicrosoftGraphApi
+
+        self.actions = actions
+        self._specs = {
+            action: ActionSpec.from_method(
+                action, getattr(MicrosoftGraphApi, action, None)
+            )
+            for action in actions
+        }
+
+    async def dispatch(self, client: Any, action: str, params_json: str) -> Any:
+        """Parse ``params_json``, resolve ``action``, and call the client.
+
+        Exact action names are found directly; anything else goes through
+        :func:`resolve_action` for discovery, aliases, and suggestions.
+        """
+
+        try:
+            kwargs = json.loads(params_json)
+        except Exception:
+            return {"error": "Invalid params_json"}
+        if not isinstance(kwargs, dict):
+            return {"error": "Invalid params_json"}
+
+        spec = self._specs.get(action)
+        if spec is None:
+            resolved = resolve_action(action, self.actions, service=ACTION_SERVICE)
+            if isinstance(resolved, dict):
+                return resolved
+            spec = self._specs.get(resolved)
+            if spec is None:
+                raise ValueError(f"Unknown action: {resolved}")
+
+        arguments = spec.arguments(
+            {name: value for name, value in kwargs.items() if value is not None}
+        )
+        return await invoke_client_method(getattr(client, spec.method), **arguments)
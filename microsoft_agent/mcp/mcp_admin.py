@@ -3,13 +3,12 @@
 Auto-generated from mcp_server.py during ecosystem standardization.
 """
 
-from agent_utilities.mcp.action_dispatch import resolve_action
-from agent_utilities.mcp.concurrency import invoke_client_method
 from fastmcp import Context, FastMCP
 from fastmcp.dependencies import Depends
 from pydantic import Field
 
 from microsoft_agent.auth import get_client_dependency
+from microsoft_agent.mcp._dispatch import ActionTable
 
 _ADMIN_ACTIONS = (
     "list_service_health",
@@ -26,6 +25,8 @@
 
 
 def register_admin_tools(mcp: FastMCP):
+    table = ActionTable(_ADMIN_ACTIONS)
+
     @mcp.tool(tags={"admin"})
     async def microsoft_admin(
         action: str = Field(
@@ -42,48 +43,4 @@ async def microsoft_admin(
         """Manage microsoft admin operations."""
         if ctx:
             ctx.info("Executing tool...")
-        import json
-
-        try:
-            kwargs = json.loads(params_json)
-        except Exception:
-            return {"error": "Invalid params_json"}
-
-        kwargs = {k: v for k, v in kwargs.items() if v is not None}
-
-        resolved = resolve_action(action, _ADMIN_ACTIONS, service="microsoft-agent")
-        if isinstance(resolved, dict):
-            return resolved
-        action = resolved
-
-        if action == "list_service_health":
-            return await invoke_client_method(client.list_service_health, **kwargs)
-        if action == "get_service_health":
-            return await invoke_client_method(client.get_service_health, **kwargs)
-        if action == "list_service_health_issues":
-            return await invoke_client_method(
-                client.list_service_health_issues, **kwargs
-            )
-        if action == "get_service_health_issue":
-            return await invoke_client_method(client.get_service_health_issue, **kwargs)
-        if action == "list_service_update_messages":
-            return await invoke_client_method(
-                client.list_service_update_messages, **kwargs
-            )
-        if action == "get_service_update_message":
-            return await invoke_client_method(
-                client.get_service_update_message, **kwargs
-            )
-        if action == "get_admin_sharepoint":
-            return await invoke_client_method(client.get_admin_sharepoint, **kwargs)
-        if action == "update_admin_sharepoint":
-            return await invoke_client_method(client.update_admin_sharepoint, **kwargs)
-        if action == "list_delegated_admin_relationships":
-            return await invoke_client_method(
-                client.list_delegated_admin_relationships, **kwargs
-            )
-        if action == "get_delegated_admin_relationship":
-            return await invoke_client_method(
-                client.get_delegated_admin_relationship, **kwargs
-            )
-        raise ValueError(f"Unknown action: {action}")
+        return await table.dispatch(client, action, params_json)
@@ -3,13 +3,12 @@
 Auto-generated from mcp_server.py during ecosystem standardization.
 """
 
-from agent_utilities.mcp.action_dispatch import resolve_action
-from agent_utilities.mcp.concurrency import invoke_client_method
 from fastmcp import Context, FastMCP
 from fastmcp.dependencies import Depends
 from pydantic import Field
 
 from microsoft_agent.auth import get_client_dependency
+from microsoft_agent.mcp._dispatch import ActionTable
 
 _APPLICATIONS_ACTIONS = (
     "list_applications",
@@ -28,6 +27,8 @@
 
 
 def register_applications_tools(mcp: FastMCP):
+    table = ActionTable(_APPLICATIONS_ACTIONS)
+
     @mcp.tool(tags={"applications"})
     async def microsoft_applications(
         action: str = Field(
@@ -44,46 +45,4 @@ async def microsoft_applications(
         """Manage microsoft applications operations."""
         if ctx:
             ctx.info("Executing tool...")
-        import json
-
-        try:
-            kwargs = json.loads(params_json)
-        except Exception:
-            return {"error": "Invalid params_json"}
-
-        kwargs = {k: v for k, v in kwargs.items() if v is not None}
-
-        resolved = resolve_action(
-            action, _APPLICATIONS_ACTIONS, service="microsoft-agent"
-        )
-        if isinstance(resolved, dict):
-            return resolved
-        action = resolved
-
-        if action == "list_applications":
-            return await invoke_client_method(client.list_applications, **kwargs)
-        if action == "get_application":
-            return await invoke_client_method(client.get_application, **kwargs)
-        if action == "create_application":
-            return await invoke_client_method(client.create_application, **kwargs)
-        if action == "update_application":
-            return await invoke_client_method(client.update_application, **kwargs)
-        if action == "delete_application":
-            return await invoke_client_method(client.delete_application, **kwargs)
-        if action == "add_application_password":
-            return await invoke_client_method(client.add_application_password, **kwargs)
-        if action == "remove_application_password":
-            return await invoke_client_method(
-                client.remove_application_password, **kwargs
-            )
-        if action == "list_service_principals":
-            return await invoke_client_method(client.list_service_principals, **kwargs)
-        if action == "get_service_principal":
-            return await invoke_client_method(client.get_service_principal, **kwargs)
-        if action == "create_service_principal":
-            return await invoke_client_method(client.create_service_principal, **kwargs)
-        if action == "update_service_principal":
-            return await invoke_client_method(client.update_service_principal, **kwargs)
-        if action == "delete_service_principal":
-            return await invoke_client_method(client.delete_service_principal, **kwargs)
-        raise ValueError(f"Unknown action: {action}")
+        return await table.dispatch(client, action, params_json)
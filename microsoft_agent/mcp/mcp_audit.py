@@ -3,13 +3,12 @@
 Auto-generated from mcp_server.py during ecosystem standardization.
 """
 
-from agent_utilities.mcp.action_dispatch import resolve_action
-from agent_utilities.mcp.concurrency import invoke_client_method
 from fastmcp import Context, FastMCP
 from fastmcp.dependencies import Depends
 from pydantic import Field
 
 from microsoft_agent.auth import get_client_dependency
+from microsoft_agent.mcp._dispatch import ActionTable
 
 _AUDIT_ACTIONS = (
     "list_directory_audits",
@@ -21,6 +20,8 @@
 
 
 def register_audit_tools(mcp: FastMCP):
+    table = ActionTable(_AUDIT_ACTIONS)
+
     @mcp.tool(tags={"audit"})
     async def microsoft_audit(
         action: str = Field(
@@ -37,28 +38,4 @@ async def microsoft_audit(
         """Manage microsoft audit operations."""
         if ctx:
             ctx.info("Executing tool...")
-        import json
-
-        try:
-            kwargs = json.loads(params_json)
-        except Exception:
-            return {"error": "Invalid params_json"}
-
-        kwargs = {k: v for k, v in kwargs.items() if v is not None}
-
-        resolved = resolve_action(action, _AUDIT_ACTIONS, service="microsoft-agent")
-        if isinstance(resolved, dict):
-            return resolved
-        action = resolved
-
-        if action == "list_directory_audits":
-            return await invoke_client_method(client.list_directory_audits, **kwargs)
-        if action == "get_directory_audit":
-            return await invoke_client_method(client.get_directory_audit, **kwargs)
-        if action == "list_sign_in_logs":
-            return await invoke_client_method(client.list_sign_in_logs, **kwargs)
-        if action == "get_sign_in_log":
-            return await invoke_client_method(client.get_sign_in_log, **kwargs)
-        if action == "list_provisioning_logs":
-            return await invoke_client_method(client.list_provisioning_logs, **kwargs)
-        raise ValueError(f"Unknown action: {action}")
+        return await table.dispatch(client, action, params_json)
@@ -0,0 +1,35 @@
+"""MCP tools for batch operations.
+
+Auto-generated from mcp_server.py during ecosystem standardization.
+"""
+
+from fastmcp import Context, FastMCP
+from fastmcp.dependencies import Depends
+from pydantic import Field
+
+from microsoft_agent.auth import get_client_dependency
+from microsoft_agent.mcp._dispatch import ActionTable
+
+_BATCH_ACTIONS = ("get_batch",)
+
+
+def register_batch_tools(mcp: FastMCP):
+    table = ActionTable(_BATCH_ACTIONS)
+
+    @mcp.tool(tags={"batch"})
+    async def microsoft_batch(
+        action: str = Field(
+            description="Action to perform. Must be one of: 'get_batch'"
+        ),
+        params_json: str = Field(
+            default="{}", description="JSON string of parameters to pass to the action."
+        ),
+        client=Depends(get_client_dependency),
+        ctx: Context | None = Field(
+            default=None, description="MCP context for progress reporting"
+        ),
+    ) -> dict:
+        """Manage microsoft batch operations."""
+        if ctx:
+            ctx.info("Executing tool...")
+        return await table.dispatch(client, action, params_json)
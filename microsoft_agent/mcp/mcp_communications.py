@@ -3,13 +3,12 @@
 Auto-generated from mcp_server.py during ecosystem standardization.
 """
 
-from agent_utilities.mcp.action_dispatch import resolve_action
-from agent_utilities.mcp.concurrency import invoke_client_method
 from fastmcp import Context, FastMCP
 from fastmcp.dependencies import Depends
 from pydantic import Field
 
 from microsoft_agent.auth import get_client_dependency
+from microsoft_agent.mcp._dispatch import ActionTable
 
 _COMMUNICATIONS_ACTIONS = (
     "list_online_meetings",
@@ -26,6 +25,8 @@
 
 
 def register_communications_tools(mcp: FastMCP):
+    table = ActionTable(_COMMUNICATIONS_ACTIONS)
+
     @mcp.tool(tags={"communications"})
     async def microsoft_communications(
         action: str = Field(
@@ -42,40 +43,4 @@ async def microsoft_communications(
         """Manage microsoft communications operations."""
         if ctx:
             ctx.info("Executing tool...")
-        import json
-
-        try:
-            kwargs = json.loads(params_json)
-        except Exception:
-            return {"error": "Invalid params_json"}
-
-        kwargs = {k: v for k, v in kwargs.items() if v is not None}
-
-        resolved = resolve_action(
-            action, _COMMUNICATIONS_ACTIONS, service="microsoft-agent"
-        )
-        if isinstance(resolved, dict):
-            return resolved
-        action = resolved
-
-        if action == "list_online_meetings":
-            return await invoke_client_method(client.list_online_meetings, **kwargs)
-        if action == "get_online_meeting":
-            return await invoke_client_method(client.get_online_meeting, **kwargs)
-        if action == "create_online_meeting":
-            return await invoke_client_method(client.create_online_meeting, **kwargs)
-        if action == "update_online_meeting":
-            return await invoke_client_method(client.update_online_meeting, **kwargs)
-        if action == "delete_online_meeting":
-            return await invoke_client_method(client.delete_online_meeting, **kwargs)
-        if action == "list_call_records":
-            return await invoke_client_method(client.list_call_records, **kwargs)
-        if action == "get_call_record":
-            return await invoke_client_method(client.get_call_record, **kwargs)
-        if action == "list_presences":
-            return await invoke_client_method(client.list_presences, **kwargs)
-        if action == "get_presence":
-            return await invoke_client_method(client.get_presence, **kwargs)
-        if action == "get_my_presence":
-            return await invoke_client_method(client.get_my_presence, **kwargs)
-        raise ValueError(f"Unknown action: {action}")
+        return await table.dispatch(client, action, params_json)
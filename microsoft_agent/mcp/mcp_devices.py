@@ -3,13 +3,12 @@
 Auto-generated from mcp_server.py during ecosystem standardization.
 """
 
-from agent_utilities.mcp.action_dispatch import resolve_action
-from agent_utilities.mcp.concurrency import invoke_client_method
 from fastmcp import Context, FastMCP
 from fastmcp.dependencies import Depends
 from pydantic import Field
 
 from microsoft_agent.auth import get_client_dependency
+from microsoft_agent.mcp._dispatch import ActionTable
 
 _DEVICES_ACTIONS = (
     "list_devices",
@@ -25,6 +24,8 @@
 
 
 def register_devices_tools(mcp: FastMCP):
+    table = ActionTable(_DEVICES_ACTIONS)
+
     @mcp.tool(tags={"devices"})
     async def microsoft_devices(
         action: str = Field(
@@ -41,40 +42,4 @@ async def microsoft_devices(
         """Manage microsoft devices operations."""
         if ctx:
             ctx.info("Executing tool...")
-        import json
-
-        try:
-            kwargs = json.loads(params_json)
-        except Exception:
-            return {"error": "Invalid params_json"}
-
-        kwargs = {k: v for k, v in kwargs.items() if v is not None}
-
-        resolved = resolve_action(action, _DEVICES_ACTIONS, service="microsoft-agent")
-        if isinstance(resolved, dict):
-            return resolved
-        action = resolved
-
-        if action == "list_devices":
-            return await invoke_client_method(client.list_devices, **kwargs)
-        if action == "get_device":
-            return await invoke_client_method(client.get_device, **kwargs)
-        if action == "delete_device":
-            return await invoke_client_method(client.delete_device, **kwargs)
-        if action == "list_managed_devices":
-            return await invoke_client_method(client.list_managed_devices, **kwargs)
-        if action == "get_managed_device":
-            return await invoke_client_method(client.get_managed_device, **kwargs)
-        if action == "list_device_compliance_policies":
-            return await invoke_client_method(
-                client.list_device_compliance_policies, **kwargs
-            )
-        if action == "list_device_configurations":
-            return await invoke_client_method(
-                client.list_device_configurations, **kwargs
-            )
-        if action == "wipe_managed_device":
-            return await invoke_client_method(client.wipe_managed_device, **kwargs)
-        if action == "retire_managed_device":
-            return await invoke_client_method(client.retire_managed_device, **kwargs)
-        raise ValueError(f"Unknown action: {action}")
+        return await table.dispatch(client, action, params_json)
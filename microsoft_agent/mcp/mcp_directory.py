@@ -3,13 +3,12 @@
 Auto-generated from mcp_server.py during ecosystem standardization.
 """
 
-from agent_utilities.mcp.action_dispatch import resolve_action
-from agent_utilities.mcp.concurrency import invoke_client_method
 from fastmcp import Context, FastMCP
 from fastmcp.dependencies import Depends
 from pydantic import Field
 
 from microsoft_agent.auth import get_client_dependency
+from microsoft_agent.mcp._dispatch import ActionTable
 
 _DIRECTORY_ACTIONS = (
     "list_directory_objects",
@@ -28,6 +27,8 @@
 
 
 def register_directory_tools(mcp: FastMCP):
+    table = ActionTable(_DIRECTORY_ACTIONS)
+
     @mcp.tool(tags={"directory"})
     async def microsoft_directory(
         action: str = Field(
@@ -44,44 +45,4 @@ async def microsoft_directory(
         """Manage microsoft directory operations."""
         if ctx:
             ctx.info("Executing tool...")
-        import json
-
-        try:
-            kwargs = json.loads(params_json)
-        except Exception:
-            return {"error": "Invalid params_json"}
-
-        kwargs = {k: v for k, v in kwargs.items() if v is not None}
-
-        resolved = resolve_action(action, _DIRECTORY_ACTIONS, service="microsoft-agent")
-        if isinstance(resolved, dict):
-            return resolved
-        action = resolved
-
-        if action == "list_directory_objects":
-            return await invoke_client_method(client.list_directory_objects, **kwargs)
-        if action == "get_directory_object":
-            return await invoke_client_method(client.get_directory_object, **kwargs)
-        if action == "list_directory_roles":
-            return await invoke_client_method(client.list_directory_roles, **kwargs)
-        if action == "get_directory_role":
-            return await invoke_client_method(client.get_directory_role, **kwargs)
-        if action == "list_directory_role_templates":
-            return await invoke_client_method(
-                client.list_directory_role_templates, **kwargs
-            )
-        if action == "list_deleted_items":
-            return await invoke_client_method(client.list_deleted_items, **kwargs)
-        if action == "restore_deleted_item":
-            return await invoke_client_method(client.restore_deleted_item, **kwargs)
-        if action == "list_role_definitions":
-            return await invoke_client_method(client.list_role_definitions, **kwargs)
-        if action == "get_role_definition":
-            return await invoke_client_method(client.get_role_definition, **kwargs)
-        if action == "list_role_assignments":
-            return await invoke_client_method(client.list_role_assignments, **kwargs)
-        if action == "get_role_assignment":
-            return await invoke_client_method(client.get_role_assignment, **kwargs)
-        if action == "create_role_assignment":
-            return await invoke_client_method(client.create_role_assignment, **kwargs)
-        raise ValueError(f"Unknown action: {action}")
+        return await table.dispatch(client, action, params_json)
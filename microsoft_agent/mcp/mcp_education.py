@@ -3,13 +3,12 @@
 Auto-generated from mcp_server.py during ecosystem standardization.
 """
 
-from agent_utilities.mcp.action_dispatch import resolve_action
-from agent_utilities.mcp.concurrency import invoke_client_method
 from fastmcp import Context, FastMCP
 from fastmcp.dependencies import Depends
 from pydantic import Field
 
 from microsoft_agent.auth import get_client_dependency
+from microsoft_agent.mcp._dispatch import ActionTable
 
 _EDUCATION_ACTIONS = (
     "list_education_classes",
@@ -22,6 +21,8 @@
 
 
 def register_education_tools(mcp: FastMCP):
+    table = ActionTable(_EDUCATION_ACTIONS)
+
     @mcp.tool(tags={"education"})
     async def microsoft_education(
         action: str = Field(
@@ -38,32 +39,4 @@ async def microsoft_education(
         """Manage microsoft education operations."""
         if ctx:
             ctx.info("Executing tool...")
-        import json
-
-        try:
-            kwargs = json.loads(params_json)
-        except Exception:
-            return {"error": "Invalid params_json"}
-
-        kwargs = {k: v for k, v in kwargs.items() if v is not None}
-
-        resolved = resolve_action(action, _EDUCATION_ACTIONS, service="microsoft-agent")
-        if isinstance(resolved, dict):
-            return resolved
-        action = resolved
-
-        if action == "list_education_classes":
-            return await invoke_client_method(client.list_education_classes, **kwargs)
-        if action == "get_education_class":
-            return await invoke_client_method(client.get_education_class, **kwargs)
-        if action == "list_education_schools":
-            return await invoke_client_method(client.list_education_schools, **kwargs)
-        if action == "get_education_school":
-            return await invoke_client_method(client.get_education_school, **kwargs)
-        if action == "list_education_users":
-            return await invoke_client_method(client.list_education_users, **kwargs)
-        if action == "list_education_assignments":
-            return await invoke_client_method(
-                client.list_education_assignments, **kwargs
-            )
-        raise ValueError(f"Unknown action: {action}")
+        return await table.dispatch(client, action, params_json)
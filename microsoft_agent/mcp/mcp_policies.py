@@ -3,13 +3,12 @@
 Auto-generated from mcp_server.py during ecosystem standardization.
 """
 
-from agent_utilities.mcp.action_dispatch import resolve_action
-from agent_utilities.mcp.concurrency import invoke_client_method
 from fastmcp import Context, FastMCP
 from fastmcp.dependencies import Depends
 from pydantic import Field
 
 from microsoft_agent.auth import get_client_dependency
+from microsoft_agent.mcp._dispatch import ActionTable
 
 _POLICIES_ACTIONS = (
     "get_authorization_policy",
@@ -21,6 +20,8 @@
 
 
 def register_policies_tools(mcp: FastMCP):
+    table = ActionTable(_POLICIES_ACTIONS)
+
     @mcp.tool(tags={"policies"})
     async def microsoft_policies(
         action: str = Field(
@@ -37,34 +38,4 @@ async def microsoft_policies(
         """Manage microsoft policies operations."""
         if ctx:
             ctx.info("Executing tool...")
-        import json
-
-        try:
-            kwargs = json.loads(params_json)
-        except Exception:
-            return {"error": "Invalid params_json"}
-
-        kwargs = {k: v for k, v in kwargs.items() if v is not None}
-
-        resolved = resolve_action(action, _POLICIES_ACTIONS, service="microsoft-agent")
-        if isinstance(resolved, dict):
-            return resolved
-        action = resolved
-
-        if action == "get_authorization_policy":
-            return await invoke_client_method(client.get_authorization_policy, **kwargs)
-        if action == "list_token_lifetime_policies":
-            return await invoke_client_method(
-                client.list_token_lifetime_policies, **kwargs
-            )
-        if action == "list_token_issuance_policies":
-            return await invoke_client_method(
-                client.list_token_issuance_policies, **kwargs
-            )
-        if action == "list_permission_grant_policies":
-            return await invoke_client_method(
-                client.list_permission_grant_policies, **kwargs
-            )
-        if action == "get_admin_consent_policy":
-            return await invoke_client_method(client.get_admin_consent_policy, **kwargs)
-        raise ValueError(f"Unknown action: {action}")
+        return await table.dispatch(client, action, params_json)
@@ -3,13 +3,12 @@
 Auto-generated from mcp_server.py during ecosystem standardization.
 """
 
-from agent_utilities.mcp.action_dispatch import resolve_action
-from agent_utilities.mcp.concurrency import invoke_client_method
 from fastmcp import Context, FastMCP
 from fastmcp.dependencies import Depends
 from pydantic import Field
 
 from microsoft_agent.auth import get_client_dependency
+from microsoft_agent.mcp._dispatch import ActionTable
 
 _PRIVACY_ACTIONS = (
     "list_subject_rights_requests",
@@ -19,6 +18,8 @@
 
 
 def register_privacy_tools(mcp: FastMCP):
+    table = ActionTable(_PRIVACY_ACTIONS)
+
     @mcp.tool(tags={"privacy"})
     async def microsoft_privacy(
         action: str = Field(
@@ -35,30 +36,4 @@ async def microsoft_privacy(
         """Manage microsoft privacy operations."""
         if ctx:
             ctx.info("Executing tool...")
-        import json
-
-        try:
-            kwargs = json.loads(params_json)
-        except Exception:
-            return {"error": "Invalid params_json"}
-
-        kwargs = {k: v for k, v in kwargs.items() if v is not None}
-
-        resolved = resolve_action(action, _PRIVACY_ACTIONS, service="microsoft-agent")
-        if isinstance(resolved, dict):
-            return resolved
-        action = resolved
-
-        if action == "list_subject_rights_requests":
-            return await invoke_client_method(
-                client.list_subject_rights_requests, **kwargs
-            )
-        if action == "get_subject_rights_request":
-            return await invoke_client_method(
-                client.get_subject_rights_request, **kwargs
-            )
-        if action == "create_subject_rights_request":
-            return await invoke_client_method(
-                client.create_subject_rights_request, **kwargs
-            )
-        raise ValueError(f"Unknown action: {action}")
+        return await table.dispatch(client, action, params_json)
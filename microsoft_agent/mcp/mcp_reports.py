@@ -3,13 +3,12 @@
 Auto-generated from mcp_server.py during ecosystem standardization.
 """
 
-from agent_utilities.mcp.action_dispatch import resolve_action
-from agent_utilities.mcp.concurrency import invoke_client_method
 from fastmcp import Context, FastMCP
 from fastmcp.dependencies import Depends
 from pydantic import Field
 
 from microsoft_agent.auth import get_client_dependency
+from microsoft_agent.mcp._dispatch import ActionTable
 
 _REPORTS_ACTIONS = (
     "get_email_activity_report",
@@ -22,6 +21,8 @@
 
 
 def register_reports_tools(mcp: FastMCP):
+    table = ActionTable(_REPORTS_ACTIONS)
+
     @mcp.tool(tags={"reports"})
     async def microsoft_reports(
         action: str = Field(
@@ -38,38 +39,4 @@ async def microsoft_reports(
         """Manage microsoft reports operations."""
         if ctx:
             ctx.info("Executing tool...")
-        import json
-
-        try:
-            kwargs = json.loads(params_json)
-        except Exception:
-            return {"error": "Invalid params_json"}
-
-        kwargs = {k: v for k, v in kwargs.items() if v is not None}
-
-        resolved = resolve_action(action, _REPORTS_ACTIONS, service="microsoft-agent")
-        if isinstance(resolved, dict):
-            return resolved
-        action = resolved
-
-        if action == "get_email_activity_report":
-            return await invoke_client_method(
-                client.get_email_activity_report, **kwargs
-            )
-        if action == "get_mailbox_usage_report":
-            return await invoke_client_method(client.get_mailbox_usage_report, **kwargs)
-        if action == "get_office365_active_users":
-            return await invoke_client_method(
-                client.get_office365_active_users, **kwargs
-            )
-        if action == "get_sharepoint_activity_report":
-            return await invoke_client_method(
-                client.get_sharepoint_activity_report, **kwargs
-            )
-        if action == "get_teams_user_activity":
-            return await invoke_client_method(client.get_teams_user_activity, **kwargs)
-        if action == "get_onedrive_usage_report":
-            return await invoke_client_method(
-                client.get_onedrive_usage_report, **kwargs
-            )
-        raise ValueError(f"Unknown action: {action}")
+        return await table.dispatch(client, action, params_json)
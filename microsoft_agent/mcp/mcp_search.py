@@ -3,18 +3,19 @@
 Auto-generated from mcp_server.py during ecosystem standardization.
 """
 
-from agent_utilities.mcp.action_dispatch import resolve_action
-from agent_utilities.mcp.concurrency import invoke_client_method
 from fastmcp import Context, FastMCP
 from fastmcp.dependencies import Depends
 from pydantic import Field
 
 from microsoft_agent.auth import get_client_dependency
+from microsoft_agent.mcp._dispatch import ActionTable
 
 _SEARCH_ACTIONS = ("search_query", "search_tools")
 
 
 def register_search_tools(mcp: FastMCP):
+    table = ActionTable(_SEARCH_ACTIONS)
+
     @mcp.tool(tags={"search"})
     async def microsoft_search(
         action: str = Field(
@@ -31,22 +32,4 @@ async def microsoft_search(
         """Manage microsoft search operations."""
         if ctx:
             ctx.info("Executing tool...")
-        import json
-
-        try:
-            kwargs = json.loads(params_json)
-        except Exception:
-            return {"error": "Invalid params_json"}
-
-        kwargs = {k: v for k, v in kwargs.items() if v is not None}
-
-        resolved = resolve_action(action, _SEARCH_ACTIONS, service="microsoft-agent")
-        if isinstance(resolved, dict):
-            return resolved
-        action = resolved
-
-        if action == "search_query":
-            return await invoke_client_method(client.search_query, **kwargs)
-        if action == "search_tools":
-            return await invoke_client_method(client.search_tools, **kwargs)
-        raise ValueError(f"Unknown action: {action}")
+        return await table.dispatch(client, action, params_json)
@@ -3,13 +3,12 @@
 Auto-generated from mcp_server.py during ecosystem standardization.
 """
 
-from agent_utilities.mcp.action_dispatch import resolve_action
-from agent_utilities.mcp.concurrency import invoke_client_method
 from fastmcp import Context, FastMCP
 from fastmcp.dependencies import Depends
 from pydantic import Field
 
 from microsoft_agent.auth import get_client_dependency
+from microsoft_agent.mcp._dispatch import ActionTable
 
 _SITES_ACTIONS = (
     "list_sites",
@@ -20,6 +19,8 @@
 
 
 def register_sites_tools(mcp: FastMCP):
+    table = ActionTable(_SITES_ACTIONS)
+
     @mcp.tool(tags={"sites"})
     async def microsoft_sites(
         action: str = Field(
@@ -36,30 +37,4 @@ async def microsoft_sites(
         """Manage microsoft sites operations."""
         if ctx:
             ctx.info("Executing tool...")
-        import json
-
-        try:
-            kwargs = json.loads(params_json)
-        except Exception:
-            return {"error": "Invalid params_json"}
-
-        kwargs = {k: v for k, v in kwargs.items() if v is not None}
-
-        resolved = resolve_action(action, _SITES_ACTIONS, service="microsoft-agent")
-        if isinstance(resolved, dict):
-            return resolved
-        action = resolved
-
-        if action == "list_sites":
-            return await invoke_client_method(client.list_sites, **kwargs)
-        if action == "get_site":
-            return await invoke_client_method(client.get_site, **kwargs)
-        if action == "get_sharepoint_site_by_path":
-            return await invoke_client_method(
-                client.get_sharepoint_site_by_path, **kwargs
-            )
-        if action == "get_sharepoint_sites_delta":
-            return await invoke_client_method(
-                client.get_sharepoint_sites_delta, **kwargs
-            )
-        raise ValueError(f"Unknown action: {action}")
+        return await table.dispatch(client, action, params_json)
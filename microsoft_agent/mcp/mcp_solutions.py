@@ -3,13 +3,12 @@
 Auto-generated from mcp_server.py during ecosystem standardization.
 """
 
-from agent_utilities.mcp.action_dispatch import resolve_action
-from agent_utilities.mcp.concurrency import invoke_client_method
 from fastmcp import Context, FastMCP
 from fastmcp.dependencies import Depends
 from pydantic import Field
 
 from microsoft_agent.auth import get_client_dependency
+from microsoft_agent.mcp._dispatch import ActionTable
 
 _SOLUTIONS_ACTIONS = (
     "list_booking_businesses",
@@ -21,6 +20,8 @@
 
 
 def register_solutions_tools(mcp: FastMCP):
+    table = ActionTable(_SOLUTIONS_ACTIONS)
+
     @mcp.tool(tags={"solutions"})
     async def microsoft_solutions(
         action: str = Field(
@@ -37,32 +38,4 @@ async def microsoft_solutions(
         """Manage microsoft solutions operations."""
         if ctx:
             ctx.info("Executing tool...")
-        import json
-
-        try:
-            kwargs = json.loads(params_json)
-        except Exception:
-            return {"error": "Invalid params_json"}
-
-        kwargs = {k: v for k, v in kwargs.items() if v is not None}
-
-        resolved = resolve_action(action, _SOLUTIONS_ACTIONS, service="microsoft-agent")
-        if isinstance(resolved, dict):
-            return resolved
-        action = resolved
-
-        if action == "list_booking_businesses":
-            return await invoke_client_method(client.list_booking_businesses, **kwargs)
-        if action == "get_booking_business":
-            return await invoke_client_method(client.get_booking_business, **kwargs)
-        if action == "list_booking_appointments":
-            return await invoke_client_method(
-                client.list_booking_appointments, **kwargs
-            )
-        if action == "create_booking_appointment":
-            return await invoke_client_method(
-                client.create_booking_appointment, **kwargs
-            )
-        if action == "list_virtual_events":
-            return await invoke_client_method(client.list_virtual_events, **kwargs)
-        raise ValueError(f"Unknown action: {action}")
+        return await table.dispatch(client, action, params_json)
@@ -0,0 +1,41 @@
+"""MCP tools for sync operations.
+
+Auto-generated from mcp_server.py during ecosystem standardization.
+"""
+
+from fastmcp import Context, FastMCP
+from fastmcp.dependencies import Depends
+from pydantic import Field
+
+from microsoft_agent.auth import get_client_dependency
+from microsoft_agent.mcp._dispatch import ActionTable
+
+_SYNC_ACTIONS = (
+    "sync_mail_messages",
+    "sync_calendar_events",
+    "sync_outlook_contacts",
+    "sync_users",
+    "sync_groups",
+)
+
+
+def register_sync_tools(mcp: FastMCP):
+    table = ActionTable(_SYNC_ACTIONS)
+
+    @mcp.tool(tags={"sync"})
+    async def microsoft_sync(
+        action: str = Field(
+            description="Action to perform. Must be one of: 'sync_mail_messages', 'sync_calendar_events', 'sync_outlook_contacts', 'sync_users', 'sync_groups'"
+        ),
+        params_json: str = Field(
+            default="{}", description="JSON string of parameters to pass to the action."
+        ),
+        client=Depends(get_client_dependency),
+        ctx: Context | None = Field(
+            default=None, description="MCP context for progress reporting"
+        ),
+    ) -> dict:
+        """Manage microsoft sync operations."""
+        if ctx:
+            ctx.info("Executing tool...")
+        return await table.dispatch(client, action, params_json)
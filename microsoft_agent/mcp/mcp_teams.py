@@ -3,18 +3,19 @@
 Auto-generated from mcp_server.py during ecosystem standardization.
 """
 
-from agent_utilities.mcp.action_dispatch import resolve_action
-from agent_utilities.mcp.concurrency import invoke_client_method
 from fastmcp import Context, FastMCP
 from fastmcp.dependencies import Depends
 from pydantic import Field
 
 from microsoft_agent.auth import get_client_dependency
+from microsoft_agent.mcp._dispatch import ActionTable
 
 _TEAMS_ACTIONS = ("get_team", "get_team_channel")
 
 
 def register_teams_tools(mcp: FastMCP):
+    table = ActionTable(_TEAMS_ACTIONS)
+
     @mcp.tool(tags={"teams"})
     async def microsoft_teams(
         action: str = Field(
@@ -31,22 +32,4 @@ async def microsoft_teams(
         """Manage microsoft teams operations."""
         if ctx:
             ctx.info("Executing tool...")
-        import json
-
-        try:
-            kwargs = json.loads(params_json)
-        except Exception:
-            return {"error": "Invalid params_json"}
-
-        kwargs = {k: v for k, v in kwargs.items() if v is not None}
-
-        resolved = resolve_action(action, _TEAMS_ACTIONS, service="microsoft-agent")
-        if isinstance(resolved, dict):
-            return resolved
-        action = resolved
-
-        if action == "get_team":
-            return await invoke_client_method(client.get_team, **kwargs)
-        if action == "get_team_channel":
-            return await invoke_client_method(client.get_team_channel, **kwargs)
-        raise ValueError(f"Unknown action: {action}")
+        return await table.dispatch(client, action, params_json)
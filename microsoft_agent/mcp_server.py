@@ -25,7 +25,9 @@
 
 import logging
 import sys
-from typing import Any
+from collections.abc import Callable
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 from agent_utilities.core.config import load_config
 from agent_utilities.mcp.concurrency import invoke_client_method
@@ -34,128 +36,54 @@
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 
+from microsoft_agent import mcp as tool_modules
 from microsoft_agent._version import __version__
-from microsoft_agent.api_client import MicrosoftGraphApi
 from microsoft_agent.auth import get_client_dependency
-from microsoft_agent.integration_tools import (
-    clear_integration_client_caches,
-    register_document_tools,
-    register_intune_tools,
-    register_power_platform_tools,
-    register_windows_companion_tools,
-)
-from microsoft_agent.mcp import (
-    register_admin_tools as register_admin_tools,
-)
-from microsoft_agent.mcp import (
-    register_agreements_tools as register_agreements_tools,
-)
-from microsoft_agent.mcp import (
-    register_applications_tools as register_applications_tools,
-)
-from microsoft_agent.mcp import (
-    register_audit_tools as register_audit_tools,
-)
-from microsoft_agent.mcp import (
-    register_auth_tools as register_auth_tools,
-)
-from microsoft_agent.mcp import (
-    register_calendar_tools as register_calendar_tools,
-)
-from microsoft_agent.mcp import (
-    register_chat_tools as register_chat_tools,
-)
-from microsoft_agent.mcp import (
-    register_communications_tools as register_communications_tools,
-)
-from microsoft_agent.mcp import (
-    register_connections_tools as register_connections_tools,
-)
-from microsoft_agent.mcp import (
-    register_contacts_tools as register_contacts_tools,
-)
-from microsoft_agent.mcp import (
-    register_devices_tools as register_devices_tools,
-)
-from microsoft_agent.mcp import (
-    register_directory_tools as register_directory_tools,
-)
-from microsoft_agent.mcp import (
-    register_domains_tools as register_domains_tools,
-)
-from microsoft_agent.mcp import (
-    register_education_tools as register_education_tools,
-)
-from microsoft_agent.mcp import (
-    register_employee_experience_tools as register_employee_experience_tools,
-)
-from microsoft_agent.mcp import (
-    register_files_tools as register_files_tools,
-)
-from microsoft_agent.mcp import (
-    register_groups_tools as register_groups_tools,
-)
-from microsoft_agent.mcp import (
-    register_identity_tools as register_identity_tools,
-)
-from microsoft_agent.mcp import (
-    register_mail_tools as register_mail_tools,
-)
-from microsoft_agent.mcp import (
-    register_meta_tools as register_meta_tools,
-)
-from microsoft_agent.mcp import (
-    register_notes_tools as register_notes_tools,
-)
-from microsoft_agent.mcp import (
-    register_organization_tools as register_organization_tools,
-)
-from microsoft_agent.mcp import (
-    register_places_tools as register_places_tools,
-)
-from microsoft_agent.mcp import (
-    register_policies_tools as register_policies_tools,
-)
-from microsoft_agent.mcp import (
-    register_print_tools as register_print_tools,
-)
-from microsoft_agent.mcp import (
-    register_privacy_tools as register_privacy_tools,
-)
-from microsoft_agent.mcp import (
-    register_reports_tools as register_reports_tools,
-)
-from microsoft_agent.mcp import (
-    register_search_tools as register_search_tools,
-)
-from microsoft_agent.mcp import (
-    register_security_tools as register_security_tools,
-)
-from microsoft_agent.mcp import (
-    register_sites_tools as register_sites_tools,
-)
-from microsoft_agent.mcp import (
-    register_solutions_tools as register_solutions_tools,
-)
-from microsoft_agent.mcp import (
-    register_storage_tools as register_storage_tools,
-)
-from microsoft_agent.mcp import (
-    register_subscriptions_tools as register_subscriptions_tools,
-)
-from microsoft_agent.mcp import (
-    register_tasks_tools as register_tasks_tools,
-)
-from microsoft_agent.mcp import (
-    register_teams_tools as register_teams_tools,
-)
-from microsoft_agent.mcp import (
-    register_user_tools as register_user_tools,
-)
-from microsoft_agent.office_bridge import register_office_bridge
+from microsoft_agent.graph_client_pool import shutdown_graph_client_pool
 from microsoft_agent.settings import get_settings
 from microsoft_agent.tool_policy import MicrosoftToolPolicy, ToolPolicyMiddleware
 
+if TYPE_CHECKING:
+    from microsoft_agent.api_client import MicrosoftGraphApi
+    from microsoft_agent.response_cache import ResponseCacheMiddleware
+
+# The Graph client, the Graph SDK, and the optional integration groups are
+# imported only when the server is built, and then only for enabled groups.
+_INTEGRATION_MODULE = "microsoft_agent.integration_tools"
+
+
+# One Graph tool family per registrar exported by ``microsoft_agent.mcp``.
+_GRAPH_TOOL_FAMILIES = tuple(
+    name.removeprefix("register_").removesuffix("_tools")
+    for name in tool_modules.__all__
+)
+
+
+def _lazy_registrar(family: str) -> Callable[[FastMCP], Any]:
+    """Return a registrar that imports its tool family only if it is enabled."""
+
+    name = f"register_{family}_tools"
+
+    def register(mcp: FastMCP) -> Any:
+        if not get_settings().tool_group_enabled(family):
+            return None
+        return getattr(tool_modules, name)(mcp)
+
+    register.__name__ = register.__qualname__ = name
+    return register
+
+
+def _family_actions(family: str) -> tuple[str, ...]:
+    """Return the routed actions a tool family declares, without the client."""
+
+    module = import_module(f"{tool_modules.__name__}.mcp_{family}")
+    return getattr(module, f"_{family.upper()}_ACTIONS")
+
+
+for _family in _GRAPH_TOOL_FAMILIES:
+    globals()[f"register_{_family}_tools"] = _lazy_registrar(_family)
+del _family
+
 logger = get_logger(name="microsoft-agent")
 logger.setLevel(logging.INFO)
 
@@ -195,7 +123,7 @@ def _bounded_params(kind: str, params_json: str) -> dict[str, Any]:
     async def _load_records(
         kind: str,
         params_json: str,
-        client: MicrosoftGraphApi,
+        client: "MicrosoftGraphApi",
         *,
         drive_id: str | None = None,
         drive_item_id: str | None = None,
@@ -261,6 +189,37 @@ async def list_microsoft_ingestion_projection(
     return None
 
 
+def register_runtime_stats_tool(
+    mcp: FastMCP,
+    policy: MicrosoftToolPolicy,
+    response_cache: "ResponseCacheMiddleware | None" = None,
+) -> None:
+    @mcp.tool(tags={"system", "read"})
+    async def get_microsoft_runtime_stats() -> dict[str, Any]:
+        """Return process-wide counters for policy, caches, retries, and coalescing.
+
+        Counters are plain in-memory tallies kept for diagnostics. They reset
+        with the process and may be approximate while requests are in flight.
+        A cache that was never created reports ``null``.
+        """
+
+        from microsoft_agent.auth import access_token_cache_stats
+        from microsoft_agent.graph_client_pool import get_graph_client_pool
+        from microsoft_agent.response_cache import etag_store_stats
+        from microsoft_agent.retry_policy import get_retry_policy
+
+        return {
+            "tool_policy": policy.stats(),
+            "response_cache": (
+                None if response_cache is None else response_cache.cache.stats()
+            ),
+            "etag_store": etag_store_stats(),
+            "token_cache": access_token_cache_stats(),
+            "retries": get_retry_policy().stats(),
+            "read_coalescing": get_graph_client_pool().stats(),
+        }
+
+
 def get_mcp_instance() -> tuple[Any, ...]:
     """Initialize and return the MCP instance."""
     load_config()
@@ -274,28 +233,60 @@ def get_mcp_instance() -> tuple[Any, ...]:
     async def health_check(request: Request) -> JSONResponse:
         return JSONResponse({"status": "OK"})
 
-    register_tool_surface(
-        mcp,
-        client_cls=MicrosoftGraphApi,
-        get_client=get_client_dependency,
-        service="microsoft-agent",
-        tools_module=sys.modules[__name__],
-    )
-
     settings = get_settings()
+    graph_families = [
+        family for family in _GRAPH_TOOL_FAMILIES if settings.tool_group_enabled(family)
+    ]
+    if graph_families:
+        from microsoft_agent.api_client import MicrosoftGraphApi
+
+        register_tool_surface(
+            mcp,
+            client_cls=MicrosoftGraphApi,
+            get_client=get_client_dependency,
+            service="microsoft-agent",
+            tools_module=sys.modules[__name__],
+        )
+
     if settings.tool_group_enabled("documents"):
+        from microsoft_agent.integration_tools import register_document_tools
+        from microsoft_agent.office_bridge import register_office_bridge
+
         register_document_tools(mcp)
         register_office_bridge(mcp)
     if settings.tool_group_enabled("power_platform"):
+        from microsoft_agent.integration_tools import register_power_platform_tools
+
         register_power_platform_tools(mcp)
     if settings.tool_group_enabled("windows"):
+        from microsoft_agent.integration_tools import (
+            register_windows_companion_tools,
+        )
+
         register_windows_companion_tools(mcp)
     if settings.tool_group_enabled("intune"):
+        from microsoft_agent.integration_tools import register_intune_tools
+
         register_intune_tools(mcp)
 
     for mw in middlewares:
         mcp.add_middleware(mw)
-    mcp.add_middleware(ToolPolicyMiddleware(MicrosoftToolPolicy(settings)))
+    # Policy decisions for the enabled families' routed actions are
+    # precomputed; other tool names are decided on first use.
+    policy = MicrosoftToolPolicy(
+        settings,
+        tool_names=(
+            action for family in graph_families for action in _family_actions(family)
+        ),
+    )
+    mcp.add_middleware(ToolPolicyMiddleware(policy))
+    response_cache = None
+    if settings.response_cache_enabled:
+        from microsoft_agent.response_cache import ResponseCacheMiddleware
+
+        response_cache = ResponseCacheMiddleware(settings)
+        mcp.add_middleware(response_cache)
+    register_runtime_stats_tool(mcp, policy, response_cache)
     return mcp, args, middlewares
 
 
@@ -317,7 +308,13 @@ def mcp_server() -> None:
             logger.error("Invalid transport", extra={"transport": args.transport})
             sys.exit(1)
     finally:
-        clear_integration_client_caches()
+        try:
+            # Integration clients exist only if an integration group loaded.
+            integration_tools = sys.modules.get(_INTEGRATION_MODULE)
+            if integration_tools is not None:
+                integration_tools.clear_integration_client_caches()
+        finally:
+            shutdown_graph_client_pool()
 
 
 if __name__ == "__main__":
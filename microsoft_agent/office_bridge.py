@@ -16,6 +16,8 @@
 
 import asyncio
 import hashlib
+import heapq
+import itertools
 import json
 import secrets
 from collections import defaultdict, deque
@@ -489,6 +491,10 @@ def __init__(
         self._session_tokens: dict[bytes, UUID] = {}
         self._commands: dict[UUID, _CommandRecord] = {}
         self._session_commands: dict[UUID, set[UUID]] = defaultdict(set)
+        # Lazy min-heap of (deadline, tiebreak, kind, key); entries are
+        # re-checked against the live record when they come due.
+        self._expiry: list[tuple[datetime, int, str, Any]] = []
+        self._expiry_sequence = itertools.count()
 
     def _now(self) -> datetime:
         now = self._clock()
@@ -496,32 +502,55 @@ def _now(self) -> datetime:
             raise ValueError("Office bridge clock must return an aware datetime")
         return now.astimezone(UTC)
 
-    def _cleanup_locked(self, now: datetime) -> None:
-        for digest, pairing in tuple(self._pairings.items()):
-            if pairing.expires_at <= now:
-                self._pairings.pop(digest, None)
-
-        for session_id, session in tuple(self._sessions.items()):
-            if (
-                session.expires_at <= now
-                or session.last_seen_at + SESSION_IDLE_TTL <= now
-            ):
-                self._expire_session_locked(session_id, now)
+    def _schedule_locked(self, deadline: datetime, kind: str, key: Any) -> None:
+        heapq.heappush(self._expiry, (deadline, next(self._expiry_sequence), kind, key))
 
-        for command_id, command in tuple(self._commands.items()):
-            if (
-                command.state
-                in {OfficeCommandState.QUEUED, OfficeCommandState.DELIVERED}
-                and command.envelope.expires_at <= now
-            ):
-                command.state = OfficeCommandState.EXPIRED
-                command.result_expires_at = now + RESULT_TTL
-                command.completed.set()
-            if (
-                command.result_expires_at is not None
-                and command.result_expires_at <= now
-            ):
-                self._remove_command_locked(command_id)
+    def _cleanup_locked(self, now: datetime) -> None:
+        """Expire only records whose scheduled deadline has passed."""
+
+        pending = {OfficeCommandState.QUEUED, OfficeCommandState.DELIVERED}
+        while self._expiry and self._expiry[0][0] <= now:
+            _, _, kind, key = heapq.heappop(self._expiry)
+            if kind == "pairing":
+                pairing = self._pairings.get(key)
+                if pairing is not None and pairing.expires_at <= now:
+                    self._pairings.pop(key, None)
+            elif kind == "session":
+                session = self._sessions.get(key)
+                if session is None:
+                    continue
+                deadline = min(
+                    session.expires_at, session.last_seen_at + SESSION_IDLE_TTL
+                )
+                if deadline <= now:
+                    self._expire_session_locked(key, now)
+                else:
+                    # Seen since this entry was scheduled; follow the idle window.
+                    self._schedule_locked(deadline, "session", key)
+            elif kind == "command":
+                command = self._commands.get(key)
+                if (
+                    command is not None
+                    and command.state in pending
+                    and command.envelope.expires_at <= now
+                ):
+                    command.state = OfficeCommandState.EXPIRED
+                    self._retain_result_locked(command, now)
+            else:
+                command = self._commands.get(key)
+                if (
+                    command is not None
+                    and command.result_expires_at is not None
+                    and command.result_expires_at <= now
+                ):
+                    self._remove_command_locked(key)
+
+    def _retain_result_locked(self, command: _CommandRecord, now: datetime) -> None:
+        command.result_expires_at = now + RESULT_TTL
+        self._schedule_locked(
+            command.result_expires_at, "result", command.envelope.command_id
+        )
+        command.completed.set()
 
     def _expire_session_locked(self, session_id: UUID, now: datetime) -> None:
         session = self._sessions.pop(session_id, None)
@@ -536,8 +565,7 @@ def _expire_session_locked(self, session_id: UUID, now: datetime) -> None:
                 OfficeCommandState.DELIVERED,
             }:
                 command.state = OfficeCommandState.EXPIRED
-                command.result_expires_at = now + RESULT_TTL
-                command.completed.set()
+                self._retain_result_locked(command, now)
 
     def _remove_command_locked(self, command_id: UUID) -> None:
         command = self._commands.pop(command_id, None)
@@ -586,6 +614,7 @@ async def create_pairing(
                 expires_at=now + PAIRING_TTL,
             )
             self._pairings[digest] = pairing
+            self._schedule_locked(pairing.expires_at, "pairing", digest)
         return OfficePairingGrant(
             pairing_id=pairing.pairing_id,
             pairing_token=token,
@@ -632,6 +661,11 @@ async def pair_session(
             )
             self._sessions[session.session_id] = session
             self._session_tokens[session_digest] = session.session_id
+            self._schedule_locked(
+                min(session.expires_at, now + SESSION_IDLE_TTL),
+                "session",
+                session.session_id,
+            )
         return OfficeSessionGrant(
             session_id=session.session_id,
             session_token=session_token,
@@ -715,6 +749,7 @@ async def enqueue(
                 state=OfficeCommandState.QUEUED,
             )
             self._commands[envelope.command_id] = command
+            self._schedule_locked(envelope.expires_at, "command", envelope.command_id)
             self._session_commands[session_id].add(envelope.command_id)
             session.queue.append(envelope.command_id)
             session.available.set()
@@ -790,8 +825,7 @@ async def complete(
                 if outcome.status == "succeeded"
                 else OfficeCommandState.FAILED
             )
-            command.result_expires_at = now + RESULT_TTL
-            command.completed.set()
+            self._retain_result_locked(command, now)
             return self._receipt_locked(command)
 
     async def get_command(self, command_id: UUID) -> OfficeCommandReceipt:
@@ -17,7 +17,8 @@
 import asyncio
 import json
 import re
-from collections.abc import Mapping
+from collections.abc import AsyncIterator, Iterable, Iterator, Mapping
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from datetime import UTC, datetime
 from enum import IntEnum, StrEnum
 from typing import Any, Never, Protocol, runtime_checkable
@@ -25,7 +26,10 @@
 from uuid import UUID, uuid4
 
 import httpx
-from agent_utilities.core.http_client import create_http_client
+from agent_utilities.core.http_client import (
+    create_async_http_client,
+    create_http_client,
+)
 from agent_utilities.core.transport_security import (
     ResolvedTLSProfile,
     resolve_configured_tls_profile,
@@ -40,6 +44,8 @@
     model_validator,
 )
 
+from microsoft_agent.retry_policy import RetryPolicy
+
 PUBLIC_FLOW_SERVICE_AUDIENCE = "https://service.flow.microsoft.com/"
 _UNSUPPORTED_FLOW_API_HOST = "api.flow.microsoft.com"
 _JSON_HEADERS = {"Accept": "application/json", "Content-Type": "application/json"}
@@ -49,6 +55,7 @@
     "OData-Version": "4.0",
     "Prefer": 'odata.include-annotations="*"',
 }
+_STREAM_CHUNK_BYTES = 1024 * 1024
 _FLOW_SELECT = ",".join(
     (
         "category",
@@ -85,6 +92,84 @@ def json_body(self) -> Any:
         return json.loads(self.body.decode("utf-8"))
 
 
+class HttpResponseStream:
+    """Response status and headers with a size-bounded streamed body.
+
+    Iterating yields body chunks as they arrive and raises ``ValueError`` as
+    soon as the running total passes ``max_bytes``, so memory per request is
+    bounded by the chunk size instead of the response cap.
+    """
+
+    def __init__(
+        self,
+        status_code: int,
+        headers: dict[str, str],
+        chunks: AsyncIterator[bytes],
+        *,
+        max_bytes: int,
+    ) -> None:
+        self.status_code = status_code
+        self.headers = headers
+        self.max_bytes = max_bytes
+        self.bytes_read = 0
+        self._chunks = chunks
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._chunks:
+            self.bytes_read += len(chunk)
+            if self.bytes_read > self.max_bytes:
+                raise ValueError("Provider response exceeds the configured bound")
+            yield chunk
+
+    async def read(self) -> bytes:
+        """Collect the remaining body within the configured bound."""
+
+        return b"".join([chunk async for chunk in self])
+
+
+def _check_declared_length(headers: Mapping[str, str], max_bytes: int) -> None:
+    declared = headers.get("content-length")
+    if declared is not None and declared.isdigit() and int(declared) > max_bytes:
+        raise ValueError("Provider response exceeds the configured bound")
+
+
+def _chunk_bytes(max_bytes: int) -> int:
+    # Large chunks keep per-chunk overhead low; reading one byte past the
+    # bound is enough to reject an oversized body.
+    return min(_STREAM_CHUNK_BYTES, max_bytes + 1)
+
+
+def _read_bounded(chunks: Iterable[bytes], max_bytes: int) -> bytes:
+    content = bytearray()
+    for chunk in chunks:
+        content += chunk
+        if len(content) > max_bytes:
+            raise ValueError("Provider response exceeds the configured bound")
+    return bytes(content)
+
+
+def _request_content(
+    headers: dict[str, str],
+    body: bytes | memoryview | None,
+    *,
+    asynchronous: bool = False,
+) -> bytes | Iterable[memoryview] | AsyncIterator[memoryview] | None:
+    # A memoryview, such as one upload fragment of a larger buffer, is sent
+    # as a single chunk instead of being copied into bytes first. httpx then
+    # frames it by Content-Length rather than chunked encoding.
+    if not isinstance(body, memoryview):
+        return body
+    if not any(name.lower() == "content-length" for name in headers):
+        headers["Content-Length"] = str(body.nbytes)
+    if asynchronous:
+        return _single_chunk(body)
+    return (body,)
+
+
+async def _single_chunk(chunk: memoryview) -> AsyncIterator[memoryview]:
+    yield chunk
+
+
 @runtime_checkable
 class AsyncHttpTransport(Protocol):
     """Minimal injectable async HTTP transport."""
@@ -96,12 +181,29 @@ async def request(
         *,
         headers: Mapping[str, str],
         params: Mapping[str, Any] | None = None,
-        body: bytes | None = None,
+        body: bytes | memoryview | None = None,
         timeout: float,
     ) -> HttpResponse:
         """Send one HTTP request without automatically following redirects."""
 
 
+class StreamingHttpTransport(AsyncHttpTransport, Protocol):
+    """Async HTTP transport that can also stream a size-bounded body."""
+
+    def stream(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Mapping[str, str],
+        params: Mapping[str, Any] | None = None,
+        body: bytes | memoryview | None = None,
+        timeout: float,
+        max_bytes: int | None = None,
+    ) -> AbstractAsyncContextManager[HttpResponseStream]:
+        """Send one request and expose its body as bounded chunks."""
+
+
 @runtime_checkable
 class AudienceTokenProvider(Protocol):
     """Acquire an OAuth access token for a resource audience."""
@@ -122,10 +224,13 @@ def __init__(
         allowed_private_hosts: tuple[str, ...] = (),
         max_response_bytes: int = 16 * 1024 * 1024,
         client: httpx.Client | None = None,
+        retry_policy: RetryPolicy | None = None,
     ) -> None:
         if not 1_024 <= max_response_bytes <= 64 * 1024 * 1024:
             raise ValueError("HTTP response bound is invalid")
         self._max_response_bytes = max_response_bytes
+        self._service = service
+        self._retry_policy = retry_policy
         self._tls: ResolvedTLSProfile | None = None
         self._owns_client = client is None
         self._closed = False
@@ -142,23 +247,29 @@ def __init__(
             self._tls = None
             raise ValueError("Pinned provider transport does not support a proxy")
         try:
-            self._client = create_http_client(
-                timeout=httpx.Timeout(30.0),
-                verify=self._tls.ssl_context,
-                follow_redirects=False,
-                trust_env=False,
-                pin_egress=True,
-                allowed_private_hosts=allowed_private_hosts,
-                limits=httpx.Limits(
-                    max_connections=32,
-                    max_keepalive_connections=8,
-                ),
-            )
+            self._client = self._create_client(self._tls, allowed_private_hosts)
         except Exception:
             self._tls.cleanup()
             self._tls = None
             raise
 
+    @staticmethod
+    def _create_client(
+        tls: ResolvedTLSProfile, allowed_private_hosts: tuple[str, ...]
+    ) -> Any:
+        return create_http_client(
+            timeout=httpx.Timeout(30.0),
+            verify=tls.ssl_context,
+            follow_redirects=False,
+            trust_env=False,
+            pin_egress=True,
+            allowed_private_hosts=allowed_private_hosts,
+            limits=httpx.Limits(
+                max_connections=32,
+                max_keepalive_connections=8,
+            ),
+        )
+
     async def request(
         self,
         method: str,
@@ -166,33 +277,156 @@ async def request(
         *,
         headers: Mapping[str, str],
         params: Mapping[str, Any] | None = None,
-        body: bytes | None = None,
+        body: bytes | memoryview | None = None,
         timeout: float,
     ) -> HttpResponse:
-        """Send one request without following redirects."""
+        """Send one request without following redirects.
+
+        With a retry policy, throttled and transiently failed requests are
+        paced and retried per service and host before the final response is
+        returned.
+        """
 
+        if self._retry_policy is None:
+            return await self._send_once(
+                method, url, headers=headers, params=params, body=body, timeout=timeout
+            )
+        return await self._retry_policy.send(
+            (self._service, (urlparse(url).hostname or "").casefold()),
+            method,
+            lambda: self._send_once(
+                method, url, headers=headers, params=params, body=body, timeout=timeout
+            ),
+        )
+
+    async def _send_once(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Mapping[str, str],
+        params: Mapping[str, Any] | None,
+        body: bytes | memoryview | None,
+        timeout: float,
+    ) -> HttpResponse:
+        # The body is read and bounded inside one worker thread, so a request
+        # costs one thread hop however many chunks arrive.
         try:
-            response = await asyncio.to_thread(
-                self._client.request,
-                method,
-                url,
-                headers=dict(headers),
-                params=params,
-                content=body,
-                timeout=timeout,
-                follow_redirects=False,
+            return await asyncio.to_thread(
+                self._request_bounded, method, url, headers, params, body, timeout
             )
         except httpx.TimeoutException:
             raise TimeoutError("Provider request timed out") from None
         except httpx.TransportError:
             raise OSError("Provider transport failed") from None
-        if len(response.content) > self._max_response_bytes:
-            raise ValueError("Provider response exceeds the configured bound")
+
+    def _request_bounded(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        params: Mapping[str, Any] | None,
+        body: bytes | memoryview | None,
+        timeout: float,
+    ) -> HttpResponse:
+        limit = self._max_response_bytes
+        request_headers = dict(headers)
+        with self._client.stream(
+            method,
+            url,
+            headers=request_headers,
+            params=params,
+            content=_request_content(request_headers, body),
+            timeout=timeout,
+            follow_redirects=False,
+        ) as response:
+            _check_declared_length(response.headers, limit)
+            content = _read_bounded(response.iter_bytes(_chunk_bytes(limit)), limit)
         return HttpResponse(
             status_code=response.status_code,
             headers=dict(response.headers),
-            body=response.content,
+            body=content,
+        )
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Mapping[str, str],
+        params: Mapping[str, Any] | None = None,
+        body: bytes | memoryview | None = None,
+        timeout: float,
+        max_bytes: int | None = None,
+    ) -> AsyncIterator[HttpResponseStream]:
+        """Send one request and stream its body within ``max_bytes``.
+
+        ``max_bytes`` defaults to the transport's response bound. Retries are
+        not applied because a partially consumed body cannot be replayed.
+        """
+
+        limit = self._stream_limit(max_bytes)
+        try:
+            context, response = await asyncio.to_thread(
+                self._open_stream, method, url, headers, params, body, timeout
+            )
+        except httpx.TimeoutException:
+            raise TimeoutError("Provider request timed out") from None
+        except httpx.TransportError:
+            raise OSError("Provider transport failed") from None
+        try:
+            _check_declared_length(response.headers, limit)
+            chunks = response.iter_bytes(_chunk_bytes(limit))
+            yield HttpResponseStream(
+                response.status_code,
+                dict(response.headers),
+                self._thread_chunks(chunks),
+                max_bytes=limit,
+            )
+        finally:
+            await asyncio.to_thread(context.__exit__, None, None, None)
+
+    def _open_stream(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        params: Mapping[str, Any] | None,
+        body: bytes | memoryview | None,
+        timeout: float,
+    ) -> tuple[Any, httpx.Response]:
+        request_headers = dict(headers)
+        context = self._client.stream(
+            method,
+            url,
+            headers=request_headers,
+            params=params,
+            content=_request_content(request_headers, body),
+            timeout=timeout,
+            follow_redirects=False,
         )
+        return context, context.__enter__()
+
+    @staticmethod
+    async def _thread_chunks(chunks: Iterator[bytes]) -> AsyncIterator[bytes]:
+        while True:
+            try:
+                chunk = await asyncio.to_thread(next, chunks, None)
+            except httpx.TimeoutException:
+                raise TimeoutError("Provider request timed out") from None
+            except httpx.TransportError:
+                raise OSError("Provider transport failed") from None
+            if chunk is None:
+                return
+            yield chunk
+
+    def _stream_limit(self, max_bytes: int | None) -> int:
+        if max_bytes is None:
+            return self._max_response_bytes
+        if max_bytes < 1:
+            raise ValueError("Streamed response bound must be positive")
+        return max_bytes
 
     def close(self) -> None:
         """Close owned HTTP state and remove materialized trust files."""
@@ -203,9 +437,154 @@ def close(self) -> None:
             if self._owns_client:
                 self._client.close()
         finally:
-            if self._tls is not None:
-                self._tls.cleanup()
-                self._tls = None
+            self._cleanup_tls()
+
+    def _cleanup_tls(self) -> None:
+        if self._tls is not None:
+            self._tls.cleanup()
+            self._tls = None
+
+
+class HttpxNativeAsyncHttpTransport(HttpxAsyncHttpTransport):
+    """Pinned provider transport backed by a native ``httpx.AsyncClient``.
+
+    Requests run on the event loop instead of holding a worker thread each, so
+    concurrency is bounded by the connection pool rather than the default
+    executor. TLS profile, egress pinning, redirect, and response-size rules
+    match :class:`HttpxAsyncHttpTransport`.
+    """
+
+    def __init__(
+        self,
+        *,
+        service: str,
+        tls_profile: str | None = None,
+        tls_profile_ref: str | None = None,
+        allowed_private_hosts: tuple[str, ...] = (),
+        max_response_bytes: int = 16 * 1024 * 1024,
+        client: httpx.AsyncClient | None = None,
+        retry_policy: RetryPolicy | None = None,
+    ) -> None:
+        super().__init__(
+            service=service,
+            tls_profile=tls_profile,
+            tls_profile_ref=tls_profile_ref,
+            allowed_private_hosts=allowed_private_hosts,
+            max_response_bytes=max_response_bytes,
+            client=client,  # type: ignore[arg-type]
+            retry_policy=retry_policy,
+        )
+        self._pending_close: asyncio.Task[None] | None = None
+
+    @staticmethod
+    def _create_client(
+        tls: ResolvedTLSProfile, allowed_private_hosts: tuple[str, ...]
+    ) -> Any:
+        return create_async_http_client(
+            timeout=httpx.Timeout(30.0),
+            verify=tls.ssl_context,
+            follow_redirects=False,
+            trust_env=False,
+            pin_egress=True,
+            allowed_private_hosts=allowed_private_hosts,
+            limits=httpx.Limits(
+                max_connections=256,
+                max_keepalive_connections=32,
+            ),
+        )
+
+    async def _send_once(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Mapping[str, str],
+        params: Mapping[str, Any] | None,
+        body: bytes | memoryview | None,
+        timeout: float,
+    ) -> HttpResponse:
+        # Reading through ``stream`` enforces the response bound while the
+        # body arrives rather than after it has been buffered.
+        async with self.stream(
+            method, url, headers=headers, params=params, body=body, timeout=timeout
+        ) as response:
+            content = await response.read()
+        return HttpResponse(
+            status_code=response.status_code,
+            headers=response.headers,
+            body=content,
+        )
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Mapping[str, str],
+        params: Mapping[str, Any] | None = None,
+        body: bytes | memoryview | None = None,
+        timeout: float,
+        max_bytes: int | None = None,
+    ) -> AsyncIterator[HttpResponseStream]:
+        """Send one request and stream its body within ``max_bytes``.
+
+        Oversized bodies are rejected from ``Content-Length`` or while reading,
+        before the remainder is downloaded.
+        """
+
+        limit = self._stream_limit(max_bytes)
+        request_headers = dict(headers)
+        try:
+            async with self._client.stream(
+                method,
+                url,
+                headers=request_headers,
+                params=params,
+                content=_request_content(request_headers, body, asynchronous=True),
+                timeout=timeout,
+                follow_redirects=False,
+            ) as response:
+                _check_declared_length(response.headers, limit)
+                yield HttpResponseStream(
+                    response.status_code,
+                    dict(response.headers),
+                    response.aiter_bytes(_chunk_bytes(limit)),
+                    max_bytes=limit,
+                )
+        except httpx.TimeoutException:
+            raise TimeoutError("Provider request timed out") from None
+        except httpx.TransportError:
+            raise OSError("Provider transport failed") from None
+
+    async def aclose(self) -> None:
+        """Close owned connections inside the event loop that opened them."""
+
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            if self._owns_client:
+                await self._client.aclose()
+        finally:
+            self._cleanup_tls()
+
+    def close(self) -> None:
+        """Release owned state from synchronous shutdown paths.
+
+        Inside a running loop the connection pool is closed in the background;
+        after the loop has stopped only the trust material is removed.
+        """
+
+        if self._closed:
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self._closed = True
+            self._cleanup_tls()
+            return
+        self._pending_close = asyncio.create_task(self.aclose())
 
 
 class FlowState(IntEnum):
@@ -1221,7 +1600,9 @@ def _raise_invalid_response(message: str) -> Never:
     "FlowState",
     "FlowType",
     "HttpResponse",
+    "HttpResponseStream",
     "HttpxAsyncHttpTransport",
+    "HttpxNativeAsyncHttpTransport",
     "NamedFlowTrigger",
     "NamedDesktopFlow",
     "PUBLIC_FLOW_SERVICE_AUDIENCE",
@@ -1230,4 +1611,5 @@ def _raise_invalid_response(message: str) -> Never:
     "PowerPlatformError",
     "PowerPlatformErrorCode",
     "PowerPlatformSettings",
+    "StreamingHttpTransport",
 ]
@@ -0,0 +1,376 @@
+"""Opt-in response cache for read-only Microsoft Graph actions.
+
+Directory, organization, and team-structure reads change slowly but are
+fetched again on every tool call. With ``MICROSOFT_RESPONSE_CACHE=true``,
+:class:`ResponseCacheMiddleware` keeps successful ``READ`` action results of
+the condensed ``microsoft_*`` tools for a per-action TTL. The cache is keyed
+by caller identity, tool, action, and canonical parameters, and is bounded
+in bytes with LRU eviction. Any other action routed through the same tool
+drops that tool's entries.
+
+Once an entry expires, the Graph request is revalidated rather than repeated
+blind. :class:`ETagRevalidationHandler` remembers ``ETag`` responses per URL
+and access token and sends ``If-None-Match``. A ``304 Not Modified`` reply is
+answered from the stored body.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Mapping
+from dataclasses import asdict, dataclass
+from typing import Any
+
+import httpx
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+from kiota_http.middleware.middleware import BaseMiddleware
+
+from microsoft_agent.auth import caller_identity, get_auth_manager
+from microsoft_agent.settings import MicrosoftSettings, get_settings
+from microsoft_agent.tool_policy import (
+    ALWAYS_ALLOWED,
+    ToolRisk,
+    _tool_action,
+    _tool_arguments,
+    _tool_name,
+    classify_tool_risk,
+)
+
+# The only reads cached by default. ``MICROSOFT_RESPONSE_CACHE_TTLS`` overrides
+# any of them, opts other reads in, and ``0`` disables caching for an action.
+DEFAULT_RESPONSE_CACHE_TTLS: dict[str, float] = {
+    "get_organization": 3600.0,
+    "list_organization": 3600.0,
+    "list_domains": 3600.0,
+    "list_directory_roles": 900.0,
+    "list_role_definitions": 900.0,
+    "list_rooms": 3600.0,
+    "list_places": 3600.0,
+    "list_groups": 300.0,
+    "list_joined_teams": 300.0,
+    "list_team_channels": 300.0,
+    "list_mail_folders": 300.0,
+}
+_UNCONDITIONAL_HEADERS = frozenset(
+    {"content-encoding", "content-length", "transfer-encoding"}
+)
+
+
+@dataclass
+class _Entry:
+    value: Any
+    size: int
+    expires_at: float
+    group: Hashable
+
+
+@dataclass
+class CacheStats:
+    """Counters for one :class:`LRUByteCache`."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    revalidated: int = 0
+
+
+class LRUByteCache:
+    """Least-recently-used entries bounded by their total size in bytes.
+
+    Each entry belongs to a group. :meth:`invalidate_group` drops a group's
+    entries and bumps its generation, so a result fetched before the
+    invalidation cannot be stored afterwards.
+    """
+
+    def __init__(
+        self, max_bytes: int, *, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        if max_bytes < 0:
+            raise ValueError("Response cache size must not be negative")
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._generations: dict[Hashable, int] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return a live entry and mark it recently used."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= self._clock():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return entry.value
+
+    def generation(self, group: Hashable) -> int:
+        """Return the invalidation generation of ``group``."""
+
+        return self._generations.get(group, 0)
+
+    def put(
+        self,
+        key: Hashable,
+        value: Any,
+        size: int,
+        *,
+        ttl: float = math.inf,
+        group: Hashable = None,
+        generation: int | None = None,
+    ) -> bool:
+        """Store an entry unless it is too large or its group went stale."""
+
+        if ttl <= 0 or size > self.max_bytes:
+            return False
+        with self._lock:
+            if generation is not None and generation != self.generation(group):
+                return False
+            self._remove(key)
+            self._entries[key] = _Entry(value, size, self._clock() + ttl, group)
+            self._bytes += size
+            self._stats.stores += 1
+            while self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._stats.evictions += 1
+        return True
+
+    def invalidate_group(self, group: Hashable) -> int:
+        """Drop every entry of ``group`` and return how many were removed."""
+
+        with self._lock:
+            self._generations[group] = self.generation(group) + 1
+            keys = [key for key, entry in self._entries.items() if entry.group == group]
+            for key in keys:
+                self._remove(key)
+            self._stats.invalidations += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def record_revalidation(self) -> None:
+        """Count a conditional request answered from a stored body."""
+
+        with self._lock:
+            self._stats.revalidated += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Return counters plus the current entry count and size."""
+
+        with self._lock:
+            return {**asdict(self._stats), "entries": len(self), "bytes": self._bytes}
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+
+def action_ttl(settings: MicrosoftSettings, action: str) -> float:
+    """Return the configured cache lifetime of a read action in seconds.
+
+    Only the slowly changing reads in :data:`DEFAULT_RESPONSE_CACHE_TTLS` are
+    cached by default; any other action is cached only when
+    ``MICROSOFT_RESPONSE_CACHE_TTLS`` gives it a lifetime.
+    """
+
+    name = action.lower()
+    if name in settings.response_cache_ttls:
+        return settings.response_cache_ttls[name]
+    return DEFAULT_RESPONSE_CACHE_TTLS.get(name, 0.0)
+
+
+def _canonical_params(arguments: Mapping[str, Any] | None) -> str | None:
+    if arguments is None:
+        return None
+    raw = arguments.get("params_json", "{}")
+    if not isinstance(raw, str):
+        return None
+    try:
+        params = json.loads(raw)
+        return json.dumps(params, sort_keys=True, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_error(result: Any) -> bool:
+    if getattr(result, "is_error", False):
+        return True
+    structured = getattr(result, "structured_content", None)
+    if isinstance(structured, dict):
+        inner = structured.get("result", structured)
+        return isinstance(inner, dict) and "error" in inner
+    return False
+
+
+def _result_size(result: Any) -> int | None:
+    dump = getattr(result, "model_dump_json", None)
+    if dump is None:
+        return None
+    try:
+        return len(dump())
+    except (TypeError, ValueError):
+        return None
+
+
+class ResponseCacheMiddleware(Middleware):
+    """Serve repeated read actions of condensed tools from a bounded cache."""
+
+    def __init__(
+        self,
+        settings: MicrosoftSettings | None = None,
+        cache: LRUByteCache | None = None,
+    ) -> None:
+        self.settings = settings or get_settings()
+        self.cache = (
+            cache
+            if cache is not None
+            else LRUByteCache(self.settings.response_cache_max_bytes)
+        )
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next):
+        name = _tool_name(context.message)
+        action = _tool_action(context.message)
+        if not name or not name.startswith("microsoft_") or not action:
+            return await call_next(context)
+        action = action.lower()
+        if classify_tool_risk(action) is not ToolRisk.READ:
+            try:
+                return await call_next(context)
+            finally:
+                self.cache.invalidate_group(name)
+        ttl = action_ttl(self.settings, action)
+        key = self._key(context, name, action)
+        # Delta reads advance stored sync state, so replaying one is wrong.
+        stateful = action.startswith("sync_")
+        if key is None or ttl <= 0 or stateful or action in ALWAYS_ALLOWED:
+            return await call_next(context)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        generation = self.cache.generation(name)
+        result = await call_next(context)
+        size = _result_size(result)
+        if size is not None and not _is_error(result):
+            self.cache.put(
+                key, result, size, ttl=ttl, group=name, generation=generation
+            )
+        return result
+
+    @staticmethod
+    def _key(context: MiddlewareContext, name: str, action: str) -> Hashable | None:
+        canonical = _canonical_params(_tool_arguments(context.message))
+        if canonical is None:
+            return None
+        try:
+            identity = caller_identity(get_auth_manager())
+        except Exception:  # Unconfigured identity: never share results.
+            return None
+        return (*identity, name, action, canonical)
+
+
+@dataclass(frozen=True)
+class _Validator:
+    etag: str
+    headers: tuple[tuple[str, str], ...]
+    body: bytes
+
+
+class ETagRevalidationHandler(BaseMiddleware):
+    """Kiota middleware that revalidates stored Graph responses by ``ETag``."""
+
+    def __init__(self, store: LRUByteCache, *, max_entry_bytes: int = 1 << 20):
+        super().__init__()
+        self.store = store
+        self.max_entry_bytes = max_entry_bytes
+
+    async def send(
+        self, request: httpx.Request, transport: httpx.AsyncBaseTransport
+    ) -> httpx.Response:
+        if request.method != "GET" or "if-none-match" in request.headers:
+            return await super().send(request, transport)
+        authorization = request.headers.get("authorization", "")
+        key = (
+            str(request.url),
+            hashlib.sha256(authorization.encode("utf-8")).hexdigest(),
+        )
+        validator: _Validator | None = self.store.get(key)
+        if validator is not None:
+            request.headers["If-None-Match"] = validator.etag
+        response = await super().send(request, transport)
+        if validator is not None and response.status_code == 304:
+            await response.aclose()
+            self.store.record_revalidation()
+            return httpx.Response(
+                200,
+                headers=list(validator.headers),
+                content=validator.body,
+                request=request,
+            )
+        etag = response.headers.get("etag")
+        if response.status_code == 200 and etag:
+            # The Kiota adapter buffers every response, so reading it here
+            # adds no copy beyond the stored body.
+            body = await response.aread()
+            if len(body) <= self.max_entry_bytes:
+                headers = tuple(
+                    (name, value)
+                    for name, value in response.headers.items()
+                    if name.lower() not in _UNCONDITIONAL_HEADERS
+                )
+                self.store.put(
+                    key, _Validator(etag, headers, body), len(body), group=key[1]
+                )
+        return response
+
+
+_etag_store: LRUByteCache | None = None
+
+
+def get_etag_store(max_bytes: int) -> LRUByteCache:
+    """Return the process-wide store of revalidatable Graph responses."""
+
+    global _etag_store
+    if _etag_store is None:
+        _etag_store = LRUByteCache(max_bytes)
+    return _etag_store
+
+
+def etag_store_stats() -> dict[str, Any] | None:
+    """Return the ETag store counters, if the store was created."""
+
+    store = _etag_store
+    return None if store is None else store.stats()
+
+
+__all__ = [
+    "DEFAULT_RESPONSE_CACHE_TTLS",
+    "CacheStats",
+    "ETagRevalidationHandler",
+    "LRUByteCache",
+    "ResponseCacheMiddleware",
+    "action_ttl",
+    "etag_store_stats",
+    "get_etag_store",
+]
@@ -0,0 +1,308 @@
+"""Shared throttling-aware retry and pacing for Microsoft service requests.
+
+Microsoft Graph and Power Platform answer sustained load with ``429`` and
+``503`` responses that carry ``Retry-After``. :class:`RetryPolicy` keeps one
+adaptive token bucket per tenant/workload key so every caller sharing that key
+slows down together, honours ``Retry-After`` when present, and otherwise backs
+off exponentially with jitter. The Graph SDK path installs it as Kiota
+middleware; provider transports and upload sessions call :meth:`RetryPolicy.send`
+directly.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any, Protocol, TypeVar
+
+import httpx
+from kiota_http.middleware.middleware import BaseMiddleware
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+THROTTLE_STATUS_CODES = frozenset({429, 503})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+DEFAULT_MAX_RETRIES = 3
+MAX_RETRIES_LIMIT = 8
+MAX_RETRY_AFTER_SECONDS = 30.0
+MAX_BACKOFF_SECONDS = 8.0
+DEFAULT_RATE_PER_SECOND = 50.0
+DEFAULT_BURST = 100
+MIN_RATE_PER_SECOND = 1.0
+
+RETRYABLE_EXCEPTIONS: tuple[type[BaseException], ...] = (
+    OSError,
+    TimeoutError,
+    httpx.TransportError,
+)
+
+
+class _Response(Protocol):
+    status_code: int
+    headers: Mapping[str, str]
+
+
+ResponseT = TypeVar("ResponseT", bound=_Response)
+
+
+def retry_after_seconds(headers: Mapping[str, str]) -> float | None:
+    """Parse a ``Retry-After`` delay in seconds or HTTP-date form."""
+
+    raw = next(
+        (value for key, value in headers.items() if key.casefold() == "retry-after"),
+        None,
+    )
+    if raw is None:
+        return None
+    try:
+        seconds = float(raw)
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(raw)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=UTC)
+        seconds = (when - datetime.now(UTC)).total_seconds()
+    if not math.isfinite(seconds):
+        return None
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER_SECONDS)
+
+
+def backoff_delay(attempt: int, *, cap: float = MAX_BACKOFF_SECONDS) -> float:
+    """Exponential backoff with equal jitter for the zero-based ``attempt``."""
+
+    ceiling = min(2.0 ** max(attempt, 0), cap)
+    return ceiling / 2 + random.uniform(0, ceiling / 2)
+
+
+def retry_delay(headers: Mapping[str, str], attempt: int) -> float:
+    """Delay before retrying a response: ``Retry-After`` first, then backoff."""
+
+    delay = retry_after_seconds(headers)
+    return delay if delay is not None else backoff_delay(attempt)
+
+
+class TokenBucket:
+    """Adaptive request pacing for one tenant/workload.
+
+    Throttling halves the refill rate and blocks the bucket until the server's
+    ``Retry-After`` has elapsed; successful responses restore the rate
+    gradually.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float = DEFAULT_RATE_PER_SECOND,
+        burst: int = DEFAULT_BURST,
+    ) -> None:
+        if rate_per_second < MIN_RATE_PER_SECOND or burst < 1:
+            raise ValueError("Token bucket rate and burst must be positive")
+        self.max_rate = rate_per_second
+        self.rate = rate_per_second
+        self.capacity = float(burst)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return how long the caller must wait for it."""
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            return max(self._blocked_until - now, -self._tokens / self.rate, 0.0)
+
+    def throttle(self, delay: float) -> None:
+        """Slow down after the service signalled throttling."""
+
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+            self.rate = max(self.rate / 2, MIN_RATE_PER_SECOND)
+
+    def recover(self) -> None:
+        """Step the rate back towards its configured maximum."""
+
+        if self.rate < self.max_rate:
+            with self._lock:
+                self.rate = min(self.rate * 1.1, self.max_rate)
+
+
+@dataclass
+class RetryStats:
+    """Counters for one tenant/workload key."""
+
+    requests: int = 0
+    retries: int = 0
+    throttled: int = 0
+    exhausted: int = 0
+    paced_seconds: float = 0.0
+
+
+class RetryPolicy:
+    """Retry, backoff, and pacing shared by every client of one process."""
+
+    def __init__(
+        self,
+        *,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        rate_per_second: float = DEFAULT_RATE_PER_SECOND,
+        burst: int = DEFAULT_BURST,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    ) -> None:
+        if not 0 <= max_retries <= MAX_RETRIES_LIMIT:
+            raise ValueError(f"max_retries must be between 0 and {MAX_RETRIES_LIMIT}")
+        self.max_retries = max_retries
+        self._rate = rate_per_second
+        self._burst = burst
+        self._sleep = sleep
+        self._buckets: dict[Hashable, TokenBucket] = {}
+        self._stats: dict[Hashable, RetryStats] = {}
+
+    def bucket(self, key: Hashable) -> TokenBucket:
+        """Return the pacing bucket for a tenant/workload key."""
+
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets.setdefault(key, TokenBucket(self._rate, self._burst))
+        return bucket
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return retry counters keyed by tenant/workload."""
+
+        return {str(key): asdict(value) for key, value in self._stats.items()}
+
+    @staticmethod
+    def should_retry(method: str, status_code: int) -> bool:
+        """Whether a response status may be retried for this method.
+
+        A ``429`` means the request was not processed, so any method may be
+        resent; server errors are retried only for idempotent methods.
+        """
+
+        if status_code == 429:
+            return True
+        return (
+            status_code in RETRYABLE_STATUS_CODES
+            and method.upper() in IDEMPOTENT_METHODS
+        )
+
+    async def send(
+        self,
+        key: Hashable,
+        method: str,
+        send_once: Callable[[], Awaitable[ResponseT]],
+        *,
+        max_retries: int | None = None,
+    ) -> ResponseT:
+        """Pace and send one request, retrying throttled or failed attempts.
+
+        Returns the first non-retryable response, or the last response once
+        retries are exhausted. Transport errors propagate after the final
+        attempt, and immediately for non-idempotent methods.
+        """
+
+        retries = self.max_retries if max_retries is None else max_retries
+        bucket = self.bucket(key)
+        stats = self._stats.setdefault(key, RetryStats())
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            wait = bucket.reserve()
+            if wait > 0:
+                stats.paced_seconds += wait
+                await self._sleep(wait)
+            stats.requests += 1
+            try:
+                response = await send_once()
+            except RETRYABLE_EXCEPTIONS:
+                if not idempotent or attempt >= retries:
+                    stats.exhausted += 1
+                    raise
+                delay = backoff_delay(attempt)
+            else:
+                status = response.status_code
+                if not self.should_retry(method, status):
+                    bucket.recover()
+                    return response
+                delay = retry_delay(response.headers, attempt)
+                if status in THROTTLE_STATUS_CODES:
+                    stats.throttled += 1
+                    bucket.throttle(delay)
+                if attempt >= retries:
+                    stats.exhausted += 1
+                    return response
+            stats.retries += 1
+            attempt += 1
+            logger.debug(
+                "Retrying Microsoft request: key=%s attempt=%d delay=%.2f",
+                key,
+                attempt,
+                delay,
+            )
+            await self._sleep(delay)
+
+
+class ThrottlingRetryHandler(BaseMiddleware):
+    """Kiota middleware that routes Graph SDK requests through a policy."""
+
+    def __init__(self, policy: RetryPolicy, key: Hashable) -> None:
+        super().__init__()
+        self.policy = policy
+        self.key = key
+
+    async def send(
+        self, request: httpx.Request, transport: httpx.AsyncBaseTransport
+    ) -> httpx.Response:
+        discarded: list[httpx.Response] = []
+
+        async def send_once() -> httpx.Response:
+            while discarded:
+                await discarded.pop().aclose()
+            response = await super(ThrottlingRetryHandler, self).send(
+                request, transport
+            )
+            discarded.append(response)
+            return response
+
+        return await self.policy.send(self.key, request.method, send_once)
+
+
+_retry_policy: RetryPolicy | None = None
+
+
+def get_retry_policy() -> RetryPolicy:
+    """Return the process-wide retry policy."""
+
+    global _retry_policy
+    if _retry_policy is None:
+        _retry_policy = RetryPolicy()
+    return _retry_policy
+
+
+__all__ = [
+    "DEFAULT_MAX_RETRIES",
+    "RETRYABLE_STATUS_CODES",
+    "RetryPolicy",
+    "RetryStats",
+    "ThrottlingRetryHandler",
+    "TokenBucket",
+    "backoff_delay",
+    "get_retry_policy",
+    "retry_after_seconds",
+    "retry_delay",
+]
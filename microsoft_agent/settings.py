@@ -28,6 +28,7 @@
 
 GRAPH_DEFAULT_SCOPE = "https://graph.microsoft.com/.default"
 DEFAULT_AUTHORITY_HOST = "https://login.microsoftonline.com"
+DEFAULT_RESPONSE_CACHE_MAX_BYTES = 32 * 1024 * 1024
 
 
 class AuthenticationMode(StrEnum):
@@ -141,6 +142,29 @@ class PermissionProfile(StrEnum):
     "search",
     "groups",
     "communications",
+    "admin",
+    "agreements",
+    "applications",
+    "audit",
+    "batch",
+    "connections",
+    "devices",
+    "directory",
+    "domains",
+    "education",
+    "employee_experience",
+    "identity",
+    "organization",
+    "places",
+    "policies",
+    "print",
+    "privacy",
+    "reports",
+    "security",
+    "solutions",
+    "storage",
+    "subscriptions",
+    "sync",
     "documents",
     "power_platform",
     "windows",
@@ -175,6 +199,16 @@ def _configured_bool(
     return raw.strip().lower() in {"1", "true", "yes", "on"}
 
 
+def _configured_ttls(source: Mapping[str, str] | None, name: str) -> dict[str, float]:
+    ttls: dict[str, float] = {}
+    for item in _split_values(_configured_value(source, name)):
+        action, separator, seconds = item.partition("=")
+        if not separator or not action:
+            raise ValueError(f"{name} entries must use action=seconds")
+        ttls[action.strip().lower()] = float(seconds)
+    return ttls
+
+
 def _resolved_secret(reference: str | None) -> SecretStr | None:
     if not reference:
         return None
@@ -212,6 +246,12 @@ class MicrosoftSettings(BaseModel):
     graph_tls_profile: str | None = None
     graph_tls_profile_ref: str | None = None
     office_addin_origins: tuple[str, ...] = ()
+    response_cache_enabled: bool = False
+    response_cache_max_bytes: int = Field(
+        default=DEFAULT_RESPONSE_CACHE_MAX_BYTES, ge=0
+    )
+    response_cache_ttls: dict[str, float] = Field(default_factory=dict)
+    delta_state_path: Path | None = None
     ingestion_pseudonymization_key: SecretStr | None = Field(default=None, repr=False)
 
     @field_validator("authority_host")
@@ -271,6 +311,15 @@ def _normalize_groups(cls, values: tuple[str, ...]) -> tuple[str, ...]:
         normalized = tuple(dict.fromkeys(value.lower().strip() for value in values))
         return normalized or DEFAULT_TOOL_GROUPS
 
+    @field_validator("response_cache_ttls")
+    @classmethod
+    def _validate_response_cache_ttls(
+        cls, values: dict[str, float]
+    ) -> dict[str, float]:
+        if any(not 0 <= seconds < float("inf") for seconds in values.values()):
+            raise ValueError("Response cache TTLs must be finite and non-negative")
+        return {action.lower().strip(): seconds for action, seconds in values.items()}
+
     @field_validator("office_addin_origins")
     @classmethod
     def _validate_office_origins(cls, values: tuple[str, ...]) -> tuple[str, ...]:
@@ -419,6 +468,7 @@ def from_env(cls, env: Mapping[str, str] | None = None) -> MicrosoftSettings:
         workload_token_file = _configured_value(
             env, "MICROSOFT_WORKLOAD_IDENTITY_TOKEN_FILE"
         ) or _configured_value(env, "AZURE_FEDERATED_TOKEN_FILE")
+        delta_state_path = _configured_value(env, "MICROSOFT_DELTA_STATE_PATH")
         return cls(
             tenant_id=_configured_value(env, "MICROSOFT_TENANT_ID"),
             client_id=_configured_value(env, "MICROSOFT_CLIENT_ID"),
@@ -475,6 +525,20 @@ def from_env(cls, env: Mapping[str, str] | None = None) -> MicrosoftSettings:
             office_addin_origins=_split_values(
                 _configured_value(env, "MICROSOFT_OFFICE_ADDIN_ORIGINS")
             ),
+            response_cache_enabled=_configured_bool(
+                env, "MICROSOFT_RESPONSE_CACHE", False
+            ),
+            response_cache_max_bytes=int(
+                _configured_value(
+                    env,
+                    "MICROSOFT_RESPONSE_CACHE_MAX_BYTES",
+                    str(DEFAULT_RESPONSE_CACHE_MAX_BYTES),
+                )
+            ),
+            response_cache_ttls=_configured_ttls(env, "MICROSOFT_RESPONSE_CACHE_TTLS"),
+            delta_state_path=(
+                Path(delta_state_path).expanduser() if delta_state_path else None
+            ),
             ingestion_pseudonymization_key=_resolved_secret(
                 _configured_value(env, "MICROSOFT_INGESTION_PSEUDONYMIZATION_KEY_REF")
             ),
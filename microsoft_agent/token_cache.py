@@ -0,0 +1,216 @@
+"""In-process access-token cache with refresh-ahead for workload identities.
+
+Application, managed-identity, and workload-identity tokens are identical for
+every request that asks for the same scope set, so :class:`AccessTokenCache`
+keeps the latest result per ``(mode, scopes)`` key. Reads are lock-free while a
+token is comfortably valid. Inside the refresh-ahead window the cached token is
+still returned while one background thread renews it; once a token is too close
+to expiry, concurrent callers wait on a single acquisition instead of each
+calling the identity provider.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Hashable
+from dataclasses import asdict, dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REFRESH_AHEAD_SECONDS = 300.0
+DEFAULT_MIN_VALIDITY_SECONDS = 30.0
+
+TokenAcquirer = Callable[[], "dict[str, Any] | None"]
+
+
+def token_expires_at(details: dict[str, Any], *, now: float) -> float | None:
+    """Return the absolute expiry of a token result, if it declares one."""
+
+    expires_on = details.get("expires_on")
+    if expires_on is not None:
+        try:
+            return float(expires_on)
+        except (TypeError, ValueError):
+            return None
+    expires_in = details.get("expires_in")
+    if expires_in is not None:
+        try:
+            return now + float(expires_in)
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
+@dataclass(frozen=True)
+class _Entry:
+    details: dict[str, Any]
+    expires_at: float
+
+
+class _Flight:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: dict[str, Any] | None = None
+        self.error: BaseException | None = None
+
+
+@dataclass
+class TokenCacheStats:
+    """Counters for one :class:`AccessTokenCache`.
+
+    Hits are counted on the lock-free read path, so threads reading at the
+    same moment may lose an increment; treat the counters as approximate.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    refreshes: int = 0
+    refresh_failures: int = 0
+    shared_waits: int = 0
+
+
+class AccessTokenCache:
+    """Per-key token results with single-flight acquisition."""
+
+    def __init__(
+        self,
+        *,
+        refresh_ahead_seconds: float = DEFAULT_REFRESH_AHEAD_SECONDS,
+        min_validity_seconds: float = DEFAULT_MIN_VALIDITY_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if not 0 <= min_validity_seconds <= refresh_ahead_seconds:
+            raise ValueError(
+                "min_validity_seconds must be between 0 and refresh_ahead_seconds"
+            )
+        self.refresh_ahead_seconds = refresh_ahead_seconds
+        self.min_validity_seconds = min_validity_seconds
+        self._clock = clock
+        self._entries: dict[Hashable, _Entry] = {}
+        self._flights: dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._stats = TokenCacheStats()
+
+    def lookup(self, key: Hashable, acquire: TokenAcquirer) -> dict[str, Any] | None:
+        """Return a usable cached result without blocking, or ``None``.
+
+        A result inside the refresh-ahead window is still returned; its renewal
+        starts in a background thread unless one is already running.
+        """
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        remaining = entry.expires_at - self._clock()
+        if remaining <= self.min_validity_seconds:
+            return None
+        if remaining <= self.refresh_ahead_seconds:
+            self._refresh_in_background(key, acquire)
+        self._stats.hits += 1
+        return entry.details
+
+    def get(self, key: Hashable, acquire: TokenAcquirer) -> dict[str, Any] | None:
+        """Return a cached result, acquiring it once for concurrent callers."""
+
+        details = self.lookup(key, acquire)
+        if details is not None:
+            return details
+        self._stats.misses += 1
+        return self._acquire(key, acquire)
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        """Drop one cached result, or every result when ``key`` is omitted."""
+
+        with self._lock:
+            self._generation += 1
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit, miss, and refresh counters plus the cached key count."""
+
+        return {**asdict(self._stats), "entries": len(self._entries)}
+
+    def _begin(self, key: Hashable) -> tuple[_Flight, bool]:
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                return flight, False
+            flight = self._flights[key] = _Flight()
+            return flight, True
+
+    def _lead(
+        self, key: Hashable, flight: _Flight, acquire: TokenAcquirer
+    ) -> dict[str, Any] | None:
+        generation = self._generation
+        try:
+            flight.result = acquire()
+            self._store(key, flight.result, generation)
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+        return flight.result
+
+    def _acquire(self, key: Hashable, acquire: TokenAcquirer) -> dict[str, Any] | None:
+        flight, leader = self._begin(key)
+        if leader:
+            return self._lead(key, flight, acquire)
+        self._stats.shared_waits += 1
+        flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.result
+
+    def _store(
+        self, key: Hashable, details: dict[str, Any] | None, generation: int
+    ) -> None:
+        if not details or "access_token" not in details:
+            return
+        now = self._clock()
+        expires_at = token_expires_at(details, now=now)
+        if expires_at is None or expires_at - now <= self.min_validity_seconds:
+            return
+        with self._lock:
+            # A result acquired before an invalidation must not be resurrected.
+            if generation == self._generation:
+                self._entries[key] = _Entry(details, expires_at)
+
+    def _refresh_in_background(self, key: Hashable, acquire: TokenAcquirer) -> None:
+        if key in self._flights:
+            return
+        flight, leader = self._begin(key)
+        if not leader:
+            return
+
+        def refresh() -> None:
+            try:
+                details = self._lead(key, flight, acquire)
+            except Exception:
+                details = None
+            if details is None:
+                self._stats.refresh_failures += 1
+                logger.warning("Background token refresh failed")
+
+        self._stats.refreshes += 1
+        threading.Thread(
+            target=refresh, name="microsoft-token-refresh", daemon=True
+        ).start()
+
+
+__all__ = [
+    "DEFAULT_MIN_VALIDITY_SECONDS",
+    "DEFAULT_REFRESH_AHEAD_SECONDS",
+    "AccessTokenCache",
+    "TokenCacheStats",
+    "token_expires_at",
+]
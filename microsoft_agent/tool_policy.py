@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import fnmatch
-from collections.abc import Mapping
+import re
+from collections.abc import Iterable, Mapping
+from dataclasses import asdict, dataclass
 from enum import StrEnum
+from functools import lru_cache
 from typing import Any
 
 from fastmcp.exceptions import ToolError
@@ -63,6 +66,19 @@ class ToolRisk(StrEnum):
     "update_organization",
     "update_admin_sharepoint",
 )
+# Artifact downloads write local files despite their ``download_`` verb.
+WRITE_PATTERNS = ("download_*_to_artifact",)
+# Delta-query reads are listed by name because device commands share their
+# ``sync_`` verb; any other ``sync_`` action stays in the write tier.
+DELTA_SYNC_ACTIONS = frozenset(
+    {
+        "sync_mail_messages",
+        "sync_calendar_events",
+        "sync_outlook_contacts",
+        "sync_users",
+        "sync_groups",
+    }
+)
 ALWAYS_ALLOWED = {
     "health_check",
     "login",
@@ -76,16 +92,27 @@ class ToolRisk(StrEnum):
     "run_hunting_query",
     "calendar_today",
 }
+# Decisions for names outside the precomputed table, such as unregistered
+# actions supplied by a caller, are kept in a bounded LRU cache.
+POLICY_DECISION_CACHE_SIZE = 4096
+_DESTRUCTIVE_MATCH = re.compile(
+    "|".join(fnmatch.translate(pattern) for pattern in DESTRUCTIVE_PATTERNS)
+).match
+_WRITE_MATCH = re.compile(
+    "|".join(fnmatch.translate(pattern) for pattern in WRITE_PATTERNS)
+).match
 
 
 def classify_tool_risk(tool_name: str) -> ToolRisk:
     """Classify a tool conservatively from its stable public name."""
 
     name = tool_name.lower().strip()
-    if name in ALWAYS_ALLOWED:
+    if name in ALWAYS_ALLOWED or name in DELTA_SYNC_ACTIONS:
         return ToolRisk.READ
-    if any(fnmatch.fnmatch(name, pattern) for pattern in DESTRUCTIVE_PATTERNS):
+    if _DESTRUCTIVE_MATCH(name):
         return ToolRisk.DESTRUCTIVE
+    if _WRITE_MATCH(name):
+        return ToolRisk.WRITE
     if name.startswith(READ_PREFIXES):
         return ToolRisk.READ
     if name.startswith(WRITE_PREFIXES):
@@ -106,15 +133,61 @@ class ToolPolicyDecision(BaseModel):
     reason: str
 
 
+@dataclass
+class PolicyStats:
+    """Decision counters for one risk tier."""
+
+    allowed: int = 0
+    denied: int = 0
+
+
 class MicrosoftToolPolicy:
-    """Authorize tools using explicit deployment-level side-effect flags."""
+    """Authorize tools using explicit deployment-level side-effect flags.
+
+    Decisions for ``tool_names`` are computed once, at construction, because
+    the settings they depend on are fixed for the policy's lifetime.
+    """
 
-    def __init__(self, settings: MicrosoftSettings | None = None):
+    def __init__(
+        self,
+        settings: MicrosoftSettings | None = None,
+        tool_names: Iterable[str] = (),
+    ):
         self.settings = settings or get_settings()
+        self._decisions = {
+            name: self._decide(name) for name in {*ALWAYS_ALLOWED, *tool_names}
+        }
+        self._fallback = lru_cache(maxsize=POLICY_DECISION_CACHE_SIZE)(self._decide)
+        self._stats = {risk: PolicyStats() for risk in ToolRisk}
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return decision counters keyed by risk tier."""
+
+        fallback = self._fallback.cache_info()
+        return {
+            **{risk.value: asdict(value) for risk, value in self._stats.items()},
+            "cache": {
+                "precomputed": len(self._decisions),
+                "hits": fallback.hits,
+                "misses": fallback.misses,
+                "entries": fallback.currsize,
+            },
+        }
 
     def evaluate(self, tool_name: str) -> ToolPolicyDecision:
         """Return a deterministic, fail-closed decision for a tool."""
 
+        decision = self._decisions.get(tool_name)
+        if decision is None:
+            decision = self._fallback(tool_name)
+        stats = self._stats[decision.risk]
+        if decision.allowed:
+            stats.allowed += 1
+        else:
+            stats.denied += 1
+        return decision
+
+    def _decide(self, tool_name: str) -> ToolPolicyDecision:
         risk = classify_tool_risk(tool_name)
         if risk is ToolRisk.READ:
             return ToolPolicyDecision(
@@ -169,12 +242,21 @@ def _tool_name(message: Any) -> str | None:
     return str(name) if name else None
 
 
+def _tool_arguments(message: Any) -> Mapping[str, Any] | None:
+    """Return call arguments from ``CallToolRequestParams`` or a full request."""
+
+    arguments = getattr(message, "arguments", None)
+    if arguments is None:
+        params = getattr(message, "params", None)
+        arguments = getattr(params, "arguments", None) if params is not None else None
+    return arguments if isinstance(arguments, Mapping) else None
+
+
 def _tool_action(message: Any) -> str | None:
     """Return the routed action from a FastMCP call without trusting its name."""
 
-    params = getattr(message, "params", None)
-    arguments = getattr(params, "arguments", None) if params is not None else None
-    if not isinstance(arguments, Mapping):
+    arguments = _tool_arguments(message)
+    if arguments is None:
         return None
     action = arguments.get("action")
     if not isinstance(action, str):
@@ -8,7 +8,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import base64
 import binascii
 import json
@@ -19,6 +18,8 @@
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from microsoft_agent.power_platform import AsyncHttpTransport, HttpResponse
+from microsoft_agent.retry_policy import RetryPolicy, get_retry_policy
+from microsoft_agent.upload_pipeline import UploadProgress, UploadProgressCallback
 
 PRINT_UPLOAD_HOST = "print.print.microsoft.com"
 PRINT_UPLOAD_ORIGIN = f"https://{PRINT_UPLOAD_HOST}"
@@ -114,6 +115,7 @@ def __init__(
         timeout_seconds: float = 60,
         chunk_bytes: int = PRINT_UPLOAD_CHUNK_BYTES,
         max_retries: int = 3,
+        retry_policy: RetryPolicy | None = None,
     ) -> None:
         if not 0 < chunk_bytes < 10 * 1024 * 1024:
             raise ValueError("Universal Print chunks must be smaller than 10 MiB")
@@ -127,9 +129,15 @@ def __init__(
         self.timeout_seconds = timeout_seconds
         self.chunk_bytes = chunk_bytes
         self.max_retries = max_retries
+        self._retry_policy = retry_policy or get_retry_policy()
 
-    async def upload(self, upload_url: str, content: bytes) -> dict[str, Any]:
-        """Upload sequential ranges and return final printDocument metadata."""
+    async def upload(
+        self,
+        upload_url: str,
+        content: bytes,
+        progress: UploadProgressCallback | None = None,
+    ) -> dict[str, Any]:
+        """Upload document ranges in order and return printDocument metadata."""
 
         safe_url = validate_print_upload_url(upload_url)
         if not content:
@@ -137,13 +145,22 @@ async def upload(self, upload_url: str, content: bytes) -> dict[str, Any]:
         if len(content) > MAX_PRINT_DOCUMENT_BYTES:
             raise ValueError("print document exceeds the 100 MiB safety limit")
 
+        view = memoryview(content)
         total = len(content)
+        uploaded = 0
+
+        def advance(count: int) -> None:
+            nonlocal uploaded
+            uploaded += count
+            if progress is not None:
+                progress(UploadProgress(bytes_uploaded=uploaded, total_bytes=total))
+
         offset = 0
         while offset < total:
             end = min(offset + self.chunk_bytes, total) - 1
             response = await self._put_range(
                 safe_url,
-                content[offset : end + 1],
+                view[offset : end + 1],
                 offset,
                 end,
                 total,
@@ -158,6 +175,7 @@ async def upload(self, upload_url: str, content: bytes) -> dict[str, Any]:
                     raise UniversalPrintUploadError(
                         "Universal Print returned invalid document metadata."
                     )
+                advance(total - offset)
                 return payload
             if response.status_code != 202:
                 raise UniversalPrintUploadError(
@@ -175,6 +193,7 @@ async def upload(self, upload_url: str, content: bytes) -> dict[str, Any]:
                 raise UniversalPrintUploadError(
                     "Universal Print returned an unexpected next range."
                 )
+            advance(next_offset - offset)
             offset = next_offset
         raise UniversalPrintUploadError(
             "Universal Print did not return completed document metadata."
@@ -183,7 +202,7 @@ async def upload(self, upload_url: str, content: bytes) -> dict[str, Any]:
     async def _put_range(
         self,
         upload_url: str,
-        fragment: bytes,
+        fragment: memoryview,
         start: int,
         end: int,
         total: int,
@@ -192,31 +211,23 @@ async def _put_range(
             "Content-Length": str(len(fragment)),
             "Content-Range": f"bytes {start}-{end}/{total}",
         }
-        for attempt in range(self.max_retries + 1):
-            try:
-                response = await self._transport.request(
+        try:
+            return await self._retry_policy.send(
+                ("universal_print_upload", PRINT_UPLOAD_HOST),
+                "PUT",
+                lambda: self._transport.request(
                     "PUT",
                     upload_url,
                     headers=headers,
                     body=fragment,
                     timeout=self.timeout_seconds,
-                )
-            except (OSError, TimeoutError) as exc:
-                if attempt >= self.max_retries:
-                    raise UniversalPrintUploadError(
-                        "Universal Print upload transport failed."
-                    ) from exc
-                await asyncio.sleep(min(2**attempt, 8))
-                continue
-            if response.status_code in {201, 202}:
-                return response
-            if (
-                response.status_code not in {429, 500, 502, 503, 504}
-                or attempt >= self.max_retries
-            ):
-                return response
-            await asyncio.sleep(_retry_delay(response, attempt))
-        raise UniversalPrintUploadError("Universal Print retry limit was exceeded.")
+                ),
+                max_retries=self.max_retries,
+            )
+        except (OSError, TimeoutError) as exc:
+            raise UniversalPrintUploadError(
+                "Universal Print upload transport failed."
+            ) from exc
 
 
 def validate_print_upload_url(value: Any) -> str:
@@ -269,23 +280,6 @@ def _range_start(value: Any) -> int:
     return int(value.partition("-")[0])
 
 
-def _retry_delay(response: HttpResponse, attempt: int) -> float:
-    raw = next(
-        (
-            value
-            for key, value in response.headers.items()
-            if key.casefold() == "retry-after"
-        ),
-        None,
-    )
-    try:
-        return (
-            min(max(float(raw), 0.0), 30.0) if raw is not None else min(2**attempt, 8)
-        )
-    except ValueError:
-        return min(2**attempt, 8)
-
-
 __all__ = [
     "MAX_PRINT_DOCUMENT_BYTES",
     "PRINT_UPLOAD_CHUNK_BYTES",
@@ -0,0 +1,73 @@
+"""Byte-range scheduling shared by resumable uploads and ranged downloads.
+
+Graph drive items and Universal Print documents are uploaded, and drive items
+downloaded, as byte ranges. :func:`fragment_ranges` plans those ranges.
+Upload sessions accept ranges only in order, so uploads send them one at a
+time; downloads use :func:`transfer_ranges_concurrently` to keep a bounded
+number in flight, so only that many ranges are held in memory at once.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterator
+
+from pydantic import BaseModel, ConfigDict, Field
+
+MAX_CONCURRENT_FRAGMENTS = 8
+
+
+class UploadProgress(BaseModel):
+    """Bytes transferred so far by an upload or a ranged download."""
+
+    model_config = ConfigDict(frozen=True)
+
+    bytes_uploaded: int = Field(ge=0)
+    total_bytes: int = Field(ge=1)
+
+
+UploadProgressCallback = Callable[[UploadProgress], None]
+
+
+def fragment_ranges(total: int, fragment_bytes: int) -> Iterator[tuple[int, int]]:
+    """Yield inclusive ``(start, end)`` ranges covering ``total`` bytes."""
+
+    for start in range(0, total, fragment_bytes):
+        yield start, min(start + fragment_bytes, total) - 1
+
+
+async def transfer_ranges_concurrently(
+    ranges: Iterator[tuple[int, int]],
+    send: Callable[[int, int], Awaitable[None]],
+    concurrency: int,
+) -> None:
+    """Run ``send`` for every range with at most ``concurrency`` in flight.
+
+    The first failure cancels the remaining ranges and is re-raised.
+    """
+
+    if not 1 <= concurrency <= MAX_CONCURRENT_FRAGMENTS:
+        raise ValueError(
+            f"Transfer concurrency must be between 1 and {MAX_CONCURRENT_FRAGMENTS}"
+        )
+
+    async def worker() -> None:
+        for start, end in ranges:
+            await send(start, end)
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(concurrency)]
+    try:
+        await asyncio.gather(*workers)
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+__all__ = [
+    "MAX_CONCURRENT_FRAGMENTS",
+    "UploadProgress",
+    "UploadProgressCallback",
+    "fragment_ranges",
+    "transfer_ranges_concurrently",
+]
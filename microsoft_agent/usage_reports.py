@@ -0,0 +1,234 @@
+"""Streaming, column-projected parsing of Microsoft Graph usage reports.
+
+Graph usage reports (``/reports/get*Detail(period=...)``) are CSV files that
+reach tens of megabytes in large tenants. Returning them as one string makes
+memory and token usage grow with the tenant. :class:`UsageReportReader`
+parses a report incrementally, one byte chunk at a time. A
+:class:`UsageReportQuery` selects the columns to keep, filters rows, and
+totals numeric columns overall or per group. Only the bounded result is held:
+at most ``limit`` projected rows plus the running totals.
+"""
+
+from __future__ import annotations
+
+import codecs
+import csv
+import re
+from collections.abc import AsyncIterable
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field
+
+USAGE_REPORT_PERIODS = frozenset({"D7", "D30", "D90", "D180"})
+MAX_REPORT_ROWS = 5_000
+MAX_REPORT_GROUPS = 1_000
+MAX_REPORT_RECORD_BYTES = 1024 * 1024
+MAX_USAGE_REPORT_BYTES = 1024 * 1024 * 1024
+# A report returned whole as ``content`` is held in memory, unlike one that is
+# projected or summarized while it streams.
+MAX_USAGE_REPORT_CONTENT_BYTES = 16 * 1024 * 1024
+_INTEGER = re.compile(r"-?\d+")
+_DECIMAL = re.compile(r"-?\d+\.\d+")
+
+
+class UsageReportQuery(BaseModel):
+    """Projection, filters, and totals applied while a report streams.
+
+    ``where`` keeps rows whose column equals one of the given values,
+    compared case-insensitively. ``totals`` sums numeric columns; with
+    ``group_by`` the count and sums are also kept per distinct value.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    columns: tuple[str, ...] = ()
+    where: dict[str, str | tuple[str, ...]] = Field(default_factory=dict)
+    group_by: str | None = None
+    totals: tuple[str, ...] = ()
+    limit: int = Field(default=100, ge=0, le=MAX_REPORT_ROWS)
+
+
+def report_value(value: str) -> Any:
+    """Convert one CSV cell to ``None``, ``bool``, ``int``, ``float``, or text."""
+
+    if value == "":
+        return None
+    if value in {"True", "False"}:
+        return value == "True"
+    if _INTEGER.fullmatch(value):
+        return int(value)
+    if _DECIMAL.fullmatch(value):
+        return float(value)
+    return value
+
+
+def _amount(value: str) -> int | float:
+    number = report_value(value)
+    if isinstance(number, bool) or not isinstance(number, int | float):
+        return 0
+    return number
+
+
+class UsageReportReader:
+    """Incrementally parse one report CSV under a :class:`UsageReportQuery`."""
+
+    def __init__(self, query: UsageReportQuery) -> None:
+        self.query = query
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self._buffer = ""
+        self._pending: list[str] = []
+        self._pending_quotes = 0
+        self._pending_length = 0
+        self._header: list[str] | None = None
+        self._projection: list[int] = []
+        self._filters: list[tuple[int, frozenset[str]]] = []
+        self._group: int | None = None
+        self._totals: list[tuple[str, int]] = []
+        self.columns: list[str] = []
+        self.rows: list[list[Any]] = []
+        self.rows_scanned = 0
+        self.rows_matched = 0
+        self.sums: dict[str, int | float] = {}
+        self.groups: dict[Any, dict[str, Any]] = {}
+
+    def feed(self, chunk: bytes) -> None:
+        """Parse every complete record in ``chunk`` and keep the remainder."""
+
+        self._buffer += self._decoder.decode(chunk)
+        *lines, self._buffer = self._buffer.split("\n")
+        for line in lines:
+            self._line(line)
+        if len(self._buffer) > MAX_REPORT_RECORD_BYTES:
+            raise ValueError("Usage report record exceeds the size limit")
+
+    def finish(self) -> dict[str, Any]:
+        """Parse the final record and return the bounded report result."""
+
+        self._buffer += self._decoder.decode(b"", final=True)
+        if self._buffer:
+            self._line(self._buffer)
+            self._buffer = ""
+        if self._pending:
+            raise ValueError("Usage report ends inside a quoted field")
+        if self._header is None:
+            raise ValueError("Usage report is empty")
+        result: dict[str, Any] = {
+            "columns": self.columns,
+            "rows": self.rows,
+            "rowsScanned": self.rows_scanned,
+            "rowsMatched": self.rows_matched,
+            "truncated": self.rows_matched > len(self.rows),
+        }
+        if self._totals:
+            result["totals"] = self.sums
+        if self._group is not None:
+            result["groups"] = [
+                {"key": key, **group} for key, group in self.groups.items()
+            ]
+        return result
+
+    def _line(self, line: str) -> None:
+        # A record spans lines while its double quotes are unbalanced; escaped
+        # quotes are doubled, so they never change the parity.
+        self._pending.append(line)
+        self._pending_quotes += line.count('"')
+        self._pending_length += len(line) + 1
+        if self._pending_length > MAX_REPORT_RECORD_BYTES:
+            raise ValueError("Usage report record exceeds the size limit")
+        if self._pending_quotes % 2:
+            return
+        record = "\n".join(self._pending).removesuffix("\r")
+        self._pending.clear()
+        self._pending_quotes = 0
+        self._pending_length = 0
+        if not record:
+            return
+        fields = next(csv.reader([record], strict=True))
+        if self._header is None:
+            self._start(fields)
+        else:
+            self._row(fields)
+
+    def _start(self, header: list[str]) -> None:
+        self._header = header
+        positions = {
+            name.strip().casefold(): index for index, name in enumerate(header)
+        }
+
+        def position(name: str) -> int:
+            index = positions.get(name.strip().casefold())
+            if index is None:
+                raise ValueError(f"Unknown usage report column: {name}")
+            return index
+
+        self._projection = [position(name) for name in self.query.columns] or list(
+            range(len(header))
+        )
+        self.columns = [header[index] for index in self._projection]
+        for name, accepted in self.query.where.items():
+            values = (accepted,) if isinstance(accepted, str) else accepted
+            self._filters.append(
+                (position(name), frozenset(value.casefold() for value in values))
+            )
+        if self.query.group_by is not None:
+            self._group = position(self.query.group_by)
+        self._totals = [
+            (header[position(name)], position(name)) for name in self.query.totals
+        ]
+        self.sums = dict.fromkeys((name for name, _ in self._totals), 0)
+
+    def _row(self, fields: list[str]) -> None:
+        self.rows_scanned += 1
+        if len(fields) != len(self._header or ()):
+            raise ValueError(f"Usage report row {self.rows_scanned} is malformed")
+        if any(
+            fields[index].casefold() not in values for index, values in self._filters
+        ):
+            return
+        self.rows_matched += 1
+        if len(self.rows) < self.query.limit:
+            self.rows.append(
+                [report_value(fields[index]) for index in self._projection]
+            )
+        amounts = [(name, _amount(fields[index])) for name, index in self._totals]
+        for name, amount in amounts:
+            self.sums[name] += amount
+        if self._group is None:
+            return
+        key = report_value(fields[self._group])
+        group = self.groups.get(key)
+        if group is None:
+            if len(self.groups) >= MAX_REPORT_GROUPS:
+                raise ValueError(
+                    f"Usage report grouping exceeds {MAX_REPORT_GROUPS} groups"
+                )
+            group = self.groups[key] = {
+                "count": 0,
+                "totals": dict.fromkeys(self.sums, 0),
+            }
+        group["count"] += 1
+        for name, amount in amounts:
+            group["totals"][name] += amount
+
+
+async def summarize_usage_report(
+    chunks: AsyncIterable[bytes], query: UsageReportQuery
+) -> dict[str, Any]:
+    """Stream ``chunks`` of a report CSV through a :class:`UsageReportReader`."""
+
+    reader = UsageReportReader(query)
+    async for chunk in chunks:
+        reader.feed(chunk)
+    return reader.finish()
+
+
+__all__ = [
+    "MAX_REPORT_ROWS",
+    "MAX_USAGE_REPORT_BYTES",
+    "MAX_USAGE_REPORT_CONTENT_BYTES",
+    "USAGE_REPORT_PERIODS",
+    "UsageReportQuery",
+    "UsageReportReader",
+    "report_value",
+    "summarize_usage_report",
+]
@@ -27,7 +27,10 @@
 from uuid import UUID, uuid4
 
 import httpx
-from agent_utilities.core.http_client import create_http_client
+from agent_utilities.core.http_client import (
+    create_async_http_client,
+    create_http_client,
+)
 from agent_utilities.core.transport_security import (
     ResolvedTLSProfile,
     resolve_configured_tls_profile,
@@ -87,6 +90,25 @@ async def get_token(self, audience: str) -> str:
         """Return a bearer token for ``audience``."""
 
 
+_RESPONSE_CHUNK_BYTES = 1024 * 1024
+
+
+def _chunk_bytes(max_bytes: int) -> int:
+    # Reading one byte past the bound is enough to reject an oversized body.
+    return min(_RESPONSE_CHUNK_BYTES, max_bytes + 1)
+
+
+def _check_declared_length(headers: Mapping[str, str], max_bytes: int) -> None:
+    declared = headers.get("content-length")
+    if declared is not None and declared.isdigit() and int(declared) > max_bytes:
+        raise ValueError("Provider response exceeds the configured bound")
+
+
+def _check_read_length(read: int, max_bytes: int) -> None:
+    if read > max_bytes:
+        raise ValueError("Provider response exceeds the configured bound")
+
+
 class HttpxCompanionTransport:
     """Bounded async facade over the shared verified sync HTTP boundary."""
 
@@ -118,23 +140,142 @@ def __init__(
             self._tls = None
             raise ValueError("Pinned provider transport does not support a proxy")
         try:
-            self._client = create_http_client(
-                timeout=httpx.Timeout(30.0),
-                verify=self._tls.ssl_context,
-                follow_redirects=False,
-                trust_env=False,
-                pin_egress=True,
-                allowed_private_hosts=allowed_private_hosts,
-                limits=httpx.Limits(
-                    max_connections=32,
-                    max_keepalive_connections=8,
-                ),
-            )
+            self._client = self._create_client(self._tls, allowed_private_hosts)
         except Exception:
             self._tls.cleanup()
             self._tls = None
             raise
 
+    @staticmethod
+    def _create_client(
+        tls: ResolvedTLSProfile, allowed_private_hosts: tuple[str, ...]
+    ) -> Any:
+        return create_http_client(
+            timeout=httpx.Timeout(30.0),
+            verify=tls.ssl_context,
+            follow_redirects=False,
+            trust_env=False,
+            pin_egress=True,
+            allowed_private_hosts=allowed_private_hosts,
+            limits=httpx.Limits(
+                max_connections=32,
+                max_keepalive_connections=8,
+            ),
+        )
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Mapping[str, str],
+        params: Mapping[str, Any] | None = None,
+        body: bytes | None = None,
+        timeout: float,
+    ) -> CompanionHttpResponse:
+        """Send one request without following redirects."""
+
+        # The body is read and bounded inside one worker thread, so an
+        # oversized reply is abandoned before it is buffered whole.
+        try:
+            return await asyncio.to_thread(
+                self._request_bounded, method, url, headers, params, body, timeout
+            )
+        except httpx.TimeoutException:
+            raise TimeoutError("Companion request timed out") from None
+        except httpx.TransportError:
+            raise OSError("Companion transport failed") from None
+
+    def _request_bounded(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        params: Mapping[str, Any] | None,
+        body: bytes | None,
+        timeout: float,
+    ) -> CompanionHttpResponse:
+        limit = self._max_response_bytes
+        with self._client.stream(
+            method,
+            url,
+            headers=dict(headers),
+            params=params,
+            content=body,
+            timeout=timeout,
+            follow_redirects=False,
+        ) as response:
+            _check_declared_length(response.headers, limit)
+            content = bytearray()
+            for chunk in response.iter_bytes(_chunk_bytes(limit)):
+                content += chunk
+                _check_read_length(len(content), limit)
+        return CompanionHttpResponse(
+            status_code=response.status_code,
+            headers=dict(response.headers),
+            body=bytes(content),
+        )
+
+    def close(self) -> None:
+        """Close owned HTTP state and remove materialized trust files."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            if self._owns_client:
+                self._client.close()
+        finally:
+            self._cleanup_tls()
+
+    def _cleanup_tls(self) -> None:
+        if self._tls is not None:
+            self._tls.cleanup()
+            self._tls = None
+
+
+class HttpxNativeCompanionTransport(HttpxCompanionTransport):
+    """Companion transport backed by a native ``httpx.AsyncClient``.
+
+    Long-poll and relay requests run on the event loop instead of occupying a
+    worker thread each. TLS profile, egress pinning, redirect, and
+    response-size rules match :class:`HttpxCompanionTransport`.
+    """
+
+    def __init__(
+        self,
+        *,
+        tls_profile: str | None = None,
+        tls_profile_ref: str | None = None,
+        allowed_private_hosts: tuple[str, ...] = (),
+        max_response_bytes: int = 16 * 1024 * 1024,
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
+        super().__init__(
+            tls_profile=tls_profile,
+            tls_profile_ref=tls_profile_ref,
+            allowed_private_hosts=allowed_private_hosts,
+            max_response_bytes=max_response_bytes,
+            client=client,  # type: ignore[arg-type]
+        )
+        self._pending_close: asyncio.Task[None] | None = None
+
+    @staticmethod
+    def _create_client(
+        tls: ResolvedTLSProfile, allowed_private_hosts: tuple[str, ...]
+    ) -> Any:
+        return create_async_http_client(
+            timeout=httpx.Timeout(30.0),
+            verify=tls.ssl_context,
+            follow_redirects=False,
+            trust_env=False,
+            pin_egress=True,
+            allowed_private_hosts=allowed_private_hosts,
+            limits=httpx.Limits(
+                max_connections=256,
+                max_keepalive_connections=32,
+            ),
+        )
+
     async def request(
         self,
         method: str,
@@ -147,9 +288,10 @@ async def request(
     ) -> CompanionHttpResponse:
         """Send one request without following redirects."""
 
+        limit = self._max_response_bytes
+        content = bytearray()
         try:
-            response = await asyncio.to_thread(
-                self._client.request,
+            async with self._client.stream(
                 method,
                 url,
                 headers=dict(headers),
@@ -157,31 +299,49 @@ async def request(
                 content=body,
                 timeout=timeout,
                 follow_redirects=False,
-            )
+            ) as response:
+                _check_declared_length(response.headers, limit)
+                async for chunk in response.aiter_bytes(_chunk_bytes(limit)):
+                    content += chunk
+                    _check_read_length(len(content), limit)
         except httpx.TimeoutException:
             raise TimeoutError("Companion request timed out") from None
         except httpx.TransportError:
             raise OSError("Companion transport failed") from None
-        if len(response.content) > self._max_response_bytes:
-            raise ValueError("Provider response exceeds the configured bound")
         return CompanionHttpResponse(
             status_code=response.status_code,
             headers=dict(response.headers),
-            body=response.content,
+            body=bytes(content),
         )
 
-    def close(self) -> None:
-        """Close owned HTTP state and remove materialized trust files."""
+    async def aclose(self) -> None:
+        """Close owned connections inside the event loop that opened them."""
+
         if self._closed:
             return
         self._closed = True
         try:
             if self._owns_client:
-                self._client.close()
+                await self._client.aclose()
         finally:
-            if self._tls is not None:
-                self._tls.cleanup()
-                self._tls = None
+            self._cleanup_tls()
+
+    def close(self) -> None:
+        """Release owned state from synchronous shutdown paths.
+
+        Inside a running loop the connection pool is closed in the background;
+        after the loop has stopped only the trust material is removed.
+        """
+
+        if self._closed:
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self._closed = True
+            self._cleanup_tls()
+            return
+        self._pending_close = asyncio.create_task(self.aclose())
 
 
 class CompanionActionKind(StrEnum):
@@ -1083,6 +1243,7 @@ def _normalize_windows_path(value: str) -> str:
     "FileReadAction",
     "FileWriteAction",
     "HttpxCompanionTransport",
+    "HttpxNativeCompanionTransport",
     "NotificationShowAction",
     "OfficeExportPdfAction",
     "OfficeOpenDocumentAction",
@@ -18,11 +18,15 @@
 import hashlib
 import hmac
 import json
+import logging
 import ntpath
 import os
+import queue
 import sqlite3
 import ssl
-from collections.abc import Mapping
+import threading
+from collections.abc import AsyncIterator, Callable, Iterator, Mapping
+from contextlib import asynccontextmanager, contextmanager, suppress
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any, Protocol, runtime_checkable
@@ -42,7 +46,6 @@
 
 from microsoft_agent.windows_companion import (
     ActionPolicy,
-    CompanionActionFailure,
     CompanionActionKind,
     CompanionActionReceipt,
     CompanionActionRequest,
@@ -89,6 +92,8 @@
 except ImportError:  # pragma: no cover - exercised when PyJWT is not installed
     jwt = None  # type: ignore[assignment]
 
+logger = logging.getLogger(__name__)
+
 
 class AuthenticatedPrincipal(BaseModel):
     """Identity and authorization claims from a cryptographically valid token."""
@@ -388,6 +393,8 @@ class WindowsControlPlaneLimits(BaseModel):
     completed_retention_hours: int = Field(default=168, ge=1, le=8760)
     maximum_poll_actions: int = Field(default=100, ge=1, le=100)
     maximum_poll_wait_seconds: float = Field(default=30.0, ge=0, le=60)
+    maximum_reader_connections: int = Field(default=4, ge=1, le=32)
+    maintenance_interval_seconds: float = Field(default=30.0, ge=1, le=3600)
 
     @property
     def maximum_http_request_bytes(self) -> int:
@@ -418,6 +425,41 @@ class RelayPollRequest(BaseModel):
     capabilities: frozenset[CompanionActionKind] = Field(default_factory=frozenset)
 
 
+# Writers in another process cannot wake a waiting poller; recheck this often.
+_RELAY_RECHECK_SECONDS = 5.0
+_PENDING_STATUSES = frozenset(
+    {CompanionActionStatus.ACCEPTED.value, CompanionActionStatus.RUNNING.value}
+)
+
+
+class _DeviceWakeups:
+    """Per-device futures that wake long-polling relays when work arrives.
+
+    A poller subscribes before it reads the queue, so an action enqueued
+    between the read and the wait still wakes it. Use from the event loop.
+    """
+
+    def __init__(self) -> None:
+        self._waiters: dict[str, set[asyncio.Future[None]]] = {}
+
+    def subscribe(self, device_id: str) -> asyncio.Future[None]:
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(device_id, set()).add(waiter)
+        return waiter
+
+    def unsubscribe(self, device_id: str, waiter: asyncio.Future[None]) -> None:
+        waiters = self._waiters.get(device_id)
+        if waiters is not None:
+            waiters.discard(waiter)
+            if not waiters:
+                del self._waiters[device_id]
+
+    def notify(self, device_id: str) -> None:
+        for waiter in self._waiters.pop(device_id, ()):
+            if not waiter.done():
+                waiter.set_result(None)
+
+
 class _StoreConflict(RuntimeError):
     pass
 
@@ -430,6 +472,84 @@ class _StoreCapacity(RuntimeError):
     pass
 
 
+class _SQLiteConnectionPool:
+    """Long-lived connections: one serialized writer and bounded readers.
+
+    Connections are opened on first use and keep their PRAGMAs and compiled
+    statement cache for the life of the store. Each connection is used by one
+    thread at a time; callers wait for a free reader rather than opening more.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        readers: int,
+        configure_writer: Callable[[sqlite3.Connection], None],
+    ) -> None:
+        self.path = path
+        self._size = readers
+        self._configure_writer = configure_writer
+        self._writer: sqlite3.Connection | None = None
+        self._writer_lock = threading.Lock()
+        self._readers: queue.LifoQueue[sqlite3.Connection | None] = queue.LifoQueue()
+        for _ in range(readers):
+            self._readers.put(None)
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """Borrow the writer; the transaction commits or rolls back on exit."""
+
+        with self._writer_lock:
+            if self._writer is None:
+                writer = self._open(query_only=False)
+                self._configure_writer(writer)
+                self._writer = writer
+            with self._writer as connection:
+                yield connection
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a query-only connection that sees committed WAL snapshots."""
+
+        connection = self._readers.get()
+        try:
+            if connection is None:
+                connection = self._open(query_only=True)
+            with connection:
+                yield connection
+        finally:
+            self._readers.put(connection)
+
+    def close(self) -> None:
+        """Close idle connections; later use opens fresh ones."""
+
+        with self._writer_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+        for _ in range(self._size):
+            connection = self._readers.get()
+            if connection is not None:
+                connection.close()
+        for _ in range(self._size):
+            self._readers.put(None)
+
+    def _open(self, *, query_only: bool) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self.path,
+            timeout=10,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=256,
+        )
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA foreign_keys=ON")
+        connection.execute("PRAGMA busy_timeout=10000")
+        if query_only:
+            connection.execute("PRAGMA query_only=ON")
+        return connection
+
+
 class SQLiteCompanionStore:
     """Durable, bounded SQLite action queue and result store."""
 
@@ -445,6 +565,10 @@ def __init__(
             raise ValueError("The companion SQLite file cannot be a symlink")
         self.path.parent.mkdir(parents=True, exist_ok=True)
         self.limits = limits or WindowsControlPlaneLimits()
+        self._pool = _SQLiteConnectionPool(
+            self.path, self.limits.maximum_reader_connections, self._configure_writer
+        )
+        self.wakeups = _DeviceWakeups()
         self._initialize()
 
     async def enqueue(
@@ -452,7 +576,9 @@ async def enqueue(
         device_id: str,
         submission: ActionSubmission,
     ) -> CompanionActionReceipt:
-        return await asyncio.to_thread(self._enqueue_sync, device_id, submission)
+        receipt = await asyncio.to_thread(self._enqueue_sync, device_id, submission)
+        self.wakeups.notify(device_id)
+        return receipt
 
     async def get_action(
         self, device_id: str, action_id: UUID
@@ -493,21 +619,44 @@ async def touch_device(
     async def device_state(self, device_id: str) -> dict[str, Any] | None:
         return await asyncio.to_thread(self._device_state_sync, device_id)
 
-    def _connect(self) -> sqlite3.Connection:
-        connection = sqlite3.connect(self.path, timeout=10, isolation_level=None)
-        connection.row_factory = sqlite3.Row
-        connection.execute("PRAGMA foreign_keys=ON")
-        connection.execute("PRAGMA busy_timeout=10000")
-        return connection
+    async def expire_and_prune(self, now: datetime | None = None) -> tuple[int, int]:
+        """Expire overdue actions and drop retained results past retention.
+
+        Returns the number of expired and pruned rows.
+        """
+
+        return await asyncio.to_thread(
+            self._expire_and_prune_sync, now or datetime.now(UTC)
+        )
+
+    async def run_maintenance(self) -> None:
+        """Run :meth:`expire_and_prune` at the configured cadence until cancelled.
+
+        A failed sweep is logged and retried on the next tick.
+        """
+
+        while True:
+            try:
+                await self.expire_and_prune()
+            except Exception:
+                logger.exception("Windows companion maintenance sweep failed")
+            await asyncio.sleep(self.limits.maintenance_interval_seconds)
+
+    def close(self) -> None:
+        """Close pooled SQLite connections."""
+
+        self._pool.close()
+
+    def _configure_writer(self, connection: sqlite3.Connection) -> None:
+        connection.execute("PRAGMA journal_mode=WAL")
+        page_size = int(connection.execute("PRAGMA page_size").fetchone()[0])
+        maximum_pages = max(1, self.limits.maximum_database_bytes // page_size)
+        connection.execute(f"PRAGMA max_page_count={maximum_pages}")
+        journal_limit = min(self.limits.maximum_database_bytes // 4, 67_108_864)
+        connection.execute(f"PRAGMA journal_size_limit={journal_limit}")
 
     def _initialize(self) -> None:
-        with self._connect() as connection:
-            connection.execute("PRAGMA journal_mode=WAL")
-            page_size = int(connection.execute("PRAGMA page_size").fetchone()[0])
-            maximum_pages = max(1, self.limits.maximum_database_bytes // page_size)
-            connection.execute(f"PRAGMA max_page_count={maximum_pages}")
-            journal_limit = min(self.limits.maximum_database_bytes // 4, 67_108_864)
-            connection.execute(f"PRAGMA journal_size_limit={journal_limit}")
+        with self._pool.writer() as connection:
             connection.executescript(
                 """
                 CREATE TABLE IF NOT EXISTS actions (
@@ -532,6 +681,8 @@ def _initialize(self) -> None:
                     ON actions(device_id, status, sequence);
                 CREATE INDEX IF NOT EXISTS ix_actions_completed
                     ON actions(completed_at);
+                CREATE INDEX IF NOT EXISTS ix_actions_status_expires
+                    ON actions(status, expires_at);
                 CREATE TABLE IF NOT EXISTS device_state (
                     device_id TEXT PRIMARY KEY,
                     last_seen_at TEXT NOT NULL,
@@ -554,9 +705,8 @@ def _enqueue_sync(
             raise _StoreCapacity("Action submission exceeds the storage limit")
         fingerprint = hashlib.sha256(serialized.encode("utf-8")).hexdigest()
         now = datetime.now(UTC)
-        with self._connect() as connection:
+        with self._pool.writer() as connection:
             connection.execute("BEGIN IMMEDIATE")
-            self._expire_and_prune(connection, now)
             existing = connection.execute(
                 "SELECT * FROM actions WHERE device_id=? AND idempotency_key=?",
                 (device_id, submission.request.idempotency_key),
@@ -569,15 +719,12 @@ def _enqueue_sync(
                 connection.commit()
                 return self._receipt_from_row(existing)
 
-            counts = connection.execute(
-                """
-                SELECT COUNT(*) AS total,
-                    SUM(CASE WHEN device_id=? AND status IN ('accepted','running')
-                        THEN 1 ELSE 0 END) AS pending
-                FROM actions
-                """,
-                (device_id,),
-            ).fetchone()
+            counts = self._record_counts(connection, device_id, now)
+            if int(counts["total"] or 0) >= self.limits.maximum_records:
+                # Reclaim space now rather than waiting for the next sweep.
+                self._expire_rows(connection, now)
+                self._prune_rows(connection, now)
+                counts = self._record_counts(connection, device_id, now)
             if int(counts["total"] or 0) >= self.limits.maximum_records:
                 raise _StoreCapacity("Companion action store reached its record limit")
             if int(counts["pending"] or 0) >= self.limits.maximum_pending_per_device:
@@ -619,6 +766,13 @@ def _enqueue_sync(
                 raise _StoreConflict(
                     "Action ID or idempotency key already exists"
                 ) from exc
+            except sqlite3.OperationalError as exc:
+                # The pooled writer enforces max_page_count itself.
+                if exc.sqlite_errorcode != sqlite3.SQLITE_FULL:
+                    raise
+                raise _StoreCapacity(
+                    "Companion action store reached its byte limit"
+                ) from exc
             row = connection.execute(
                 "SELECT * FROM actions WHERE action_id=?",
                 (str(submission.request.action_id),),
@@ -631,14 +785,24 @@ def _get_action_sync(
         self, device_id: str, action_id: UUID
     ) -> CompanionActionResult:
         now = datetime.now(UTC)
-        with self._connect() as connection:
-            connection.execute("BEGIN IMMEDIATE")
-            self._expire_and_prune(connection, now)
+        with self._pool.reader() as connection:
             row = connection.execute(
                 "SELECT * FROM actions WHERE device_id=? AND action_id=?",
                 (device_id, str(action_id)),
             ).fetchone()
-            connection.commit()
+        if (
+            row is not None
+            and row["status"] in _PENDING_STATUSES
+            and row["expires_at"] <= now.isoformat()
+        ):
+            # Overdue before the next sweep: expire just this row.
+            with self._pool.writer() as connection:
+                connection.execute("BEGIN IMMEDIATE")
+                self._expire_rows(connection, now, sequence=row["sequence"])
+                row = connection.execute(
+                    "SELECT * FROM actions WHERE sequence=?", (row["sequence"],)
+                ).fetchone()
+                connection.commit()
         if row is None:
             raise _StoreNotFound("Action was not found")
         if row["result_json"]:
@@ -653,16 +817,16 @@ def _get_action_sync(
     def _poll_sync(
         self, device_id: str, maximum_actions: int, now: datetime
     ) -> RelayPollBatch:
-        with self._connect() as connection:
+        with self._pool.writer() as connection:
             connection.execute("BEGIN IMMEDIATE")
-            self._expire_and_prune(connection, now)
             rows = connection.execute(
                 """
                 SELECT * FROM actions
                 WHERE device_id=? AND status IN ('accepted','running')
+                    AND expires_at>?
                 ORDER BY sequence ASC LIMIT ?
                 """,
-                (device_id, maximum_actions),
+                (device_id, now.isoformat(), maximum_actions),
             ).fetchall()
             bounded_rows: list[sqlite3.Row] = []
             response_bytes = 1024
@@ -723,7 +887,7 @@ def _acknowledge_sync(
         if len(result_json.encode("utf-8")) > self.limits.maximum_result_bytes:
             raise _StoreCapacity("Action result exceeds the storage limit")
         now = datetime.now(UTC)
-        with self._connect() as connection:
+        with self._pool.writer() as connection:
             connection.execute("BEGIN IMMEDIATE")
             row = connection.execute(
                 "SELECT * FROM actions WHERE device_id=? AND delivery_id=?",
@@ -758,7 +922,7 @@ def _touch_device_sync(
         capabilities: frozenset[CompanionActionKind],
     ) -> None:
         capabilities_json = _canonical_json(sorted(item.value for item in capabilities))
-        with self._connect() as connection:
+        with self._pool.writer() as connection:
             connection.execute(
                 """
                 INSERT INTO device_state (
@@ -773,7 +937,7 @@ def _touch_device_sync(
             )
 
     def _device_state_sync(self, device_id: str) -> dict[str, Any] | None:
-        with self._connect() as connection:
+        with self._pool.reader() as connection:
             row = connection.execute(
                 "SELECT * FROM device_state WHERE device_id=?", (device_id,)
             ).fetchone()
@@ -788,46 +952,69 @@ def _device_state_sync(self, device_id: str) -> dict[str, Any] | None:
             ),
         }
 
-    def _expire_and_prune(self, connection: sqlite3.Connection, now: datetime) -> None:
-        rows = connection.execute(
+    def _expire_and_prune_sync(self, now: datetime) -> tuple[int, int]:
+        with self._pool.writer() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            expired = self._expire_rows(connection, now)
+            pruned = self._prune_rows(connection, now)
+            connection.commit()
+        return expired, pruned
+
+    @staticmethod
+    def _record_counts(
+        connection: sqlite3.Connection, device_id: str, now: datetime
+    ) -> sqlite3.Row:
+        return connection.execute(
             """
-            SELECT * FROM actions
-            WHERE status IN ('accepted','running') AND expires_at<=?
+            SELECT COUNT(*) AS total,
+                SUM(CASE WHEN device_id=? AND status IN ('accepted','running')
+                    AND expires_at>? THEN 1 ELSE 0 END) AS pending
+            FROM actions
             """,
-            (now.isoformat(),),
-        ).fetchall()
-        for row in rows:
-            result = CompanionActionResult(
-                action_id=UUID(row["action_id"]),
-                device_id=row["device_id"],
-                status=CompanionActionStatus.EXPIRED,
-                started_at=_parse_optional_datetime(row["started_at"]),
-                completed_at=now,
-                error=CompanionActionFailure(
-                    code="expired",
-                    message="Action expired before device acknowledgement",
-                    retryable=False,
-                ),
-            )
-            connection.execute(
-                """
-                UPDATE actions SET status='expired', completed_at=?, result_json=?
-                WHERE sequence=?
-                """,
-                (
-                    now.isoformat(),
-                    _canonical_json(result.model_dump(mode="json")),
-                    row["sequence"],
-                ),
-            )
+            (device_id, now.isoformat()),
+        ).fetchone()
+
+    @staticmethod
+    def _expire_rows(
+        connection: sqlite3.Connection, now: datetime, *, sequence: int | None = None
+    ) -> int:
+        # One statement builds the canonical (key-sorted) expired result JSON,
+        # so a sweep never materializes rows in Python.
+        cursor = connection.execute(
+            """
+            UPDATE actions SET
+                status='expired',
+                completed_at=:now,
+                result_json=json_object(
+                    'action_id', action_id,
+                    'completed_at', :now,
+                    'device_id', device_id,
+                    'error', json_object(
+                        'code', 'expired',
+                        'message', 'Action expired before device acknowledgement',
+                        'retryable', json('false')
+                    ),
+                    'output', NULL,
+                    'started_at', started_at,
+                    'status', 'expired'
+                )
+            WHERE status IN ('accepted','running') AND expires_at<=:now
+                AND (:sequence IS NULL OR sequence=:sequence)
+            """,
+            {"now": now.isoformat(), "sequence": sequence},
+        )
+        return cursor.rowcount
+
+    def _prune_rows(self, connection: sqlite3.Connection, now: datetime) -> int:
         cutoff = now - timedelta(hours=self.limits.completed_retention_hours)
-        connection.execute(
+        cursor = connection.execute(
             """
             DELETE FROM actions
             WHERE completed_at IS NOT NULL AND completed_at<?
             """,
             (cutoff.isoformat(),),
         )
+        return cursor.rowcount
 
     @staticmethod
     def _receipt_from_row(row: sqlite3.Row) -> CompanionActionReceipt:
@@ -923,11 +1110,26 @@ def create_windows_control_plane_app(
         or RequestValidationError is None
     ):
         raise ImportError("Install FastAPI to host the Windows control plane")
+
+    @asynccontextmanager
+    async def lifespan(_app: Any) -> AsyncIterator[None]:
+        maintenance = asyncio.create_task(store.run_maintenance())
+        try:
+            yield
+        finally:
+            maintenance.cancel()
+            try:
+                with suppress(asyncio.CancelledError):
+                    await maintenance
+            finally:
+                store.close()
+
     app = FastAPI(
         title="Microsoft Agent Windows Companion Control Plane",
         docs_url=None,
         redoc_url=None,
         openapi_url=None,
+        lifespan=lifespan,
     )
     configured_devices = dict(settings.devices)
     configured_policies = dict(settings.action_policies)
@@ -1140,20 +1342,25 @@ async def poll_actions(
         capabilities = frozenset(body.capabilities) & frozenset(
             configured.device.allowed_actions
         )
-        deadline = asyncio.get_running_loop().time() + allowed_wait
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + allowed_wait
+        await store.touch_device(
+            device_id, datetime.now(UTC), body.companion_version, capabilities
+        )
         while True:
-            now = datetime.now(UTC)
-            await store.touch_device(
-                device_id, now, body.companion_version, capabilities
-            )
-            batch = await store.poll(device_id, allowed_maximum, now)
-            if batch.deliveries or asyncio.get_running_loop().time() >= deadline:
-                if batch.cursor is None:
-                    batch = batch.model_copy(update={"cursor": body.cursor})
-                return batch
-            await asyncio.sleep(
-                min(0.25, max(0, deadline - asyncio.get_running_loop().time()))
-            )
+            wakeup = store.wakeups.subscribe(device_id)
+            try:
+                batch = await store.poll(device_id, allowed_maximum, datetime.now(UTC))
+                remaining = deadline - loop.time()
+                if batch.deliveries or remaining <= 0:
+                    if batch.cursor is None:
+                        batch = batch.model_copy(update={"cursor": body.cursor})
+                    return batch
+                await asyncio.wait(
+                    {wakeup}, timeout=min(remaining, _RELAY_RECHECK_SECONDS)
+                )
+            finally:
+                store.wakeups.unsubscribe(device_id, wakeup)
 
     @app.post(
         "/v1/devices/{device_id}/relay/actions/{delivery_id}/ack",
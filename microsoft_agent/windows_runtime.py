@@ -16,6 +16,7 @@
 
 import asyncio
 import base64
+import contextlib
 import hashlib
 import json
 import ntpath
@@ -24,11 +25,14 @@
 import socket
 import stat
 import sys
+import threading
+import time
 from collections import OrderedDict
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path, PureWindowsPath
-from typing import Any, Protocol, TypeVar, runtime_checkable
+from typing import Annotated, Any, Protocol, TypeVar, runtime_checkable
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
@@ -56,9 +60,38 @@
 )
 
 _REPARSE_POINT_ATTRIBUTE = 0x400
+_RACY_MTIME_NANOSECONDS = 2_000_000_000
 _T = TypeVar("_T")
 
 
+# Relay actions in one lane contend for one local resource.  Within a batch a
+# lane keeps delivery order for writes: a write waits for every earlier action
+# in its lane, and an action waits for every earlier write.  Reads only observe
+# state, so consecutive reads in a lane run concurrently.  Kinds without a lane
+# share only the overall ``relay_concurrency`` bound.
+_RELAY_LANES: Mapping[CompanionActionKind, str] = {
+    CompanionActionKind.OFFICE_OPEN_DOCUMENT: "office",
+    CompanionActionKind.OFFICE_EXPORT_PDF: "office",
+    CompanionActionKind.POWER_AUTOMATE_DESKTOP_RUN: "desktop_flow",
+    CompanionActionKind.WINDOWS_SERVICE_STATUS: "service",
+    CompanionActionKind.WINDOWS_SERVICE_START: "service",
+    CompanionActionKind.WINDOWS_SERVICE_STOP: "service",
+    CompanionActionKind.CLIPBOARD_READ_TEXT: "clipboard",
+    CompanionActionKind.CLIPBOARD_WRITE_TEXT: "clipboard",
+    CompanionActionKind.FILE_LIST: "files",
+    CompanionActionKind.FILE_READ: "files",
+    CompanionActionKind.FILE_WRITE: "files",
+}
+_RELAY_READ_KINDS = frozenset(
+    {
+        CompanionActionKind.WINDOWS_SERVICE_STATUS,
+        CompanionActionKind.CLIPBOARD_READ_TEXT,
+        CompanionActionKind.FILE_LIST,
+        CompanionActionKind.FILE_READ,
+    }
+)
+
+
 class WindowsRuntimeLimits(BaseModel):
     """Local resource limits enforced independently of controller input."""
 
@@ -68,7 +101,13 @@ class WindowsRuntimeLimits(BaseModel):
     list_hash_maximum_bytes: int = Field(default=10_485_760, ge=0, le=104_857_600)
     maximum_pad_input_bytes: int = Field(default=262_144, ge=1, le=1_048_576)
     maximum_cached_results: int = Field(default=1024, ge=1, le=10_000)
+    maximum_cached_hashes: int = Field(default=65_536, ge=0, le=1_000_000)
+    list_hash_workers: int = Field(default=4, ge=1, le=32)
     relay_batch_size: int = Field(default=10, ge=1, le=100)
+    relay_concurrency: int = Field(default=10, ge=1, le=100)
+    relay_lane_limits: dict[str, Annotated[int, Field(ge=1, le=100)]] = Field(
+        default_factory=dict
+    )
     relay_wait_seconds: float = Field(default=30.0, ge=1, le=300)
     idle_delay_seconds: float = Field(default=1.0, ge=0.05, le=60)
 
@@ -324,6 +363,39 @@ def show(self, title: str, message: str) -> None:
         self._notifier.show_toast(title, message, threaded=False, duration=5)
 
 
+class _FileHashCache:
+    """LRU of file digests keyed by path, file id, size, and timestamps.
+
+    A key changes whenever the file is replaced or rewritten, so only
+    changed files are hashed again.  Files modified within the last
+    ``_RACY_MTIME_NANOSECONDS`` are never cached, because a write in the
+    same timestamp tick would leave their key unchanged.
+    """
+
+    def __init__(self, maximum_entries: int) -> None:
+        self.maximum_entries = maximum_entries
+        self._entries: OrderedDict[tuple[Any, ...], str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[Any, ...]) -> str | None:
+        with self._lock:
+            digest = self._entries.get(key)
+            if digest is not None:
+                self._entries.move_to_end(key)
+            return digest
+
+    def put(self, key: tuple[Any, ...], digest: str, modified_ns: int) -> None:
+        if not self.maximum_entries:
+            return
+        if time.time_ns() - modified_ns < _RACY_MTIME_NANOSECONDS:
+            return
+        with self._lock:
+            self._entries[key] = digest
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maximum_entries:
+                self._entries.popitem(last=False)
+
+
 class _RootBinding:
     def __init__(self, logical_root: str, physical_root: Path) -> None:
         self.logical_root = _normalize_windows_path(logical_root)
@@ -494,6 +566,7 @@ def __init__(
             str, tuple[str, asyncio.Future[CompanionActionResult]]
         ] = {}
         self._cache_lock = asyncio.Lock()
+        self._hashes = _FileHashCache(self.limits.maximum_cached_hashes)
 
     @property
     def local_policies(self) -> Mapping[CompanionActionKind, ActionPolicy]:
@@ -738,6 +811,7 @@ def _inventory(self, action: SystemInventoryAction) -> Mapping[str, Any]:
     def _list_files(self, action: FileListAction) -> Mapping[str, Any]:
         guarded = self._files.read_path(action.path, require_directory=True)
         entries: list[dict[str, Any]] = []
+        unhashed: list[tuple[dict[str, Any], Path, tuple[Any, ...]]] = []
         truncated = False
         pending = [guarded.physical_path]
         while pending:
@@ -761,32 +835,68 @@ def _list_files(self, action: FileListAction) -> Mapping[str, Any]:
                 is_directory = stat.S_ISDIR(info.st_mode) and not reparse
                 is_file = stat.S_ISREG(info.st_mode) and not reparse
                 digest: str | None = None
+                hash_key: tuple[Any, ...] | None = None
                 if is_file and info.st_size <= self.limits.list_hash_maximum_bytes:
-                    digest = _hash_file_no_follow(path, self.limits.maximum_file_bytes)
-                entries.append(
-                    {
-                        "path": self._files.logical_child(guarded, path),
-                        "name": entry.name,
-                        "type": (
-                            "reparse_point"
-                            if reparse
-                            else "directory"
-                            if is_directory
-                            else "file"
-                            if is_file
-                            else "other"
-                        ),
-                        "size_bytes": info.st_size if is_file else None,
-                        "modified_at": datetime.fromtimestamp(
-                            info.st_mtime, tz=UTC
-                        ).isoformat(),
-                        "sha256": digest,
-                    }
-                )
+                    # DirEntry.stat() leaves st_ino unset on Windows; inode()
+                    # fetches the file id there.
+                    hash_key = (
+                        entry.path,
+                        entry.inode(),
+                        info.st_size,
+                        info.st_mtime_ns,
+                        info.st_ctime_ns,
+                    )
+                    digest = self._hashes.get(hash_key)
+                entry_output: dict[str, Any] = {
+                    "path": self._files.logical_child(guarded, path),
+                    "name": entry.name,
+                    "type": (
+                        "reparse_point"
+                        if reparse
+                        else "directory"
+                        if is_directory
+                        else "file"
+                        if is_file
+                        else "other"
+                    ),
+                    "size_bytes": info.st_size if is_file else None,
+                    "modified_at": datetime.fromtimestamp(
+                        info.st_mtime, tz=UTC
+                    ).isoformat(),
+                    "sha256": digest,
+                }
+                entries.append(entry_output)
+                if hash_key is not None and digest is None:
+                    unhashed.append((entry_output, path, hash_key))
                 if action.recursive and is_directory:
                     pending.append(path)
+        self._hash_listed_files(unhashed)
         return {"entries": entries, "count": len(entries), "truncated": truncated}
 
+    def _hash_listed_files(
+        self, unhashed: list[tuple[dict[str, Any], Path, tuple[Any, ...]]]
+    ) -> None:
+        def hash_one(path: Path) -> str:
+            return _hash_file_no_follow(path, self.limits.maximum_file_bytes)
+
+        paths = [path for _, path, _ in unhashed]
+        workers = min(self.limits.list_hash_workers, len(paths))
+        if workers > 1:
+            with ThreadPoolExecutor(workers, "microsoft-agent-hash") as pool:
+                digests = list(pool.map(hash_one, paths))
+        else:
+            digests = [hash_one(path) for path in paths]
+        for (entry_output, path, hash_key), digest in zip(
+            unhashed, digests, strict=True
+        ):
+            entry_output["sha256"] = digest
+            try:
+                current = os.lstat(path)
+            except OSError:
+                continue
+            if (current.st_size, current.st_mtime_ns) == hash_key[2:4]:
+                self._hashes.put(hash_key, digest, current.st_mtime_ns)
+
     def _read_file(self, action: FileReadAction) -> Mapping[str, Any]:
         guarded = self._files.read_path(action.path)
         maximum = min(action.max_bytes, self.limits.maximum_file_bytes)
@@ -1043,9 +1153,55 @@ async def run_once(self) -> int:
             raise WindowsRuntimeError(
                 "invalid_relay_batch", "Relay returned more actions than requested"
             )
-        for delivery in batch.deliveries:
-            result = await self._execute_delivery(delivery)
+        overall = asyncio.Semaphore(self._limits.relay_concurrency)
+        lanes = {
+            lane: asyncio.Semaphore(limit)
+            for lane, limit in self._limits.relay_lane_limits.items()
+        }
+        # Per lane, the completion of the last write and of the reads since.
+        last_write: dict[str, asyncio.Event] = {}
+        reads_since_write: dict[str, list[asyncio.Event]] = {}
+
+        async def process(
+            delivery: RelayActionDelivery,
+            lane: str | None,
+            predecessors: list[asyncio.Event],
+            done: asyncio.Event,
+        ) -> None:
+            try:
+                for predecessor in predecessors:
+                    await predecessor.wait()
+                # Take the lane first so a queued lane never holds an overall
+                # slot.
+                async with lanes.get(lane or "") or contextlib.nullcontext(), overall:
+                    result = await self._execute_delivery(delivery)
+            finally:
+                done.set()
             await self._transport.acknowledge(identity, delivery.delivery_id, result)
+
+        tasks = []
+        for delivery in batch.deliveries:
+            kind = delivery.request.action.kind
+            lane = _RELAY_LANES.get(kind)
+            done = asyncio.Event()
+            predecessors: list[asyncio.Event] = []
+            if lane is not None:
+                if lane in last_write:
+                    predecessors.append(last_write[lane])
+                if kind in _RELAY_READ_KINDS:
+                    reads_since_write.setdefault(lane, []).append(done)
+                else:
+                    predecessors.extend(reads_since_write.pop(lane, []))
+                    last_write[lane] = done
+            tasks.append(process(delivery, lane, predecessors, done))
+
+        # Each action is acknowledged as it completes.  A failed delivery lets
+        # the others finish before it is raised; the cursor advances only
+        # after the whole batch was acknowledged.
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
         self._cursor = batch.cursor
         return len(batch.deliveries)
 
@@ -1158,6 +1314,10 @@ def _ensure_contained(candidate: Path, root: Path) -> None:
 
 
 def _read_file_no_follow(path: Path, maximum_bytes: int) -> bytes:
+    return b"".join(_read_chunks_no_follow(path, maximum_bytes))
+
+
+def _read_chunks_no_follow(path: Path, maximum_bytes: int) -> Iterator[bytes]:
     _reject_reparse(path)
     flags = os.O_RDONLY | getattr(os, "O_BINARY", 0)
     if hasattr(os, "O_NOFOLLOW"):
@@ -1174,21 +1334,26 @@ def _read_file_no_follow(path: Path, maximum_bytes: int) -> bytes:
             raise WindowsRuntimePolicyError("The requested path is not a regular file")
         if info.st_size > maximum_bytes:
             raise WindowsRuntimePolicyError("The file exceeds the requested byte limit")
-        data = bytearray()
-        while len(data) <= maximum_bytes:
-            chunk = os.read(descriptor, min(1024 * 1024, maximum_bytes + 1 - len(data)))
+        total = 0
+        while total <= maximum_bytes:
+            chunk = os.read(descriptor, min(1024 * 1024, maximum_bytes + 1 - total))
             if not chunk:
                 break
-            data.extend(chunk)
-        if len(data) > maximum_bytes:
-            raise WindowsRuntimePolicyError("The file exceeds the requested byte limit")
-        return bytes(data)
+            total += len(chunk)
+            if total > maximum_bytes:
+                raise WindowsRuntimePolicyError(
+                    "The file exceeds the requested byte limit"
+                )
+            yield chunk
     finally:
         os.close(descriptor)
 
 
 def _hash_file_no_follow(path: Path, maximum_bytes: int) -> str:
-    return hashlib.sha256(_read_file_no_follow(path, maximum_bytes)).hexdigest()
+    digest = hashlib.sha256()
+    for chunk in _read_chunks_no_follow(path, maximum_bytes):
+        digest.update(chunk)
+    return digest.hexdigest()
 
 
 def _atomic_write(path: Path, data: bytes, *, overwrite: bool) -> None:
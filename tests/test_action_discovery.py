@@ -4,7 +4,7 @@
 """
 
 import sys
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -66,3 +66,34 @@ async def test_unknown_action_raises_with_discovery_hint():
             client=MagicMock(),
             ctx=MagicMock(),
         )
+
+
+@pytest.mark.concept("AU-ECO.mcp.fastmcp-middleware")
+@pytest.mark.asyncio
+async def test_action_arguments_are_checked_before_the_client_is_called():
+    from fastmcp import FastMCP
+
+    from microsoft_agent.mcp_server import register_contacts_tools
+
+    mcp = FastMCP("dispatch-test")
+    register_contacts_tools(mcp)
+    contacts = await mcp.get_tool("microsoft_contacts")
+    client = MagicMock()
+    client.get_outlook_contact = AsyncMock(return_value={"id": "c-1"})
+    client.create_outlook_contact = AsyncMock(return_value={"id": "c-2"})
+
+    async def call(action: str, params_json: str):
+        return await contacts.fn(
+            action=action, params_json=params_json, client=client, ctx=None
+        )
+
+    assert await call("get_outlook_contact", '{"contact_id": "c-1"}') == {"id": "c-1"}
+    with pytest.raises(ValueError, match="Unknown parameters.*contactId"):
+        await call("get_outlook_contact", '{"contactId": "c-1"}')
+    with pytest.raises(ValueError, match="Missing required parameters.*contact_id"):
+        await call("get_outlook_contact", '{"contact_id": null}')
+    assert await call("get_outlook_contact", "[]") == {"error": "Invalid params_json"}
+    client.get_outlook_contact.assert_awaited_once_with(contact_id="c-1")
+
+    await call("create_outlook_contact", '{"givenName": "Ada", "params": null}')
+    client.create_outlook_contact.assert_awaited_once_with(data={"givenName": "Ada"})
@@ -1,5 +1,6 @@
 """Extended tests for the current modular Microsoft Graph API client."""
 
+import json
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -16,6 +17,19 @@ def _awaited_argument(mock: Any) -> Any:
     return awaited_call.args[0]
 
 
+def _raw_json_requests(send: AsyncMock) -> list[tuple[str, str, Any]]:
+    """Return ``(method, url, body)`` for each raw Graph request sent."""
+
+    return [
+        (
+            awaited_call.args[0].http_method.value,
+            awaited_call.args[0].url,
+            json.loads(awaited_call.args[0].content),
+        )
+        for awaited_call in send.await_args_list
+    ]
+
+
 class TestMicrosoftGraphApi:
     """Test MicrosoftGraphApi class."""
 
@@ -248,14 +262,29 @@ async def test_get_mail_message_success(
             "microsoft_agent.api.api_client_base.GraphServiceClient"
         ) as mock_client_class:
             mock_client = MagicMock()
-            mock_client.me.messages.by_message_id.return_value.get = AsyncMock(
+            mock_native_response.json.return_value = {
+                "responses": [{"id": "1", "status": 200, "body": {"id": "msg123"}}]
+            }
+            send = mock_client.request_adapter.send_primitive_async = AsyncMock(
                 return_value=mock_native_response
             )
             mock_client_class.return_value = mock_client
 
             api = MicrosoftGraphApi(mock_auth_manager)
-            result = await api.get_mail_message("msg123")
-            assert result == {"value": []}
+            result = await api.get_mail_message("msg123", params={"$select": "subject"})
+            assert result == {"id": "msg123"}
+
+        graph = "https://graph.microsoft.com/v1.0"
+        batch_request = {
+            "requests": [
+                {
+                    "method": "GET",
+                    "url": "/me/messages/msg123?$select=subject",
+                    "id": "1",
+                }
+            ]
+        }
+        assert _raw_json_requests(send) == [("POST", f"{graph}/$batch", batch_request)]
 
     async def test_send_mail_success(self, mock_auth_manager, sample_mail_data):
         """Test send_mail successfully."""
@@ -268,12 +297,15 @@ async def test_send_mail_success(self, mock_auth_manager, sample_mail_data):
             "microsoft_agent.api.api_client_base.GraphServiceClient"
         ) as mock_client_class:
             mock_client = MagicMock()
-            mock_client.me.send_mail.post = AsyncMock()
+            mock_client.request_adapter.send_primitive_async = AsyncMock()
             mock_client_class.return_value = mock_client
 
             api = MicrosoftGraphApi(mock_auth_manager)
             result = await api.send_mail(sample_mail_data)
             assert result == {"status": "success"}
+            assert await api.send_mail({"saveToSentItems": True}) == {
+                "error": "Operation failed"
+            }
 
     async def test_send_mail_error(self, mock_auth_manager, sample_mail_data):
         """Test send_mail with error."""
@@ -286,7 +318,7 @@ async def test_send_mail_error(self, mock_auth_manager, sample_mail_data):
             "microsoft_agent.api.api_client_base.GraphServiceClient"
         ) as mock_client_class:
             mock_client = MagicMock()
-            mock_client.me.send_mail.post = AsyncMock(
+            mock_client.request_adapter.send_primitive_async = AsyncMock(
                 side_effect=Exception("Send failed")
             )
             mock_client_class.return_value = mock_client
@@ -774,15 +806,9 @@ async def test_calendar_event_mutations_propagate_complete_payloads(
             "microsoft_agent.api.api_client_base.GraphServiceClient"
         ) as mock_client_class:
             mock_client = MagicMock()
-            mock_client.me.events.post = AsyncMock(return_value=mock_native_response)
-            event_item = mock_client.me.events.by_event_id.return_value
-            event_item.patch = AsyncMock(return_value=mock_native_response)
-            calendar_events = (
-                mock_client.me.calendars.by_calendar_id.return_value.events
+            send = mock_client.request_adapter.send_primitive_async = AsyncMock(
+                return_value=mock_native_response
             )
-            calendar_events.post = AsyncMock(return_value=mock_native_response)
-            calendar_event_item = calendar_events.by_event_id.return_value
-            calendar_event_item.patch = AsyncMock(return_value=mock_native_response)
             mock_client_class.return_value = mock_client
 
             api = MicrosoftGraphApi(mock_auth_manager)
@@ -795,20 +821,13 @@ async def test_calendar_event_mutations_propagate_complete_payloads(
                 "calendar-1", "event-2", data
             ) == {"value": []}
 
-        calls = (
-            mock_client.me.events.post.await_args,
-            event_item.patch.await_args,
-            calendar_events.post.await_args,
-            calendar_event_item.patch.await_args,
-        )
-        for awaited_call in calls:
-            assert awaited_call is not None
-            event = awaited_call.args[0]
-            assert event.subject == "Architecture review"
-            assert event.attendees[0].email_address.address == ("attendee@example.com")
-            assert event.location.display_name == "Conference Room A"
-            assert event.is_online_meeting is True
-            assert event.online_meeting_provider.value == "teamsForBusiness"
+        graph = "https://graph.microsoft.com/v1.0"
+        assert _raw_json_requests(send) == [
+            ("POST", f"{graph}/me/events", data),
+            ("PATCH", f"{graph}/me/events/event-1", data),
+            ("POST", f"{graph}/me/calendars/calendar-1/events", data),
+            ("PATCH", f"{graph}/me/calendars/calendar-1/events/event-2", data),
+        ]
 
     async def test_mail_mutations_propagate_complete_recipient_payloads(
         self, mock_auth_manager, mock_native_response
@@ -847,12 +866,12 @@ async def test_mail_mutations_propagate_complete_recipient_payloads(
             "microsoft_agent.api.api_client_base.GraphServiceClient"
         ) as mock_client_class:
             mock_client = MagicMock()
-            mock_client.me.send_mail.post = AsyncMock()
+            send = mock_client.request_adapter.send_primitive_async = AsyncMock(
+                return_value=mock_native_response
+            )
             mock_client.me.messages.post = AsyncMock(return_value=mock_native_response)
             message_item = mock_client.me.messages.by_message_id.return_value
             message_item.patch = AsyncMock(return_value=mock_native_response)
-            shared_send = mock_client.users.by_user_id.return_value.send_mail
-            shared_send.post = AsyncMock()
             mock_client_class.return_value = mock_client
 
             api = MicrosoftGraphApi(mock_auth_manager)
@@ -866,28 +885,16 @@ async def test_mail_mutations_propagate_complete_recipient_payloads(
                 "shared@example.com", send_data
             ) == {"status": "success"}
 
-        send_call = mock_client.me.send_mail.post.await_args
         draft_call = mock_client.me.messages.post.await_args
         update_call = message_item.patch.await_args
-        shared_call = shared_send.post.await_args
-        assert send_call is not None
         assert draft_call is not None
         assert update_call is not None
-        assert shared_call is not None
 
-        for request_body in (send_call.args[0], shared_call.args[0]):
-            assert request_body.save_to_sent_items is False
-            sent_message = request_body.message
-            assert sent_message.cc_recipients[0].email_address.address == (
-                "cc@example.com"
-            )
-            assert sent_message.bcc_recipients[0].email_address.address == (
-                "bcc@example.com"
-            )
-            assert sent_message.reply_to[0].email_address.address == (
-                "reply@example.com"
-            )
-            assert sent_message.importance.value == "high"
+        graph = "https://graph.microsoft.com/v1.0"
+        assert _raw_json_requests(send) == [
+            ("POST", f"{graph}/me/sendMail", send_data),
+            ("POST", f"{graph}/users/shared%40example.com/sendMail", send_data),
+        ]
 
         draft = draft_call.args[0]
         assert draft.cc_recipients[0].email_address.address == "cc@example.com"
@@ -1140,24 +1147,20 @@ async def test_search_query_propagates_payload(
             "microsoft_agent.api.api_client_base.GraphServiceClient"
         ) as mock_client_class:
             mock_client = MagicMock()
-            mock_client.search.query.post = AsyncMock(return_value=mock_native_response)
+            send = mock_client.request_adapter.send_primitive_async = AsyncMock(
+                return_value=mock_native_response
+            )
             mock_client_class.return_value = mock_client
 
             api = MicrosoftGraphApi(mock_auth_manager)
             result = await api.search_query(data)
+            rejected = await api.search_query({"requests": []})
 
         assert result == {"value": []}
-        awaited_call = mock_client.search.query.post.await_args
-        assert awaited_call is not None
-        request_body = awaited_call.args[0]
-        request = request_body.requests[0]
-        assert [entity_type.value for entity_type in request.entity_types] == [
-            "message"
+        assert rejected == {"error": "Operation failed"}
+        assert _raw_json_requests(send) == [
+            ("POST", "https://graph.microsoft.com/v1.0/search/query", data)
         ]
-        assert request.query.query_string == "quarterly report"
-        assert request.from_ == 10
-        assert request.size == 25
-        assert request.fields == ["subject", "receivedDateTime"]
 
     async def test_update_admin_sharepoint_propagates_payload(
         self, mock_auth_manager, mock_native_response
@@ -1644,17 +1647,13 @@ async def test_tenant_subscription_invitation_and_security_payloads(
         ) as mock_client_class:
             mock_client = MagicMock()
             org_item = mock_client.organization.by_organization_id.return_value
-            subscription_item = (
-                mock_client.subscriptions.by_subscription_id.return_value
-            )
             alert_item = mock_client.security.alerts_v2.by_alert_id.return_value
             incident_item = mock_client.security.incidents.by_incident_id.return_value
             org_item.patch = AsyncMock(return_value=mock_native_response)
             org_item.branding.patch = AsyncMock(return_value=mock_native_response)
-            mock_client.subscriptions.post = AsyncMock(
+            send = mock_client.request_adapter.send_primitive_async = AsyncMock(
                 return_value=mock_native_response
             )
-            subscription_item.patch = AsyncMock(return_value=mock_native_response)
             mock_client.invitations.post = AsyncMock(return_value=mock_native_response)
             alert_item.patch = AsyncMock(return_value=mock_native_response)
             incident_item.patch = AsyncMock(return_value=mock_native_response)
@@ -1683,16 +1682,11 @@ async def test_tenant_subscription_invitation_and_security_payloads(
         assert org_branding.username_hint_text == "Use your Contoso email"
         assert org_branding.background_color == "#112233"
 
-        created_subscription = _awaited_argument(mock_client.subscriptions.post)
-        assert created_subscription.include_resource_data is True
-        assert created_subscription.lifecycle_notification_url.endswith("/lifecycle")
-        assert created_subscription.expiration_date_time.isoformat() == (
-            "2026-07-20T10:00:00+00:00"
-        )
-        renewed_subscription = _awaited_argument(subscription_item.patch)
-        assert renewed_subscription.lifecycle_notification_url.endswith(
-            "/new-lifecycle"
-        )
+        graph = "https://graph.microsoft.com/v1.0"
+        assert _raw_json_requests(send) == [
+            ("POST", f"{graph}/subscriptions", subscription),
+            ("PATCH", f"{graph}/subscriptions/subscription-1", subscription_update),
+        ]
         created_invitation = _awaited_argument(mock_client.invitations.post)
         assert created_invitation.invite_redirect_url == "https://myapps.microsoft.com"
         assert (
@@ -407,19 +407,23 @@ async def test_get_client_with_token():
 
 
 @pytest.mark.asyncio
-async def test_graph_client_dependency_closes_request_transport():
-    """The FastMCP dependency owns and closes its request-scoped client."""
+async def test_graph_client_dependency_returns_client_to_pool():
+    """The FastMCP dependency borrows a pooled client and always returns it."""
 
     client = MagicMock()
-    client.close = AsyncMock()
-    with patch("microsoft_agent.auth.get_client", AsyncMock(return_value=client)):
+    pool = MagicMock()
+    pool.acquire = AsyncMock(return_value=client)
+    pool.release = AsyncMock()
+    with patch(
+        "microsoft_agent.graph_client_pool.get_graph_client_pool", return_value=pool
+    ):
         from microsoft_agent.auth import get_client_dependency
 
         dependency = get_client_dependency()
         assert await anext(dependency) is client
         await dependency.aclose()
 
-    client.close.assert_awaited_once_with()
+    pool.release.assert_awaited_once_with(client)
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,226 @@
+"""Incremental delta-query sync with SQLite deltaLink state."""
+
+from __future__ import annotations
+
+import base64
+import json
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from microsoft_agent.api_client import MicrosoftGraphApi
+from microsoft_agent.auth import durable_caller_identity
+from microsoft_agent.delta_sync import (
+    DeltaResource,
+    DeltaStateStore,
+    DeltaSyncEngine,
+    DeltaSyncError,
+)
+from microsoft_agent.settings import AuthenticationMode, MicrosoftSettings
+
+_GRAPH = "https://graph.microsoft.com/v1.0"
+_USERS = DeltaResource("users", "/users/delta", (("$select", "id"),))
+
+
+class _Graph:
+    def __init__(self, pages: dict[str, tuple[int, dict[str, Any]]]) -> None:
+        self.pages = pages
+        self.requested: list[str] = []
+
+    async def __call__(self, url: str) -> tuple[int, dict[str, Any]]:
+        self.requested.append(url)
+        return self.pages[url]
+
+
+@pytest.fixture
+def engine(tmp_path) -> DeltaSyncEngine:
+    return DeltaSyncEngine(DeltaStateStore(tmp_path / "delta.sqlite3"), _GRAPH)
+
+
+@pytest.mark.asyncio
+async def test_store_round_trips_links_per_identity(tmp_path) -> None:
+    store = DeltaStateStore(tmp_path / "state" / "delta.sqlite3")
+
+    await store.save(("tenant", "alice"), "users", "delta", f"{_GRAPH}/a")
+    await store.save(("tenant", "alice"), "users", "next", f"{_GRAPH}/b")
+
+    assert await store.load(("tenant", "alice"), "users") == ("next", f"{_GRAPH}/b")
+    assert await store.load(("tenant", "bob"), "users") is None
+    await store.reset(("tenant", "alice"), "users")
+    assert await store.load(("tenant", "alice"), "users") is None
+    with pytest.raises(ValueError):
+        DeltaStateStore(":memory:")
+
+
+@pytest.mark.asyncio
+async def test_second_sync_returns_only_changes(engine) -> None:
+    graph = _Graph(
+        {
+            f"{_GRAPH}/users/delta?%24select=id": (
+                200,
+                {
+                    "value": [{"id": "1"}],
+                    "@odata.nextLink": f"{_GRAPH}/users/delta?$skiptoken=p2",
+                },
+            ),
+            f"{_GRAPH}/users/delta?$skiptoken=p2": (
+                200,
+                {
+                    "value": [{"id": "2"}],
+                    "@odata.deltaLink": f"{_GRAPH}/users/delta?$deltatoken=d1",
+                },
+            ),
+            f"{_GRAPH}/users/delta?$deltatoken=d1": (
+                200,
+                {
+                    "value": [{"id": "2", "@removed": {"reason": "deleted"}}],
+                    "@odata.deltaLink": f"{_GRAPH}/users/delta?$deltatoken=d2",
+                },
+            ),
+        }
+    )
+
+    first = await engine.sync("alice", _USERS, graph)
+    second = await engine.sync("alice", _USERS, graph)
+
+    assert first["value"] == [{"id": "1"}, {"id": "2"}]
+    assert first["initial"] is True and first["pagesFetched"] == 2
+    assert second["initial"] is False and second["removed"] == ["2"]
+    assert await engine.store.load("alice", _USERS.key) == (
+        "delta",
+        f"{_GRAPH}/users/delta?$deltatoken=d2",
+    )
+
+
+@pytest.mark.asyncio
+async def test_bounded_round_resumes_from_its_next_link(engine) -> None:
+    graph = _Graph(
+        {
+            f"{_GRAPH}/users/delta?%24select=id": (
+                200,
+                {"value": [1], "@odata.nextLink": f"{_GRAPH}/users/delta?p=2"},
+            ),
+            f"{_GRAPH}/users/delta?p=2": (
+                200,
+                {"value": [2], "@odata.deltaLink": f"{_GRAPH}/users/delta?d=1"},
+            ),
+        }
+    )
+
+    partial = await engine.sync("alice", _USERS, graph, max_pages=1)
+    rest = await engine.sync("alice", _USERS, graph, max_pages=1)
+
+    assert partial["partial"] is True and partial["value"] == [1]
+    assert rest["partial"] is False and rest["value"] == [2]
+
+
+@pytest.mark.asyncio
+async def test_expired_state_restarts_with_a_full_round(engine) -> None:
+    await engine.store.save("alice", _USERS.key, "delta", f"{_GRAPH}/users/delta?d=0")
+    graph = _Graph(
+        {
+            f"{_GRAPH}/users/delta?d=0": (410, {}),
+            f"{_GRAPH}/users/delta?%24select=id": (
+                200,
+                {"value": [1], "@odata.deltaLink": f"{_GRAPH}/users/delta?d=1"},
+            ),
+        }
+    )
+
+    result = await engine.sync("alice", _USERS, graph)
+
+    assert result["initial"] is True and result["value"] == [1]
+    with pytest.raises(DeltaSyncError):
+        await engine.sync(
+            "alice", _USERS, _Graph({f"{_GRAPH}/users/delta?d=1": (503, {})})
+        )
+
+
+@pytest.mark.asyncio
+async def test_foreign_continuation_links_are_rejected(engine) -> None:
+    graph = _Graph(
+        {
+            f"{_GRAPH}/users/delta?%24select=id": (
+                200,
+                {"value": [], "@odata.deltaLink": "https://attacker.example/v1.0/x"},
+            )
+        }
+    )
+
+    with pytest.raises(ValueError, match="configured endpoint"):
+        await engine.sync("alice", _USERS, graph)
+    assert await engine.store.load("alice", _USERS.key) is None
+
+
+@pytest.mark.asyncio
+async def test_sync_actions_require_a_configured_state_path(
+    monkeypatch, tmp_path
+) -> None:
+    client = object.__new__(MicrosoftGraphApi)
+    client.auth_manager = SimpleNamespace(
+        mode=None, expected_tenant_id="tenant", graph_base_url=_GRAPH
+    )
+    response = SimpleNamespace(
+        status_code=200,
+        json=lambda: {"value": [{"id": "g"}], "@odata.deltaLink": f"{_GRAPH}/g?d=1"},
+    )
+    client._graph_request = AsyncMock(return_value=response)  # noqa: SLF001
+    monkeypatch.setattr(
+        "microsoft_agent.api.api_client_sync.get_settings", MicrosoftSettings
+    )
+
+    assert "MICROSOFT_DELTA_STATE_PATH" in (await client.sync_groups())["error"]
+
+    monkeypatch.setattr(
+        "microsoft_agent.api.api_client_sync.get_settings",
+        lambda: MicrosoftSettings(delta_state_path=tmp_path / "delta.sqlite3"),
+    )
+    result = await client.sync_groups(params={"$select": "id"})
+
+    assert result["value"] == [{"id": "g"}]
+    client._graph_request.assert_awaited_once_with(  # noqa: SLF001
+        "GET", f"{_GRAPH}/groups/delta?%24select=id"
+    )
+
+
+def _token(**claims: Any) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).decode()
+    return f"header.{payload.rstrip('=')}.signature"
+
+
+def test_durable_identity_survives_token_rotation() -> None:
+    tokens = iter(
+        [
+            _token(tid="tenant", oid="alice", uti="first"),
+            _token(tid="tenant", oid="alice", uti="second"),
+            _token(tid="tenant"),
+        ]
+    )
+    manager = SimpleNamespace(
+        mode=AuthenticationMode.ON_BEHALF_OF,
+        external_token_provider=lambda: next(tokens),
+    )
+
+    first = durable_caller_identity(manager)
+    assert first == ("tenant", "object:alice")
+    assert durable_caller_identity(manager) == first
+    assert durable_caller_identity(manager) is None
+
+
+@pytest.mark.asyncio
+async def test_idle_sync_locks_are_released(engine) -> None:
+    graph = _Graph(
+        {
+            f"{_GRAPH}/users/delta?%24select=id": (
+                200,
+                {"value": [], "@odata.deltaLink": f"{_GRAPH}/users/delta?d=1"},
+            )
+        }
+    )
+
+    for caller in ("alice", "bob"):
+        await engine.sync(caller, _USERS, graph)
+
+    assert len(engine._locks) == 0  # noqa: SLF001
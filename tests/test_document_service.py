@@ -155,6 +155,53 @@ async def test_word_template_replacement_preserves_split_run_formatting(
     assert generated_paragraph.runs[-1].text == "!"
 
 
+@pytest.mark.skipif(
+    not CAPABILITIES.word_available, reason="python-docx is not installed"
+)
+@pytest.mark.asyncio
+async def test_word_template_is_validated_once_and_copied_per_document(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Cached templates skip revalidation and never leak earlier edits."""
+    from docx import Document
+
+    template_path = tmp_path / "memo.docx"
+    template = Document()
+    template.add_paragraph("Dear {{name}},")
+    template.save(template_path)
+    service = documents.DocumentService(tmp_path / "out", template_root=tmp_path)
+    validated: list[int] = []
+    validate = service._validate_office_archive
+    monkeypatch.setattr(
+        service,
+        "_validate_office_archive",
+        lambda content: validated.append(len(content)) or validate(content),
+    )
+
+    async def render(name: str) -> list[str]:
+        artifact = await service.generate_word_document(
+            documents.WordDocumentRequest(
+                template_path="memo.docx",
+                replacements={"name": name},
+                paragraphs=[documents.WordParagraph(text=f"For {name}")],
+                artifact=documents.ArtifactOptions(delivery="bytes"),
+            )
+        )
+        assert artifact.content is not None
+        return [p.text for p in Document(BytesIO(artifact.content)).paragraphs]
+
+    first = await render("Ada")
+    second = await render("Grace")
+    template.add_paragraph("Revised")
+    template.save(template_path)
+    third = await render("Alan")
+
+    assert first == ["Dear Ada,", "For Ada"]
+    assert second == ["Dear Grace,", "For Grace"]
+    assert third[:2] == ["Dear Alan,", "Revised"]
+    assert len(validated) == 2
+
+
 @pytest.mark.skipif(
     not CAPABILITIES.word_available, reason="python-docx is not installed"
 )
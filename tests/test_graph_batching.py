@@ -0,0 +1,254 @@
+"""Graph JSON $batch coalescing for fan-out requests."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from microsoft_agent.api._batching import GraphBatchCoalescer, validated_batch_url
+from microsoft_agent.api_client import MicrosoftGraphApi
+from microsoft_agent.auth import AuthenticationMode
+from microsoft_agent.settings import MicrosoftSettings
+
+_BASE = "https://graph.microsoft.com/v1.0"
+
+
+def _echo_batch(requests: list[dict]) -> MagicMock:
+    response = MagicMock()
+    response.raise_for_status = MagicMock()
+    response.json.return_value = {
+        "responses": [
+            {"id": request["id"], "status": 200, "body": {"url": request["url"]}}
+            for request in reversed(requests)
+        ]
+    }
+    return response
+
+
+def _api() -> tuple[MicrosoftGraphApi, AsyncMock]:
+    async def send(request_info, *_):
+        return _echo_batch(json.loads(request_info.content)["requests"])
+
+    client = MagicMock()
+    client.request_adapter.send_primitive_async = AsyncMock(side_effect=send)
+    api = object.__new__(MicrosoftGraphApi)
+    api.client = client
+    api.auth_manager = SimpleNamespace(graph_base_url=_BASE)
+    return api, client.request_adapter.send_primitive_async
+
+
+@pytest.mark.asyncio
+async def test_batch_scope_splits_requests_into_groups_of_twenty() -> None:
+    api, send = _api()
+
+    async with api.batch() as group:
+        futures = [group.get(f"/users/{index}") for index in range(25)]
+
+    assert [future.result()["body"]["url"] for future in futures] == [
+        f"/users/{index}" for index in range(25)
+    ]
+    requests = [call.args[0] for call in send.await_args_list]
+    assert [request.url for request in requests] == [f"{_BASE}/$batch"] * 2
+    assert [len(json.loads(request.content)["requests"]) for request in requests] == [
+        20,
+        5,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_batch() -> None:
+    api, send = _api()
+
+    results = await asyncio.gather(
+        api.batch_request("GET", "/me"),
+        api.batch_request("GET", "/me/presence"),
+        api.batch_request("GET", "/me/manager"),
+    )
+
+    assert [result["body"]["url"] for result in results] == [
+        "/me",
+        "/me/presence",
+        "/me/manager",
+    ]
+    send.assert_awaited_once()
+
+
+def test_graph_retry_key_separates_tenants_and_applications(monkeypatch) -> None:
+    fingerprint = MagicMock(return_value=("tenant-a", "client-a"))
+    monkeypatch.setattr(
+        "microsoft_agent.api.api_client_base.get_auth_fingerprint", fingerprint
+    )
+    first, _ = _api()
+    first_key = first._graph_retry_key()
+    fingerprint.return_value = ("tenant-b", "client-a")
+    second, _ = _api()
+
+    assert first_key == (
+        "microsoft_graph",
+        "graph.microsoft.com",
+        ("tenant-a", "client-a"),
+    )
+    assert second._graph_retry_key() != first_key
+    assert first._graph_retry_key() == first_key
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_fails_every_queued_request() -> None:
+    coalescer = GraphBatchCoalescer(AsyncMock(side_effect=ConnectionError()))
+
+    futures = [coalescer.submit({"method": "GET", "url": "/me"}) for _ in range(2)]
+    await coalescer.flush()
+
+    assert all(isinstance(future.exception(), ConnectionError) for future in futures)
+
+
+@pytest.mark.asyncio
+async def test_get_batch_action_accepts_only_allowed_read_actions(monkeypatch) -> None:
+    api, send = _api()
+    monkeypatch.setattr(
+        "microsoft_agent.api.api_client_other.get_settings",
+        lambda: MicrosoftSettings(enabled_tool_groups=("mail",)),
+    )
+
+    for request, error in [
+        ({"action": "list_users"}, "cannot be batched"),
+        ({"action": "delete_mail_message"}, "cannot be batched"),
+        ({"action": "get_group", "params": {"group_id": "g"}}, "'groups'"),
+        ({"action": "get_mail_message", "params": {"url": "/me"}}, "url"),
+    ]:
+        valid = {"action": "get_mail_message", "params": {"message_id": "m"}}
+        result = await api.get_batch([valid, request])
+        assert error in result["error"]
+    send.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_batch_action_returns_responses_in_request_order() -> None:
+    api, _ = _api()
+
+    result = await api.get_batch(
+        [
+            {"id": "a", "action": "get_presence", "params": {"user_id": "u/1"}},
+            {
+                "action": "get_mail_message",
+                "params": {"message_id": "m", "params": {"$select": "subject"}},
+            },
+        ]
+    )
+
+    assert result == {
+        "responses": [
+            {
+                "id": "a",
+                "status": 200,
+                "headers": {},
+                "body": {"url": "/communications/presences/u%2F1"},
+            },
+            {
+                "id": None,
+                "status": 200,
+                "headers": {},
+                "body": {"url": "/me/messages/m?$select=subject"},
+            },
+        ]
+    }
+
+
+@pytest.mark.asyncio
+async def test_concurrent_fan_out_reads_share_one_batch() -> None:
+    api, send = _api()
+
+    results = await asyncio.gather(
+        *(api.get_presence(f"user-{index}") for index in range(3)),
+        api.get_calendar_event("event-1", timezone="UTC"),
+    )
+
+    assert [result["url"] for result in results] == [
+        "/communications/presences/user-0",
+        "/communications/presences/user-1",
+        "/communications/presences/user-2",
+        "/me/events/event-1",
+    ]
+    send.assert_awaited_once()
+    requests = json.loads(send.await_args.args[0].content)["requests"]
+    assert requests[3]["headers"] == {"Prefer": 'outlook.timezone="UTC"'}
+
+
+@pytest.mark.asyncio
+async def test_callers_with_different_tokens_never_share_a_batch() -> None:
+    token: contextvars.ContextVar[str] = contextvars.ContextVar("token")
+    sent_with: list[tuple[str, list[str]]] = []
+
+    async def send(request_info, *_):
+        requests = json.loads(request_info.content)["requests"]
+        sent_with.append((token.get(), [request["url"] for request in requests]))
+        return _echo_batch(requests)
+
+    api, _ = _api()
+    api.client.request_adapter.send_primitive_async = AsyncMock(side_effect=send)
+    api.auth_manager = SimpleNamespace(
+        graph_base_url=_BASE,
+        expected_tenant_id="tenant",
+        mode=AuthenticationMode.ON_BEHALF_OF,
+        external_token_provider=token.get,
+    )
+
+    async def read_as(user: str) -> list[dict]:
+        token.set(f"assertion-{user}")
+        return await asyncio.gather(
+            api.get_mail_message(f"{user}-1"), api.get_mail_message(f"{user}-2")
+        )
+
+    await asyncio.gather(read_as("ada"), read_as("grace"))
+
+    assert sorted(sent_with) == [
+        ("assertion-ada", ["/me/messages/ada-1", "/me/messages/ada-2"]),
+        ("assertion-grace", ["/me/messages/grace-1", "/me/messages/grace-2"]),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_throttled_sub_requests_are_retried_after_their_delay() -> None:
+    statuses = iter([429, 200])
+
+    async def send(request_info, *_):
+        requests = json.loads(request_info.content)["requests"]
+        response = MagicMock()
+        response.json.return_value = {
+            "responses": [
+                {
+                    "id": request["id"],
+                    "status": next(statuses),
+                    "headers": {"Retry-After": "0"},
+                    "body": {"id": "m"},
+                }
+                for request in requests
+            ]
+        }
+        return response
+
+    api, sent = _api()
+    sent.side_effect = send
+
+    assert await api.get_mail_message("m") == {"id": "m"}
+    assert sent.await_count == 2
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://example.invalid/v1.0/me",
+        "//example.invalid/me",
+        "me",
+        "/users/../me",
+        "/me#fragment",
+    ],
+)
+def test_batch_urls_must_be_api_relative(url: str) -> None:
+    with pytest.raises(ValueError, match="relative"):
+        validated_batch_url(url)
@@ -0,0 +1,133 @@
+"""Process-wide Microsoft Graph client pool contract."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from microsoft_agent import graph_client_pool
+from microsoft_agent.auth import AuthenticationRequiredError
+from microsoft_agent.graph_client_pool import GraphClientPool
+
+
+def _client(manager: MagicMock) -> MagicMock:
+    client = MagicMock()
+    client.auth_manager = manager
+    client.close = AsyncMock()
+    return client
+
+
+@pytest.fixture
+def manager(monkeypatch) -> MagicMock:
+    auth_manager = MagicMock()
+    auth_manager.get_token.return_value = "token"
+    monkeypatch.setattr(
+        graph_client_pool, "get_auth_manager", MagicMock(return_value=auth_manager)
+    )
+    monkeypatch.setattr(
+        graph_client_pool, "get_auth_fingerprint", MagicMock(return_value=("a",))
+    )
+    return auth_manager
+
+
+@pytest.mark.asyncio
+async def test_pool_reuses_one_client_across_calls(monkeypatch, manager) -> None:
+    factory = AsyncMock(side_effect=lambda: _client(manager))
+    monkeypatch.setattr(graph_client_pool, "get_client", factory)
+    pool = GraphClientPool()
+
+    first = await pool.acquire()
+    await pool.release(first)
+    second = await pool.acquire()
+    await pool.release(second)
+
+    assert first is second
+    factory.assert_awaited_once_with()
+    first.close.assert_not_awaited()
+    assert manager.get_token.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_pool_requires_a_token_before_lending(monkeypatch, manager) -> None:
+    manager.get_token.return_value = None
+    factory = AsyncMock()
+    monkeypatch.setattr(graph_client_pool, "get_client", factory)
+
+    with pytest.raises(AuthenticationRequiredError):
+        await GraphClientPool().acquire()
+
+    factory.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_superseded_client_closes_after_last_borrower(
+    monkeypatch, manager
+) -> None:
+    monkeypatch.setattr(
+        graph_client_pool, "get_client", AsyncMock(side_effect=lambda: _client(manager))
+    )
+    fingerprint = MagicMock(return_value=("a",))
+    monkeypatch.setattr(graph_client_pool, "get_auth_fingerprint", fingerprint)
+    pool = GraphClientPool()
+
+    old = await pool.acquire()
+    fingerprint.return_value = ("b",)
+    new = await pool.acquire()
+
+    assert new is not old
+    old.close.assert_not_awaited()
+    await pool.release(old)
+    old.close.assert_awaited_once_with()
+    await pool.release(new)
+    new.close.assert_not_awaited()
+    assert len(pool) == 1
+
+
+@pytest.mark.asyncio
+async def test_idle_clients_are_evicted(monkeypatch, manager) -> None:
+    monkeypatch.setattr(
+        graph_client_pool, "get_client", AsyncMock(side_effect=lambda: _client(manager))
+    )
+    clock = MagicMock(return_value=100.0)
+    monkeypatch.setattr(graph_client_pool.time, "monotonic", clock)
+    pool = GraphClientPool(idle_timeout_seconds=10)
+
+    idle = await pool.acquire()
+    await pool.release(idle)
+    clock.return_value = 111.0
+    fresh = await pool.acquire()
+
+    assert fresh is not idle
+    idle.close.assert_awaited_once_with()
+
+
+@pytest.mark.asyncio
+async def test_pool_shutdown_closes_every_client(monkeypatch, manager) -> None:
+    monkeypatch.setattr(
+        graph_client_pool, "get_client", AsyncMock(side_effect=lambda: _client(manager))
+    )
+    monkeypatch.setattr(graph_client_pool, "_graph_client_pool", None)
+    pool = graph_client_pool.get_graph_client_pool()
+    client = await pool.acquire()
+
+    await graph_client_pool.close_graph_client_pool()
+
+    client.close.assert_awaited_once_with()
+    assert graph_client_pool.get_graph_client_pool() is not pool
+
+
+def test_pool_abandon_removes_tls_material(manager) -> None:
+    pool = GraphClientPool()
+    client = _client(manager)
+    profile = MagicMock()
+    client.tls_profile = profile
+    entry = graph_client_pool._PoolEntry(key=("a",), client=client, loop=MagicMock())
+    pool._entries[("a",)] = entry
+    pool._by_client[id(client)] = entry
+
+    pool.abandon()
+
+    profile.cleanup.assert_called_once_with()
+    assert client.tls_profile is None
+    assert len(pool) == 0
@@ -0,0 +1,126 @@
+"""Single-flight coalescing of concurrent identical Graph reads."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import inspect
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from microsoft_agent.api.api_client_base import MicrosoftGraphApiBase
+from microsoft_agent.api_client import MicrosoftGraphApi
+from microsoft_agent.settings import AuthenticationMode
+
+_assertion: contextvars.ContextVar[str] = contextvars.ContextVar("assertion")
+
+
+class _Reader(MicrosoftGraphApiBase):
+    calls: list[Any]
+
+    def verify_login(self) -> str:
+        return "Authenticated"
+
+    async def get_profile(self, params: dict | None = None) -> dict[str, Any]:
+        self.calls.append(params)
+        await asyncio.sleep(0.01)
+        return {"id": "me", "params": params}
+
+    async def list_items(self, params: dict | None = None) -> dict[str, Any]:
+        self.calls.append(params)
+        await asyncio.sleep(0.01)
+        raise RuntimeError("Graph unavailable")
+
+
+def _reader(mode: AuthenticationMode = AuthenticationMode.APPLICATION) -> _Reader:
+    reader = object.__new__(_Reader)
+    reader.calls = []
+    reader.auth_manager = SimpleNamespace(
+        mode=mode,
+        expected_tenant_id="tenant",
+        selected_account_id="account",
+        external_token_provider=lambda: _assertion.get(""),
+    )
+    return reader
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_reads_share_one_request() -> None:
+    reader = _reader()
+
+    results = await asyncio.gather(
+        reader.get_profile(params={"$select": "id", "$top": 1}),
+        reader.get_profile(params={"$top": 1, "$select": "id"}),
+        reader.get_profile(params={"$select": "id", "$top": 1}),
+    )
+
+    assert len(reader.calls) == 1
+    assert results[0] == results[1] == results[2]
+    assert results[0] is not results[1]
+    assert reader._read_coalescer.stats() == {  # noqa: SLF001
+        "started": 1,
+        "joined": 2,
+        "in_flight": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_distinct_or_sequential_reads_are_sent_separately() -> None:
+    reader = _reader()
+
+    await asyncio.gather(
+        reader.get_profile(params={"$top": 1}),
+        reader.get_profile(params={"$top": 2}),
+    )
+    await reader.get_profile(params={"$top": 1})
+
+    assert reader.calls == [{"$top": 1}, {"$top": 2}, {"$top": 1}]
+
+
+@pytest.mark.asyncio
+async def test_reads_for_different_users_are_not_shared() -> None:
+    reader = _reader(AuthenticationMode.ON_BEHALF_OF)
+
+    async def as_user(token: str) -> dict[str, Any]:
+        _assertion.set(token)
+        return await reader.get_profile()
+
+    await asyncio.gather(as_user("alice"), as_user("bob"), as_user("alice"))
+
+    assert len(reader.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_shared_failure_reaches_every_caller_and_clears_the_flight() -> None:
+    reader = _reader()
+
+    results = await asyncio.gather(
+        reader.list_items(), reader.list_items(), return_exceptions=True
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert len(reader.calls) == 1
+    assert len(reader._read_coalescer) == 0  # noqa: SLF001
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_does_not_cancel_followers() -> None:
+    reader = _reader()
+
+    leader = asyncio.ensure_future(reader.get_profile())
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(reader.get_profile())
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert (await follower)["id"] == "me"
+    assert len(reader.calls) == 1
+
+
+def test_graph_read_wrappers_are_coalesced_and_keep_pagination() -> None:
+    assert MicrosoftGraphApi.get_me.__coalesced__
+    assert MicrosoftGraphApi.list_users.__coalesced__
+    assert "fetch_all" in inspect.signature(MicrosoftGraphApi.list_users).parameters
+    assert not hasattr(MicrosoftGraphApi.create_group, "__coalesced__")
@@ -2,21 +2,32 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
-from collections.abc import Mapping
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
 from typing import Any
 
 import pytest
 from pydantic import ValidationError
 
+from microsoft_agent.document_service import (
+    ArtifactDelivery,
+    DocumentPathError,
+    DocumentService,
+    DocumentServiceError,
+    GeneratedArtifact,
+)
 from microsoft_agent.graph_file_service import (
     GRAPH_AUDIENCE,
+    DriveRangeDownloader,
     GraphFileService,
     GraphFileServiceError,
     GraphFileSettings,
     UploadConflictBehavior,
 )
-from microsoft_agent.power_platform import HttpResponse
+from microsoft_agent.power_platform import HttpResponse, HttpResponseStream
+from microsoft_agent.retry_policy import RetryPolicy
 
 
 class TokenProvider:
@@ -124,6 +135,305 @@ async def test_large_upload_uses_sequential_preauthenticated_fragments() -> None
     assert all("Authorization" not in request["headers"] for request in fragments)
 
 
+@pytest.mark.asyncio
+async def test_resumable_upload_sends_memoryview_fragments_in_order() -> None:
+    chunk = 320 * 1024
+    content = bytes(range(256)) * (chunk * 3 // 256) + b"tail"
+    transport = Transport(
+        [
+            response(200, {"uploadUrl": "https://upload.example.test/session"}),
+            *(
+                response(202, {"nextExpectedRanges": [f"{index * chunk}-"]})
+                for index in range(1, 4)
+            ),
+            response(201, {"id": "item-3", "name": "big.bin", "size": len(content)}),
+        ]
+    )
+    service = GraphFileService(
+        GraphFileSettings(resumable_threshold_bytes=1, fragment_size_bytes=chunk),
+        TokenProvider(),
+        transport,
+    )
+    events = []
+
+    item = await service.upload_bytes(
+        "drive-1", "big.bin", content, progress=events.append
+    )
+
+    assert item.item_id == "item-3"
+    fragments = transport.requests[1:]
+    assert [request["headers"]["Content-Range"] for request in fragments] == [
+        f"bytes {index * chunk}-{min((index + 1) * chunk, len(content)) - 1}"
+        f"/{len(content)}"
+        for index in range(4)
+    ]
+    assert all(isinstance(request["body"], memoryview) for request in fragments)
+    assert b"".join(request["body"] for request in fragments) == content
+    assert [event.bytes_uploaded for event in events] == [
+        chunk,
+        2 * chunk,
+        3 * chunk,
+        len(content),
+    ]
+
+
+class FlakyTransport(Transport):
+    async def request(self, method: str, url: str, **kwargs: Any) -> HttpResponse:
+        if isinstance(self.responses[0], Exception):
+            self.requests.append({"method": method, "url": url, **kwargs})
+            raise self.responses.pop(0)
+        return await super().request(method, url, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_failed_fragment_resumes_from_next_expected_range() -> None:
+    chunk = 320 * 1024
+    content = bytes(range(256)) * (chunk // 256) + b"rest"
+    transport = FlakyTransport(
+        [
+            response(200, {"uploadUrl": "https://upload.example.test/session"}),
+            OSError("connection reset"),
+            OSError("connection reset"),
+            response(200, {"nextExpectedRanges": ["1024-"]}),
+            response(202, {"nextExpectedRanges": [f"{chunk}-"]}),
+            response(201, {"id": "item-5", "name": "big.bin", "size": 4}),
+        ]
+    )
+
+    async def no_sleep(delay: float) -> None:
+        return None
+
+    service = GraphFileService(
+        GraphFileSettings(
+            resumable_threshold_bytes=1, fragment_size_bytes=chunk, max_retries=1
+        ),
+        TokenProvider(),
+        transport,
+        retry_policy=RetryPolicy(sleep=no_sleep),
+    )
+
+    item = await service.upload_bytes("drive-1", "big.bin", content)
+
+    assert item.item_id == "item-5"
+    status, resumed = transport.requests[3:5]
+    assert status["method"] == "GET"
+    assert "Authorization" not in status["headers"]
+    assert resumed["headers"]["Content-Range"] == (
+        f"bytes 1024-{chunk - 1}/{len(content)}"
+    )
+    assert bytes(resumed["body"]) == content[1024:chunk]
+
+
+@pytest.mark.asyncio
+async def test_path_upload_streams_fragments_and_hashes_them(tmp_path) -> None:
+    chunk = 320 * 1024
+    content = bytes(range(256)) * (chunk // 256) + b"rest"
+    source = tmp_path / "deck.pptx"
+    source.write_bytes(content)
+    transport = Transport(
+        [
+            response(200, {"uploadUrl": "https://upload.example.test/session"}),
+            response(202, {"nextExpectedRanges": [f"{chunk}-"]}),
+            response(201, {"id": "item-4", "name": "deck.pptx", "size": 4}),
+        ]
+    )
+    service = GraphFileService(
+        GraphFileSettings(resumable_threshold_bytes=1, fragment_size_bytes=chunk),
+        TokenProvider(),
+        transport,
+    )
+
+    item = await service.upload_path("drive-1", "deck.pptx", source)
+
+    assert item.sha256 == hashlib.sha256(content).hexdigest()
+    assert [request["body"] for request in transport.requests[1:]] == [
+        content[:chunk],
+        content[chunk:],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_path_upload_stops_before_the_final_fragment_on_digest_mismatch(
+    tmp_path,
+) -> None:
+    chunk = 320 * 1024
+    source = tmp_path / "deck.pptx"
+    source.write_bytes(b"a" * (chunk + 1))
+    transport = Transport(
+        [
+            response(200, {"uploadUrl": "https://upload.example.test/session"}),
+            response(202, {"nextExpectedRanges": [f"{chunk}-"]}),
+        ]
+    )
+    service = GraphFileService(
+        GraphFileSettings(resumable_threshold_bytes=1, fragment_size_bytes=chunk),
+        TokenProvider(),
+        transport,
+    )
+
+    with pytest.raises(GraphFileServiceError, match="SHA-256"):
+        await service.upload_path(
+            "drive-1", "deck.pptx", source, expected_sha256="0" * 64
+        )
+    assert len(transport.requests) == 2
+
+    link = tmp_path / "link.pptx"
+    link.symlink_to(source)
+    with pytest.raises(ValueError, match="regular file"):
+        await service.upload_path("drive-1", "deck.pptx", link)
+    with pytest.raises(ValueError, match="regular file"):
+        await service.upload_path("drive-1", "deck.pptx", tmp_path)
+
+
+@pytest.mark.asyncio
+async def test_file_artifacts_upload_only_from_inside_the_artifact_root(
+    tmp_path,
+) -> None:
+    root = tmp_path / "artifacts"
+    root.mkdir()
+    inside = root / "deck.pptx"
+    outside = tmp_path / "secret.pptx"
+    for path in (inside, outside):
+        path.write_bytes(b"deck")
+
+    def artifact(path) -> GeneratedArtifact:
+        return GeneratedArtifact(
+            document_type="powerpoint",
+            filename=path.name,
+            content_type="application/octet-stream",
+            size_bytes=4,
+            sha256=hashlib.sha256(b"deck").hexdigest(),
+            delivery=ArtifactDelivery.FILE,
+            path=path,
+        )
+
+    transport = Transport(
+        [response(201, {"id": "item-1", "name": "deck.pptx", "size": 4})]
+    )
+    service = GraphFileService(GraphFileSettings(), TokenProvider(), transport)
+    documents = DocumentService(artifact_root=root)
+
+    with pytest.raises(DocumentServiceError, match="read explicitly"):
+        await service.upload_artifact("drive-1", "deck.pptx", artifact(inside))
+    with pytest.raises(DocumentPathError, match="inside its configured root"):
+        await service.upload_artifact(
+            "drive-1", "deck.pptx", artifact(outside), documents=documents
+        )
+    assert transport.requests == []
+
+    item = await service.upload_artifact(
+        "drive-1", "deck.pptx", artifact(inside), documents=documents
+    )
+
+    assert item.item_id == "item-1"
+    assert transport.requests[0]["body"] == b"deck"
+
+
+class RangeTransport(Transport):
+    def __init__(
+        self, content: bytes, *, short: bool = False, status: int = 206
+    ) -> None:
+        super().__init__([])
+        self.content = content
+        self.short = short
+        self.status = status
+        self.bodies_read = 0
+
+    @asynccontextmanager
+    async def stream(
+        self, method: str, url: str, *, headers, timeout, max_bytes
+    ) -> AsyncIterator[HttpResponseStream]:
+        self.requests.append({"method": method, "url": url, "headers": headers})
+        start, _, end = headers["Range"].removeprefix("bytes=").partition("-")
+        body = self.content[int(start) : int(end) + 1]
+        if self.short:
+            body = body[:-1]
+
+        async def chunks() -> AsyncIterator[bytes]:
+            self.bodies_read += 1
+            yield body
+
+        yield HttpResponseStream(self.status, {}, chunks(), max_bytes=max_bytes)
+
+
+@pytest.mark.asyncio
+async def test_ranged_download_writes_chunks_into_place(tmp_path) -> None:
+    content = bytes(range(256)) * 40 + b"end"
+    transport = RangeTransport(content)
+    destination = tmp_path / "report.bin"
+    events = []
+    downloader = DriveRangeDownloader(
+        transport, chunk_bytes=1024, max_concurrent_ranges=3
+    )
+
+    result = await downloader.download(
+        "https://tenant.sharepoint.example/download?tempauth=x",
+        len(content),
+        destination,
+        progress=events.append,
+    )
+
+    assert result.size == len(content)
+    assert destination.read_bytes() == content
+    assert len(transport.requests) == 11
+    assert all("Authorization" not in item["headers"] for item in transport.requests)
+    assert events[-1].bytes_uploaded == len(content)
+    with pytest.raises(FileExistsError):
+        await downloader.download(
+            "https://tenant.sharepoint.example/download", 3, destination
+        )
+    assert list(tmp_path.iterdir()) == [destination]
+
+
+@pytest.mark.asyncio
+async def test_ranged_download_never_replaces_a_file_created_meanwhile(
+    tmp_path,
+) -> None:
+    destination = tmp_path / "report.bin"
+
+    def progress(event) -> None:
+        # Another writer claims the name while the download is in flight.
+        destination.write_bytes(b"theirs")
+
+    downloader = DriveRangeDownloader(RangeTransport(b"x" * 10))
+
+    with pytest.raises(FileExistsError):
+        await downloader.download(
+            "https://tenant.sharepoint.example/download",
+            10,
+            destination,
+            progress=progress,
+        )
+    assert destination.read_bytes() == b"theirs"
+    assert list(tmp_path.iterdir()) == [destination]
+
+
+@pytest.mark.asyncio
+async def test_ranged_download_discards_partial_files(tmp_path) -> None:
+    downloader = DriveRangeDownloader(RangeTransport(b"x" * 10, short=True))
+
+    with pytest.raises(GraphFileServiceError, match="short download range"):
+        await downloader.download(
+            "https://tenant.sharepoint.example/download", 10, tmp_path / "a.bin"
+        )
+    with pytest.raises(GraphFileServiceError, match="unsafe download URL"):
+        await downloader.download("http://tenant.example/download", 10, tmp_path / "b")
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_ranged_download_refuses_non_partial_replies_unread(tmp_path) -> None:
+    transport = RangeTransport(b"x" * 10, status=200)
+    downloader = DriveRangeDownloader(transport, max_retries=0)
+
+    with pytest.raises(GraphFileServiceError, match="rejected a download range"):
+        await downloader.download(
+            "https://tenant.sharepoint.example/download", 10, tmp_path / "a.bin"
+        )
+    assert transport.bodies_read == 0
+    assert list(tmp_path.iterdir()) == []
+
+
 @pytest.mark.parametrize(
     "upload_url",
     [
@@ -13,6 +13,7 @@
 @pytest.mark.asyncio
 async def test_audience_provider_requests_default_scope() -> None:
     manager = MagicMock()
+    manager.cached_token.return_value = None
     manager.acquire_token_for_scopes.return_value = "access-token"
     provider = MicrosoftAudienceTokenProvider(
         ["https://graph.microsoft.com/"], auth_manager=manager
@@ -29,6 +30,7 @@ async def test_audience_provider_requests_default_scope() -> None:
 @pytest.mark.asyncio
 async def test_audience_provider_interactive_consent_is_explicit() -> None:
     manager = MagicMock()
+    manager.cached_token.return_value = None
     manager.acquire_token_for_scopes.return_value = "access-token"
     provider = MicrosoftAudienceTokenProvider(
         ["https://contoso.crm.dynamics.com"],
@@ -57,6 +59,7 @@ async def test_audience_provider_denies_dynamic_resource() -> None:
 @pytest.mark.asyncio
 async def test_audience_provider_requires_cached_authentication() -> None:
     manager = MagicMock()
+    manager.cached_token.return_value = None
     manager.acquire_token_for_scopes.return_value = None
     provider = MicrosoftAudienceTokenProvider(
         ["https://graph.microsoft.com"], auth_manager=manager
@@ -79,3 +82,18 @@ def test_audience_provider_accepts_entra_app_id_uri() -> None:
     provider = MicrosoftAudienceTokenProvider(["api://windows-companion/"])
 
     assert provider.allowed_audiences == frozenset({"api://windows-companion"})
+
+
+@pytest.mark.asyncio
+async def test_audience_provider_uses_cached_token_without_a_thread_hop() -> None:
+    manager = MagicMock()
+    manager.cached_token.return_value = "cached-token"
+    provider = MicrosoftAudienceTokenProvider(
+        ["https://graph.microsoft.com"], auth_manager=manager
+    )
+
+    assert await provider.get_token("https://graph.microsoft.com") == "cached-token"
+    manager.cached_token.assert_called_once_with(
+        ["https://graph.microsoft.com/.default"]
+    )
+    manager.acquire_token_for_scopes.assert_not_called()
@@ -13,6 +13,7 @@
     "microsoft_applications",
     "microsoft_audit",
     "microsoft_auth",
+    "microsoft_batch",
     "microsoft_calendar",
     "microsoft_chat",
     "microsoft_communications",
@@ -41,6 +42,7 @@
     "microsoft_solutions",
     "microsoft_storage",
     "microsoft_subscriptions",
+    "microsoft_sync",
     "microsoft_tasks",
     "microsoft_teams",
     "microsoft_user",
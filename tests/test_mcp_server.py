@@ -3,15 +3,35 @@
 from __future__ import annotations
 
 import importlib
+import json
+import os
+import subprocess
+import sys
 
 import pytest
 from fastmcp import FastMCP
 
 from microsoft_agent import mcp_server
+from microsoft_agent.settings import MicrosoftSettings
+
+# Modules a cold ``mcp_server`` import must leave to server construction.
+_DEFERRED_MODULES = (
+    "microsoft_agent.api_client",
+    "microsoft_agent.integration_tools",
+    "microsoft_agent.office_bridge",
+    "microsoft_agent.power_platform",
+    "microsoft_agent.response_cache",
+    "msgraph",
+)
+# Building a server limited to integration groups imports no Graph client,
+# SDK, or tool family, and must stay sub-second once ``fastmcp`` is loaded.
+_STARTUP_BUDGET_SECONDS = 1.0
 
 _ACTION_FAMILIES = (
     ("auth", "microsoft_auth"),
     ("meta", "microsoft_meta"),
+    ("batch", "microsoft_batch"),
+    ("sync", "microsoft_sync"),
     ("mail", "microsoft_mail"),
     ("files", "microsoft_files"),
     ("calendar", "microsoft_calendar"),
@@ -80,6 +100,41 @@ async def test_knowledge_projection_registers_only_current_tools() -> None:
     assert {"kg", "read"}.issubset(projection.tags)
 
 
+@pytest.mark.asyncio
+async def test_runtime_stats_tool_reports_every_counter_source(monkeypatch) -> None:
+    from microsoft_agent import auth, graph_client_pool, response_cache, retry_policy
+    from microsoft_agent.tool_policy import MicrosoftToolPolicy
+
+    monkeypatch.setattr(auth, "_auth_manager", None)
+    monkeypatch.setattr(response_cache, "_etag_store", None)
+    monkeypatch.setattr(retry_policy, "_retry_policy", None)
+    monkeypatch.setattr(graph_client_pool, "_graph_client_pool", None)
+    settings = MicrosoftSettings()
+    policy = MicrosoftToolPolicy(settings)
+    policy.evaluate("list_users")
+    cache = response_cache.ResponseCacheMiddleware(settings)
+    cache.cache.get("missing")
+    server = FastMCP("test-microsoft-agent")
+
+    mcp_server.register_runtime_stats_tool(server, policy, cache)
+
+    tools = await server.list_tools()
+    assert [tool.name for tool in tools] == ["get_microsoft_runtime_stats"]
+    assert {"system", "read"}.issubset(tools[0].tags)
+    stats = await tools[0].fn()
+    assert stats["tool_policy"]["read"]["allowed"] == 1
+    assert stats["response_cache"]["misses"] == 1
+    assert stats["etag_store"] is None
+    assert stats["token_cache"] is None
+    assert stats["retries"] == {}
+    assert stats["read_coalescing"] == {
+        "clients": 0,
+        "started": 0,
+        "joined": 0,
+        "in_flight": 0,
+    }
+
+
 def test_fragmented_registration_and_auth_surfaces_are_absent() -> None:
     module = importlib.import_module("microsoft_agent.mcp_server")
 
@@ -91,3 +146,71 @@ def test_fragmented_registration_and_auth_surfaces_are_absent() -> None:
 def test_mcp_server_version_is_explicit() -> None:
     assert isinstance(mcp_server.__version__, str)
     assert mcp_server.__version__
+
+
+def _probe_modules(statement: str, setup: str = "", **env: str):
+    # A fresh interpreter sees exactly what the statement loads, without
+    # unloading modules that other tests in this process still hold.
+    probe = (
+        f"import json, sys, time\n{setup}\n"
+        "started = time.perf_counter()\n"
+        f"{statement}\n"
+        "elapsed = time.perf_counter() - started\n"
+        "print(json.dumps([sorted(sys.modules), elapsed]))\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", probe],
+        capture_output=True,
+        check=True,
+        env={**os.environ, **env, "PYTHONPATH": os.pathsep.join(sys.path)},
+        text=True,
+    )
+    return json.loads(completed.stdout.splitlines()[-1])
+
+
+def test_server_import_defers_graph_sdk_and_tool_families() -> None:
+    modules, _ = _probe_modules("import microsoft_agent.mcp_server")
+
+    assert [name for name in modules if name in _DEFERRED_MODULES] == []
+    assert [name for name in modules if ".mcp.mcp_" in name] == []
+
+
+def test_server_without_graph_groups_starts_within_budget() -> None:
+    modules, elapsed = _probe_modules(
+        "get_mcp_instance()",
+        setup="from microsoft_agent.mcp_server import get_mcp_instance",
+        MICROSOFT_ENABLED_TOOL_GROUPS="power_platform",
+    )
+
+    assert "microsoft_agent.api_client" not in modules
+    assert "msgraph" not in modules
+    assert "microsoft_agent.office_bridge" not in modules
+    assert [name for name in modules if ".mcp.mcp_" in name] == []
+    assert elapsed < _STARTUP_BUDGET_SECONDS
+
+
+def test_server_loads_only_enabled_graph_families() -> None:
+    modules, _ = _probe_modules(
+        "get_mcp_instance()",
+        setup="from microsoft_agent.mcp_server import get_mcp_instance",
+        MICROSOFT_ENABLED_TOOL_GROUPS="mail",
+    )
+
+    assert [name for name in modules if ".mcp.mcp_" in name] == [
+        "microsoft_agent.mcp.mcp_mail"
+    ]
+    assert "microsoft_agent.integration_tools" not in modules
+
+
+@pytest.mark.asyncio
+async def test_disabled_graph_family_registers_nothing(monkeypatch) -> None:
+    monkeypatch.setattr(
+        mcp_server,
+        "get_settings",
+        lambda: MicrosoftSettings(enabled_tool_groups=("mail",)),
+    )
+    server = FastMCP("test-microsoft-agent")
+
+    assert mcp_server.register_admin_tools(server) is None
+
+    assert await server.list_tools() == []
@@ -187,6 +187,24 @@ async def test_pairing_session_and_command_expiry_are_enforced() -> None:
         await store.poll(session.session_token, wait_seconds=0)
 
 
+@pytest.mark.asyncio
+async def test_idle_expiry_follows_session_activity() -> None:
+    clock = MutableClock()
+    store = OfficeBridgeStore(clock=clock)
+    _, session = await paired_session(store)
+    clock.advance(timedelta(minutes=10))
+    assert await store.poll(session.session_token, wait_seconds=0) is None
+
+    clock.advance(timedelta(minutes=10))
+    assert len(await store.list_sessions()) == 1
+
+    clock.advance(timedelta(minutes=16))
+    assert await store.list_sessions() == ()
+    clock.advance(timedelta(hours=8))
+    await store.list_sessions()
+    assert store._expiry == []  # noqa: SLF001
+
+
 @pytest.mark.asyncio
 async def test_capacity_is_bounded_per_session() -> None:
     store = OfficeBridgeStore(max_commands_per_session=1)
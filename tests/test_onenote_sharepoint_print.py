@@ -211,6 +211,33 @@ async def test_universal_print_uploads_bounded_ranges_without_bearer() -> None:
     assert all(item["url"] == upload_url for item in transport.requests)
 
 
+@pytest.mark.asyncio
+async def test_universal_print_sends_memoryview_ranges_with_progress() -> None:
+    content = b"b" * (2 * PRINT_UPLOAD_CHUNK_BYTES + 5)
+    upload_url = "https://print.print.microsoft.com/uploadSessions/session-2?t=x"
+    transport = RecordingTransport(
+        [
+            response(202, {"nextExpectedRanges": [f"{PRINT_UPLOAD_CHUNK_BYTES}-"]}),
+            response(202, {"nextExpectedRanges": [f"{2 * PRINT_UPLOAD_CHUNK_BYTES}-"]}),
+            response(201, {"id": "document-2", "size": len(content)}),
+        ]
+    )
+    events = []
+
+    result = await UniversalPrintUploader(transport).upload(
+        upload_url, content, progress=events.append
+    )
+
+    assert result["id"] == "document-2"
+    assert all(isinstance(item["body"], memoryview) for item in transport.requests)
+    assert b"".join(item["body"] for item in transport.requests) == content
+    assert [event.bytes_uploaded for event in events] == [
+        PRINT_UPLOAD_CHUNK_BYTES,
+        2 * PRINT_UPLOAD_CHUNK_BYTES,
+        len(content),
+    ]
+
+
 @pytest.mark.parametrize(
     "url",
     [
@@ -0,0 +1,191 @@
+"""Opt-in TTL and ETag response cache for read-only Graph actions."""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+from fastmcp.tools.base import ToolResult
+from mcp.types import CallToolRequestParams
+
+from microsoft_agent.response_cache import (
+    ETagRevalidationHandler,
+    LRUByteCache,
+    ResponseCacheMiddleware,
+    action_ttl,
+)
+from microsoft_agent.settings import MicrosoftSettings
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _context(tool: str, action: str, **params) -> SimpleNamespace:
+    return SimpleNamespace(
+        message=CallToolRequestParams(
+            name=tool,
+            arguments={"action": action, "params_json": json.dumps(params)},
+        )
+    )
+
+
+@pytest.fixture
+def middleware(monkeypatch) -> tuple[ResponseCacheMiddleware, _Clock]:
+    monkeypatch.setattr(
+        "microsoft_agent.response_cache.get_auth_manager",
+        lambda: SimpleNamespace(expected_tenant_id="tenant", mode=None),
+    )
+    clock = _Clock()
+    settings = MicrosoftSettings(
+        response_cache_enabled=True, response_cache_ttls={"list_team_channels": 30}
+    )
+    return ResponseCacheMiddleware(settings, LRUByteCache(1 << 20, clock=clock)), clock
+
+
+@pytest.mark.asyncio
+async def test_read_actions_are_served_from_cache_until_their_ttl(middleware) -> None:
+    cache, clock = middleware
+    call_next = AsyncMock(side_effect=lambda _: ToolResult({"value": ["general"]}))
+
+    first = await cache.on_call_tool(
+        _context("microsoft_teams", "list_team_channels", team_id="t", top=5),
+        call_next,
+    )
+    second = await cache.on_call_tool(
+        _context("microsoft_teams", "list_team_channels", top=5, team_id="t"),
+        call_next,
+    )
+    clock.now = 31
+    await cache.on_call_tool(
+        _context("microsoft_teams", "list_team_channels", team_id="t", top=5),
+        call_next,
+    )
+
+    assert first is second
+    assert call_next.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_write_actions_invalidate_their_tool_group(middleware) -> None:
+    cache, _ = middleware
+    call_next = AsyncMock(side_effect=lambda _: ToolResult({"value": []}))
+
+    await cache.on_call_tool(_context("microsoft_groups", "list_groups"), call_next)
+    await cache.on_call_tool(
+        _context("microsoft_teams", "list_joined_teams"), call_next
+    )
+    await cache.on_call_tool(
+        _context("microsoft_groups", "create_group", display_name="x"), call_next
+    )
+    await cache.on_call_tool(_context("microsoft_groups", "list_groups"), call_next)
+    await cache.on_call_tool(
+        _context("microsoft_teams", "list_joined_teams"), call_next
+    )
+
+    assert call_next.await_count == 4
+    assert cache.cache.stats()["invalidations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_errors_and_zero_ttl_actions_are_not_cached(middleware) -> None:
+    cache, _ = middleware
+    cache.settings = MicrosoftSettings(response_cache_ttls={"list_rooms": 0})
+    failing = AsyncMock(
+        side_effect=lambda _: ToolResult(structured_content={"error": "Graph failed"})
+    )
+    uncached = AsyncMock(side_effect=lambda _: ToolResult({"value": []}))
+
+    for _ in range(2):
+        await cache.on_call_tool(_context("microsoft_places", "list_places"), failing)
+        await cache.on_call_tool(_context("microsoft_places", "list_rooms"), uncached)
+
+    assert failing.await_count == 2
+    assert uncached.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_unlisted_reads_are_cached_only_when_opted_in(middleware) -> None:
+    cache, _ = middleware
+    call_next = AsyncMock(side_effect=lambda _: ToolResult({"value": []}))
+
+    for _ in range(2):
+        await cache.on_call_tool(
+            _context("microsoft_mail", "list_mail_messages"), call_next
+        )
+    assert call_next.await_count == 2
+
+    cache.settings = MicrosoftSettings(response_cache_ttls={"list_mail_messages": 30})
+    for _ in range(2):
+        await cache.on_call_tool(
+            _context("microsoft_mail", "list_mail_messages"), call_next
+        )
+    assert call_next.await_count == 3
+
+
+def test_lru_evicts_least_recently_used_entries_by_size() -> None:
+    cache = LRUByteCache(100)
+    cache.put("a", "a", 40)
+    cache.put("b", "b", 40)
+    cache.get("a")
+    cache.put("c", "c", 40)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "a"
+    assert cache.put("huge", "x", 101) is False
+    assert cache.stats()["bytes"] == 80
+
+
+def test_settings_parse_per_action_ttls() -> None:
+    settings = MicrosoftSettings.from_env(
+        {
+            "MICROSOFT_RESPONSE_CACHE": "true",
+            "MICROSOFT_RESPONSE_CACHE_TTLS": "List_Groups=600, list_rooms=0",
+            "MICROSOFT_RESPONSE_CACHE_MAX_BYTES": "1024",
+        }
+    )
+
+    assert settings.response_cache_enabled is True
+    assert settings.response_cache_max_bytes == 1024
+    assert action_ttl(settings, "list_groups") == 600
+    assert action_ttl(settings, "list_rooms") == 0
+    assert action_ttl(settings, "get_organization") == 3600
+    assert action_ttl(settings, "list_users") == 0
+    with pytest.raises(ValueError):
+        MicrosoftSettings.from_env({"MICROSOFT_RESPONSE_CACHE_TTLS": "list_groups"})
+
+
+@pytest.mark.asyncio
+async def test_etag_handler_revalidates_and_replays_not_modified_bodies() -> None:
+    transport = MagicMock()
+    transport.handle_async_request = AsyncMock(
+        side_effect=[
+            httpx.Response(200, headers={"ETag": 'W/"1"'}, content=b'{"id":"org"}'),
+            httpx.Response(304, headers={"ETag": 'W/"1"'}),
+        ]
+    )
+    store = LRUByteCache(1 << 20)
+    handler = ETagRevalidationHandler(store)
+
+    def request() -> httpx.Request:
+        return httpx.Request(
+            "GET",
+            "https://graph.microsoft.com/v1.0/organization",
+            headers={"Authorization": "Bearer token"},
+        )
+
+    await handler.send(request(), transport)
+    replayed = await handler.send(request(), transport)
+
+    conditional = transport.handle_async_request.await_args_list[1].args[0]
+    assert conditional.headers["If-None-Match"] == 'W/"1"'
+    assert replayed.status_code == 200
+    assert replayed.json() == {"id": "org"}
+    assert store.stats()["revalidated"] == 1
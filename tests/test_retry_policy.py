@@ -0,0 +1,139 @@
+"""Shared throttling-aware retry policy contract."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from microsoft_agent.power_platform import HttpResponse, HttpxAsyncHttpTransport
+from microsoft_agent.retry_policy import (
+    RetryPolicy,
+    ThrottlingRetryHandler,
+    TokenBucket,
+    backoff_delay,
+    retry_after_seconds,
+)
+
+
+def _policy(**kwargs) -> tuple[RetryPolicy, AsyncMock]:
+    sleep = AsyncMock()
+    return RetryPolicy(sleep=sleep, **kwargs), sleep
+
+
+def _response(status: int, headers: dict[str, str] | None = None) -> HttpResponse:
+    return HttpResponse(status_code=status, headers=headers or {})
+
+
+@pytest.mark.asyncio
+async def test_throttled_request_honours_retry_after_and_counts_retries() -> None:
+    policy, sleep = _policy()
+    send = AsyncMock(side_effect=[_response(429, {"Retry-After": "7"}), _response(200)])
+
+    response = await policy.send(("graph", "tenant"), "GET", send)
+
+    assert response.status_code == 200
+    assert send.await_count == 2
+    assert 7.0 in [call.args[0] for call in sleep.await_args_list]
+    stats = policy.stats()["('graph', 'tenant')"]
+    assert stats["retries"] == 1
+    assert stats["throttled"] == 1
+
+
+@pytest.mark.asyncio
+async def test_server_errors_are_not_retried_for_non_idempotent_methods() -> None:
+    policy, _ = _policy()
+    send = AsyncMock(return_value=_response(503))
+
+    response = await policy.send("key", "POST", send)
+
+    assert response.status_code == 503
+    send.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_exhausted_retries_return_the_last_response() -> None:
+    policy, _ = _policy(max_retries=2)
+    send = AsyncMock(return_value=_response(500))
+
+    response = await policy.send("key", "GET", send)
+
+    assert response.status_code == 500
+    assert send.await_count == 3
+    assert policy.stats()["key"]["exhausted"] == 1
+
+
+@pytest.mark.asyncio
+async def test_transport_errors_retry_only_idempotent_requests() -> None:
+    policy, _ = _policy()
+    send = AsyncMock(side_effect=[OSError("reset"), _response(200)])
+
+    assert (await policy.send("key", "PUT", send)).status_code == 200
+
+    send = AsyncMock(side_effect=OSError("reset"))
+    with pytest.raises(OSError):
+        await policy.send("key", "POST", send)
+    send.assert_awaited_once()
+
+
+def test_throttled_bucket_blocks_and_slows_every_caller() -> None:
+    bucket = TokenBucket(rate_per_second=10, burst=5)
+    assert bucket.reserve() == 0
+
+    bucket.throttle(5.0)
+
+    assert bucket.reserve() > 4.0
+    assert bucket.rate == 5
+
+
+def test_retry_after_and_backoff_are_bounded() -> None:
+    assert retry_after_seconds({"retry-after": "3600"}) == 30.0
+    assert retry_after_seconds({"Retry-After": "soon"}) is None
+    assert all(0.5 <= backoff_delay(0) <= 1.0 for _ in range(20))
+    assert all(4.0 <= backoff_delay(10) <= 8.0 for _ in range(20))
+
+
+@pytest.mark.asyncio
+async def test_kiota_handler_retries_and_closes_discarded_responses() -> None:
+    policy, _ = _policy()
+    throttled = httpx.Response(429, headers={"Retry-After": "1"})
+    throttled.aclose = AsyncMock()
+    transport = MagicMock()
+    transport.handle_async_request = AsyncMock(
+        side_effect=[throttled, httpx.Response(200)]
+    )
+    handler = ThrottlingRetryHandler(policy, ("microsoft_graph", "graph"))
+
+    response = await handler.send(
+        httpx.Request("GET", "https://graph.microsoft.com/v1.0/me"), transport
+    )
+
+    assert response.status_code == 200
+    throttled.aclose.assert_awaited_once_with()
+
+
+@pytest.mark.asyncio
+async def test_provider_transport_applies_configured_policy() -> None:
+    policy, _ = _policy()
+    replies = [
+        httpx.Response(429, headers={"Retry-After": "1"}),
+        httpx.Response(200, content=b"{}"),
+    ]
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return replies.pop(0)
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    transport = HttpxAsyncHttpTransport(
+        service="microsoft_power_platform", client=client, retry_policy=policy
+    )
+
+    response = await transport.request(
+        "POST", "https://org.crm.dynamics.com/api", headers={}, timeout=1
+    )
+
+    assert response.status_code == 200
+    assert len(requests) == 2
@@ -173,6 +173,10 @@ def test_ingestion_pseudonymization_key_rejects_short_values(monkeypatch):
         ("write_word_selection_in_office", ToolRisk.WRITE),
         ("delete_powerpoint_slide_in_office", ToolRisk.DESTRUCTIVE),
         ("list_microsoft_ingestion_projection", ToolRisk.READ),
+        ("sync_mail_messages", ToolRisk.READ),
+        ("sync_intune_device", ToolRisk.WRITE),
+        ("sync_anything_else", ToolRisk.WRITE),
+        ("download_onedrive_file_to_artifact", ToolRisk.WRITE),
     ],
 )
 def test_tool_risk_classification(tool_name, risk):
@@ -201,3 +205,47 @@ def test_policy_separates_writes_and_destructive_actions():
         )
     )
     assert destructive_policy.require("delete_mail_message").allowed is True
+
+
+def test_policy_decisions_are_precomputed_cached_and_counted():
+    policy = MicrosoftToolPolicy(
+        MicrosoftSettings(), tool_names=("list_mail_messages", "send_mail")
+    )
+
+    decision = policy.evaluate("list_mail_messages")
+    assert policy.evaluate("list_mail_messages") is decision
+    assert policy.evaluate("send_mail").allowed is False
+    unknown = policy.evaluate("delete_unregistered_thing")
+    assert policy.evaluate("delete_unregistered_thing") is unknown
+    assert unknown.risk is ToolRisk.DESTRUCTIVE
+
+    stats = policy.stats()
+    assert stats["read"] == {"allowed": 2, "denied": 0}
+    assert stats["write"] == {"allowed": 0, "denied": 1}
+    assert stats["destructive"] == {"allowed": 0, "denied": 2}
+    assert stats["cache"]["hits"] == 1
+    assert stats["cache"]["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_policy_middleware_authorizes_the_routed_action():
+    from types import SimpleNamespace
+    from unittest.mock import AsyncMock
+
+    from mcp.types import CallToolRequestParams
+
+    from microsoft_agent.tool_policy import ToolPolicyMiddleware
+
+    middleware = ToolPolicyMiddleware(MicrosoftToolPolicy(MicrosoftSettings()))
+    call_next = AsyncMock(return_value="ok")
+
+    def call(action: str) -> SimpleNamespace:
+        return SimpleNamespace(
+            message=CallToolRequestParams(
+                name="microsoft_mail", arguments={"action": action}
+            )
+        )
+
+    assert await middleware.on_call_tool(call("list_mail_messages"), call_next) == "ok"
+    with pytest.raises(ToolError, match="MICROSOFT_ALLOW_WRITES"):
+        await middleware.on_call_tool(call("send_mail"), call_next)
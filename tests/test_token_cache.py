@@ -0,0 +1,147 @@
+"""Process-identity token cache with refresh-ahead and single-flight."""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from microsoft_agent.auth import AuthManager
+from microsoft_agent.settings import AuthenticationMode
+from microsoft_agent.token_cache import AccessTokenCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _token(name: str, expires_in: float = 3600) -> dict:
+    return {"access_token": name, "expires_in": expires_in}
+
+
+def test_cached_results_are_returned_until_the_refresh_window() -> None:
+    clock = _Clock()
+    cache = AccessTokenCache(clock=clock)
+    acquire = MagicMock(return_value=_token("first"))
+
+    assert cache.get("key", acquire)["access_token"] == "first"
+    clock.now += 3000
+    assert cache.get("key", acquire)["access_token"] == "first"
+
+    acquire.assert_called_once_with()
+    assert cache.stats() == {
+        "hits": 1,
+        "misses": 1,
+        "refreshes": 0,
+        "refresh_failures": 0,
+        "shared_waits": 0,
+        "entries": 1,
+    }
+
+
+def test_refresh_ahead_serves_the_old_token_while_renewing() -> None:
+    clock = _Clock()
+    cache = AccessTokenCache(clock=clock)
+    refreshed = threading.Event()
+
+    def acquire() -> dict:
+        refreshed.set()
+        return _token("second")
+
+    cache.get("key", lambda: _token("first"))
+    clock.now += 3400
+
+    assert cache.get("key", acquire)["access_token"] == "first"
+    assert refreshed.wait(5)
+    deadline = time.monotonic() + 5
+    while cache.get("key", acquire)["access_token"] == "first":
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    assert cache.stats()["refreshes"] == 1
+
+
+def test_concurrent_misses_share_one_acquisition() -> None:
+    cache = AccessTokenCache()
+    release = threading.Event()
+    calls: list[int] = []
+
+    def acquire() -> dict:
+        calls.append(1)
+        release.wait(5)
+        return _token("shared")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(cache.get, "key", acquire) for _ in range(8)]
+        while cache.stats()["shared_waits"] < 7:
+            time.sleep(0.01)
+        release.set()
+        results = [future.result(timeout=5) for future in futures]
+
+    assert len(calls) == 1
+    assert {result["access_token"] for result in results} == {"shared"}
+
+
+def test_failures_and_short_lived_tokens_are_not_cached() -> None:
+    cache = AccessTokenCache()
+    acquire = MagicMock(side_effect=[None, _token("short", 10), RuntimeError()])
+
+    assert cache.get("key", acquire) is None
+    assert cache.get("key", acquire)["access_token"] == "short"
+    with pytest.raises(RuntimeError):
+        cache.get("key", acquire)
+    assert cache.stats()["entries"] == 0
+
+
+def _application_manager() -> AuthManager:
+    with patch("microsoft_agent.auth.msal.ConfidentialClientApplication"):
+        return AuthManager(
+            "client-id",
+            "https://login.microsoftonline.com/tenant-id",
+            ["https://graph.microsoft.com/.default"],
+            mode=AuthenticationMode.APPLICATION,
+            client_credential="secret",
+        )
+
+
+def test_application_tokens_skip_msal_on_the_hot_path() -> None:
+    manager = _application_manager()
+    manager.msal_app.acquire_token_for_client.return_value = _token("app-token")
+
+    assert manager.cached_token() is None
+    assert manager.get_token() == "app-token"
+    assert manager.get_token() == "app-token"
+    assert manager.cached_token() == "app-token"
+
+    manager.msal_app.acquire_token_for_client.assert_called_once_with(
+        scopes=["https://graph.microsoft.com/.default"]
+    )
+    manager.logout()
+    assert manager.cached_token() is None
+
+
+def test_delegated_tokens_bypass_the_process_cache() -> None:
+    with (
+        patch("microsoft_agent.auth.msal.PublicClientApplication"),
+        patch("microsoft_agent.auth.keyring.get_password", return_value=None),
+    ):
+        manager = AuthManager(
+            "client-id",
+            "https://login.microsoftonline.com/common",
+            ["User.Read"],
+            require_secure_cache=False,
+        )
+    manager.msal_app.get_accounts.return_value = [{"home_account_id": "user"}]
+    manager.msal_app.acquire_token_silent.return_value = _token("user-token")
+
+    manager.get_token()
+    manager.get_token()
+
+    assert manager.msal_app.acquire_token_silent.call_count == 2
+    assert manager.access_token_cache.stats()["entries"] == 0
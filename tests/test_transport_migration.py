@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -10,9 +11,15 @@
 import pytest
 
 from microsoft_agent.api_client import MicrosoftGraphApi
-from microsoft_agent.power_platform import HttpxAsyncHttpTransport
+from microsoft_agent.power_platform import (
+    HttpxAsyncHttpTransport,
+    HttpxNativeAsyncHttpTransport,
+)
 from microsoft_agent.universal_print import PrintDocumentSubmission
-from microsoft_agent.windows_companion import HttpxCompanionTransport
+from microsoft_agent.windows_companion import (
+    HttpxCompanionTransport,
+    HttpxNativeCompanionTransport,
+)
 
 
 def _tls_profile() -> SimpleNamespace:
@@ -84,10 +91,10 @@ def test_companion_transport_uses_selected_tls_profile(monkeypatch) -> None:
 
 @pytest.mark.asyncio
 async def test_provider_transport_sanitizes_pinned_egress_failure() -> None:
-    client = MagicMock()
-    client.request.side_effect = httpx.ConnectError(
-        "sensitive destination must not escape"
-    )
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("sensitive destination must not escape")
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
     transport = HttpxAsyncHttpTransport(service="microsoft_graph", client=client)
 
     with pytest.raises(OSError, match="^Provider transport failed$") as exc_info:
@@ -101,6 +108,261 @@ async def test_provider_transport_sanitizes_pinned_egress_failure() -> None:
     assert exc_info.value.__cause__ is None
 
 
+@pytest.mark.asyncio
+async def test_native_provider_transport_keeps_pinning_and_closes_in_loop(
+    monkeypatch,
+) -> None:
+    profile = _tls_profile()
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda _: httpx.Response(200, content=b"{}"))
+    )
+    factory = MagicMock(return_value=client)
+    monkeypatch.setattr(
+        "microsoft_agent.power_platform.resolve_configured_tls_profile",
+        MagicMock(return_value=profile),
+    )
+    monkeypatch.setattr(
+        "microsoft_agent.power_platform.create_async_http_client", factory
+    )
+
+    transport = HttpxNativeAsyncHttpTransport(
+        service="microsoft_power_platform",
+        allowed_private_hosts=("org.crm.dynamics.com",),
+    )
+    response = await transport.request(
+        "GET", "https://org.crm.dynamics.com/api", headers={}, timeout=1
+    )
+    await transport.aclose()
+    transport.close()
+
+    kwargs = factory.call_args.kwargs
+    assert kwargs["verify"] is profile.ssl_context
+    assert kwargs["pin_egress"] is True
+    assert kwargs["follow_redirects"] is False
+    assert kwargs["trust_env"] is False
+    assert kwargs["allowed_private_hosts"] == ("org.crm.dynamics.com",)
+    assert response.json_body() == {}
+    assert client.is_closed
+    profile.cleanup.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_provider_transports_send_memoryview_bodies_by_length() -> None:
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.headers.get("content-length"), request.read()))
+        return httpx.Response(202)
+
+    fragment = memoryview(b"0123456789")[2:6]
+    transports = (
+        HttpxAsyncHttpTransport(
+            service="microsoft_graph",
+            client=httpx.Client(transport=httpx.MockTransport(handler)),
+        ),
+        HttpxNativeAsyncHttpTransport(
+            service="microsoft_graph",
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        ),
+    )
+
+    for transport in transports:
+        await transport.request(
+            "PUT",
+            "https://upload.example/session",
+            headers={},
+            body=fragment,
+            timeout=1,
+        )
+
+    assert seen == [("4", b"2345"), ("4", b"2345")]
+
+
+class _ChunkStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Unbuffered 16 KiB chunks that record how much was served."""
+
+    def __init__(self, chunks: int) -> None:
+        self.chunks = chunks
+        self.served = 0
+
+    def __iter__(self):
+        for _ in range(self.chunks):
+            self.served += 1
+            yield b"x" * 16 * 1024
+
+    async def __aiter__(self):
+        for chunk in self:
+            yield chunk
+
+
+class _StreamTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    def __init__(self, stream: _ChunkStream) -> None:
+        self.stream = stream
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, stream=self.stream)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, stream=self.stream)
+
+
+@pytest.mark.asyncio
+async def test_native_provider_stream_aborts_once_the_bound_is_passed() -> None:
+    stream = _ChunkStream(64)
+    transport = HttpxNativeAsyncHttpTransport(
+        service="microsoft_power_platform",
+        client=httpx.AsyncClient(transport=_StreamTransport(stream)),
+        max_response_bytes=4096,
+    )
+
+    with pytest.raises(ValueError, match="configured bound"):
+        await transport.request("GET", "https://org.example/", headers={}, timeout=1)
+
+    assert stream.served < 64
+
+
+@pytest.mark.asyncio
+async def test_provider_streams_reject_declared_oversize_and_yield_chunks() -> None:
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(
+                200,
+                content=b"x" * 2048,
+                headers={} if request.url.path == "/small" else None,
+            )
+        )
+    )
+    transport = HttpxNativeAsyncHttpTransport(
+        service="microsoft_graph", client=client, max_response_bytes=1024
+    )
+
+    with pytest.raises(ValueError, match="configured bound"):
+        async with transport.stream(
+            "GET", "https://graph.example/large", headers={}, timeout=1
+        ):
+            pass
+    async with transport.stream(
+        "GET", "https://graph.example/small", headers={}, timeout=1, max_bytes=4096
+    ) as response:
+        chunks = [chunk async for chunk in response]
+
+    assert b"".join(chunks) == b"x" * 2048
+    assert response.bytes_read == 2048
+
+
+@pytest.mark.asyncio
+async def test_thread_backed_stream_enforces_bound_incrementally() -> None:
+    stream = _ChunkStream(64)
+    transport = HttpxAsyncHttpTransport(
+        service="microsoft_graph",
+        client=httpx.Client(transport=_StreamTransport(stream)),
+        max_response_bytes=4096,
+    )
+
+    with pytest.raises(ValueError, match="configured bound"):
+        async with transport.stream(
+            "GET", "https://graph.example/", headers={}, timeout=1
+        ) as response:
+            await response.read()
+
+    assert stream.served < 64
+
+
+@pytest.mark.asyncio
+async def test_thread_backed_request_is_bounded_while_the_body_arrives() -> None:
+    stream = _ChunkStream(64)
+    transport = HttpxAsyncHttpTransport(
+        service="microsoft_graph",
+        client=httpx.Client(transport=_StreamTransport(stream)),
+        max_response_bytes=4096,
+    )
+
+    with pytest.raises(ValueError, match="configured bound"):
+        await transport.request("GET", "https://graph.example/", headers={}, timeout=1)
+
+    assert stream.served < 64
+
+
+@pytest.mark.asyncio
+async def test_thread_backed_request_reads_the_body_in_one_thread_hop(
+    monkeypatch,
+) -> None:
+    hops = []
+    to_thread = asyncio.to_thread
+
+    async def counting_to_thread(function, /, *args, **kwargs):
+        hops.append(function)
+        return await to_thread(function, *args, **kwargs)
+
+    monkeypatch.setattr(asyncio, "to_thread", counting_to_thread)
+    transport = HttpxAsyncHttpTransport(
+        service="microsoft_graph",
+        client=httpx.Client(transport=_StreamTransport(_ChunkStream(128))),
+    )
+
+    response = await transport.request(
+        "GET", "https://graph.example/", headers={}, timeout=1
+    )
+
+    assert len(response.body) == 128 * 16 * 1024
+    assert len(hops) == 1
+
+
+@pytest.mark.asyncio
+async def test_companion_transports_enforce_bounds_while_reading() -> None:
+    for transport_type, client_type in (
+        (HttpxCompanionTransport, httpx.Client),
+        (HttpxNativeCompanionTransport, httpx.AsyncClient),
+    ):
+        stream = _ChunkStream(64)
+        transport = transport_type(
+            client=client_type(transport=_StreamTransport(stream)),
+            max_response_bytes=4096,
+        )
+
+        with pytest.raises(ValueError, match="configured bound"):
+            await transport.request(
+                "GET", "https://relay.example/", headers={}, timeout=1
+            )
+
+        assert stream.served < 64
+
+
+@pytest.mark.asyncio
+async def test_native_companion_transport_sanitizes_transport_errors() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("sensitive destination must not escape")
+
+    transport = HttpxNativeCompanionTransport(
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+
+    with pytest.raises(OSError, match="^Companion transport failed$") as exc_info:
+        await transport.request("GET", "https://relay.example/", headers={}, timeout=1)
+
+    assert exc_info.value.__cause__ is None
+
+
+def test_native_transport_close_after_loop_removes_trust_material(
+    monkeypatch,
+) -> None:
+    profile = _tls_profile()
+    client = MagicMock()
+    monkeypatch.setattr(
+        "microsoft_agent.windows_companion.resolve_configured_tls_profile",
+        MagicMock(return_value=profile),
+    )
+    monkeypatch.setattr(
+        "microsoft_agent.windows_companion.create_async_http_client",
+        MagicMock(return_value=client),
+    )
+
+    HttpxNativeCompanionTransport(tls_profile="private-ca").close()
+
+    profile.cleanup.assert_called_once_with()
+    client.close.assert_not_called()
+
+
 def test_integration_cache_clear_closes_owned_transports(monkeypatch) -> None:
     from microsoft_agent import integration_tools
 
@@ -108,7 +370,8 @@ def test_integration_cache_clear_closes_owned_transports(monkeypatch) -> None:
     transport = MagicMock()
     transport_type = MagicMock(return_value=transport)
     monkeypatch.setattr(
-        "microsoft_agent.integration_tools.HttpxAsyncHttpTransport", transport_type
+        "microsoft_agent.integration_tools.HttpxNativeAsyncHttpTransport",
+        transport_type,
     )
 
     created = integration_tools._http_transport(  # noqa: SLF001
@@ -123,6 +386,7 @@ def test_integration_cache_clear_closes_owned_transports(monkeypatch) -> None:
         tls_profile="private-ca",
         tls_profile_ref=None,
         allowed_private_hosts=(),
+        retry_policy=None,
     )
     transport.close.assert_called_once_with()
 
@@ -0,0 +1,121 @@
+"""Streaming, column-projected Graph usage reports."""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from microsoft_agent.api_client import MicrosoftGraphApi
+from microsoft_agent.power_platform import HttpResponseStream
+from microsoft_agent.usage_reports import (
+    MAX_USAGE_REPORT_BYTES,
+    MAX_USAGE_REPORT_CONTENT_BYTES,
+    UsageReportQuery,
+    UsageReportReader,
+    summarize_usage_report,
+)
+
+_GRAPH = "https://graph.microsoft.com/v1.0"
+_REPORT = (
+    "\ufeffReport Refresh Date,User Principal Name,Display Name,Is Deleted,"
+    "Send Count,Receive Count,Assigned Products\r\n"
+    "2026-10-17,ada@contoso.com,Ada,False,12,40,OFFICE 365 E3\r\n"
+    '2026-10-17,grace@contoso.com,"Hopper, Grace",False,3,,"E5\r\nVisio"\r\n'
+    "2026-10-17,old@contoso.com,Old,True,0,1,\r\n"
+).encode()
+
+
+async def _chunks(content: bytes, size: int):
+    for start in range(0, len(content), size):
+        yield content[start : start + size]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk_size", [1, 7, len(_REPORT)])
+async def test_report_rows_are_projected_filtered_and_totalled(chunk_size) -> None:
+    query = UsageReportQuery(
+        columns=("user principal name", "Send Count", "Assigned Products"),
+        where={"Is Deleted": "false"},
+        group_by="Report Refresh Date",
+        totals=("Send Count", "Receive Count"),
+        limit=1,
+    )
+
+    result = await summarize_usage_report(_chunks(_REPORT, chunk_size), query)
+
+    assert result == {
+        "columns": ["User Principal Name", "Send Count", "Assigned Products"],
+        "rows": [["ada@contoso.com", 12, "OFFICE 365 E3"]],
+        "rowsScanned": 3,
+        "rowsMatched": 2,
+        "truncated": True,
+        "totals": {"Send Count": 15, "Receive Count": 40},
+        "groups": [
+            {
+                "key": "2026-10-17",
+                "count": 2,
+                "totals": {"Send Count": 15, "Receive Count": 40},
+            }
+        ],
+    }
+
+
+def test_malformed_reports_are_rejected() -> None:
+    reader = UsageReportReader(UsageReportQuery(columns=("Missing",)))
+    with pytest.raises(ValueError, match="Unknown usage report column"):
+        reader.feed(b"Display Name\n")
+
+    reader = UsageReportReader(UsageReportQuery())
+    reader.feed(b'Display Name\n"unterminated\n')
+    with pytest.raises(ValueError, match="quoted field"):
+        reader.finish()
+
+
+class _ReportTransport:
+    def __init__(self) -> None:
+        self.requests: list[tuple[str, dict[str, str], int]] = []
+
+    @asynccontextmanager
+    async def stream(self, method, url, *, headers, timeout, max_bytes):
+        self.requests.append((url, headers, max_bytes))
+        yield HttpResponseStream(200, {}, _chunks(_REPORT, 16), max_bytes=max_bytes)
+
+
+@pytest.mark.asyncio
+async def test_report_actions_stream_the_redirected_csv() -> None:
+    transport = _ReportTransport()
+    client = object.__new__(MicrosoftGraphApi)
+    client._downloads = transport  # noqa: SLF001
+    client.auth_manager = SimpleNamespace(
+        graph_base_url=_GRAPH, graph_tls_profile=None, graph_tls_profile_ref=None
+    )
+    download_url = "https://reports.office.com/data/report.csv?sig=abc"
+    client._graph_request = AsyncMock(  # noqa: SLF001
+        return_value=SimpleNamespace(
+            status_code=302, headers={"location": download_url}
+        )
+    )
+    result = await client.get_email_activity_report(
+        "D30", params={"columns": ["Display Name"], "limit": 5}
+    )
+    whole = await client.get_mailbox_usage_report()
+
+    assert result["rows"] == [["Ada"], ["Hopper, Grace"], ["Old"]]
+    assert whole["content"].startswith("Report Refresh Date,")
+    client._graph_request.assert_any_await(  # noqa: SLF001
+        "GET", f"{_GRAPH}/reports/getEmailActivityUserDetail(period='D30')"
+    )
+    assert transport.requests[0] == (
+        download_url,
+        {"Accept": "text/csv"},
+        MAX_USAGE_REPORT_BYTES,
+    )
+    assert transport.requests[1][2] == MAX_USAGE_REPORT_CONTENT_BYTES
+    assert "Authorization" not in transport.requests[0][1]
+    assert "error" in await client.get_teams_user_activity("D1")
+    assert "error" in await client.get_office365_active_users(
+        params={"where": {"Nope": "x"}}
+    )
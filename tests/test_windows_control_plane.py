@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import os
+import sqlite3
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -477,6 +479,50 @@ async def test_health_reflects_authenticated_outbound_poll(control_plane: Any) -
     assert after.json()["companion_version"] == "2.0.0"
 
 
+@pytest.mark.asyncio
+async def test_long_poll_sleeps_until_enqueue_wakes_it(
+    control_plane: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    app, store, settings = control_plane
+    calls = {"poll": 0, "touch": 0}
+    poll, touch = store.poll, store.touch_device
+
+    async def counting_poll(*args: Any) -> RelayPollBatch:
+        calls["poll"] += 1
+        return await poll(*args)
+
+    async def counting_touch(*args: Any) -> None:
+        calls["touch"] += 1
+        await touch(*args)
+
+    monkeypatch.setattr(store, "poll", counting_poll)
+    monkeypatch.setattr(store, "touch_device", counting_touch)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="https://control.test"
+    ) as client:
+        waiting = asyncio.ensure_future(
+            client.post(
+                f"/v1/devices/{DEVICE_ID}/relay/poll",
+                headers=_device_headers(),
+                json={
+                    "wait_seconds": 30,
+                    "companion_version": "1.0.0",
+                    "capabilities": [CompanionActionKind.SYSTEM_INVENTORY.value],
+                },
+            )
+        )
+        while calls["poll"] == 0:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.1)
+        assert not waiting.done()
+        await store.enqueue(DEVICE_ID, _submission(settings))
+        polled = await asyncio.wait_for(waiting, timeout=5)
+
+    assert len(polled.json()["deliveries"]) == 1
+    assert calls == {"poll": 2, "touch": 1}
+
+
 @pytest.mark.asyncio
 async def test_acknowledgement_is_idempotent_but_conflicts_on_changed_result(
     control_plane: Any,
@@ -546,6 +592,68 @@ async def test_store_expires_unclaimed_actions(tmp_path: Path) -> None:
     assert result.error and result.error.code == "expired"
 
 
+@pytest.mark.asyncio
+async def test_maintenance_expires_and_prunes_in_batches(tmp_path: Path) -> None:
+    limits = WindowsControlPlaneLimits(completed_retention_hours=1)
+    store = SQLiteCompanionStore(tmp_path / "maintained.db", limits)
+    settings = _settings(require_device_mtls=False, trusted_proxy_mtls_header=None)
+    now = datetime.now(UTC)
+    for key in ("a", "b"):
+        await store.enqueue(
+            DEVICE_ID,
+            _submission(
+                settings,
+                CompanionActionRequest(
+                    action=SystemInventoryAction(),
+                    requested_at=now - timedelta(minutes=2),
+                    expires_at=now - timedelta(minutes=1),
+                    idempotency_key=key,
+                ),
+            ),
+        )
+    live = await store.enqueue(DEVICE_ID, _submission(settings, _inventory_request()))
+
+    assert (await store.poll(DEVICE_ID, 10, now)).deliveries[0].request.action_id == (
+        live.action_id
+    )
+    assert await store.expire_and_prune(now) == (2, 0)
+    assert await store.expire_and_prune(now + timedelta(hours=2)) == (1, 2)
+    expired = await store.get_action(DEVICE_ID, live.action_id)
+    assert expired.status is CompanionActionStatus.EXPIRED
+    assert expired.error and expired.error.code == "expired"
+    assert expired.started_at is not None
+
+
+@pytest.mark.asyncio
+async def test_maintenance_survives_a_failed_sweep(tmp_path: Path, monkeypatch) -> None:
+    store = SQLiteCompanionStore(
+        tmp_path / "maintenance.db",
+        WindowsControlPlaneLimits(maintenance_interval_seconds=1),
+    )
+    sweeps = 0
+
+    async def expire_and_prune(now=None):
+        nonlocal sweeps
+        sweeps += 1
+        if sweeps == 1:
+            raise sqlite3.OperationalError("database is locked")
+        if sweeps == 2:
+            raise asyncio.CancelledError
+        return (0, 0)
+
+    async def no_wait(_seconds: float) -> None:
+        return None
+
+    monkeypatch.setattr(store, "expire_and_prune", expire_and_prune)
+    monkeypatch.setattr("microsoft_agent.windows_control_plane.asyncio.sleep", no_wait)
+
+    with pytest.raises(asyncio.CancelledError):
+        await store.run_maintenance()
+
+    assert sweeps == 2
+    store.close()
+
+
 @pytest.mark.asyncio
 async def test_store_enforces_pending_capacity(tmp_path: Path) -> None:
     limits = WindowsControlPlaneLimits(maximum_pending_per_device=1)
@@ -559,6 +667,47 @@ async def test_store_enforces_pending_capacity(tmp_path: Path) -> None:
         )
 
 
+@pytest.mark.asyncio
+async def test_store_reuses_pooled_connections(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    limits = WindowsControlPlaneLimits(maximum_reader_connections=2)
+    store = SQLiteCompanionStore(tmp_path / "pooled.db", limits)
+    settings = _settings(require_device_mtls=False, trusted_proxy_mtls_header=None)
+    opened: list[str] = []
+    connect = sqlite3.connect
+
+    def counting_connect(*args: Any, **kwargs: Any) -> sqlite3.Connection:
+        opened.append(str(args[0]))
+        return connect(*args, **kwargs)
+
+    monkeypatch.setattr(sqlite3, "connect", counting_connect)
+    await store.enqueue(DEVICE_ID, _submission(settings))
+    now = datetime.now(UTC)
+    await asyncio.gather(
+        *(
+            store.touch_device(
+                DEVICE_ID,
+                now,
+                "1.0.0",
+                frozenset({CompanionActionKind.SYSTEM_INVENTORY}),
+            )
+            for _ in range(8)
+        ),
+        *(store.poll(DEVICE_ID, 10, now) for _ in range(8)),
+        *(store.device_state(DEVICE_ID) for _ in range(8)),
+    )
+
+    assert len(opened) <= 2
+    with pytest.raises(sqlite3.OperationalError, match="readonly"):
+        with store._pool.reader() as connection:  # noqa: SLF001
+            connection.execute("DELETE FROM device_state")
+
+    store.close()
+    state = await store.device_state(DEVICE_ID)
+    assert state and state["companion_version"] == "1.0.0"
+
+
 def test_mtls_configuration_is_explicit() -> None:
     with pytest.raises(ValidationError, match="trusted proxy"):
         _settings(trusted_proxy_mtls_header=None, require_device_mtls=True)
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import hashlib
+import os
 import sys
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
@@ -12,6 +14,7 @@
 
 import pytest
 
+from microsoft_agent import windows_runtime
 from microsoft_agent.windows_companion import (
     ClipboardReadTextAction,
     ClipboardWriteTextAction,
@@ -38,6 +41,7 @@
     RelayActionDelivery,
     RelayPollBatch,
     WindowsActionExecutor,
+    WindowsRuntimeLimits,
     WindowsRuntimePolicyError,
 )
 
@@ -213,6 +217,42 @@ async def test_recursive_list_is_bounded_and_hashes_files(tmp_path: Path) -> Non
     )
 
 
+@pytest.mark.asyncio
+async def test_repeated_listing_rehashes_only_changed_files(
+    tmp_path: Path, monkeypatch
+) -> None:
+    for name in ("a.txt", "b.txt", "c.txt"):
+        (tmp_path / name).write_bytes(name.encode())
+        os.utime(tmp_path / name, ns=(1_000_000_000, 1_000_000_000))
+    (tmp_path / "fresh.txt").write_bytes(b"just written")
+    hashed: list[str] = []
+    original = windows_runtime._hash_file_no_follow  # noqa: SLF001
+
+    def counting_hash(path: Path, maximum_bytes: int) -> str:
+        hashed.append(path.name)
+        return original(path, maximum_bytes)
+
+    monkeypatch.setattr(windows_runtime, "_hash_file_no_follow", counting_hash)
+    executor = _executor(tmp_path)
+
+    async def listing(key: str) -> dict[str, str]:
+        result = await executor.execute(
+            _request(FileListAction(path=LOGICAL_ROOT), key=key)
+        )
+        assert result.output
+        return {entry["name"]: entry["sha256"] for entry in result.output["entries"]}
+
+    first = await listing("list-1")
+    (tmp_path / "b.txt").write_bytes(b"changed")
+    os.utime(tmp_path / "b.txt", ns=(2_000_000_000, 2_000_000_000))
+    hashed.clear()
+    second = await listing("list-2")
+
+    assert sorted(hashed) == ["b.txt", "fresh.txt"]
+    assert second["a.txt"] == first["a.txt"]
+    assert second["b.txt"] == hashlib.sha256(b"changed").hexdigest()
+
+
 @pytest.mark.asyncio
 async def test_traversal_and_symlinks_are_rejected(tmp_path: Path) -> None:
     outside = tmp_path.parent / f"{tmp_path.name}-outside"
@@ -556,6 +596,165 @@ async def test_outbound_worker_rejects_identity_and_policy_downgrade(
     assert result.error.code == "identity_mismatch"
 
 
+class GatedDesktopFlows(FakeDesktopFlows):
+    def __init__(self) -> None:
+        super().__init__()
+        self.release = asyncio.Event()
+        self.running = 0
+        self.peak = 0
+
+    async def run_flow(self, flow_name: str, inputs: dict[str, Any], **kwargs: Any):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await self.release.wait()
+        self.running -= 1
+        return await super().run_flow(flow_name, inputs, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_outbound_worker_runs_lanes_concurrently_and_acks_as_completed(
+    tmp_path: Path,
+) -> None:
+    flows = GatedDesktopFlows()
+    executor = _executor(tmp_path, desktop_flows=flows)
+
+    def delivery(action: Any, key: str, confirmed: bool = True) -> RelayActionDelivery:
+        return RelayActionDelivery(
+            delivery_id=key,
+            device_id=_identity().device_id,
+            expected_device_identity=_identity(),
+            request=_request(action, confirmed=confirmed, key=key),
+            policy=executor.local_policies[CompanionActionKind(action.kind)],
+        )
+
+    flow = PowerAutomateDesktopRunAction(flow_name="Reconcile invoices")
+    relay = FakeRelay(
+        RelayPollBatch(
+            cursor="after-batch",
+            deliveries=(
+                delivery(flow, "flow-1"),
+                delivery(flow, "flow-2"),
+                delivery(SystemInventoryAction(), "inventory", confirmed=False),
+            ),
+        )
+    )
+    worker = OutboundRelayWorker(relay, executor)
+
+    task = asyncio.create_task(worker.run_once())
+    async with asyncio.timeout(5):
+        while not relay.acks:
+            await asyncio.sleep(0)
+    assert [key for key, _ in relay.acks] == ["inventory"]
+    assert worker.cursor is None
+    flows.release.set()
+    await task
+
+    assert [key for key, _ in relay.acks] == ["inventory", "flow-1", "flow-2"]
+    assert flows.peak == 1
+    assert worker.cursor == "after-batch"
+
+
+@pytest.mark.asyncio
+async def test_outbound_worker_runs_lane_reads_together_between_writes(
+    tmp_path: Path,
+) -> None:
+    executor = _executor(tmp_path)
+
+    def delivery(action: Any, key: str) -> RelayActionDelivery:
+        return RelayActionDelivery(
+            delivery_id=key,
+            device_id=_identity().device_id,
+            expected_device_identity=_identity(),
+            request=_request(action, confirmed=True, key=key),
+            policy=executor.local_policies[CompanionActionKind(action.kind)],
+        )
+
+    path = str(tmp_path / "notes.txt")
+    write = FileWriteAction(path=path, content_base64="aGk=", overwrite=True)
+    relay = FakeRelay(
+        RelayPollBatch(
+            deliveries=(
+                delivery(write, "write-1"),
+                delivery(FileReadAction(path=path), "read"),
+                delivery(FileListAction(path=str(tmp_path)), "list"),
+                delivery(write, "write-2"),
+            ),
+        )
+    )
+    worker = OutboundRelayWorker(relay, executor)
+    gates = {key: asyncio.Event() for key in ("write-1", "read", "list", "write-2")}
+    running: set[str] = set()
+
+    async def execute(delivery: RelayActionDelivery):
+        running.add(delivery.delivery_id)
+        await gates[delivery.delivery_id].wait()
+        running.discard(delivery.delivery_id)
+        return executor._rejected(delivery.request, "test_gate", "Gated")  # noqa: SLF001
+
+    worker._execute_delivery = execute  # type: ignore[method-assign]
+
+    async def settle() -> set[str]:
+        for _ in range(20):
+            await asyncio.sleep(0)
+        return set(running)
+
+    task = asyncio.create_task(worker.run_once())
+    async with asyncio.timeout(5):
+        assert await settle() == {"write-1"}
+        gates["write-1"].set()
+        assert await settle() == {"read", "list"}
+        gates["read"].set()
+        assert await settle() == {"list"}
+        gates["list"].set()
+        assert await settle() == {"write-2"}
+        gates["write-2"].set()
+        await task
+
+    assert [key for key, _ in relay.acks] == ["write-1", "read", "list", "write-2"]
+
+
+@pytest.mark.asyncio
+async def test_outbound_worker_lane_limit_caps_concurrent_reads(
+    tmp_path: Path,
+) -> None:
+    executor = _executor(tmp_path)
+    limits = WindowsRuntimeLimits(relay_lane_limits={"service": 1})
+    status = WindowsServiceStatusAction(service_name="Spooler")
+    relay = FakeRelay(
+        RelayPollBatch(
+            deliveries=tuple(
+                RelayActionDelivery(
+                    delivery_id=key,
+                    device_id=_identity().device_id,
+                    expected_device_identity=_identity(),
+                    request=_request(status, confirmed=False, key=key),
+                    policy=executor.local_policies[
+                        CompanionActionKind.WINDOWS_SERVICE_STATUS
+                    ],
+                )
+                for key in ("status-1", "status-2")
+            ),
+        )
+    )
+    worker = OutboundRelayWorker(relay, executor, limits=limits)
+    running = 0
+    peak = 0
+
+    async def execute(delivery: RelayActionDelivery):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0)
+        running -= 1
+        return executor._rejected(delivery.request, "test_gate", "Gated")  # noqa: SLF001
+
+    worker._execute_delivery = execute  # type: ignore[method-assign]
+    await worker.run_once()
+
+    assert peak == 1
+    assert [key for key, _ in relay.acks] == ["status-1", "status-2"]
+
+
 def test_pywin32_automation_is_optional_off_windows() -> None:
     if sys.platform == "win32":
         pytest.skip("This guard is specific to non-Windows test hosts")